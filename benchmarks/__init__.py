@@ -0,0 +1,4 @@
+"""Offline benchmark suite for the scanner and packet pipeline hot paths.
+
+See benchmarks/README.md. Run with ``python -m benchmarks.run``.
+"""
@@ -0,0 +1,220 @@
+"""Run the benchmark suite and optionally compare against a baseline.
+
+Usage:
+    python -m benchmarks.run                          # all scenarios, scale 1.0
+    python -m benchmarks.run --scale 10 --scenario score_items --scenario graph_build
+    python -m benchmarks.run --output base.json       # save a baseline
+    python -m benchmarks.run --compare base.json      # exit 1 on >20% regression
+    python -m benchmarks.run --compare base.json --threshold 0.1
+
+Results are JSON: run parameters, data sizes, environment, and per
+scenario the individual run times plus min/median seconds and items/s.
+``--compare`` checks each scenario's median against the baseline's and
+fails when it is slower by more than ``--threshold`` (a fraction). Both
+runs must use the same scale, seed and packet fraction.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.scenarios import SCENARIOS, BenchContext
+from benchmarks.synthetic import SyntheticWorld
+
+RESULTS_FORMAT: int = 1
+DEFAULT_OUTPUT: Path = Path(__file__).resolve().parent / "results" / "latest.json"
+DEFAULT_THRESHOLD: float = 0.2
+
+_COMPARED_PARAMS = ("scale", "seed", "packet_fraction")
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=Path(__file__).resolve().parent, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def time_scenario(run, repeat: int, warmup: int = 1) -> dict:
+    """Time ``run()`` ``repeat`` times after ``warmup`` untimed calls.
+
+    Returns:
+        Dict with runs, min_s, median_s, items and items_per_s (at the
+        median).
+    """
+    for _ in range(warmup):
+        run()
+    runs = []
+    items = 0
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        items = run()
+        runs.append(time.perf_counter() - start)
+    median = statistics.median(runs)
+    return {
+        "runs": runs,
+        "min_s": min(runs),
+        "median_s": median,
+        "items": items,
+        "items_per_s": items / median if median > 0 else None,
+    }
+
+
+def run_suite(
+    names: list[str],
+    scale: float = 1.0,
+    seed: int = 7,
+    repeat: int | None = None,
+    warmup: int = 1,
+    packet_fraction: float = 0.1,
+    workers: int = 1,
+    workdir: Path | None = None,
+) -> dict:
+    """Generate the synthetic world and time the named scenarios.
+
+    Returns:
+        The results dict (see module docstring).
+    """
+    world = SyntheticWorld(scale=scale, seed=seed)
+    with tempfile.TemporaryDirectory(prefix="tcr-bench-") as tmp:
+        ctx = BenchContext(
+            world=world, root=workdir or Path(tmp),
+            packet_fraction=packet_fraction, workers=workers,
+        )
+        scenarios = {}
+        for name in names:
+            scenario = SCENARIOS[name]
+            print(f"{name}...", end="", flush=True)
+            run = scenario.setup(ctx)
+            scenarios[name] = time_scenario(
+                run, repeat or scenario.repeat, warmup if scenario.repeat > 1 else 0,
+            )
+            print(f" {scenarios[name]['median_s']:.3f}s median", flush=True)
+
+    return {
+        "format": RESULTS_FORMAT,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "params": {"scale": scale, "seed": seed, "packet_fraction": packet_fraction,
+                   "workers": workers},
+        "sizes": world.sizes(),
+        "scenarios": scenarios,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """Scenarios whose median is slower than the baseline's by > threshold.
+
+    Raises:
+        ValueError: If the two runs used different data parameters.
+    """
+    mismatched = [
+        k for k in _COMPARED_PARAMS
+        if current["params"].get(k) != baseline["params"].get(k)
+    ]
+    if mismatched:
+        raise ValueError(f"benchmark parameters differ from baseline: {', '.join(mismatched)}")
+    regressions = []
+    for name, result in current["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None or base["median_s"] <= 0:
+            continue
+        change = result["median_s"] / base["median_s"] - 1.0
+        if change > threshold:
+            regressions.append({
+                "scenario": name, "median_s": result["median_s"],
+                "baseline_median_s": base["median_s"], "change": change,
+            })
+    return regressions
+
+
+def format_comparison(current: dict, baseline: dict) -> str:
+    """Side-by-side medians for scenarios present in both runs."""
+    lines = [f"{'scenario':<16} {'baseline':>10} {'current':>10} {'change':>8}"]
+    for name, result in current["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            lines.append(f"{name:<16} {'-':>10} {result['median_s']:>9.3f}s {'new':>8}")
+            continue
+        change = result["median_s"] / base["median_s"] - 1.0 if base["median_s"] > 0 else 0.0
+        lines.append(
+            f"{name:<16} {base['median_s']:>9.3f}s {result['median_s']:>9.3f}s {change:>+7.1%}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point. Returns the process exit code."""
+    parser = argparse.ArgumentParser(description="TCR Policy Scanner benchmark suite")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Scenario to run (repeatable; default: all)")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="Data size relative to 592 Tribes / 18 programs (default: 1.0)")
+    parser.add_argument("--seed", type=int, default=7, help="Synthetic data seed (default: 7)")
+    parser.add_argument("--repeat", type=int, help="Timed runs per scenario (default: per scenario)")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs first (default: 1)")
+    parser.add_argument("--packet-fraction", type=float, default=0.1,
+                        help="Share of Tribes rendered by run_all_tribes/review_batch (default: 0.1)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for run_all_tribes/review_batch (default: 1)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT,
+                        help=f"Results JSON path (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE",
+                        help="Baseline results JSON; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown as a fraction (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR, format="%(levelname)s %(name)s: %(message)s")
+
+    results = run_suite(
+        args.scenario or list(SCENARIOS), scale=args.scale, seed=args.seed,
+        repeat=args.repeat, warmup=args.warmup,
+        packet_fraction=args.packet_fraction, workers=args.workers,
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        try:
+            regressions = compare(results, baseline, args.threshold)
+        except ValueError as exc:
+            print(f"Cannot compare: {exc}")
+            return 2
+        print(format_comparison(results, baseline))
+        for reg in regressions:
+            print(
+                f"REGRESSION: {reg['scenario']} {reg['median_s']:.3f}s vs "
+                f"{reg['baseline_median_s']:.3f}s ({reg['change']:+.1%})"
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""Timed benchmark scenarios, one per pipeline hot path.
+
+Each scenario's ``setup(ctx)`` does the untimed preparation and returns a
+callable; the runner times that callable, which returns how many items
+it processed (for items/s).
+
+    score_items       RelevanceScorer(config, programs).score_items(scan items)
+    graph_build       GraphBuilder(programs).build(scored items)
+    match_awards      TribalAwardMatcher(config).match_all_awards(awards)
+    run_all_tribes    PacketOrchestrator.run_all_tribes(), Doc A/B/C/D
+                      plus quality review, for a fraction of the Tribes
+    review_batch      DocumentQualityReviewer.review_batch over those docs
+
+Construction is inside the timed call where the pipeline builds a fresh
+object per run (scorer keyword index, graph builder, matcher tables).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import math
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from unittest.mock import patch
+
+from benchmarks.synthetic import SyntheticWorld, WorldFiles
+
+
+@dataclass
+class BenchContext:
+    """What scenarios share within one benchmark run."""
+
+    world: SyntheticWorld
+    root: Path
+    packet_fraction: float = 0.1
+    workers: int = 1
+    _files: WorldFiles | None = None
+    _packet_files: WorldFiles | None = None
+    _scored: list[dict] | None = None
+
+    def files(self) -> WorldFiles:
+        """Full-size files (written on first use)."""
+        if self._files is None:
+            self._files = self.world.write(self.root / "world")
+        return self._files
+
+    def packet_files(self) -> WorldFiles:
+        """Files for the packet scenarios' Tribe subset."""
+        if self._packet_files is None:
+            count = max(1, math.ceil(len(self.world.tribes) * self.packet_fraction))
+            self._packet_files = self.world.write(
+                self.root / "packets_world", tribes=self.world.tribes[:count],
+            )
+        return self._packet_files
+
+    def scored(self) -> list[dict]:
+        """Scan items scored once, as GraphBuilder input."""
+        if self._scored is None:
+            from src.analysis.relevance import RelevanceScorer
+
+            scorer = RelevanceScorer(self.world.config, self.world.programs)
+            self._scored = scorer.score_items(self.world.scan_items)
+        return self._scored
+
+
+@dataclass
+class Scenario:
+    """A named hot path and its default repeat count."""
+
+    name: str
+    setup: Callable[[BenchContext], Callable[[], int]]
+    repeat: int = 5
+
+
+def _setup_score_items(ctx: BenchContext) -> Callable[[], int]:
+    from src.analysis.relevance import RelevanceScorer
+
+    world = ctx.world
+
+    def run() -> int:
+        RelevanceScorer(world.config, world.programs).score_items(world.scan_items)
+        return len(world.scan_items)
+    return run
+
+
+def _setup_graph_build(ctx: BenchContext) -> Callable[[], int]:
+    from src.graph.builder import GraphBuilder
+
+    programs, scored = ctx.world.programs, ctx.scored()
+
+    def run() -> int:
+        GraphBuilder(programs).build(scored)
+        return len(scored)
+    return run
+
+
+def _setup_match_awards(ctx: BenchContext) -> Callable[[], int]:
+    from src.packets.awards import TribalAwardMatcher
+
+    files = ctx.files()
+    config = {"packets": {
+        "tribal_registry": {"data_path": str(files.registry)},
+        "awards": {"alias_path": str(files.aliases), "cache_dir": str(files.award_cache_dir)},
+    }}
+    awards = ctx.world.awards_by_cfda
+
+    def run() -> int:
+        TribalAwardMatcher(config).match_all_awards(awards)
+        return sum(len(v) for v in awards.values())
+    return run
+
+
+def _render_packets(ctx: BenchContext) -> dict:
+    from src.packets import orchestrator as orch_mod
+
+    files = ctx.packet_files()
+    with patch.object(orch_mod, "CONGRESSIONAL_INTEL_PATH", files.congressional_intel), \
+         contextlib.redirect_stdout(io.StringIO()):
+        orch = orch_mod.PacketOrchestrator(
+            ctx.world.packet_config(files), ctx.world.programs, force=True,
+        )
+        return orch.run_all_tribes(workers=ctx.workers)
+
+
+def _setup_run_all_tribes(ctx: BenchContext) -> Callable[[], int]:
+    ctx.packet_files()
+
+    def run() -> int:
+        return _render_packets(ctx)["total"]
+    return run
+
+
+def _setup_review_batch(ctx: BenchContext) -> Callable[[], int]:
+    from src.packets.quality_review import DocumentQualityReviewer
+
+    out = ctx.packet_files().root / "packets"
+    if not any(out.rglob("*.docx")):
+        _render_packets(ctx)
+
+    def run() -> int:
+        result = DocumentQualityReviewer(workers=ctx.workers).review_batch(out)
+        return result.total_reviewed
+    return run
+
+
+SCENARIOS: dict[str, Scenario] = {
+    s.name: s for s in (
+        Scenario("score_items", _setup_score_items),
+        Scenario("graph_build", _setup_graph_build),
+        Scenario("match_awards", _setup_match_awards, repeat=3),
+        Scenario("run_all_tribes", _setup_run_all_tribes, repeat=1),
+        Scenario("review_batch", _setup_review_batch, repeat=3),
+    )
+}
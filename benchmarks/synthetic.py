@@ -0,0 +1,454 @@
+"""Deterministic synthetic data for the benchmark suite.
+
+``SyntheticWorld(scale, seed)`` generates every input the benchmarked hot
+paths read, sized relative to today's footprint (scale 1.0 = 592 Tribes
+and the 18-program inventory; scale 10 = 5,920 Tribes, 180 programs;
+below 1.0 the program inventory stays at its real size):
+
+    tribes        registry entries spread over the 50 states
+    programs      copies of data/program_inventory.json with suffixed ids
+    scan_items    raw scraper items mixing program, Tribal, action,
+                  authority, barrier and funding phrases
+    awards        USASpending award rows by CFDA: exact alias, fuzzy
+                  variant, consortium and unmatched recipients
+    bills         congressional_intel bills with sponsors and cosponsors
+    delegations   congressional cache with senators/representatives
+
+The same (scale, seed) always yields the same data. Scan item dates are
+relative to ``today`` so recency scoring sees a realistic spread.
+
+``world.write(root)`` lays the data out as files the pipeline classes
+load (registry, aliases, congressional cache and intel, award store,
+hazard profiles) and returns the paths.
+
+Usage:
+    world = SyntheticWorld(scale=1.0, seed=7)
+    files = world.write(Path("/tmp/bench"))
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+from src.packets.award_store import AwardCacheStore
+from src.paths import PROGRAM_INVENTORY_PATH, SCANNER_CONFIG_PATH
+
+BASE_TRIBES: int = 592
+BASE_SCAN_ITEMS: int = 2000
+BASE_AWARDS: int = 4000
+BASE_BILLS: int = 300
+
+STATES = [
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID",
+    "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS",
+    "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK",
+    "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV",
+    "WI", "WY",
+]
+# Tribal lands concentrate in a few states; weight them accordingly.
+_STATE_WEIGHTS = {"AK": 40, "CA": 18, "OK": 8, "AZ": 5, "WA": 5, "NM": 4, "MN": 3, "WI": 3}
+
+_NAME_PARTS = [
+    "River", "Lake", "Mountain", "Valley", "Creek", "Prairie", "Mesa", "Bay",
+    "Falls", "Springs", "Canyon", "Island", "Ridge", "Point", "Meadow", "Rock",
+]
+_NAME_PREFIXES = [
+    "Red", "Black", "White", "Blue", "Grand", "Little", "Big", "North",
+    "South", "Eagle", "Bear", "Wolf", "Elk", "Cedar", "Pine", "Stone",
+]
+_NAME_FORMS = [
+    "{} Band of Indians", "{} Tribe", "{} Nation", "{} Rancheria",
+    "{} Indian Community", "Native Village of {}", "{} Pueblo",
+]
+_FILLER = (
+    "the of and to for in on with notice agency federal program proposed rule "
+    "comment period annual report update public meeting docket section "
+    "implementation guidance applicants eligible fiscal year application"
+).split()
+_AUTHORITY_PHRASES = [
+    "under 42 U.S.C. 5121", "pursuant to 25 U.S.C. 5304", "Stafford Act",
+    "Public Law 117-58", "Snyder Act", "Indian Self-Determination Act",
+]
+_BARRIER_PHRASES = [
+    "a 25 percent cost share", "non-federal matching requirement",
+    "state pass-through", "competitive grant application burden",
+]
+_FUNDING_PHRASES = ["$12 million", "$3.5 billion", "$450,000", "$80 million"]
+_SOURCES = [
+    ("federal_register", 0.9), ("grants_gov", 0.8),
+    ("congress_gov", 0.85), ("usaspending", 0.7),
+]
+_SUBTYPES = ["", "", "", "", "icr", "guidance", "rfi"]
+_HAZARDS = [
+    ("Wildfire", "WFIR"), ("Drought", "DRGT"), ("Riverine Flooding", "RFLD"),
+    ("Coastal Flooding", "CFLD"), ("Hurricane", "HRCN"), ("Heat Wave", "HWAV"),
+    ("Earthquake", "ERQK"), ("Landslide", "LNDS"), ("Winter Weather", "WNTW"),
+    ("Tornado", "TRND"),
+]
+
+
+def _load_json(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+@dataclass
+class WorldFiles:
+    """Paths written by ``SyntheticWorld.write``."""
+
+    root: Path
+    registry: Path
+    aliases: Path
+    congressional_cache: Path
+    congressional_intel: Path
+    award_cache_dir: Path
+    hazard_dir: Path
+
+
+class SyntheticWorld:
+    """All benchmark inputs for one (scale, seed).
+
+    Args:
+        scale: Size relative to today's footprint (1.0 = 592 Tribes).
+        seed: Random seed; the same seed always yields the same data.
+        today: Reference date for scan item publication dates.
+    """
+
+    def __init__(self, scale: float = 1.0, seed: int = 7, today: date | None = None) -> None:
+        self.scale = scale
+        self.seed = seed
+        self.today = today or date.today()
+        rng = random.Random(seed)
+
+        self.config = _load_json(SCANNER_CONFIG_PATH)
+        base_programs = _load_json(PROGRAM_INVENTORY_PATH)["programs"]
+        self.programs = self._programs(base_programs, max(len(base_programs), round(len(base_programs) * scale)))
+        self.tribes = self._tribes(rng, max(1, round(BASE_TRIBES * scale)))
+        self.members, self.delegations = self._congress(rng)
+        self.scan_items = self._scan_items(rng, round(BASE_SCAN_ITEMS * scale))
+        self.awards_by_cfda = self._awards(rng, round(BASE_AWARDS * scale))
+        self.bills = self._bills(rng, round(BASE_BILLS * scale))
+        self.hazard_profiles = {t["tribe_id"]: self._hazard_profile(rng, t) for t in self.tribes}
+
+    def sizes(self) -> dict[str, int]:
+        """Record counts, for benchmark result metadata."""
+        return {
+            "tribes": len(self.tribes),
+            "programs": len(self.programs),
+            "scan_items": len(self.scan_items),
+            "awards": sum(len(v) for v in self.awards_by_cfda.values()),
+            "bills": len(self.bills),
+            "cosponsors": sum(len(b["cosponsors"]) for b in self.bills),
+        }
+
+    # -- Generators -----------------------------------------------------------
+
+    @staticmethod
+    def _programs(base: list[dict], count: int) -> list[dict]:
+        programs = []
+        for i in range(count):
+            prog = dict(base[i % len(base)])
+            copy = i // len(base)
+            if copy:
+                prog["id"] = f"{prog['id']}_{copy}"
+                prog["name"] = f"{prog['name']} ({copy})"
+            programs.append(prog)
+        return programs
+
+    @staticmethod
+    def _tribes(rng: random.Random, count: int) -> list[dict]:
+        weights = [_STATE_WEIGHTS.get(s, 1) for s in STATES]
+        tribes = []
+        used: set[str] = set()
+        for i in range(count):
+            while True:
+                place = f"{rng.choice(_NAME_PREFIXES)} {rng.choice(_NAME_PARTS)}"
+                name = rng.choice(_NAME_FORMS).format(place)
+                if name not in used:
+                    break
+                name = f"{name} {i}"
+                if name not in used:
+                    break
+            used.add(name)
+            states = [rng.choices(STATES, weights)[0]]
+            if rng.random() < 0.1:
+                states.append(rng.choice(STATES))
+            tribes.append({
+                "tribe_id": f"epa_{100000001 + i}",
+                "bia_code": str(100 + i),
+                "name": name,
+                "states": sorted(set(states)),
+                "alternate_names": [f"{name} of {states[0]}"],
+                "epa_region": str(1 + i % 10),
+                "bia_recognized": True,
+            })
+        return tribes
+
+    def _congress(self, rng: random.Random) -> tuple[dict, dict]:
+        members: dict[str, dict] = {}
+        by_state: dict[str, dict[str, list[str]]] = {}
+        for s_idx, state in enumerate(STATES):
+            senators = []
+            for seat in range(2):
+                bid = f"S{s_idx:02d}{seat}"
+                party = rng.choice("DR")
+                members[bid] = {
+                    "bioguide_id": bid, "name": f"Senator{bid}, Pat", "state": state,
+                    "district": None, "party_abbr": party, "chamber": "Senate",
+                    "formatted_name": f"Sen. Pat Senator{bid} ({party}-{state})",
+                    "committees": self._committees(rng, "senate"),
+                }
+                senators.append(bid)
+            reps = []
+            for district in range(1, 1 + max(1, _STATE_WEIGHTS.get(state, 1) // 4 + 1)):
+                bid = f"H{s_idx:02d}{district:02d}"
+                party = rng.choice("DR")
+                members[bid] = {
+                    "bioguide_id": bid, "name": f"Rep{bid}, Sam", "state": state,
+                    "district": district, "party_abbr": party, "chamber": "House",
+                    "formatted_name": f"Rep. Sam Rep{bid} ({party}-{state}-{district:02d})",
+                    "committees": self._committees(rng, "house"),
+                }
+                reps.append(bid)
+            by_state[state] = {"senators": senators, "representatives": reps}
+
+        delegations = {}
+        for tribe in self.tribes:
+            senators, reps, districts = [], [], []
+            for state in tribe["states"]:
+                senators += [members[b] for b in by_state[state]["senators"]]
+                rep = rng.choice(by_state[state]["representatives"])
+                reps.append(members[rep])
+                districts.append({
+                    "district": f"{state}-{members[rep]['district']:02d}", "state": state,
+                    "aiannh_name": tribe["name"], "overlap_pct": 100.0,
+                })
+            delegations[tribe["tribe_id"]] = {
+                "tribe_id": tribe["tribe_id"], "districts": districts,
+                "states": tribe["states"], "senators": senators, "representatives": reps,
+            }
+        return members, delegations
+
+    @staticmethod
+    def _committees(rng: random.Random, chamber: str) -> list[dict]:
+        prefix = "SS" if chamber == "senate" else "HS"
+        names = ["Appropriations", "Indian Affairs", "Natural Resources", "Energy", "Homeland Security"]
+        picks = rng.sample(range(len(names)), k=rng.randint(1, 3))
+        return [
+            {"committee_id": f"{prefix}{k:02d}", "committee_name": f"Committee on {names[k]}",
+             "role": "member", "title": "", "rank": rng.randint(1, 20)}
+            for k in picks
+        ]
+
+    def _scan_items(self, rng: random.Random, count: int) -> list[dict]:
+        tribal = self.config.get("tribal_keywords", []) or ["tribal"]
+        action = self.config.get("action_keywords", []) or ["appropriations"]
+        items = []
+        for i in range(count):
+            source, authority = _SOURCES[i % len(_SOURCES)]
+            words = rng.choices(_FILLER, k=rng.randint(20, 60))
+            for prog in rng.sample(self.programs, k=rng.randint(0, 2)):
+                words.append(rng.choice(prog["keywords"]))
+            words += rng.sample(tribal, k=min(len(tribal), rng.randint(0, 3)))
+            words += rng.sample(action, k=min(len(action), rng.randint(0, 2)))
+            for phrases, p in ((_AUTHORITY_PHRASES, 0.3), (_BARRIER_PHRASES, 0.2), (_FUNDING_PHRASES, 0.25)):
+                if rng.random() < p:
+                    words.append(rng.choice(phrases))
+            rng.shuffle(words)
+            published = self.today - timedelta(days=rng.randint(0, 60))
+            item = {
+                "source": source,
+                "source_id": f"{source}-{i:07d}",
+                "title": " ".join(words[:12]).capitalize(),
+                "abstract": " ".join(words[12:]),
+                "published_date": published.isoformat(),
+                "authority_weight": authority,
+                "document_subtype": rng.choice(_SUBTYPES),
+                "url": f"https://example.invalid/{source}/{i}",
+            }
+            if source == "usaspending":
+                prog = rng.choice(self.programs)
+                item.update({
+                    "award_amount": round(rng.uniform(5e4, 5e6), 2),
+                    "recipient": rng.choice(self.tribes)["name"],
+                    "cfda": prog.get("cfda", ""),
+                })
+            if source == "grants_gov" and rng.random() < 0.3:
+                item.update({"tribal_eligible": True, "tribal_eligibility_override": True})
+            items.append(item)
+        return items
+
+    def _awards(self, rng: random.Random, count: int) -> dict[str, list[dict]]:
+        cfdas = sorted({p["cfda"] for p in self.programs if p.get("cfda")}) or ["15.156"]
+        by_cfda: dict[str, list[dict]] = {c: [] for c in cfdas}
+        for i in range(count):
+            tribe = rng.choice(self.tribes)
+            roll = rng.random()
+            if roll < 0.5:
+                recipient = tribe["name"].upper()
+            elif roll < 0.8:
+                recipient = f"THE {tribe['name'].upper().replace(' OF ', ' ')}, {tribe['states'][0]}"
+            elif roll < 0.9:
+                recipient = f"INTER TRIBAL COUNCIL OF {rng.choice(STATES)}"
+            else:
+                recipient = f"{rng.choice(_NAME_PREFIXES).upper()} COUNTY WATER DISTRICT"
+            fy = self.today.year - rng.randint(0, 4)
+            by_cfda[rng.choice(cfdas)].append({
+                "Award ID": f"AWD-{i:08d}",
+                "Recipient Name": recipient,
+                "Total Obligation": round(rng.uniform(1e4, 3e6), 2),
+                "Start Date": f"{fy}-{rng.randint(1, 12):02d}-15",
+                "End Date": f"{fy + 1}-09-30",
+                "Description": "Synthetic award",
+                "Awarding Agency": "Department of the Interior",
+            })
+        return by_cfda
+
+    def _bills(self, rng: random.Random, count: int) -> list[dict]:
+        member_ids = sorted(self.members)
+        program_ids = [p["id"] for p in self.programs]
+        bills = []
+        for i in range(count):
+            sponsor = self.members[rng.choice(member_ids)]
+            cosponsors = [
+                self.members[b] for b in rng.sample(member_ids, k=min(len(member_ids), rng.randint(0, 40)))
+            ]
+            chamber = "S" if sponsor["chamber"] == "Senate" else "HR"
+            bills.append({
+                "bill_id": f"{chamber.lower()}{1000 + i}",
+                "bill_type": chamber,
+                "bill_number": str(1000 + i),
+                "title": f"Tribal Resilience Act {i}",
+                "relevance_score": round(rng.uniform(0.1, 1.0), 2),
+                "matched_programs": rng.sample(program_ids, k=min(len(program_ids), rng.randint(0, 3))),
+                "subjects": ["Native Americans", "Climate change"][: rng.randint(1, 2)],
+                "committees": [{"name": "Committee on Indian Affairs"}],
+                "sponsor": {
+                    "name": sponsor["formatted_name"], "bioguide_id": sponsor["bioguide_id"],
+                    "party": sponsor["party_abbr"], "state": sponsor["state"],
+                },
+                "cosponsors": [
+                    {"name": m["formatted_name"], "bioguide_id": m["bioguide_id"],
+                     "party": m["party_abbr"], "state": m["state"]}
+                    for m in cosponsors
+                ],
+                "cosponsor_count": len(cosponsors),
+                "latest_action": {
+                    "date": f"{self.today.isoformat()}T00:00:00Z",
+                    "text": "Referred to committee",
+                },
+            })
+        return bills
+
+    @staticmethod
+    def _hazard_profile(rng: random.Random, tribe: dict) -> dict:
+        hazards = rng.sample(_HAZARDS, k=5)
+        scores = sorted((round(rng.uniform(5, 99), 2) for _ in hazards), reverse=True)
+        return {
+            "tribe_id": tribe["tribe_id"],
+            "tribe_name": tribe["name"],
+            "sources": {"fema_nri": {
+                "version": "synthetic",
+                "counties_analyzed": rng.randint(1, 20),
+                "composite": {
+                    "risk_score": round(rng.uniform(10, 99), 2),
+                    "risk_rating": "Relatively High",
+                    "eal_total": round(rng.uniform(1e5, 5e8), 2),
+                },
+                "top_hazards": [
+                    {"type": name, "code": code, "risk_score": score,
+                     "risk_rating": "Relatively High", "eal_total": round(score * 1e5, 2)}
+                    for (name, code), score in zip(hazards, scores)
+                ],
+            }},
+        }
+
+    # -- Files ----------------------------------------------------------------
+
+    def award_records(self) -> list[dict]:
+        """Award cache store records for every Tribe (a few awards each)."""
+        rng = random.Random(self.seed + 1)
+        records = []
+        for tribe in self.tribes:
+            awards = [
+                {"award_id": f"{tribe['tribe_id']}-{k}", "cfda": p.get("cfda", ""),
+                 "program_id": p["id"], "obligation": round(rng.uniform(1e4, 2e6), 2),
+                 "start_date": f"{self.today.year - 1}-03-01"}
+                for k, p in enumerate(rng.sample(self.programs, k=min(3, len(self.programs))))
+            ]
+            records.append({
+                "tribe_id": tribe["tribe_id"], "tribe_name": tribe["name"], "awards": awards,
+                "total_obligation": sum(a["obligation"] for a in awards),
+                "award_count": len(awards),
+            })
+        return records
+
+    def write(self, root: Path, tribes: list[dict] | None = None) -> WorldFiles:
+        """Write the file-backed inputs under ``root``.
+
+        Args:
+            root: Output directory (created if needed).
+            tribes: Registry subset to write (default: every Tribe).
+        """
+        tribes = self.tribes if tribes is None else tribes
+        files = WorldFiles(
+            root=root,
+            registry=root / "tribal_registry.json",
+            aliases=root / "tribal_aliases.json",
+            congressional_cache=root / "congressional_cache.json",
+            congressional_intel=root / "congressional_intel.json",
+            award_cache_dir=root / "award_cache",
+            hazard_dir=root / "hazard_profiles",
+        )
+        ids = {t["tribe_id"] for t in tribes}
+        _write_json(files.registry, {
+            "metadata": {"total_tribes": len(tribes), "placeholder": False},
+            "tribes": tribes,
+        })
+        _write_json(files.aliases, {"aliases": {t["name"].lower(): t["tribe_id"] for t in tribes}})
+        _write_json(files.congressional_cache, {
+            "metadata": {"congress_session": "119", "total_members": len(self.members),
+                         "total_tribes_mapped": len(ids), "placeholder": False},
+            "members": self.members,
+            "committees": {},
+            "delegations": {k: v for k, v in self.delegations.items() if k in ids},
+        })
+        _write_json(files.congressional_intel, {
+            "metadata": {"congress": 119, "session": 1, "total_bills": len(self.bills),
+                         "built_at": f"{self.today.isoformat()}T00:00:00+00:00"},
+            "bills": self.bills,
+        })
+        AwardCacheStore(files.award_cache_dir).write_all(
+            r for r in self.award_records() if r["tribe_id"] in ids
+        )
+        for tid in sorted(ids):
+            _write_json(files.hazard_dir / f"{tid}.json", self.hazard_profiles[tid])
+        return files
+
+    def packet_config(self, files: WorldFiles) -> dict:
+        """PacketOrchestrator config reading the files from ``write``."""
+        out = files.root / "packets"
+        return {
+            "packets": {
+                "tribal_registry": {"data_path": str(files.registry)},
+                "congressional_cache": {"data_path": str(files.congressional_cache)},
+                "output_dir": str(out),
+                "state_dir": str(files.root / "packet_state"),
+                "awards": {
+                    "alias_path": str(files.aliases),
+                    "cache_dir": str(files.award_cache_dir),
+                },
+                "hazards": {"cache_dir": str(files.hazard_dir)},
+                "docx": {"enabled": True, "output_dir": str(out)},
+            },
+        }
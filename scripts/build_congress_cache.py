@@ -40,6 +40,7 @@ from src.paths import (
     CONGRESSIONAL_CACHE_PATH,
     TRIBAL_REGISTRY_PATH,
 )
+from src.scrapers.http_pool import HOST_GOVERNOR, shared_session
 
 logger = logging.getLogger("tcr_scanner.build_congress_cache")
 
@@ -64,6 +65,7 @@ COMMITTEES_METADATA_URL = (
 
 CONGRESS_API_BASE = "https://api.congress.gov/v3"
 CONGRESS_SESSION = "119"
+CONGRESS_REQUESTS_PER_SECOND = 3
 
 # CLASSFP codes for federally recognized tribal areas
 FEDERAL_CLASSFP = {"D1", "D2", "D3", "D5", "D8", "D6", "E1"}
@@ -608,6 +610,7 @@ async def fetch_119th_members(
     headers = {"X-Api-Key": api_key}
     all_members: dict[str, dict] = {}
     offset = 0
+    HOST_GOVERNOR.register(CONGRESS_API_BASE, CONGRESS_REQUESTS_PER_SECOND)
 
     while True:
         url = (
@@ -616,6 +619,7 @@ async def fetch_119th_members(
         )
         logger.info("Fetching members: offset=%d", offset)
 
+        await HOST_GOVERNOR.acquire(url)
         try:
             async with session.get(
                 url,
@@ -627,7 +631,7 @@ async def fetch_119th_members(
                     raise RuntimeError("Invalid CONGRESS_API_KEY")
                 if resp.status == 429:
                     logger.warning("Rate limited (429). Waiting 60s...")
-                    await asyncio.sleep(60)
+                    HOST_GOVERNOR.defer(url, 60)
                     continue
                 resp.raise_for_status()
                 data = await resp.json()
@@ -700,7 +704,6 @@ async def fetch_119th_members(
             break
 
         offset += 250
-        await asyncio.sleep(0.3)
 
     logger.info("Total members fetched: %d", len(all_members))
     return all_members
@@ -1119,7 +1122,7 @@ async def main() -> None:
         logger.info("Falling back to --skip-api mode.")
         args.skip_api = True
 
-    async with aiohttp.ClientSession() as session:
+    async with shared_session() as session:
         # Step 0: Download Census file
         try:
             census_path = await download_census_file(session)
@@ -1185,6 +1188,7 @@ async def main() -> None:
             census_only=args.skip_api,
         )
 
+    HOST_GOVERNOR.log_summary()
     logger.info("Congressional cache build complete.")
 
 
@@ -36,6 +36,7 @@ if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
 from src.paths import (
+    BILL_DETAIL_CACHE_PATH,
     CONGRESSIONAL_INTEL_PATH,
     PROGRAM_INVENTORY_PATH,
     SCANNER_CONFIG_PATH,
@@ -400,7 +401,6 @@ async def build_congressional_intel(
     congress = intel_config.get("congress", 119)
     relevance_threshold = intel_config.get("relevance_threshold", 0.30)
     max_bills_detail = max_bills or intel_config.get("max_bills_detail", 50)
-    detail_delay = intel_config.get("detail_delay_seconds", 0.3)
     bill_types = intel_config.get("bill_types", ["hr", "s", "hjres", "sjres"])
     out_path = output_path or Path(
         intel_config.get("data_path", "data/congressional_intel.json")
@@ -482,85 +482,94 @@ async def build_congressional_intel(
     skipped = 0
     errors = 0
 
+    to_fetch: list[tuple[dict, tuple[int, str, str]]] = []
+    for _, item in top_items:
+        bill_type = item.get("bill_type", "").lower()
+        bill_number = str(item.get("bill_number", ""))
+        item_congress = item.get("congress", congress)
+
+        if not bill_type or not bill_number:
+            logger.warning(
+                "Skipping item with missing bill_type/number: %s",
+                item.get("source_id", "?"),
+            )
+            skipped += 1
+            continue
+
+        # Only fetch detail for configured bill types
+        if bill_type not in bill_types:
+            skipped += 1
+            continue
+
+        to_fetch.append((item, (item_congress, bill_type, bill_number)))
+
+    # Hydrate all candidates concurrently; unchanged bills reuse cached
+    # sub-resources from earlier builds. The saved cache keeps only this
+    # build's bills, so it does not grow as bills leave the top-N.
+    cached_bills = scraper.load_detail_cache(BILL_DETAIL_CACHE_PATH)
+    logger.info(
+        "Hydrating %d bills (%d in detail cache)", len(to_fetch), cached_bills,
+    )
+    bill_keys = [key for _, key in to_fetch]
     async with scraper._create_session() as session:
-        for idx, (initial_score, item) in enumerate(top_items):
-            bill_type = item.get("bill_type", "").lower()
-            bill_number = str(item.get("bill_number", ""))
-            item_congress = item.get("congress", congress)
-
-            if not bill_type or not bill_number:
-                logger.warning(
-                    "Skipping item with missing bill_type/number: %s",
-                    item.get("source_id", "?"),
-                )
-                skipped += 1
-                continue
-
-            # Only fetch detail for configured bill types
-            if bill_type not in bill_types:
-                skipped += 1
-                continue
-
-            try:
-                detail = await scraper._fetch_bill_detail(
-                    session, item_congress, bill_type, bill_number,
-                )
-            except Exception:
-                logger.warning(
-                    "Failed to fetch detail for %s-%s-%s",
-                    item_congress, bill_type, bill_number,
-                )
-                errors += 1
-                continue
-
-            # Compute full relevance score with detail data
-            full_score, matched = score_bill_relevance(
-                {
-                    "title": detail.get("bill", {}).get("title", item.get("title", "")),
-                    "subjects": detail.get("subjects", []),
-                    "committees": detail.get("bill", {}).get("committees", {}).get("item", []),
-                },
-                program_keywords,
-                cfda_to_program,
-                tribal_keywords,
+        details = await scraper.fetch_bill_details(session, bill_keys)
+    scraper.save_detail_cache(BILL_DETAIL_CACHE_PATH, keep=bill_keys)
+
+    for idx, ((item, key), detail) in enumerate(zip(to_fetch, details)):
+        item_congress, bill_type, bill_number = key
+
+        if isinstance(detail, Exception):
+            logger.warning(
+                "Failed to fetch detail for %s-%s-%s",
+                item_congress, bill_type, bill_number,
             )
+            errors += 1
+            continue
+
+        # Compute full relevance score with detail data
+        full_score, matched = score_bill_relevance(
+            {
+                "title": detail.get("bill", {}).get("title", item.get("title", "")),
+                "subjects": detail.get("subjects", []),
+                "committees": detail.get("bill", {}).get("committees", {}).get("item", []),
+            },
+            program_keywords,
+            cfda_to_program,
+            tribal_keywords,
+        )
+
+        # Apply threshold
+        if full_score < relevance_threshold:
+            skipped += 1
+            continue
+
+        # Transform to BillIntelligence format
+        try:
+            bill_dict = transform_to_bill_intel(
+                detail,
+                item_congress,
+                bill_type,
+                bill_number,
+                full_score,
+                matched,
+            )
+
+            # Validate with Pydantic model
+            validated = BillIntelligence(**bill_dict)
+            validated_bills.append(validated.model_dump())
 
-            # Apply threshold
-            if full_score < relevance_threshold:
-                skipped += 1
-                continue
-
-            # Transform to BillIntelligence format
-            try:
-                bill_dict = transform_to_bill_intel(
-                    detail,
-                    item_congress,
-                    bill_type,
-                    bill_number,
-                    full_score,
-                    matched,
-                )
-
-                # Validate with Pydantic model
-                validated = BillIntelligence(**bill_dict)
-                validated_bills.append(validated.model_dump())
-
-            except Exception as exc:
-                logger.warning(
-                    "Validation failed for %s-%s-%s: %s",
-                    item_congress, bill_type, bill_number, exc,
-                )
-                errors += 1
-
-            # Rate limiting between detail fetches
-            if idx < len(top_items) - 1:
-                await asyncio.sleep(detail_delay)
-
-            if (idx + 1) % 10 == 0:
-                logger.info(
-                    "Progress: %d/%d fetched, %d validated",
-                    idx + 1, len(top_items), len(validated_bills),
-                )
+        except Exception as exc:
+            logger.warning(
+                "Validation failed for %s-%s-%s: %s",
+                item_congress, bill_type, bill_number, exc,
+            )
+            errors += 1
+
+        if (idx + 1) % 10 == 0:
+            logger.info(
+                "Progress: %d/%d processed, %d validated",
+                idx + 1, len(to_fetch), len(validated_bills),
+            )
 
     # Sort by relevance score descending
     validated_bills.sort(key=lambda b: b.get("relevance_score", 0), reverse=True)
@@ -27,6 +27,7 @@ if str(_PROJECT_ROOT) not in sys.path:
 import aiohttp
 
 from src.paths import TRIBAL_REGISTRY_PATH
+from src.scrapers.http_pool import shared_session
 
 logger = logging.getLogger("tcr_scanner.build_registry")
 
@@ -373,7 +374,7 @@ async def main() -> None:
     logger.info("Output path: %s", output_path)
 
     try:
-        async with aiohttp.ClientSession() as session:
+        async with shared_session() as session:
             raw_records = await fetch_tribes(session)
 
         # Transform records
@@ -22,6 +22,7 @@ _PROJECT_ROOT = _SCRIPT_DIR.parent
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
+from src.packets.award_store import AwardCacheStore  # noqa: E402
 from src.paths import (  # noqa: E402
     AWARD_CACHE_DIR,
     CONGRESSIONAL_CACHE_PATH,
@@ -38,10 +39,10 @@ from src.paths import (  # noqa: E402
 
 
 def analyze_awards(award_dir: Path) -> dict:
-    """Analyze award cache files for coverage.
+    """Analyze award cache records for coverage.
 
     Args:
-        award_dir: Directory containing per-Tribe award JSON files.
+        award_dir: Award cache directory (store or per-Tribe JSON files).
 
     Returns:
         Dict with total, populated, zero_ids, coverage_pct.
@@ -58,20 +59,18 @@ def analyze_awards(award_dir: Path) -> dict:
             "coverage_pct": 0.0,
         }
 
-    for path in sorted(award_dir.glob("*.json")):
+    for tribe_id, data in AwardCacheStore(award_dir).items():
         total += 1
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            awards = data.get("awards", [])
-            total_obligation = data.get("total_obligation", 0) or 0
-            award_count = data.get("award_count", 0) or 0
-            if len(awards) > 0 or total_obligation > 0 or award_count > 0:
-                populated += 1
-            else:
-                zero_ids.append(path.stem)
-        except (json.JSONDecodeError, OSError):
-            zero_ids.append(path.stem)
+        if data is None:
+            zero_ids.append(tribe_id)
+            continue
+        awards = data.get("awards", [])
+        total_obligation = data.get("total_obligation", 0) or 0
+        award_count = data.get("award_count", 0) or 0
+        if len(awards) > 0 or total_obligation > 0 or award_count > 0:
+            populated += 1
+        else:
+            zero_ids.append(tribe_id)
 
     coverage_pct = (populated / total * 100) if total > 0 else 0.0
     return {
@@ -302,7 +301,7 @@ def analyze_cross_source(
     Determines which Tribes have all, partial, or no data.
 
     Args:
-        award_dir: Directory of per-Tribe award JSON files.
+        award_dir: Award cache directory (store or per-Tribe JSON files).
         hazard_dir: Directory of per-Tribe hazard profile JSON files.
         congressional_path: Path to congressional_cache.json.
 
@@ -311,17 +310,14 @@ def analyze_cross_source(
     """
     # Collect Tribe IDs with data in each source
     award_ids: set[str] = set()
-    if award_dir.is_dir():
-        for path in award_dir.glob("*.json"):
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                awards = data.get("awards", [])
-                total_obl = data.get("total_obligation", 0) or 0
-                if len(awards) > 0 or total_obl > 0:
-                    award_ids.add(path.stem)
-            except (json.JSONDecodeError, OSError):
-                pass
+    award_store = AwardCacheStore(award_dir)
+    for tribe_id, data in award_store.items():
+        if data is None:
+            continue
+        awards = data.get("awards", [])
+        total_obl = data.get("total_obligation", 0) or 0
+        if len(awards) > 0 or total_obl > 0:
+            award_ids.add(tribe_id)
 
     hazard_ids: set[str] = set()
     if hazard_dir.is_dir():
@@ -355,8 +351,7 @@ def analyze_cross_source(
 
     # All Tribe IDs across sources
     all_ids = set()
-    if award_dir.is_dir():
-        all_ids.update(p.stem for p in award_dir.glob("*.json"))
+    all_ids.update(award_store.tribe_ids())
     if hazard_dir.is_dir():
         all_ids.update(p.stem for p in hazard_dir.glob("*.json"))
     all_ids.update(delegation_ids)
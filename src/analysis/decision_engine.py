@@ -21,6 +21,8 @@ Exports:
 
 import logging
 
+from src.graph.adjacency import EdgeIndex
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -72,14 +74,8 @@ class DecisionEngine:
         Returns:
             Dict mapping each program_id to its classification dict.
         """
-        # Build edge index for O(1) lookups
-        self._edge_idx: dict[tuple, list] = {}
-        for e in graph_data.get("edges", []):
-            src, tgt, etype = e.get("source"), e.get("target"), e.get("type")
-            if src and etype:
-                self._edge_idx.setdefault((src, etype, "source"), []).append(e)
-            if tgt and etype:
-                self._edge_idx.setdefault((tgt, etype, "target"), []).append(e)
+        # Adjacency index shipped with the graph (built if absent)
+        self._edge_index = EdgeIndex.for_graph(graph_data)
 
         results: dict[str, dict] = {}
         for pid, program in self.programs.items():
@@ -303,11 +299,13 @@ class DecisionEngine:
     # -- Helper methods -----------------------------------------------------
 
     def _get_edges(self, program_id: str, edge_type: str, direction: str = "any") -> list[dict]:
-        """Get edges for a program using the pre-built index."""
-        if direction == "any":
-            return (self._edge_idx.get((program_id, edge_type, "source"), [])
-                    + self._edge_idx.get((program_id, edge_type, "target"), []))
-        return self._edge_idx.get((program_id, edge_type, direction), [])
+        """Get edges for a program from the graph's adjacency index."""
+        index = self._edge_index
+        if direction == "source":
+            return index.out_edges(program_id, edge_type)
+        if direction == "target":
+            return index.in_edges(program_id, edge_type)
+        return index.out_edges(program_id, edge_type) + index.in_edges(program_id, edge_type)
 
     def _has_discretionary_funding(
         self, pid: str, program: dict, graph_data: dict
@@ -8,13 +8,21 @@ Enhanced with:
 - Tribal eligibility override: Grants.gov items with Tribal government
   eligibility codes are force-included above threshold
 - ICR/guidance document subtype detection for bureaucratic friction signals
+
+All keyword lists (program keywords, scanner trigger keywords, Tribal and
+action keywords) are compiled once into a single KeywordMatcher, so each
+item's text is scanned in one pass regardless of how many keywords exist.
 """
 
 import logging
+from collections import Counter
+from collections.abc import Hashable
 from datetime import datetime, timezone
 
 from dateutil import parser as dateparser
 
+from src.text_matching import KeywordMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +38,19 @@ class RelevanceScorer:
         self.programs = programs
         self.eligibility_override = config["scoring"].get("tribal_eligibility_override", True)
 
+        groups: dict[Hashable, list[str]] = {
+            "tribal": self.tribal_keywords,
+            "action": self.action_keywords,
+        }
+        for idx, program in enumerate(programs):
+            groups[("program", idx)] = [
+                kw.lower()
+                for kw in program["keywords"] + program.get("scanner_trigger_keywords", [])
+            ]
+        self._matcher = KeywordMatcher(groups)
+        # published_date strings repeat heavily across items; parse each once
+        self._date_cache: dict[str, datetime] = {}
+
     def score_items(self, items: list[dict]) -> list[dict]:
         """Score all items and return those above the relevance threshold."""
         scored = []
@@ -45,12 +66,13 @@ class RelevanceScorer:
     def _score_item(self, item: dict) -> dict:
         """Compute the composite relevance score for a single item."""
         text = f"{item.get('title', '')} {item.get('abstract', '')}".lower()
+        hits = self._matcher.count(text)
 
-        program_score, matched_programs = self._program_match(text, item)
-        keyword_score = self._tribal_keyword_density(text)
+        program_score, matched_programs = self._program_match(text, item, hits)
+        keyword_score = self._tribal_keyword_density(text, hits)
         recency_score = self._recency(item.get("published_date", ""))
         authority_score = item.get("authority_weight", 0.5)
-        action_score = self._action_relevance(text)
+        action_score = self._action_relevance(text, hits)
 
         w = self.weights
         composite = (
@@ -101,8 +123,12 @@ class RelevanceScorer:
         })
         return item_scored
 
-    def _program_match(self, text: str, item: dict | None = None) -> tuple[float, list[dict]]:
+    def _program_match(
+        self, text: str, item: dict | None = None, hits: Counter | None = None,
+    ) -> tuple[float, list[dict]]:
         """Score based on matches to tracked program keywords and CFDA lookups."""
+        if hits is None:
+            hits = self._matcher.count(text)
         matched = []
         total_hits = 0
 
@@ -115,29 +141,28 @@ class RelevanceScorer:
                     total_hits += 3  # CFDA match = strong signal
                     break
 
-        for program in self.programs:
+        for idx, program in enumerate(self.programs):
             if program in matched:
                 continue
-            hits = sum(1 for kw in program["keywords"] if kw.lower() in text)
-            # Also check scanner_trigger_keywords if present
-            trigger_kws = program.get("scanner_trigger_keywords", [])
-            hits += sum(1 for kw in trigger_kws if kw.lower() in text)
-            if hits > 0:
+            # keywords + scanner_trigger_keywords, counted by the matcher
+            program_hits = hits[("program", idx)]
+            if program_hits > 0:
                 matched.append(program)
-                total_hits += hits
+                total_hits += program_hits
 
         if not matched:
             return 0.0, []
         # Normalize: 1 hit = 0.5, 3+ hits = 1.0
         return min(1.0, 0.3 + total_hits * 0.233), matched
 
-    def _tribal_keyword_density(self, text: str) -> float:
+    def _tribal_keyword_density(self, text: str, hits: Counter | None = None) -> float:
         """Score based on concentration of Tribal-relevant terms."""
         words = text.split()
         if not words:
             return 0.0
-        hits = sum(1 for kw in self.tribal_keywords if kw in text)
-        density = hits / max(len(words), 1)
+        if hits is None:
+            hits = self._matcher.count(text)
+        density = hits["tribal"] / max(len(words), 1)
         # Normalize: map density to 0-1 score (cap at 10% density = 1.0)
         return min(1.0, density * 10)
 
@@ -146,10 +171,13 @@ class RelevanceScorer:
         if not date_str:
             return 0.3  # default for missing dates
         try:
-            pub_date = dateparser.parse(date_str)
+            pub_date = self._date_cache.get(date_str)
+            if pub_date is None:
+                pub_date = dateparser.parse(date_str)
+                if pub_date.tzinfo is None:
+                    pub_date = pub_date.replace(tzinfo=timezone.utc)
+                self._date_cache[date_str] = pub_date
             now = datetime.now(timezone.utc)
-            if pub_date.tzinfo is None:
-                pub_date = pub_date.replace(tzinfo=timezone.utc)
             days_old = (now - pub_date).days
             if days_old <= 1:
                 return 1.0
@@ -166,9 +194,11 @@ class RelevanceScorer:
         except (ValueError, TypeError):
             return 0.3
 
-    def _action_relevance(self, text: str) -> float:
+    def _action_relevance(self, text: str, hits: Counter | None = None) -> float:
         """Score based on presence of actionable policy signals."""
-        hits = sum(1 for kw in self.action_keywords if kw in text)
-        if hits == 0:
+        if hits is None:
+            hits = self._matcher.count(text)
+        action_hits = hits["action"]
+        if action_hits == 0:
             return 0.0
-        return min(1.0, hits * 0.25)
+        return min(1.0, action_hits * 0.25)
@@ -0,0 +1,169 @@
+"""Per-source high-water marks for incremental scans.
+
+A full scan refetches every source's whole ``scan_window_days`` window and
+re-scores everything it gets back. With ``--incremental``, each source that
+supports it (``BaseScraper.supports_incremental``) is asked only for records
+published/updated on or after its high-water mark. The mark is the latest
+``published_date`` seen so far, plus a ``source_id -> published_date`` map of
+records already ingested, which removes the overlap on the boundary day.
+Only records that are new, or whose date moved (e.g. a Congress.gov bill
+with a fresh ``updateDate``), are scored and merged into the stored set.
+
+Removals and recency-score decay are reconciled by the next full scan,
+which also rewrites the marks.
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from dateutil import parser as dateparser
+
+from src.paths import SCAN_STATE_PATH
+
+logger = logging.getLogger(__name__)
+
+
+def _item_key(item: dict) -> str:
+    """Cross-source identity key (matches ChangeDetector._item_key)."""
+    return f"{item.get('source', '')}:{item.get('source_id', '')}"
+
+
+def _parse_date(date_str: str) -> datetime | None:
+    """Parse a scraper ``published_date`` into an aware UTC datetime."""
+    if not date_str:
+        return None
+    try:
+        parsed = dateparser.parse(str(date_str))
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class HighWaterMarks:
+    """Loads, filters against, advances, and persists per-source marks.
+
+    Args:
+        state_path: JSON state file. Defaults to ``SCAN_STATE_PATH``.
+        scan_window_days: Seen-ID entries older than this are pruned on
+            save, keeping the state file bounded by the scan window.
+    """
+
+    def __init__(self, state_path: Path | None = None, scan_window_days: int = 14):
+        self.state_path = state_path or SCAN_STATE_PATH
+        self.scan_window_days = scan_window_days
+        self._sources: dict[str, dict] = self._load()
+
+    def _load(self) -> dict[str, dict]:
+        if not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data.get("sources", {})
+        except (json.JSONDecodeError, IOError, AttributeError):
+            logger.warning("Scan state at %s is corrupt, starting fresh", self.state_path)
+            return {}
+
+    def reset(self) -> None:
+        """Forget all marks so the next scan of every source is a full one."""
+        self._sources = {}
+
+    def since(self, source: str) -> datetime | None:
+        """Return the high-water date for ``source``, or None if unknown."""
+        entry = self._sources.get(source)
+        if not entry:
+            return None
+        return _parse_date(entry.get("high_water", ""))
+
+    def filter_unchanged(self, source: str, items: list[dict]) -> list[dict]:
+        """Drop items already ingested with the same ``published_date``."""
+        seen = self._sources.get(source, {}).get("seen", {})
+        if not seen:
+            return list(items)
+        fresh = [
+            item for item in items
+            if seen.get(str(item.get("source_id", ""))) != item.get("published_date", "")
+        ]
+        logger.info(
+            "%s: %d fetched, %d new or updated since high-water mark",
+            source, len(items), len(fresh),
+        )
+        return fresh
+
+    def advance(self, source: str, items: list[dict]) -> None:
+        """Record ``items`` as ingested and move the mark forward.
+
+        The mark never moves backwards and never past today (Grants.gov
+        forecasts can carry future open dates).
+        """
+        entry = self._sources.setdefault(source, {"high_water": ""})
+        seen = entry.setdefault("seen", {})
+        today = datetime.now(timezone.utc)
+        latest = _parse_date(entry.get("high_water", ""))
+        for item in items:
+            published = item.get("published_date", "")
+            seen[str(item.get("source_id", ""))] = published
+            parsed = _parse_date(published)
+            if parsed is not None and parsed <= today and (latest is None or parsed > latest):
+                latest = parsed
+        if latest is not None:
+            entry["high_water"] = latest.strftime("%Y-%m-%d")
+        entry["updated_at"] = today.isoformat()
+
+    def rebuild(self, source: str, items: list[dict]) -> None:
+        """Replace the mark for ``source`` with one derived from a full scan."""
+        self._sources.pop(source, None)
+        self.advance(source, items)
+
+    def _prune(self) -> None:
+        """Drop seen entries dated before the scan window."""
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.scan_window_days)
+        for entry in self._sources.values():
+            seen = entry.get("seen", {})
+            for source_id, published in list(seen.items()):
+                parsed = _parse_date(published)
+                if parsed is not None and parsed < cutoff:
+                    del seen[source_id]
+
+    def save(self) -> None:
+        """Persist marks with an atomic write."""
+        self._prune()
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"sources": self._sources}, f, indent=2)
+        tmp_path.replace(self.state_path)
+        logger.info("Saved scan high-water marks to %s", self.state_path)
+
+
+def merge_scored(
+    previous: list[dict],
+    fresh_items: list[dict],
+    fresh_scored: list[dict],
+    replaced_sources: set[str],
+) -> list[dict]:
+    """Merge newly scored items into the stored scored set.
+
+    Args:
+        previous: Stored scored set (``LATEST-RESULTS.json``).
+        fresh_items: Every raw item ingested this run, including those
+            that scored below threshold; their stored copies are replaced.
+        fresh_scored: The subset of ``fresh_items`` above threshold.
+        replaced_sources: Sources that were fully re-fetched this run
+            (non-incremental scrapers); all of their stored items are dropped.
+
+    Returns:
+        Merged scored set, sorted by relevance score descending.
+    """
+    fresh_keys = {_item_key(item) for item in fresh_items}
+    kept = [
+        item for item in previous
+        if item.get("source") not in replaced_sources and _item_key(item) not in fresh_keys
+    ]
+    merged = kept + list(fresh_scored)
+    merged.sort(key=lambda x: x.get("relevance_score", 0), reverse=True)
+    return merged
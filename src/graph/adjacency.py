@@ -0,0 +1,128 @@
+"""Adjacency index over knowledge graph edges.
+
+Maps ``(node_id, edge_type)`` to the positions of matching edges in the
+graph's edge list, in both directions, so "which barriers block this
+program" or "which programs does this ask advance" cost O(degree)
+instead of a scan over every edge.
+
+KnowledgeGraph maintains one as edges are added and ships it with
+``to_dict()`` under ``"adjacency"``::
+
+    "adjacency": {
+        "edge_count": 3,
+        "out": {"bia_tcr": {"BLOCKED_BY": [0, 2]}},
+        "in":  {"bar_cost_share": {"BLOCKED_BY": [0]}}
+    }
+
+Consumers of the serialized graph call ``EdgeIndex.for_graph(graph_data)``.
+It reuses the shipped index, indexes any edges appended after
+serialization (e.g. THREATENS edges added by monitors), and builds
+from scratch for graph dicts that predate the index.
+"""
+
+from __future__ import annotations
+
+
+def _copy_postings(postings: dict[str, dict[str, list[int]]]) -> dict[str, dict[str, list[int]]]:
+    return {node_id: {t: list(p) for t, p in by_type.items()} for node_id, by_type in postings.items()}
+
+
+class EdgeIndex:
+    """Out/in edge positions keyed by node id, then edge type.
+
+    Args:
+        out: node_id -> edge_type -> positions of edges with that source.
+        in_: node_id -> edge_type -> positions of edges with that target.
+        edges: The serialized edge list the positions refer to, or None
+            when the owner resolves positions itself (KnowledgeGraph).
+    """
+
+    def __init__(
+        self,
+        out: dict[str, dict[str, list[int]]] | None = None,
+        in_: dict[str, dict[str, list[int]]] | None = None,
+        edges: list[dict] | None = None,
+        edge_count: int = 0,
+    ):
+        self.out = out if out is not None else {}
+        self.in_ = in_ if in_ is not None else {}
+        self.edges = edges
+        self.edge_count = edge_count
+
+    def add(self, source_id: str, target_id: str, edge_type: str) -> int:
+        """Index the next edge; returns its position."""
+        pos = self.edge_count
+        self.out.setdefault(source_id, {}).setdefault(edge_type, []).append(pos)
+        self.in_.setdefault(target_id, {}).setdefault(edge_type, []).append(pos)
+        self.edge_count += 1
+        return pos
+
+    def out_positions(self, node_id: str, edge_type: str) -> list[int]:
+        """Positions of ``edge_type`` edges leaving ``node_id``."""
+        return self.out.get(node_id, {}).get(edge_type, [])
+
+    def in_positions(self, node_id: str, edge_type: str) -> list[int]:
+        """Positions of ``edge_type`` edges entering ``node_id``."""
+        return self.in_.get(node_id, {}).get(edge_type, [])
+
+    def incident_positions(self, node_id: str) -> list[int]:
+        """Positions of every edge touching ``node_id``, in edge order."""
+        positions: set[int] = set()
+        for by_type in (self.out.get(node_id, {}), self.in_.get(node_id, {})):
+            for plist in by_type.values():
+                positions.update(plist)
+        return sorted(positions)
+
+    # -- Serialized-graph queries (require ``edges``) ------------------------
+
+    def out_edges(self, node_id: str, edge_type: str) -> list[dict]:
+        """Serialized ``edge_type`` edges leaving ``node_id``."""
+        return [self.edges[i] for i in self.out_positions(node_id, edge_type)]
+
+    def in_edges(self, node_id: str, edge_type: str) -> list[dict]:
+        """Serialized ``edge_type`` edges entering ``node_id``."""
+        return [self.edges[i] for i in self.in_positions(node_id, edge_type)]
+
+    def targets(self, node_id: str, edge_type: str) -> list[str]:
+        """Target ids of ``edge_type`` edges leaving ``node_id``."""
+        return [self.edges[i]["target"] for i in self.out_positions(node_id, edge_type)]
+
+    def sources(self, node_id: str, edge_type: str) -> list[str]:
+        """Source ids of ``edge_type`` edges entering ``node_id``."""
+        return [self.edges[i]["source"] for i in self.in_positions(node_id, edge_type)]
+
+    def to_dict(self, copy: bool = False) -> dict:
+        """Serializable form stored under graph_data["adjacency"].
+
+        Args:
+            copy: Return fresh posting lists instead of this index's own.
+                Needed when the dict leaves its owner: ``for_graph`` adopts
+                the lists as they are and appends to them.
+        """
+        if not copy:
+            return {"edge_count": self.edge_count, "out": self.out, "in": self.in_}
+        return {
+            "edge_count": self.edge_count,
+            "out": _copy_postings(self.out),
+            "in": _copy_postings(self.in_),
+        }
+
+    @classmethod
+    def for_graph(cls, graph_data: dict) -> "EdgeIndex":
+        """Index for a serialized graph dict.
+
+        Adopts ``graph_data["adjacency"]`` when present and extends it over
+        edges appended since it was written; otherwise builds one and
+        stores it back on ``graph_data`` for later consumers.
+        """
+        edges = graph_data.get("edges", [])
+        shipped = graph_data.get("adjacency")
+        if isinstance(shipped, dict) and shipped.get("edge_count", 0) <= len(edges):
+            index = cls(shipped["out"], shipped["in"], edges, shipped["edge_count"])
+        else:
+            index = cls(edges=edges)
+        for edge in edges[index.edge_count:]:
+            index.add(edge.get("source"), edge.get("target"), edge.get("type"))
+        if "edges" in graph_data:
+            graph_data["adjacency"] = index.to_dict()
+        return index
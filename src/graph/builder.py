@@ -16,6 +16,7 @@ from pathlib import Path
 
 from src.config import FISCAL_YEAR_SHORT
 from src.paths import GRAPH_SCHEMA_PATH
+from src.graph.adjacency import EdgeIndex
 from src.graph.schema import (
     ProgramNode, AuthorityNode, FundingVehicleNode,
     BarrierNode, AdvocacyLeverNode, ObligationNode, TrustSuperNode, Edge,
@@ -67,6 +68,7 @@ class KnowledgeGraph:
         self.edges: list[Edge] = []
         self._program_ids: set[str] = set()
         self._edge_keys: set[tuple[str, str, str]] = set()
+        self._index = EdgeIndex()
 
     def add_node(self, node) -> None:
         """Add a node (any schema type) to the graph."""
@@ -79,34 +81,40 @@ class KnowledgeGraph:
         """Add an edge to the graph."""
         self.edges.append(edge)
         self._edge_keys.add((edge.source_id, edge.target_id, edge.edge_type))
+        self._index.add(edge.source_id, edge.target_id, edge.edge_type)
 
     def has_edge(self, source_id: str, target_id: str, edge_type: str) -> bool:
         """Check if an edge already exists (O(1) lookup)."""
         return (source_id, target_id, edge_type) in self._edge_keys
 
+    def out_edges(self, node_id: str, edge_type: str) -> list[Edge]:
+        """Edges of ``edge_type`` leaving ``node_id`` (O(degree))."""
+        return [self.edges[i] for i in self._index.out_positions(node_id, edge_type)]
+
+    def in_edges(self, node_id: str, edge_type: str) -> list[Edge]:
+        """Edges of ``edge_type`` entering ``node_id`` (O(degree))."""
+        return [self.edges[i] for i in self._index.in_positions(node_id, edge_type)]
+
     def get_program_subgraph(self, program_id: str) -> dict:
         """Return all nodes and edges connected to a program."""
-        connected_edges = [e for e in self.edges
-                           if e.source_id == program_id or e.target_id == program_id]
-        connected_ids = {program_id}
+        connected_edges = [self.edges[i] for i in self._index.incident_positions(program_id)]
+        connected_ids = dict.fromkeys([program_id])
         for e in connected_edges:
-            connected_ids.add(e.source_id)
-            connected_ids.add(e.target_id)
+            connected_ids[e.source_id] = None
+            connected_ids[e.target_id] = None
         return {
-            "nodes": {k: v for k, v in self.nodes.items() if k in connected_ids},
+            "nodes": {k: self.nodes[k] for k in connected_ids if k in self.nodes},
             "edges": [edge_to_dict(e) for e in connected_edges],
         }
 
     def get_barriers_for_program(self, program_id: str) -> list[dict]:
         """Return all barriers blocking a specific program."""
-        barrier_ids = [e.target_id for e in self.edges
-                       if e.source_id == program_id and e.edge_type == "BLOCKED_BY"]
+        barrier_ids = [e.target_id for e in self.out_edges(program_id, "BLOCKED_BY")]
         return [self.nodes[bid] for bid in barrier_ids if bid in self.nodes]
 
     def get_levers_for_barrier(self, barrier_id: str) -> list[dict]:
         """Return advocacy levers that mitigate a specific barrier."""
-        lever_ids = [e.target_id for e in self.edges
-                     if e.source_id == barrier_id and e.edge_type == "MITIGATED_BY"]
+        lever_ids = [e.target_id for e in self.out_edges(barrier_id, "MITIGATED_BY")]
         return [self.nodes[lid] for lid in lever_ids if lid in self.nodes]
 
     def to_dict(self) -> dict:
@@ -114,6 +122,7 @@ class KnowledgeGraph:
         return {
             "nodes": self.nodes,
             "edges": [edge_to_dict(e) for e in self.edges],
+            "adjacency": self._index.to_dict(copy=True),
             "summary": {
                 "total_nodes": len(self.nodes),
                 "total_edges": len(self.edges),
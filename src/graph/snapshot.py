@@ -0,0 +1,210 @@
+"""Compact binary snapshot of the serialized knowledge graph.
+
+``build_graph`` writes ``LATEST-GRAPH.json`` for people and downstream
+tools, and alongside it a snapshot for the pipeline itself:
+
+    .graph_snapshot.npz
+        meta        -- JSON: format, input fingerprint, edge type table,
+                       summary
+        nodes       -- JSON list of node dicts (ids interned by position)
+        edge_src    -- int32  [n_edges]  index into the node id table
+        edge_dst    -- int32  [n_edges]
+        edge_type   -- uint8  [n_edges]  index into meta["edge_types"]
+        meta_pos    -- int32  [n_meta]   edges with non-empty metadata
+        edge_meta   -- JSON list of those metadata dicts
+
+Edge endpoints that are not graph nodes (committee ids, ecoregions) are
+appended to the id table after the real nodes. Arrays are deflate
+compressed by default; ``np.load`` reads each member on first access.
+
+The fingerprint hashes everything GraphBuilder.build reads (programs,
+scored items, graph_schema.json, fiscal year). ``--graph-from-snapshot``
+loads a snapshot whose fingerprint matches the current inputs instead of
+rebuilding the graph.
+
+Usage:
+    fp = graph_fingerprint(programs, scored)
+    write_snapshot(graph_data, GRAPH_SNAPSHOT_PATH, fp)
+    graph_data = load_snapshot(GRAPH_SNAPSHOT_PATH, fingerprint=fp)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+import numpy as np
+
+from src.config import FISCAL_YEAR_SHORT
+from src.graph.adjacency import EdgeIndex
+from src.paths import GRAPH_SCHEMA_PATH
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT: int = 1
+"""Bumped when the snapshot layout changes; older snapshots are ignored."""
+
+
+def _json_bytes(obj) -> np.ndarray:
+    raw = json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
+    return np.frombuffer(raw, dtype=np.uint8)
+
+
+def _from_json_bytes(arr: np.ndarray):
+    return json.loads(arr.tobytes().decode("utf-8"))
+
+
+def graph_fingerprint(
+    programs: list[dict], scored_items: list[dict], schema_path: Path | None = None,
+) -> str:
+    """SHA256 over every input GraphBuilder.build depends on."""
+    h = hashlib.sha256()
+    h.update(f"{SNAPSHOT_FORMAT}|{FISCAL_YEAR_SHORT}|".encode())
+    for part in (programs, scored_items):
+        h.update(json.dumps(part, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"))
+        h.update(b"|")
+    path = schema_path or GRAPH_SCHEMA_PATH
+    if path.exists():
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def write_snapshot(
+    graph_data: dict, path: Path, fingerprint: str, compress: bool = True,
+) -> None:
+    """Write ``graph_data`` (KnowledgeGraph.to_dict() output) atomically."""
+    nodes = list(graph_data.get("nodes", {}).values())
+    ids: dict[str, int] = {n["id"]: i for i, n in enumerate(nodes)}
+    external: list[str] = []
+    type_codes: dict[str, int] = {}
+
+    def _id(node_id: str) -> int:
+        pos = ids.get(node_id)
+        if pos is None:
+            pos = ids[node_id] = len(ids)
+            external.append(node_id)
+        return pos
+
+    edges = graph_data.get("edges", [])
+    src: list[int] = []
+    dst: list[int] = []
+    etype: list[int] = []
+    meta_pos: list[int] = []
+    meta: list[dict] = []
+    for i, e in enumerate(edges):
+        src.append(_id(e["source"]))
+        dst.append(_id(e["target"]))
+        etype.append(type_codes.setdefault(e["type"], len(type_codes)))
+        if e.get("metadata"):
+            meta_pos.append(i)
+            meta.append(e["metadata"])
+    if len(type_codes) > 255:
+        raise ValueError(f"too many edge types for snapshot: {len(type_codes)}")
+
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "fingerprint": fingerprint,
+        "edge_types": list(type_codes),
+        "external_ids": external,
+        "summary": graph_data.get("summary", {}),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            (np.savez_compressed if compress else np.savez)(
+                f,
+                meta=_json_bytes(header),
+                nodes=_json_bytes(nodes),
+                edge_src=np.array(src, dtype=np.int32),
+                edge_dst=np.array(dst, dtype=np.int32),
+                edge_type=np.array(etype, dtype=np.uint8),
+                meta_pos=np.array(meta_pos, dtype=np.int32),
+                edge_meta=_json_bytes(meta),
+            )
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    logger.info(
+        "Graph snapshot written to %s (%d nodes, %d edges, %d bytes)",
+        path, len(nodes), len(edges), path.stat().st_size,
+    )
+
+
+def load_snapshot(path: Path, fingerprint: str | None = None) -> dict | None:
+    """Load a snapshot as a graph dict (nodes, edges, adjacency, summary).
+
+    Returns None when the file is missing, unreadable, from another
+    snapshot format, or (if ``fingerprint`` is given) built from
+    different inputs.
+    """
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as z:
+            header = _from_json_bytes(z["meta"])
+            if header.get("format") != SNAPSHOT_FORMAT:
+                logger.info("Graph snapshot %s has an old format, ignoring", path)
+                return None
+            if fingerprint is not None and header.get("fingerprint") != fingerprint:
+                logger.info("Graph snapshot %s is stale (inputs changed)", path)
+                return None
+            nodes = _from_json_bytes(z["nodes"])
+            src = z["edge_src"].tolist()
+            dst = z["edge_dst"].tolist()
+            etype = z["edge_type"].tolist()
+            meta_pos = z["meta_pos"].tolist()
+            meta = _from_json_bytes(z["edge_meta"])
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile) as exc:
+        logger.warning("Graph snapshot %s unreadable: %s", path, exc)
+        return None
+
+    id_table = [n["id"] for n in nodes] + header["external_ids"]
+    type_table = header["edge_types"]
+    edges = [
+        {"source": id_table[s], "target": id_table[t], "type": type_table[k], "metadata": {}}
+        for s, t, k in zip(src, dst, etype)
+    ]
+    for pos, md in zip(meta_pos, meta):
+        edges[pos]["metadata"] = md
+
+    return {
+        "nodes": {n["id"]: n for n in nodes},
+        "edges": edges,
+        "adjacency": EdgeIndex(
+            _group_positions(src, etype, id_table, type_table),
+            _group_positions(dst, etype, id_table, type_table),
+            edge_count=len(edges),
+        ).to_dict(),
+        "summary": header["summary"],
+    }
+
+
+def _group_positions(
+    node_col: list[int], type_col: list[int], id_table: list[str], type_table: list[str],
+) -> dict[str, dict[str, list[int]]]:
+    """Adjacency map (node -> type -> edge positions) from edge columns.
+
+    A stable sort on (node, type) turns each group into one contiguous
+    slice, so the Python work is per group rather than per edge.
+    """
+    nodes = np.asarray(node_col, dtype=np.int64)
+    types = np.asarray(type_col, dtype=np.int64)
+    order = np.lexsort((types, nodes))  # stable: positions stay ascending
+    keys = nodes[order] * 256 + types[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else keys
+    bounds = np.r_[starts, len(keys)].tolist()
+    positions = order.tolist()
+    group_nodes = nodes[order][starts].tolist()
+    group_types = types[order][starts].tolist()
+
+    out: dict[str, dict[str, list[int]]] = {}
+    for g, (n, t) in enumerate(zip(group_nodes, group_types)):
+        out.setdefault(id_table[n], {})[type_table[t]] = positions[bounds[g]:bounds[g + 1]]
+    return out
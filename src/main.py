@@ -9,45 +9,83 @@ Usage:
     python -m src.main --source federal_register  # Scan one source
     python -m src.main --report-only              # Regenerate report from cache
     python -m src.main --graph-only               # Export knowledge graph from cache
+    python -m src.main --incremental              # Fetch only records past each source's high-water mark
+    python -m src.main --prep-packets --all-tribes --workers 8  # Parallel packet batch
+    python -m src.main --prep-packets --all-tribes --force    # Re-render unchanged packets too
+    python -m src.main --profile                  # Full scan with per-stage timing/memory profile
+    python -m src.main --import-profile --programs   # Slowest imports for a CLI mode
 """
 
+from __future__ import annotations
+
 import argparse
-import asyncio
+import importlib
 import json
 import logging
 import os
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from src.scrapers.circuit_breaker import CircuitOpenError
-from src.scrapers.federal_register import FederalRegisterScraper
-from src.scrapers.grants_gov import GrantsGovScraper
-from src.scrapers.congress_gov import CongressGovScraper
-from src.scrapers.usaspending import USASpendingScraper
-from src.analysis.relevance import RelevanceScorer
-from src.analysis.change_detector import ChangeDetector
-from src.graph.builder import GraphBuilder
-from src.reports.generator import ReportGenerator
-from src.monitors import MonitorRunner
-from src.analysis.decision_engine import DecisionEngine
 from src.paths import (
     GRAPH_SCHEMA_PATH,
+    GRAPH_SNAPSHOT_PATH,
     LATEST_GRAPH_PATH,
     LATEST_MONITOR_DATA_PATH,
     OUTPUTS_DIR,
+    PROFILE_HISTORY_PATH,
+    PROFILES_DIR,
     PROGRAM_INVENTORY_PATH,
     SCANNER_CONFIG_PATH,
 )
+from src.profiling import (
+    HISTORY_WINDOW,
+    REGRESSION_RATIO,
+    ProfileHistory,
+    StageProfiler,
+    profile_imports,
+)
+
+if TYPE_CHECKING:
+    from src.analysis.scan_state import HighWaterMarks
+
+# Pipeline stages are imported where they run, so each CLI mode pays only
+# for its own imports: scrapers (aiohttp) on scan paths, the graph and
+# report stack on pipeline paths, python-docx on packet paths.
+# --programs and --dry-run import none of them (see --import-profile).
 
 logger = logging.getLogger(__name__)
 
-SCRAPERS = {
-    "federal_register": FederalRegisterScraper,
-    "grants_gov": GrantsGovScraper,
-    "congress_gov": CongressGovScraper,
-    "usaspending": USASpendingScraper,
+_SCAN_DEADLINE_GRACE_S: float = 5.0
+"""How long past the scan deadline a scraper may take to wrap up."""
+
+SCRAPERS: dict[str, str | type] = {
+    "federal_register": "src.scrapers.federal_register:FederalRegisterScraper",
+    "grants_gov": "src.scrapers.grants_gov:GrantsGovScraper",
+    "congress_gov": "src.scrapers.congress_gov:CongressGovScraper",
+    "usaspending": "src.scrapers.usaspending:USASpendingScraper",
 }
+"""Scraper per source name, as "module:Class" until first used.
+
+scraper_class() imports the module and stores the class back.
+"""
+
+
+def scraper_class(source_name: str) -> type | None:
+    """Return the scraper class for a source, importing it on first use.
+
+    Returns:
+        The class, or None for an unknown source.
+    """
+    entry = SCRAPERS.get(source_name)
+    if isinstance(entry, str):
+        module_name, _, class_name = entry.partition(":")
+        entry = getattr(importlib.import_module(module_name), class_name)
+        SCRAPERS[source_name] = entry
+    return entry
 
 
 def load_config() -> dict:
@@ -95,9 +133,9 @@ def dry_run(config: dict, programs: list[dict], sources: list[str]) -> None:
         print(f"  - {src.get('name', name)} ({status})")
 
     # CFDA coverage
-    from src.scrapers.grants_gov import CFDA_NUMBERS
-    print(f"\nCFDA-targeted programs ({len(CFDA_NUMBERS)}):")
-    for cfda, pid in sorted(CFDA_NUMBERS.items()):
+    from src.scrapers.cfda_map import CFDA_TO_PROGRAM
+    print(f"\nCFDA-targeted programs ({len(CFDA_TO_PROGRAM)}):")
+    for cfda, pid in sorted(CFDA_TO_PROGRAM.items()):
         prog = next((p for p in programs if p["id"] == pid), None)
         name = prog["name"] if prog else pid
         print(f"  - {cfda}: {name}")
@@ -208,34 +246,136 @@ def _load_source_cache(source_name: str, config: dict | None = None) -> list[dic
         return []
 
 
-async def run_scan(config: dict, programs: list[dict], sources: list[str]) -> list[dict]:
+def _merge_source_cache(source_name: str, items: list[dict]) -> None:
+    """Fold an incremental delta into the per-source cache by source_id.
+
+    Keeps the fallback cache a complete picture of the source even when
+    runs only fetch deltas.
+    """
+    cache_path = _source_cache_path(source_name)
+    cached: list[dict] = []
+    if cache_path.exists() and not cache_path.is_symlink():
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                cached = json.load(f).get("items", [])
+        except (json.JSONDecodeError, IOError):
+            logger.warning("Cache for %s unreadable, rewriting from delta", source_name)
+    fresh_ids = {item.get("source_id") for item in items}
+    merged = items + [item for item in cached if item.get("source_id") not in fresh_ids]
+    _save_source_cache(source_name, merged)
+
+
+async def run_scan(
+    config: dict, programs: list[dict], sources: list[str],
+    marks: HighWaterMarks | None = None,
+    profiler: StageProfiler | None = None,
+) -> list[dict]:
     """Execute scrapers concurrently and return all collected items (Ingest + Normalize).
 
     On successful scan, caches results per source. On CircuitOpenError or any
     other exception, falls back to cached data so the pipeline can continue
     in degraded mode.
+
+    When ``marks`` is given (``--incremental``), sources that support it are
+    asked only for records past their high-water mark, and only new or
+    updated items are returned. A failing incremental source returns nothing
+    and keeps its mark, so its stored items are left as they were.
+
+    With a ``profiler``, each scraper is recorded as a "scraper" span.
+
+    ``resilience.scan_deadline_seconds`` bounds the whole scan. Scrapers
+    stop retrying at the deadline (see src/scrapers/latency.py), and a scan
+    still running _SCAN_DEADLINE_GRACE_S later is cancelled. A source cut
+    short returns what it fetched, filled in from its cache; a cancelled one
+    falls back to the cache entirely. Incremental sources keep their marks.
     """
+    import asyncio
+
+    from src.scrapers import latency
+    from src.scrapers.http_pool import HOST_GOVERNOR, configure_pool
+
+    configure_pool(config)
+    profiler = profiler or StageProfiler(enabled=False)
+    deadline_s = config.get("resilience", {}).get("scan_deadline_seconds")
+    deadline = time.monotonic() + deadline_s if deadline_s else None
+
+    async def _bounded(scan, source_name: str):
+        if deadline is None:
+            return await scan
+        left = max(0.0, deadline - time.monotonic())
+        try:
+            return await asyncio.wait_for(scan, left + _SCAN_DEADLINE_GRACE_S)
+        except asyncio.TimeoutError:
+            if time.monotonic() < deadline:
+                raise  # the scraper's own timeout, not the scan deadline
+            raise latency.ScanDeadlineExceeded(source_name) from None
+
     async def _run_one(source_name: str) -> list[dict]:
-        if source_name not in SCRAPERS:
+        with profiler.span(source_name, kind="scraper") as span:
+            items = await _scan_one(source_name)
+            span.items = len(items)
+        return items
+
+    async def _scan_one(source_name: str) -> list[dict]:
+        scraper_cls = scraper_class(source_name)
+        if scraper_cls is None:
             logger.warning("Unknown source: %s", source_name)
             return []
-        scraper_cls = SCRAPERS[source_name]
         scraper = scraper_cls(config)
-        logger.info("Scanning %s...", source_name)
+        scraper.deadline = deadline
+        incremental = marks is not None and scraper.supports_incremental
+        logger.info("Scanning %s%s...", source_name, " (incremental)" if incremental else "")
         try:
-            items = await scraper.scan()
+            if incremental:
+                fetched = await _bounded(scraper.scan(since=marks.since(source_name)), source_name)
+                items = marks.filter_unchanged(source_name, fetched)
+                if getattr(scraper, "deadline_exceeded", False):
+                    logger.warning(
+                        "DEGRADED: %s hit the scan deadline, keeping its mark", source_name,
+                    )
+                else:
+                    marks.advance(source_name, fetched)
+                logger.info("  -> %d new/updated items from %s", len(items), source_name)
+                if items:
+                    _merge_source_cache(source_name, items)
+                return items
+            items = await _bounded(scraper.scan(), source_name)
+            if getattr(scraper, "deadline_exceeded", False):
+                logger.warning(
+                    "DEGRADED: %s hit the scan deadline after %d items, filling in from cache",
+                    source_name, len(items),
+                )
+                fresh_ids = {item.get("source_id") for item in items}
+                return items + [
+                    item for item in _load_source_cache(source_name, config)
+                    if item.get("source_id") not in fresh_ids
+                ]
             logger.info("  -> %d items from %s", len(items), source_name)
             if items:
                 _save_source_cache(source_name, items)
             return items
         except CircuitOpenError:
+            if incremental:
+                logger.warning("DEGRADED: %s circuit OPEN, keeping stored items", source_name)
+                return []
             logger.warning("DEGRADED: %s circuit OPEN, falling back to cache", source_name)
             return _load_source_cache(source_name, config)
+        except latency.ScanDeadlineExceeded:
+            if incremental:
+                logger.warning("DEGRADED: %s out of scan time, keeping stored items", source_name)
+                return []
+            logger.warning("DEGRADED: %s out of scan time, falling back to cache", source_name)
+            return _load_source_cache(source_name, config)
         except Exception:
+            if incremental:
+                logger.exception("Failed to scan %s, keeping stored items", source_name)
+                return []
             logger.exception("Failed to scan %s, falling back to cache", source_name)
             return _load_source_cache(source_name, config)
 
     results = await asyncio.gather(*[_run_one(s) for s in sources])
+    HOST_GOVERNOR.log_summary()
+    latency.log_summary()
     all_items = []
     for result in results:
         all_items.extend(result)
@@ -243,13 +383,41 @@ async def run_scan(config: dict, programs: list[dict], sources: list[str]) -> li
     return all_items
 
 
-def build_graph(programs: list[dict], scored_items: list[dict]) -> dict:
-    """Build the knowledge graph from scored items (Graph Construction)."""
+def build_graph(
+    programs: list[dict], scored_items: list[dict], from_snapshot: bool = False,
+) -> dict:
+    """Build the knowledge graph from scored items (Graph Construction).
+
+    Every build also writes a binary snapshot keyed by a fingerprint of its
+    inputs. With ``from_snapshot``, a snapshot whose fingerprint matches is
+    loaded instead of rebuilding. The JSON export is then only rewritten if
+    LATEST-GRAPH.json is missing.
+    """
+    from src.graph.builder import GraphBuilder
+    from src.graph.snapshot import graph_fingerprint, load_snapshot, write_snapshot
+
+    fingerprint = graph_fingerprint(programs, scored_items)
+    if from_snapshot:
+        graph_data = load_snapshot(GRAPH_SNAPSHOT_PATH, fingerprint=fingerprint)
+        if graph_data is not None:
+            logger.info("Knowledge graph loaded from snapshot %s", GRAPH_SNAPSHOT_PATH)
+            if not LATEST_GRAPH_PATH.exists():
+                _write_graph_json(graph_data)
+            return graph_data
+        logger.info("No usable graph snapshot; rebuilding")
+
     builder = GraphBuilder(programs)
     graph = builder.build(scored_items)
     graph_data = graph.to_dict()
 
-    # Write graph output (atomic)
+    _write_graph_json(graph_data)
+    write_snapshot(graph_data, GRAPH_SNAPSHOT_PATH, fingerprint)
+
+    return graph_data
+
+
+def _write_graph_json(graph_data: dict) -> None:
+    """Write graph output to LATEST_GRAPH_PATH (atomic)."""
     LATEST_GRAPH_PATH.parent.mkdir(parents=True, exist_ok=True)
     tmp_path = LATEST_GRAPH_PATH.with_suffix(".tmp")
     with open(tmp_path, "w", encoding="utf-8") as f:
@@ -257,25 +425,33 @@ def build_graph(programs: list[dict], scored_items: list[dict]) -> dict:
     tmp_path.replace(LATEST_GRAPH_PATH)
     logger.info("Knowledge graph written to %s", LATEST_GRAPH_PATH)
 
-    return graph_data
-
 
 def run_monitors_and_classify(
-    config: dict, programs_dict: dict, graph_data: dict, scored: list[dict]
+    config: dict, programs_dict: dict, graph_data: dict, scored: list[dict],
+    profiler: StageProfiler | None = None,
 ) -> tuple[list, dict, dict]:
     """Run monitors and decision engine. Returns (alerts, classifications, monitor_data).
 
     This stage runs after graph construction and before reporting:
         Graph -> [HotSheets -> Monitors -> Decision Engine] -> Report
     """
+    from src.analysis.decision_engine import DecisionEngine
+    from src.monitors import MonitorRunner
+
+    profiler = profiler or StageProfiler(enabled=False)
+
     # Stage 3.5: Monitors (detect threats, consultation signals, Hot Sheets sync)
-    monitor_runner = MonitorRunner(config, programs_dict)
-    alerts = monitor_runner.run_all(graph_data, scored)
+    with profiler.span("monitors") as span:
+        monitor_runner = MonitorRunner(config, programs_dict)
+        alerts = monitor_runner.run_all(graph_data, scored)
+        span.items = len(alerts)
     logger.info("Monitors produced %d alerts", len(alerts))
 
     # Stage 3.6: Decision Engine (classify programs into advocacy goals)
-    decision_engine = DecisionEngine(config, programs_dict)
-    classifications = decision_engine.classify_all(graph_data, alerts)
+    with profiler.span("decision_engine") as span:
+        decision_engine = DecisionEngine(config, programs_dict)
+        classifications = decision_engine.classify_all(graph_data, alerts)
+        span.items = len(classifications)
     logger.info("Classified %d programs into advocacy goals", len(classifications))
 
     # Build monitor data dict for output
@@ -314,33 +490,89 @@ def run_monitors_and_classify(
 
 
 def run_pipeline(config: dict, programs: list[dict], sources: list[str],
-                 report_only: bool = False, graph_only: bool = False) -> None:
-    """Run the full DAG pipeline: Ingest -> Normalize -> Graph -> Monitors -> Decision -> Report."""
+                 report_only: bool = False, graph_only: bool = False,
+                 incremental: bool = False, graph_from_snapshot: bool = False,
+                 profiler: StageProfiler | None = None) -> None:
+    """Run the full DAG pipeline: Ingest -> Normalize -> Graph -> Monitors -> Decision -> Report.
+
+    With ``incremental``, only records past each source's high-water mark are
+    fetched and scored, then merged into the stored scored set. Full scans
+    rebuild the marks so a later incremental run can pick up from them.
+    ``graph_from_snapshot`` reuses the stored graph snapshot when the scored
+    items, programs and graph schema are unchanged (see build_graph).
+    ``profiler`` (``--profile``) records each stage and scraper.
+    """
+    import asyncio
+
+    from src.analysis.change_detector import ChangeDetector
+    from src.analysis.relevance import RelevanceScorer
+    from src.analysis.scan_state import HighWaterMarks, merge_scored
+    from src.reports.generator import ReportGenerator
+
+    profiler = profiler or StageProfiler(enabled=False)
     detector = ChangeDetector()
     scorer = RelevanceScorer(config, programs)
 
     if report_only or graph_only:
         logger.info("Loading cached results")
-        previous = detector.load_cached()
+        with profiler.span("load_cached") as span:
+            previous = detector.load_cached()
+            span.items = len(previous)
         if not previous:
             logger.error("No cached results found. Run a full scan first.")
             sys.exit(1)
-        scored = scorer.score_items(previous)
+        with profiler.span("score") as span:
+            scored = scorer.score_items(previous)
+            span.items = len(previous)
         changes = {"new_items": [], "updated_items": [], "removed_items": [],
                     "summary": {"new_count": 0, "updated_count": 0,
                                 "removed_count": 0, "total_current": len(scored),
                                 "total_previous": len(scored)}}
     else:
-        # Stage 1-2: Ingest + Normalize
-        raw_items = asyncio.run(run_scan(config, programs, sources))
+        marks = HighWaterMarks(scan_window_days=config.get("scan_window_days", 14))
+        previous: list[dict] = []
+        if incremental:
+            previous = detector.load_cached()
+            if not previous:
+                logger.info("No stored results; incremental scan starts with a full window")
+                marks.reset()
 
-        # Stage 4: Analysis (scoring)
-        scored = scorer.score_items(raw_items)
-        changes = detector.detect_changes(scored)
-        detector.save_current(scored)
+        # Stage 1-2: Ingest + Normalize
+        with profiler.span("ingest") as span:
+            raw_items = asyncio.run(run_scan(
+                config, programs, sources,
+                marks=marks if incremental else None, profiler=profiler,
+            ))
+            span.items = len(raw_items)
+
+        # Stage 4: Analysis (scoring) -- incremental runs score only the delta
+        with profiler.span("score") as span:
+            scored = scorer.score_items(raw_items)
+            span.items = len(raw_items)
+        if incremental:
+            full_sources = {
+                s for s in sources
+                if s in SCRAPERS and not scraper_class(s).supports_incremental
+            }
+            scored = merge_scored(previous, raw_items, scored, full_sources)
+        with profiler.span("change_detector") as span:
+            changes = detector.detect_changes(scored)
+            detector.save_current(scored)
+            span.items = len(scored)
+
+        if not incremental:
+            for source_name in sources:
+                if source_name in SCRAPERS and scraper_class(source_name).supports_incremental:
+                    marks.rebuild(
+                        source_name,
+                        [i for i in raw_items if i.get("source") == source_name],
+                    )
+        marks.save()
 
     # Stage 3: Graph Construction
-    graph_data = build_graph(programs, scored)
+    with profiler.span("graph") as span:
+        graph_data = build_graph(programs, scored, from_snapshot=graph_from_snapshot)
+        span.items = len(scored)
 
     # Stage 3.5-3.6: Monitors + Decision Engine
     # programs_dict is needed by monitors and decision engine (keyed by program_id).
@@ -348,7 +580,7 @@ def run_pipeline(config: dict, programs: list[dict], sources: list[str],
     # they are the same objects used downstream.
     programs_dict = {p["id"]: p for p in programs}
     alerts, classifications, monitor_data = run_monitors_and_classify(
-        config, programs_dict, graph_data, scored
+        config, programs_dict, graph_data, scored, profiler=profiler,
     )
 
     if graph_only:
@@ -362,12 +594,14 @@ def run_pipeline(config: dict, programs: list[dict], sources: list[str],
         return
 
     # Stage 5: Reporting
-    reporter = ReportGenerator(programs)
-    paths = reporter.generate(
-        scored, changes, graph_data,
-        monitor_data=monitor_data,
-        classifications=classifications,
-    )
+    with profiler.span("report") as span:
+        reporter = ReportGenerator(programs)
+        paths = reporter.generate(
+            scored, changes, graph_data,
+            monitor_data=monitor_data,
+            classifications=classifications,
+        )
+        span.items = len(scored)
     print("\nScan complete.")
     print(f"  Items scored above threshold: {len(scored)}")
     print(f"  New since last scan: {changes['summary']['new_count']}")
@@ -380,6 +614,38 @@ def run_pipeline(config: dict, programs: list[dict], sources: list[str],
     print(f"  Monitor data: {LATEST_MONITOR_DATA_PATH}")
 
 
+def write_profile(profiler: StageProfiler, config: dict) -> list[dict]:
+    """Write a ``--profile`` run and report stages slower than usual.
+
+    Returns:
+        Regressions against the profile history (see ProfileHistory).
+    """
+    record = profiler.record()
+    paths = profiler.write(PROFILES_DIR, record)
+    prof_cfg = config.get("profiling", {})
+    history = ProfileHistory(
+        PROFILE_HISTORY_PATH,
+        window=prof_cfg.get("history_window", HISTORY_WINDOW),
+        ratio=prof_cfg.get("regression_ratio", REGRESSION_RATIO),
+    )
+    regressions = history.regressions(record)
+    history.append(record)
+
+    print(f"\nProfile ({record['total']['wall_s']:.1f}s wall, "
+          f"{record['total']['cpu_s']:.1f}s CPU):")
+    for span in record["spans"]:
+        label = span["name"] if span["kind"] == "stage" else f"  {span['name']}"
+        print(f"  {label:<20} {span['wall_s']:8.2f}s wall {span['cpu_s']:8.2f}s CPU")
+    for reg in regressions:
+        logger.warning(
+            "PROFILE REGRESSION: %s %s took %.2fs vs median %.2fs over %d runs",
+            reg["kind"], reg["name"], reg["wall_s"], reg["median_s"], reg["runs"],
+        )
+    print(f"  Record: {paths['record']}")
+    print(f"  Trace:  {paths['trace']} (open in ui.perfetto.dev)")
+    return regressions
+
+
 def main() -> None:
     """CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -390,6 +656,10 @@ def main() -> None:
     parser.add_argument("--source", type=str, help="Scan a specific source only")
     parser.add_argument("--report-only", action="store_true", help="Regenerate report from cached data")
     parser.add_argument("--graph-only", action="store_true", help="Export knowledge graph from cached data")
+    parser.add_argument("--graph-from-snapshot", action="store_true",
+                        help="Reuse the binary graph snapshot when scored inputs are unchanged")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Fetch only records newer than each source's last high-water mark")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
     parser.add_argument("--prep-packets", action="store_true",
                         help="Generate Tribe-specific advocacy packets")
@@ -397,12 +667,23 @@ def main() -> None:
                         help="Tribe name for single packet (used with --prep-packets)")
     parser.add_argument("--all-tribes", action="store_true",
                         help="Generate for all Tribes (used with --prep-packets)")
+    parser.add_argument("--workers", type=int, default=1, metavar="N",
+                        help="Worker processes for --all-tribes packet rendering (default: 1)")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-render packets even when their inputs are unchanged")
     parser.add_argument("--enable-agent-review", action="store_true",
                         help="Enable 3-pass agent review cycle for DOCX Hot Sheets")
     parser.add_argument("--health-check", action="store_true",
                         help="Check API availability for all sources")
+    parser.add_argument("--profile", action="store_true",
+                        help="Record per-stage/per-scraper time and memory to outputs/profiles")
+    parser.add_argument("--import-profile", action="store_true",
+                        help="Run the command under python -X importtime and print the slowest imports")
     args = parser.parse_args()
 
+    if args.import_profile:
+        sys.exit(profile_imports([a for a in sys.argv[1:] if a != "--import-profile"]))
+
     log_level = logging.DEBUG if args.verbose else logging.INFO
     logging.basicConfig(
         level=log_level,
@@ -414,6 +695,8 @@ def main() -> None:
     programs = load_programs()
 
     if args.health_check:
+        import asyncio
+
         from src.health import HealthChecker, format_report
         checker = HealthChecker(config)
         results = asyncio.run(checker.check_all())
@@ -431,11 +714,12 @@ def main() -> None:
         orch = PacketOrchestrator(
             config, programs,
             enable_agent_review=args.enable_agent_review,
+            force=args.force,
         )
         if args.tribe:
             orch.run_single_tribe(args.tribe)
         else:
-            orch.run_all_tribes()
+            orch.run_all_tribes(workers=args.workers)
         return
 
     if args.programs:
@@ -454,8 +738,16 @@ def main() -> None:
         dry_run(config, programs, sources)
         return
 
-    run_pipeline(config, programs, sources,
-                 report_only=args.report_only, graph_only=args.graph_only)
+    profiler = StageProfiler() if args.profile else None
+    try:
+        run_pipeline(config, programs, sources,
+                     report_only=args.report_only, graph_only=args.graph_only,
+                     incremental=args.incremental,
+                     graph_from_snapshot=args.graph_from_snapshot,
+                     profiler=profiler)
+    finally:
+        if profiler is not None:
+            write_profile(profiler, config)
 
 
 if __name__ == "__main__":
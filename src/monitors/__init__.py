@@ -15,6 +15,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+from src.graph.adjacency import EdgeIndex
+
 logger = logging.getLogger(__name__)
 
 # Severity ordering for alert sorting (lower index = higher priority)
@@ -194,11 +196,8 @@ class MonitorRunner:
         if "nodes" not in graph_data:
             graph_data["nodes"] = {}
 
-        # Build set of existing edge keys for deduplication
-        existing_edges = {
-            (e.get("source"), e.get("target"), e.get("type"))
-            for e in graph_data["edges"]
-        }
+        # Existing THREATENS sources per program, for deduplication
+        index = EdgeIndex.for_graph(graph_data)
 
         edges_added = 0
         for alert in alerts:
@@ -212,8 +211,7 @@ class MonitorRunner:
                 threat_node_id = f"threat_{threat_type}_{program_id}"
 
                 # Skip duplicate edges
-                edge_key = (threat_node_id, program_id, "THREATENS")
-                if edge_key in existing_edges:
+                if threat_node_id in index.sources(program_id, "THREATENS"):
                     continue
 
                 # Create ThreatNode so edge source is not dangling
@@ -242,8 +240,9 @@ class MonitorRunner:
                     },
                 }
                 graph_data["edges"].append(edge)
-                existing_edges.add(edge_key)
+                index.add(threat_node_id, program_id, "THREATENS")
                 edges_added += 1
 
+        graph_data["adjacency"] = index.to_dict()
         if edges_added:
             logger.info("Added %d THREATENS edges to graph", edges_added)
@@ -0,0 +1,266 @@
+"""Single-file store for the per-Tribe award cache.
+
+TribalAwardMatcher used to write one indented JSON file per Tribe (592
+files) and the packet orchestrator re-opened and re-parsed each of them.
+The store keeps every Tribe's cache record in one JSON Lines file with a
+byte-offset index beside it:
+
+    award_cache/awards.jsonl    one compact JSON record per line
+    award_cache/awards.idx      JSON: format, data file size, and
+                                tribe_id -> [offset, length, digest]
+
+``write_all`` replaces the whole store atomically (data file first, then
+index). ``append`` adds or supersedes records at the end of the data file;
+the newest line for a Tribe wins. The index records the data file size it
+describes, so an index left stale by an interrupted write is detected and
+rebuilt by scanning the data file.
+
+Reads are random access: ``get`` seeks straight to a Tribe's line. Tribes
+missing from the store fall back to the legacy ``{tribe_id}.json`` files,
+so caches written before the store existed keep working. Legacy files
+are never deleted: the store takes precedence for any Tribe it holds, and
+the per-file layout stays readable alongside it.
+
+``data/award_cache/awards.jsonl`` and ``awards.idx`` are committed: they
+are the repository's award cache, and ``populate_awards`` refreshes them.
+
+Usage:
+    store = AwardCacheStore(AWARD_CACHE_DIR)
+    store.write_all(records)
+    record = store.get("epa_100000001")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STORE_FILENAME: str = "awards.jsonl"
+INDEX_FILENAME: str = "awards.idx"
+
+STORE_FORMAT: int = 1
+"""Bumped when the index layout changes; older indexes are rebuilt."""
+
+
+def _encode(record: dict) -> bytes:
+    line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+    return line.encode("utf-8") + b"\n"
+
+
+def _digest(line: bytes) -> str:
+    return hashlib.sha256(line).hexdigest()[:16]
+
+
+class AwardCacheStore:
+    """Append-friendly JSON Lines store of award cache records by tribe_id.
+
+    Attributes:
+        cache_dir: Directory holding the store (and any legacy files).
+        data_path: Path of the JSON Lines data file.
+        index_path: Path of the offset index.
+        max_record_bytes: Records (or legacy files) larger than this are
+            skipped with a warning; None disables the check.
+    """
+
+    def __init__(self, cache_dir: Path, max_record_bytes: int | None = None) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.data_path = self.cache_dir / STORE_FILENAME
+        self.index_path = self.cache_dir / INDEX_FILENAME
+        self.max_record_bytes = max_record_bytes
+        self._index: dict[str, list] | None = None
+        self._handle = None
+        self._lock = threading.Lock()
+
+    # -- Writing --------------------------------------------------------------
+
+    def write_all(self, records: Iterable[dict]) -> int:
+        """Replace the store with ``records`` (each must carry ``tribe_id``).
+
+        Returns:
+            Number of records written.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        index: dict[str, list] = {}
+        fd, tmp = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                offset = 0
+                for record in records:
+                    line = _encode(record)
+                    index[record["tribe_id"]] = [offset, len(line), _digest(line)]
+                    f.write(line)
+                    offset += len(line)
+            self.close()
+            os.replace(tmp, self.data_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._save_index(index, offset)
+        logger.info("Award store written to %s (%d records)", self.data_path, len(index))
+        return len(index)
+
+    def append(self, records: Iterable[dict]) -> int:
+        """Add or supersede records at the end of the store.
+
+        Returns:
+            Number of records appended.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        index = dict(self._load_index())
+        self.close()
+        count = 0
+        with open(self.data_path, "ab") as f:
+            offset = f.tell()
+            for record in records:
+                line = _encode(record)
+                index[record["tribe_id"]] = [offset, len(line), _digest(line)]
+                f.write(line)
+                offset += len(line)
+                count += 1
+        self._save_index(index, offset)
+        return count
+
+    def _save_index(self, index: dict[str, list], data_size: int) -> None:
+        payload = {"format": STORE_FORMAT, "data_size": data_size, "records": index}
+        fd, tmp = tempfile.mkstemp(dir=str(self.cache_dir), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, self.index_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._index = index
+
+    # -- Reading --------------------------------------------------------------
+
+    def _load_index(self) -> dict[str, list]:
+        """Index of the data file, rebuilt by a scan when missing or stale."""
+        if self._index is not None:
+            return self._index
+        if not self.data_path.exists():
+            self._index = {}
+            return self._index
+        data_size = self.data_path.stat().st_size
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if (
+                payload.get("format") == STORE_FORMAT
+                and payload.get("data_size") == data_size
+            ):
+                self._index = payload["records"]
+                return self._index
+            logger.info("Award store index %s is stale, rebuilding", self.index_path)
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, OSError, KeyError) as exc:
+            logger.warning("Award store index %s unreadable (%s), rebuilding", self.index_path, exc)
+        self._index = self._scan()
+        return self._index
+
+    def _scan(self) -> dict[str, list]:
+        index: dict[str, list] = {}
+        offset = 0
+        with open(self.data_path, "rb") as f:
+            for line in f:
+                try:
+                    tribe_id = json.loads(line)["tribe_id"]
+                except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                    logger.warning(
+                        "Award store %s: skipping unreadable line at byte %d",
+                        self.data_path, offset,
+                    )
+                else:
+                    index[tribe_id] = [offset, len(line), _digest(line)]
+                offset += len(line)
+        return index
+
+    def __contains__(self, tribe_id: str) -> bool:
+        return tribe_id in self._load_index() or self._legacy_path(tribe_id) is not None
+
+    def tribe_ids(self) -> list[str]:
+        """Sorted tribe_ids in the store plus any legacy-only files."""
+        ids = set(self._load_index())
+        if self.cache_dir.is_dir():
+            ids.update(p.stem for p in self.cache_dir.glob("*.json"))
+        return sorted(ids)
+
+    def get(self, tribe_id: str) -> dict | None:
+        """A Tribe's cache record, or None if absent or unreadable."""
+        entry = self._load_index().get(tribe_id)
+        if entry is None:
+            return self._get_legacy(tribe_id)
+        offset, length = entry[0], entry[1]
+        if self.max_record_bytes is not None and length > self.max_record_bytes:
+            logger.warning(
+                "Award record %s exceeds size limit (%d bytes > %d), skipping",
+                tribe_id, length, self.max_record_bytes,
+            )
+            return None
+        try:
+            with self._lock:
+                if self._handle is None:
+                    self._handle = open(self.data_path, "rb")
+                self._handle.seek(offset)
+                line = self._handle.read(length)
+            return json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
+            logger.warning("Failed to read award record %s from %s: %s", tribe_id, self.data_path, exc)
+            return None
+
+    def items(self) -> Iterator[tuple[str, dict | None]]:
+        """(tribe_id, record) for every Tribe, in tribe_id order."""
+        for tribe_id in self.tribe_ids():
+            yield tribe_id, self.get(tribe_id)
+
+    def signature(self, tribe_id: str) -> str:
+        """Cheap change marker for a Tribe's record (no record read)."""
+        entry = self._load_index().get(tribe_id)
+        if entry is not None:
+            return f"store:{entry[2]}"
+        path = self._legacy_path(tribe_id)
+        if path is None:
+            return "missing"
+        st = path.stat()
+        return f"file:{st.st_size}:{st.st_mtime_ns}"
+
+    def _legacy_path(self, tribe_id: str) -> Path | None:
+        if not tribe_id or Path(tribe_id).name != tribe_id:
+            return None
+        path = self.cache_dir / f"{tribe_id}.json"
+        return path if path.is_file() else None
+
+    def _get_legacy(self, tribe_id: str) -> dict | None:
+        path = self._legacy_path(tribe_id)
+        if path is None:
+            return None
+        try:
+            size = path.stat().st_size
+            if self.max_record_bytes is not None and size > self.max_record_bytes:
+                logger.warning(
+                    "Cache file %s exceeds size limit (%d bytes > %d), skipping",
+                    path, size, self.max_record_bytes,
+                )
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as exc:
+            logger.warning("Failed to load cache %s: %s", path, exc)
+            return None
+
+    def close(self) -> None:
+        """Release the read handle; the next ``get`` reopens the data file."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            self._index = None
@@ -4,10 +4,14 @@ Provides the TribalAwardMatcher class that:
   1. Fetches all Tribal government awards from USASpending via batch queries
   2. Matches awards to specific Tribes using a two-tier approach:
      - Tier 1: Curated alias table lookup (O(1), exact match)
-     - Tier 2: rapidfuzz token_sort_ratio >= 85 with state-overlap validation
+     - Tier 2: rapidfuzz token_sort_ratio >= 85 with state-overlap validation,
+       scored in C over the candidates a trigram index admits for the
+       recipient's name and state, and memoized per (recipient, state)
+       across CFDAs and fiscal years
   3. Deduplicates awards by Award ID (multi-year awards span FY queries)
   4. Detects consortium/inter-Tribal awards (logged, not attributed)
-  5. Writes per-Tribe JSON cache files with year-by-year obligation breakdowns
+  5. Writes per-Tribe cache records with year-by-year obligation breakdowns
+     to a single AwardCacheStore (see award_store.py)
 
 Usage:
     matcher = TribalAwardMatcher(config)
@@ -21,10 +25,14 @@ Usage:
 import asyncio
 import json
 import logging
-import os
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
 
 from src.config import FISCAL_YEAR_INT
+from src.packets.award_store import AwardCacheStore
 from src.packets.registry import TribalRegistry
 from src.paths import AWARD_CACHE_DIR, PROJECT_ROOT, TRIBAL_ALIASES_PATH
 from src.scrapers.usaspending import CFDA_TO_PROGRAM
@@ -87,6 +95,107 @@ def _determine_award_fy(award: dict) -> int | None:
         return None
 
 
+def _sorted_tokens(name: str) -> str:
+    """Return ``name`` as token_sort_ratio compares it (tokens sorted, space-joined)."""
+    return " ".join(sorted(name.split()))
+
+
+def _trigrams(text: str) -> set[str]:
+    """Distinct character trigrams of ``text``."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class _FuzzyNameIndex:
+    """Trigram index over every Tribe name and alternate name for Tier 2.
+
+    ``candidates`` returns the positions that can still reach the
+    token_sort_ratio cutoff, so ``extractOne`` / ``cdist`` score a handful
+    of names instead of the whole registry. The filter is exact, never
+    heuristic. A score >= ``t`` means the Indel distance ``d`` between the
+    sorted-token strings is at most ``(100 - t) / 100 * (len_a + len_b)``.
+    Each deletion from the query breaks at most 3 of its trigrams and each
+    insertion at most 2. So a name of a given length must share at least
+    ``|trigrams(query)| - 3 * deletions - 2 * insertions`` distinct trigrams
+    with the query. When that bound is <= 0 (short names), every name of
+    that length is kept.
+
+    Positions follow registry order (official name, then alternates) so
+    tie-breaking matches a full scan. Records are read-only views.
+    """
+
+    def __init__(self, tribes) -> None:
+        self.names: list[str] = []
+        self.tribes: list[Mapping] = []
+        self._states: list[frozenset[str]] = []
+        lengths: list[int] = []
+        postings: dict[str, list[int]] = {}
+        for tribe in tribes:
+            view = MappingProxyType(tribe)
+            states = frozenset(tribe.get("states") or ())
+            for name in [tribe["name"]] + tribe.get("alternate_names", []):
+                pos = len(self.names)
+                name = name.lower()
+                sorted_name = _sorted_tokens(name)
+                self.names.append(name)
+                self.tribes.append(view)
+                self._states.append(states)
+                lengths.append(len(sorted_name))
+                for gram in _trigrams(sorted_name):
+                    postings.setdefault(gram, []).append(pos)
+        self._lengths = np.asarray(lengths, dtype=np.int64)
+        self._postings = {g: np.asarray(p, dtype=np.int64) for g, p in postings.items()}
+        self._state_masks: dict[str, np.ndarray] = {}
+
+    def _required_overlap(self, query_len: int, query_grams: int, threshold: float) -> np.ndarray:
+        """Minimum shared trigrams each name needs to reach ``threshold``.
+
+        Names whose length rules them out entirely get a requirement
+        above ``query_grams``.
+        """
+        slack = (100 - threshold) / 100
+        gap = query_len - self._lengths
+        max_dist = np.floor(slack * (query_len + self._lengths) + 1e-9).astype(np.int64)
+        # Indel distance has the parity of the length gap
+        max_dist -= (max_dist - gap) % 2
+        deletions = (max_dist + gap) // 2
+        insertions = (max_dist - gap) // 2
+        required = query_grams - 3 * deletions - 2 * insertions
+        return np.where(max_dist >= np.abs(gap), required, query_grams + 1)
+
+    def _state_mask(self, state: str) -> np.ndarray:
+        """Names that pass the state-overlap guard for ``state`` (cached)."""
+        mask = self._state_masks.get(state)
+        if mask is None:
+            mask = np.fromiter(
+                (not states or state in states for states in self._states),
+                dtype=bool, count=len(self._states),
+            )
+            self._state_masks[state] = mask
+        return mask
+
+    def candidates(self, normalized: str, state: str | None, threshold: float) -> list[int]:
+        """Registry-order positions that pass the state guard and may reach ``threshold``.
+
+        Args:
+            normalized: Lowercased, stripped recipient name.
+            state: Uppercase two-letter state code, or None for no state guard.
+            threshold: token_sort_ratio cutoff (0-100).
+        """
+        if not self.names:
+            return []
+        sorted_query = _sorted_tokens(normalized)
+        grams = _trigrams(sorted_query)
+        hits = [self._postings[g] for g in grams if g in self._postings]
+        shared = (
+            np.bincount(np.concatenate(hits), minlength=len(self.names))
+            if hits else np.zeros(len(self.names), dtype=np.int64)
+        )
+        mask = shared >= self._required_overlap(len(sorted_query), len(grams), threshold)
+        if state:
+            mask &= self._state_mask(state)
+        return np.flatnonzero(mask).tolist()
+
+
 class TribalAwardMatcher:
     """Two-tier award-to-Tribe matching with per-Tribe cache writes.
 
@@ -146,6 +255,12 @@ class TribalAwardMatcher:
                 "Invalid JSON in alias table %s: %s", alias_path, exc,
             )
 
+        # Tier 2 candidate index (built on first use) and memo of
+        # already-resolved recipients keyed by (normalized name, state,
+        # threshold).
+        self._fuzzy_index_cache: _FuzzyNameIndex | None = None
+        self._fuzzy_memo: dict[tuple[str, str | None, float], Mapping | None] = {}
+
         # Build reverse lookup: lowercased name -> tribe dict
         self._name_to_tribe: dict[str, dict] = {}
         for tribe in self.registry.get_all():
@@ -216,7 +331,7 @@ class TribalAwardMatcher:
         self,
         recipient_name: str,
         recipient_state: str | None = None,
-    ) -> dict | None:
+    ) -> Mapping | None:
         """Match a USASpending recipient name to a Tribe using two-tier matching.
 
         Tier 1: Curated alias table lookup (O(1)).
@@ -228,7 +343,7 @@ class TribalAwardMatcher:
                 state-overlap validation. None to skip state check.
 
         Returns:
-            Tribe dict if matched, None if no match found.
+            Read-only tribe record if matched, None if no match found.
         """
         if not recipient_name or not recipient_name.strip():
             return None
@@ -236,60 +351,119 @@ class TribalAwardMatcher:
         normalized = recipient_name.strip().lower()
 
         # Tier 1: Alias table lookup
-        tribe_id = self.alias_table.get(normalized)
-        if tribe_id:
-            tribe = self.registry.get_by_id(tribe_id)
-            if tribe:
-                logger.debug(
-                    "Tier 1 alias match: %r -> %s (%s)",
-                    recipient_name, tribe_id, tribe["name"],
-                )
-                return tribe
+        tribe = self._alias_match(normalized)
+        if tribe is not None:
+            logger.debug(
+                "Tier 1 alias match: %r -> %s (%s)",
+                recipient_name, tribe["tribe_id"], tribe["name"],
+            )
+            return tribe
 
         # Tier 2: Fuzzy matching with token_sort_ratio
         try:
-            from rapidfuzz import fuzz
+            from rapidfuzz import fuzz, process
         except ImportError:
             logger.warning(
                 "rapidfuzz not installed -- Tier 2 fuzzy matching unavailable."
             )
             return None
 
-        best_match: dict | None = None
-        best_score: float = 0.0
+        state = recipient_state.upper() if recipient_state else None
+        key = (normalized, state, self.fuzzy_threshold)
+        if key in self._fuzzy_memo:
+            return self._fuzzy_memo[key]
+
+        index = self._fuzzy_index()
+        positions = index.candidates(normalized, state, self.fuzzy_threshold)
+        best_match: Mapping | None = None
+        result = process.extractOne(
+            normalized, [index.names[p] for p in positions],
+            scorer=fuzz.token_sort_ratio,
+            score_cutoff=self.fuzzy_threshold,
+        ) if positions else None
+        # extractOne keeps the first best candidate on ties, matching the
+        # registry-order "score > best_score" scan this replaces.
+        if result is not None and result[1] > 0:
+            best_match = index.tribes[positions[result[2]]]
+            logger.debug(
+                "Tier 2 fuzzy match: %r -> %s (score=%.0f)",
+                recipient_name, best_match["name"], result[1],
+            )
 
-        for tribe in self.registry.get_all():
-            # Check official name + alternate names
-            searchable_names = [tribe["name"]] + tribe.get("alternate_names", [])
+        self._fuzzy_memo[key] = best_match
+        return best_match
 
-            for name in searchable_names:
-                score = fuzz.token_sort_ratio(normalized, name.lower())
+    def _alias_match(self, normalized: str) -> Mapping | None:
+        """Tier 1: resolve a normalized recipient name via the alias table."""
+        tribe_id = self.alias_table.get(normalized)
+        if tribe_id:
+            return self.registry.get_by_id(tribe_id)
+        return None
 
-                if score < self.fuzzy_threshold:
-                    continue
+    def _fuzzy_index(self) -> _FuzzyNameIndex:
+        """Return the Tier 2 trigram index, building it on first use."""
+        if self._fuzzy_index_cache is None:
+            self._fuzzy_index_cache = _FuzzyNameIndex(self.registry.get_all())
+        return self._fuzzy_index_cache
 
-                # State-overlap validation (critical anti-false-positive guard)
-                if recipient_state and tribe.get("states"):
-                    if recipient_state.upper() not in tribe["states"]:
-                        logger.debug(
-                            "Tier 2 state mismatch: %r scored %.0f against %s "
-                            "but state %s not in %s",
-                            recipient_name, score, tribe["name"],
-                            recipient_state, tribe["states"],
-                        )
-                        continue
-
-                if score > best_score:
-                    best_score = score
-                    best_match = tribe
-
-        if best_match:
-            logger.debug(
-                "Tier 2 fuzzy match: %r -> %s (score=%.0f)",
-                recipient_name, best_match["name"], best_score,
+    def _prime_fuzzy_memo(self, queries: set[tuple[str, str | None]]) -> None:
+        """Batch-score unresolved Tier 2 recipients with ``rapidfuzz.process.cdist``.
+
+        Groups (normalized name, state) queries by state and scores each
+        group in one multi-threaded cdist call over the union of its
+        queries' index candidates, filling the memo used by
+        ``match_recipient_to_tribe``. A name outside a query's own
+        candidates cannot reach the cutoff, so scoring it against the
+        union changes nothing. Without rapidfuzz this is a no-op (Tier 2
+        is then unavailable anyway).
+
+        Args:
+            queries: Set of (normalized recipient name, uppercase state or None).
+        """
+        try:
+            from rapidfuzz import fuzz, process
+        except ImportError:
+            return
+
+        by_state: dict[str | None, list[str]] = {}
+        for normalized, state in queries:
+            if (normalized, state, self.fuzzy_threshold) not in self._fuzzy_memo:
+                by_state.setdefault(state, []).append(normalized)
+
+        index = self._fuzzy_index()
+        for state, pending in by_state.items():
+            union: set[int] = set()
+            for normalized in pending:
+                union.update(index.candidates(normalized, state, self.fuzzy_threshold))
+            positions = sorted(union)
+            if not positions:
+                for normalized in pending:
+                    self._fuzzy_memo[(normalized, state, self.fuzzy_threshold)] = None
+                continue
+            # float64 keeps scores bit-identical to the scalar scorer, so
+            # argmax (first maximum) reproduces the scan's tie-breaking.
+            scores = process.cdist(
+                pending, [index.names[p] for p in positions],
+                scorer=fuzz.token_sort_ratio,
+                score_cutoff=self.fuzzy_threshold,
+                dtype=np.float64,
+                workers=-1,
             )
+            best_idx = scores.argmax(axis=1)
+            for row, normalized in enumerate(pending):
+                idx = int(best_idx[row])
+                score = scores[row, idx]
+                match = (
+                    index.tribes[positions[idx]]
+                    if score > 0 and score >= self.fuzzy_threshold
+                    else None
+                )
+                self._fuzzy_memo[(normalized, state, self.fuzzy_threshold)] = match
 
-        return best_match
+        logger.debug(
+            "Tier 2 batch scoring: %d recipients across %d states",
+            sum(len(p) for p in by_state.values()), len(by_state),
+        )
 
     def match_all_awards(
         self, awards_by_cfda: dict[str, list[dict]],
@@ -314,6 +488,23 @@ class TribalAwardMatcher:
         matched_count = 0
         unmatched_count = 0
 
+        # Batch-score every distinct recipient that will miss Tier 1
+        pending: set[tuple[str, str | None]] = set()
+        for awards in awards_by_cfda.values():
+            for award in awards:
+                recipient_name = award.get("Recipient Name", "")
+                normalized = (recipient_name or "").strip().lower()
+                if (
+                    not normalized
+                    or _is_consortium(recipient_name)
+                    or self._alias_match(normalized) is not None
+                ):
+                    continue
+                state = _extract_state_from_name(recipient_name)
+                pending.add((normalized, state.upper() if state else None))
+        if pending:
+            self._prime_fuzzy_memo(pending)
+
         for cfda, awards in awards_by_cfda.items():
             for award in awards:
                 total_awards += 1
@@ -409,12 +600,13 @@ class TribalAwardMatcher:
         fy_start: int | None = None,
         fy_end: int | None = None,
     ) -> int:
-        """Write per-Tribe JSON cache files with enhanced schema.
+        """Write every Tribe's award cache record to the award store.
 
-        Creates a cache file for EVERY Tribe (592), not just those with
+        Creates a record for EVERY Tribe (592), not just those with
         awards. Zero-award Tribes get a ``no_awards_context`` field with
-        advocacy framing. Each file includes year-by-year obligation
-        breakdowns and a funding trend indicator.
+        advocacy framing. Each record includes year-by-year obligation
+        breakdowns and a funding trend indicator. All records go to one
+        AwardCacheStore file in a single atomic write.
 
         Args:
             matched_awards: Dict keyed by tribe_id -> list of award dicts.
@@ -422,88 +614,80 @@ class TribalAwardMatcher:
             fy_end: Last fiscal year in range (default: FISCAL_YEAR_INT).
 
         Returns:
-            Number of cache files written.
+            Number of Tribe records written.
         """
         if fy_end is None:
             fy_end = FISCAL_YEAR_INT
         if fy_start is None:
             fy_start = FISCAL_YEAR_INT - 4
 
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        files_written = 0
-
-        for tribe in self.registry.get_all():
-            tribe_id = tribe["tribe_id"]
-            awards = matched_awards.get(tribe_id, [])
-            total_obligation = sum(a.get("obligation", 0.0) for a in awards)
+        store = AwardCacheStore(self.cache_dir)
+        records_written = store.write_all(
+            self._cache_record(tribe, matched_awards.get(tribe["tribe_id"], []), fy_start, fy_end)
+            for tribe in self.registry.get_all()
+        )
 
-            # Build CFDA summary
-            cfda_summary: dict[str, dict] = {}
-            for award in awards:
-                cfda = award.get("cfda", "")
-                if cfda not in cfda_summary:
-                    cfda_summary[cfda] = {"count": 0, "total": 0.0}
-                cfda_summary[cfda]["count"] += 1
-                cfda_summary[cfda]["total"] += award.get("obligation", 0.0)
-
-            # Build yearly obligations breakdown
-            yearly_obligations: dict[str, float] = {}
-            for fy in range(fy_start, fy_end + 1):
-                yearly_obligations[str(fy)] = 0.0
-            for award in awards:
-                award_fy = _determine_award_fy(award)
-                if award_fy is not None and fy_start <= award_fy <= fy_end:
-                    yearly_obligations[str(award_fy)] += award.get(
-                        "obligation", 0.0,
-                    )
+        logger.info(
+            "Wrote %d award cache records to %s (FY%d-FY%d)",
+            records_written, store.data_path, fy_start, fy_end,
+        )
+        return records_written
 
-            # Compute funding trend
-            trend = _compute_trend(yearly_obligations, fy_start, fy_end)
-
-            cache_data: dict = {
-                "tribe_id": tribe_id,
-                "tribe_name": tribe["name"],
-                "fiscal_year_range": {"start": fy_start, "end": fy_end},
-                "awards": awards,
-                "total_obligation": total_obligation,
-                "award_count": len(awards),
-                "cfda_summary": cfda_summary,
-                "yearly_obligations": yearly_obligations,
-                "trend": trend,
-            }
-
-            if not awards:
-                cache_data["no_awards_context"] = (
-                    "No federal climate resilience awards found in tracked programs. "
-                    "This represents a first-time applicant opportunity -- the Tribe "
-                    "can leverage this status to demonstrate unmet need in competitive "
-                    "grant applications."
+    @staticmethod
+    def _cache_record(tribe: dict, awards: list[dict], fy_start: int, fy_end: int) -> dict:
+        """Build one Tribe's award cache record."""
+        tribe_id = tribe["tribe_id"]
+        total_obligation = sum(a.get("obligation", 0.0) for a in awards)
+
+        # Build CFDA summary
+        cfda_summary: dict[str, dict] = {}
+        for award in awards:
+            cfda = award.get("cfda", "")
+            if cfda not in cfda_summary:
+                cfda_summary[cfda] = {"count": 0, "total": 0.0}
+            cfda_summary[cfda]["count"] += 1
+            cfda_summary[cfda]["total"] += award.get("obligation", 0.0)
+
+        # Build yearly obligations breakdown
+        yearly_obligations: dict[str, float] = {}
+        for fy in range(fy_start, fy_end + 1):
+            yearly_obligations[str(fy)] = 0.0
+        for award in awards:
+            award_fy = _determine_award_fy(award)
+            if award_fy is not None and fy_start <= award_fy <= fy_end:
+                yearly_obligations[str(award_fy)] += award.get(
+                    "obligation", 0.0,
                 )
 
-            cache_path = self.cache_dir / f"{tribe_id}.json"
-            tmp_path = cache_path.with_suffix(".tmp")
-            try:
-                with open(tmp_path, "w", encoding="utf-8") as f:
-                    json.dump(cache_data, f, indent=2, ensure_ascii=False)
-                os.replace(str(tmp_path), str(cache_path))
-            except Exception:
-                if tmp_path.exists():
-                    tmp_path.unlink()
-                raise
-
-            files_written += 1
+        # Compute funding trend
+        trend = _compute_trend(yearly_obligations, fy_start, fy_end)
+
+        cache_data: dict = {
+            "tribe_id": tribe_id,
+            "tribe_name": tribe["name"],
+            "fiscal_year_range": {"start": fy_start, "end": fy_end},
+            "awards": awards,
+            "total_obligation": total_obligation,
+            "award_count": len(awards),
+            "cfda_summary": cfda_summary,
+            "yearly_obligations": yearly_obligations,
+            "trend": trend,
+        }
 
-        logger.info(
-            "Wrote %d cache files to %s (FY%d-FY%d)",
-            files_written, self.cache_dir, fy_start, fy_end,
-        )
-        return files_written
+        if not awards:
+            cache_data["no_awards_context"] = (
+                "No federal climate resilience awards found in tracked programs. "
+                "This represents a first-time applicant opportunity -- the Tribe "
+                "can leverage this status to demonstrate unmet need in competitive "
+                "grant applications."
+            )
+        return cache_data
 
     def run(self, scraper) -> dict:
         """High-level orchestration: fetch, match, cache.
 
         Calls scraper.fetch_all_tribal_awards() (async), matches all
-        awards to Tribes, and writes per-Tribe cache files.
+        awards to Tribes, and writes the award cache store.
 
         Args:
             scraper: USASpendingScraper instance.
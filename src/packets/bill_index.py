@@ -0,0 +1,159 @@
+"""Inverted index over congressional_intel.json bills.
+
+Per-Tribe bill filtering used to scan every tracked bill (and each bill's
+cosponsor list) once per Tribe. BillIndex is built once per loaded intel
+file and maps each lookup key to the positions of the bills it touches:
+
+  - sponsor bioguide_id -> bills sponsored
+  - cosponsor bioguide_id -> bills cosponsored (one entry per listing)
+  - sponsor state -> bills
+  - matched program ID -> bills
+  - committee name / systemCode -> bills referred to that committee
+
+Filtering a Tribe is then a set union over its delegation's postings.
+Positions are indices into the original ``bills`` list, so callers that
+sort them ascending see bills in file order, exactly as a full scan would.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+
+def committee_code(code: str) -> str:
+    """Normalize a committee id to Congress.gov's ``systemCode`` form.
+
+    congressional_cache.json stores committee ids as ``HSAP`` (full
+    committee) or ``HSAP01`` (subcommittee); bills from Congress.gov carry
+    ``hsap00`` and ``hsap01``.
+    """
+    code = code.strip().lower()
+    return code + "00" if len(code) == 4 else code
+
+
+def _bill_committees(bill: dict) -> list[dict]:
+    """Return a bill's committee dicts from either stored shape.
+
+    build_congressional_intel.py writes a flat list; raw Congress.gov
+    records nest them under ``{"item": [...]}``.
+    """
+    committees = bill.get("committees") or []
+    if isinstance(committees, dict):
+        committees = committees.get("item", []) or []
+    return [c for c in committees if isinstance(c, dict)]
+
+
+class BillIndex:
+    """Posting lists from members, states, programs and committees to bills.
+
+    Usage::
+
+        index = BillIndex(intel.get("bills", []))
+        bills = index.bills_for(bioguides={"S000001"}, states={"WA"})
+        activity = index.member_activity("S000001")
+        referred = index.bills_for_committee("HSII")
+
+    Args:
+        bills: Bill dicts from congressional_intel.json, in file order.
+    """
+
+    def __init__(self, bills: list[dict]) -> None:
+        self.bills = bills
+        self._sponsored: dict[str, list[int]] = {}
+        self._cosponsored: dict[str, list[int]] = {}
+        self._by_state: dict[str, list[int]] = {}
+        self._by_program: dict[str, list[int]] = {}
+        self._by_committee: dict[str, list[int]] = {}
+
+        for pos, bill in enumerate(bills):
+            sponsor = bill.get("sponsor", {}) or {}
+            sp_bg = sponsor.get("bioguide_id")
+            if sp_bg:
+                self._sponsored.setdefault(sp_bg, []).append(pos)
+            state = sponsor.get("state", "")
+            if isinstance(state, str) and state:
+                self._by_state.setdefault(state, []).append(pos)
+
+            for cs in bill.get("cosponsors", []) or []:
+                cs_bg = cs.get("bioguide_id")
+                if cs_bg:
+                    self._cosponsored.setdefault(cs_bg, []).append(pos)
+
+            for pid in set(bill.get("matched_programs", []) or []):
+                self._by_program.setdefault(pid, []).append(pos)
+
+            keys: set[str] = set()
+            for comm in _bill_committees(bill):
+                if comm.get("name"):
+                    keys.add(comm["name"])
+                if comm.get("systemCode"):
+                    keys.add(committee_code(comm["systemCode"]))
+            for key in keys:
+                self._by_committee.setdefault(key, []).append(pos)
+
+    def __len__(self) -> int:
+        return len(self.bills)
+
+    def positions_for(
+        self,
+        bioguides: Iterable[str] = (),
+        states: Iterable[str] = (),
+        program_ids: Iterable[str] = (),
+    ) -> list[int]:
+        """Return sorted positions of bills matching any of the keys.
+
+        A bill matches if a member in ``bioguides`` sponsored or cosponsored
+        it, its sponsor's state is in ``states``, or one of its
+        ``matched_programs`` is in ``program_ids``.
+        """
+        positions: set[int] = set()
+        for bg in bioguides:
+            positions.update(self._sponsored.get(bg, ()))
+            positions.update(self._cosponsored.get(bg, ()))
+        for state in states:
+            positions.update(self._by_state.get(state, ()))
+        for pid in program_ids:
+            positions.update(self._by_program.get(pid, ()))
+        return sorted(positions)
+
+    def bills_for(
+        self,
+        bioguides: Iterable[str] = (),
+        states: Iterable[str] = (),
+        program_ids: Iterable[str] = (),
+    ) -> list[dict]:
+        """Return matching bills in file order (see ``positions_for``)."""
+        return [
+            self.bills[pos]
+            for pos in self.positions_for(bioguides, states, program_ids)
+        ]
+
+    def committee_positions(self, committees: Iterable[str]) -> list[int]:
+        """Return sorted positions of bills referred to any of ``committees``.
+
+        Each committee may be given by name, by Congress.gov systemCode, or
+        by congressional_cache.json committee id (see ``committee_code``).
+        """
+        positions: set[int] = set()
+        for committee in committees:
+            if not committee:
+                continue
+            positions.update(self._by_committee.get(committee, ()))
+            positions.update(self._by_committee.get(committee_code(committee), ()))
+        return sorted(positions)
+
+    def bills_for_committee(self, committee: str) -> list[dict]:
+        """Return bills referred to a committee, in file order."""
+        return [self.bills[pos] for pos in self.committee_positions([committee])]
+
+    def member_activity(self, bioguide_id: str) -> tuple[list[dict], list[dict]]:
+        """Return ``(sponsored, cosponsored)`` bills for one member.
+
+        Cosponsored bills repeat if the member is listed more than once on
+        the same bill, matching a scan of every cosponsor entry.
+        """
+        sponsored = [self.bills[pos] for pos in self._sponsored.get(bioguide_id, ())]
+        cosponsored = [
+            self.bills[pos] for pos in self._cosponsored.get(bioguide_id, ())
+        ]
+        return sponsored, cosponsored
@@ -8,6 +8,10 @@ a list of human-readable change dicts.
 First generation (no previous state): returns empty changes list; the
 "Since Last Packet" section is omitted entirely.
 
+The state file also carries ``doc_fingerprints`` -- one
+``document_fingerprint()`` per generated document type -- so the
+orchestrator can skip re-rendering a document whose inputs are unchanged.
+
 Security considerations:
     - Path traversal protection via ``Path(tribe_id).name`` + reject ``.``/``..``
     - JSON cache size limit: 10 MB cap via ``stat().st_size`` before ``json.load()``
@@ -20,10 +24,12 @@ Concurrency:
     worker affinity.
 """
 
+import hashlib
 import json
 import logging
 import os
 import tempfile
+from dataclasses import asdict, is_dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -35,6 +41,46 @@ logger = logging.getLogger(__name__)
 MAX_STATE_FILE_SIZE: int = 10 * 1024 * 1024  # 10 MB
 
 
+def _jsonable(obj):
+    """json.dumps fallback: dataclasses as dicts, anything else as str."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
+
+def document_fingerprint(
+    context: TribePacketContext,
+    doc_type: str,
+    renderer_digest: str,
+    **inputs,
+) -> str:
+    """SHA256 over the exact inputs DocxEngine renders one document from.
+
+    ``context.generated_at`` is excluded so an unchanged Tribe keeps its
+    fingerprint across runs. The "Since Last Packet" changes are excluded
+    too: they are derived from this state file, and a skipped document
+    keeps the section it was rendered with.
+
+    Args:
+        context: Fully populated (economics-enriched) TribePacketContext.
+        doc_type: Document type identifier ("A", "B").
+        renderer_digest: Digest of the renderer version and template.
+        **inputs: Remaining render inputs (relevant/omitted programs,
+            economic summary, structural asks).
+
+    Returns:
+        Hex digest string.
+    """
+    payload = asdict(context)
+    payload.pop("generated_at", None)
+    h = hashlib.sha256(f"{renderer_digest}|{doc_type}|".encode("utf-8"))
+    h.update(json.dumps(
+        {"context": payload, **inputs},
+        sort_keys=True, separators=(",", ":"), default=_jsonable,
+    ).encode("utf-8"))
+    return h.hexdigest()
+
+
 class PacketChangeTracker:
     """Tracks state between packet generations to detect meaningful changes.
 
@@ -0,0 +1,382 @@
+"""Columnar binary store for county-level CSV tables (FEMA NRI, CDC SVI).
+
+The hazard builders used to parse ``NRI_Table_Counties.csv`` (~3,200 rows x
+~470 columns) and the SVI county CSV with ``csv.DictReader`` on every build.
+This module converts a CSV once into a columnar store next to it:
+
+    .NRI_Table_Counties.csv.colstore/
+        manifest.json          -- headers, column kinds, text vocabularies,
+                                  source SHA256
+        floats-<sha>.npy       -- float64 [n_float_columns, n_rows]
+        codes-<sha>.npy        -- int32   [n_text_columns,  n_rows]
+
+Numeric columns hold NaN wherever ``_safe_float`` would fall back to its
+default (empty, non-numeric, NaN, inf). Text columns are interned: each
+cell is an index into a per-column vocabulary, so FIPS codes, county names
+and rating strings are stored once. Both arrays are memory-mapped on load.
+
+The store is keyed by the source file's SHA256: every open re-validates
+the CSV with ``validate_nri_checksum`` and rebuilds on mismatch. Within a
+process, opened tables are shared, so HazardProfileBuilder and
+NRIExpandedBuilder read the same mapping.
+
+Builders read columns through ``CountyTable.row_reader`` and expose their
+per-county dicts through ``CountyRecords``, which builds a county's record
+only when it is first looked up.
+
+Usage:
+    table = open_county_table(csv_path, text_columns=("STCOFIPS", "COUNTY"))
+    fips = table.strings("STCOFIPS")
+    read = table.row_reader(["RISK_SCORE"], ["COUNTY"])
+    (risk,), (county,) = read(0)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import json
+import logging
+import math
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+STORE_FORMAT: int = 1
+"""Bumped when the on-disk layout changes; older stores are rebuilt."""
+
+# Process-wide cache of opened tables: (resolved path, size, mtime_ns) -> table
+_TABLES: dict[tuple[str, int, int], "CountyTable"] = {}
+
+
+def _parse_float(text: str | None) -> float | None:
+    """Parse one CSV cell the way ``_safe_float`` does.
+
+    Returns:
+        The float value, NaN for empty/None/NaN/inf cells, or None if the
+        cell is non-numeric text.
+    """
+    if text is None:
+        return math.nan
+    s = text.strip()
+    if not s:
+        return math.nan
+    try:
+        value = float(s)
+    except ValueError:
+        return None
+    if math.isnan(value) or math.isinf(value):
+        return math.nan
+    return value
+
+
+def store_dir_for(csv_path: Path) -> Path:
+    """Return the store directory that sits next to ``csv_path``."""
+    return csv_path.parent / f".{csv_path.name}.colstore"
+
+
+class CountyTable:
+    """Read-only columnar view of one county CSV.
+
+    Attributes:
+        source: Path of the CSV the table was built from.
+        sha256: SHA256 of that CSV.
+        headers: CSV header names, in file order.
+        n_rows: Number of data rows.
+    """
+
+    def __init__(
+        self,
+        source: Path,
+        manifest: dict,
+        floats: np.ndarray,
+        codes: np.ndarray,
+    ) -> None:
+        self.source = source
+        self.sha256: str = manifest["sha256"]
+        self.headers: list[str] = manifest["headers"]
+        self.n_rows: int = manifest["rows"]
+        self._float_index: dict[str, int] = {
+            name: i for i, name in enumerate(manifest["float_columns"])
+        }
+        self._text_index: dict[str, int] = {
+            name: i for i, name in enumerate(manifest["text_columns"])
+        }
+        self._vocab: list[list[str]] = manifest["vocab"]
+        self._floats = floats
+        self._codes = codes
+
+    @property
+    def text_columns(self) -> list[str]:
+        """Columns stored as interned text."""
+        return list(self._text_index)
+
+    def floats(self, name: str) -> np.ndarray:
+        """Return a column as float64, NaN where the cell is not a number.
+
+        Absent columns come back as all-NaN, mirroring ``row.get(name)``
+        returning None.
+        """
+        if name in self._float_index:
+            return self._floats[self._float_index[name]]
+        if name in self._text_index:
+            parsed = [_parse_float(v) for v in self._vocab[self._text_index[name]]]
+            lookup = np.array(
+                [math.nan if v is None else v for v in parsed], dtype=np.float64,
+            )
+            return lookup[self._codes[self._text_index[name]]]
+        return np.full(self.n_rows, math.nan)
+
+    def strings(self, name: str) -> list[str]:
+        """Return a text column as raw (unstripped) strings.
+
+        Absent columns come back as empty strings.
+
+        Raises:
+            TypeError: If the column was stored as numeric; open the table
+                with the column in ``text_columns`` instead.
+        """
+        if name in self._text_index:
+            vocab = self._vocab[self._text_index[name]]
+            return [vocab[c] for c in self._codes[self._text_index[name]].tolist()]
+        if name in self._float_index:
+            raise TypeError(f"Column {name!r} is stored as numeric")
+        return [""] * self.n_rows
+
+    def row_reader(
+        self,
+        float_columns: list[str],
+        text_columns: list[str] = (),
+    ) -> Callable[[int], tuple[list[float], list[str]]]:
+        """Return ``read(row) -> (floats, strings)`` for a fixed column set.
+
+        Numeric values keep NaN for missing cells; callers apply their own
+        defaults. Reading one row touches only the requested columns.
+        """
+        stored = [c for c in float_columns if c in self._float_index]
+        if len(stored) == len(float_columns):
+            block = self._floats
+            idx = np.array([self._float_index[c] for c in float_columns], dtype=np.intp)
+        else:
+            block = np.stack([self.floats(c) for c in float_columns]) if float_columns \
+                else np.empty((0, self.n_rows))
+            idx = np.arange(len(float_columns), dtype=np.intp)
+
+        text_getters: list[Callable[[int], str]] = []
+        for name in text_columns:
+            if name in self._text_index:
+                col = self._codes[self._text_index[name]]
+                vocab = self._vocab[self._text_index[name]]
+                text_getters.append(lambda row, col=col, vocab=vocab: vocab[col[row]])
+            elif name in self._float_index:
+                raise TypeError(f"Column {name!r} is stored as numeric")
+            else:
+                text_getters.append(lambda row: "")
+
+        def read(row: int) -> tuple[list[float], list[str]]:
+            return block[idx, row].tolist(), [get(row) for get in text_getters]
+
+        return read
+
+
+class CountyRecords(Mapping):
+    """Lazy ``key -> record dict`` mapping over a CountyTable.
+
+    Behaves like the dict-of-dicts the builders used to build eagerly
+    (later rows win on duplicate keys, iteration follows first
+    appearance), but a county's record is only built -- and then cached --
+    when it is looked up.
+
+    Args:
+        keys: One key per table row; rows with an empty key are skipped.
+        make_record: ``make_record(key, row) -> dict``.
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str],
+        make_record: Callable[[str, int], dict],
+    ) -> None:
+        self._rows: dict[str, int] = {}
+        for row, key in enumerate(keys):
+            if key:
+                self._rows[key] = row
+        self._make_record = make_record
+        self._cache: dict[str, dict] = {}
+
+    def __getitem__(self, key: str) -> dict:
+        record = self._cache.get(key)
+        if record is None:
+            record = self._cache[key] = self._make_record(key, self._rows[key])
+        return record
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+def open_county_table(
+    csv_path: Path,
+    text_columns: Iterable[str] = (),
+) -> CountyTable:
+    """Open (building or rebuilding if needed) the store for ``csv_path``.
+
+    Args:
+        csv_path: County CSV (NRI or SVI).
+        text_columns: Columns that must be kept as text even when every
+            value looks numeric (FIPS codes, names, ratings). Matched
+            case-insensitively against the CSV headers.
+
+    Returns:
+        CountyTable for the current contents of ``csv_path``.
+    """
+    from src.packets.nri_expanded import _compute_sha256, validate_nri_checksum
+
+    wanted = {c.upper() for c in text_columns}
+    stat = csv_path.stat()
+    cache_key = (str(csv_path.resolve()), stat.st_size, stat.st_mtime_ns)
+    table = _TABLES.get(cache_key)
+    if table is not None and _covers(table.headers, table.text_columns, wanted):
+        return table
+
+    store_dir = store_dir_for(csv_path)
+    manifest = _read_manifest(store_dir)
+    if (
+        manifest is not None
+        and manifest.get("format") == STORE_FORMAT
+        and _covers(manifest["headers"], manifest["text_columns"], wanted)
+        and validate_nri_checksum(csv_path, manifest["sha256"])
+    ):
+        try:
+            table = CountyTable(
+                csv_path,
+                manifest,
+                np.load(store_dir / manifest["floats_file"], mmap_mode="r"),
+                np.load(store_dir / manifest["codes_file"], mmap_mode="r"),
+            )
+        except (OSError, ValueError) as exc:
+            logger.warning("County store at %s unreadable (%s), rebuilding", store_dir, exc)
+            table = None
+    else:
+        table = None
+
+    if table is None:
+        if manifest is not None:
+            wanted |= {c.upper() for c in manifest.get("text_columns", [])}
+        table = _build(csv_path, store_dir, _compute_sha256(csv_path), wanted)
+
+    _TABLES[cache_key] = table
+    return table
+
+
+def _covers(headers: list[str], stored_text: list[str], wanted: set[str]) -> bool:
+    """True if every wanted text column present in ``headers`` is stored as text."""
+    stored = {c.upper() for c in stored_text}
+    return all(h.upper() in stored for h in headers if h.upper() in wanted)
+
+
+def _read_manifest(store_dir: Path) -> dict | None:
+    try:
+        with open(store_dir / "manifest.json", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _build(csv_path: Path, store_dir: Path, sha256: str, wanted: set[str]) -> CountyTable:
+    """Convert ``csv_path`` to columns and persist them (best effort)."""
+    logger.info("Building county column store for %s", csv_path)
+    with open(csv_path, encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        headers = next(reader, [])
+        rows = list(reader)
+
+    # Duplicate headers: the last occurrence wins, as with csv.DictReader
+    positions = {name: i for i, name in enumerate(headers)}
+    names = list(positions)
+    float_columns: list[str] = []
+    float_data: list[np.ndarray] = []
+    text_columns: list[str] = []
+    text_codes: list[np.ndarray] = []
+    vocab: list[list[str]] = []
+
+    for name in names:
+        pos = positions[name]
+        cells = [row[pos] if pos < len(row) else None for row in rows]
+        if name.upper() not in wanted:
+            parsed = [_parse_float(c) for c in cells]
+            if all(v is not None for v in parsed):
+                float_columns.append(name)
+                float_data.append(np.array(parsed, dtype=np.float64))
+                continue
+        interned: dict[str, int] = {}
+        text_codes.append(np.array(
+            [interned.setdefault(c or "", len(interned)) for c in cells], dtype=np.int32,
+        ))
+        text_columns.append(name)
+        vocab.append(list(interned))
+
+    n_rows = len(rows)
+    floats = np.array(float_data, dtype=np.float64).reshape(len(float_columns), n_rows)
+    codes = np.array(text_codes, dtype=np.int32).reshape(len(text_columns), n_rows)
+    manifest = {
+        "format": STORE_FORMAT,
+        "source": csv_path.name,
+        "sha256": sha256,
+        "rows": n_rows,
+        "headers": names,
+        "float_columns": float_columns,
+        "text_columns": text_columns,
+        "vocab": vocab,
+        "floats_file": f"floats-{sha256[:16]}.npy",
+        "codes_file": f"codes-{sha256[:16]}.npy",
+    }
+
+    try:
+        _write_store(store_dir, manifest, floats, codes)
+    except OSError as exc:
+        logger.warning(
+            "Could not persist county store at %s (%s); using in-memory columns",
+            store_dir, exc,
+        )
+        return CountyTable(csv_path, manifest, floats, codes)
+
+    return CountyTable(
+        csv_path,
+        manifest,
+        np.load(store_dir / manifest["floats_file"], mmap_mode="r"),
+        np.load(store_dir / manifest["codes_file"], mmap_mode="r"),
+    )
+
+
+def _write_store(store_dir: Path, manifest: dict, floats: np.ndarray, codes: np.ndarray) -> None:
+    """Write data files, then the manifest (the commit point), then prune."""
+    store_dir.mkdir(parents=True, exist_ok=True)
+    keep = {"manifest.json", manifest["floats_file"], manifest["codes_file"]}
+    for filename, array in (
+        (manifest["floats_file"], floats),
+        (manifest["codes_file"], codes),
+    ):
+        tmp = store_dir / f"{filename}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, array)
+        os.replace(tmp, store_dir / filename)
+
+    tmp = store_dir / "manifest.json.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp, store_dir / "manifest.json")
+
+    for stale in store_dir.iterdir():
+        if stale.name not in keep:
+            with contextlib.suppress(OSError):
+                stale.unlink()
@@ -402,8 +402,14 @@ def render_regional_delegation(
         )
 
         headers = ["Member", "Role", "Tribes Served", "Key Committees"]
+        # Tracked bills before the member's committees (needs a BillIndex)
+        show_bills = any(
+            "committee_bills" in m for m in ctx.delegation_overlap
+        )
+        if show_bills:
+            headers.append("Tracked Bills in Committee")
         table = doc.add_table(
-            rows=1 + len(ctx.delegation_overlap), cols=4
+            rows=1 + len(ctx.delegation_overlap), cols=len(headers)
         )
         format_header_row(table, headers)
 
@@ -416,6 +422,8 @@ def render_regional_delegation(
             row.cells[3].text = "; ".join(
                 c for c in committees if c
             )[:100]  # Truncate long committee lists
+            if show_bills:
+                row.cells[4].text = str(member.get("committee_bills", 0))
 
         apply_zebra_stripe(table)
 
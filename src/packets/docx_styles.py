@@ -175,6 +175,17 @@ class StyleManager:
         self.doc = document
         self._create_styles()
 
+    @classmethod
+    def attach(cls, document: Document) -> "StyleManager":
+        """Wrap a document whose custom styles are already registered.
+
+        Used for documents cloned from a styled prototype, where running
+        ``_create_styles()`` again would only re-scan the style table.
+        """
+        manager = cls.__new__(cls)
+        manager.doc = document
+        return manager
+
     def _create_styles(self) -> None:
         """Create all custom paragraph styles, skipping any that already exist."""
         existing_names = {s.name for s in self.doc.styles}
@@ -1,7 +1,8 @@
 """Hazard profiling pipeline: FEMA NRI + USFS Wildfire Risk ingestion.
 
 Builds per-Tribe hazard profiles by:
-  1. Parsing FEMA National Risk Index (NRI) county-level CSV data
+  1. Parsing FEMA National Risk Index (NRI) county-level CSV data (via the
+     columnar county store in county_store.py)
   2. Bridging NRI counties to Tribal areas via AIANNH crosswalk
   3. Parsing USFS Wildfire Risk to Communities XLSX data
   4. Aggregating and caching per-Tribe hazard profiles as JSON
@@ -21,6 +22,7 @@ import csv
 import json
 import logging
 import math
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -30,6 +32,7 @@ from src.packets._geo_common import (
     load_aiannh_crosswalk,
     load_area_weights,
 )
+from src.packets.county_store import CountyRecords, open_county_table
 from src.paths import (
     AIANNH_CROSSWALK_PATH,
     HAZARD_PROFILES_DIR,
@@ -64,6 +67,14 @@ NRI_HAZARD_CODES = {
     "WNTW": "Winter Weather",
 }
 
+# NRI columns read back as text; the county store keeps them interned
+# rather than numeric (FIPS codes keep their leading zeros).
+NRI_TEXT_COLUMNS: tuple[str, ...] = (
+    "STCOFIPS", "COUNTY", "STATE",
+    "RISK_RATNG", "EAL_RATNG", "SOVI_RATNG", "RESL_RATNG",
+    *(f"{code}_RISKR" for code in NRI_HAZARD_CODES),
+)
+
 # US state abbreviation to FIPS prefix mapping for state-level fallback
 _STATE_FIPS_PREFIX = {
     "AL": "01", "AK": "02", "AZ": "04", "AR": "05", "CA": "06",
@@ -236,15 +247,16 @@ class HazardProfileBuilder:
         )
         return default_version
 
-    def _load_nri_county_data(self) -> dict[str, dict]:
-        """Parse the NRI county-level CSV file.
+    def _load_nri_county_data(self) -> Mapping[str, dict]:
+        """Load NRI county-level metrics from the columnar county store.
 
-        Reads data/nri/NRI_Table_Counties.csv and extracts composite
+        Reads data/nri/NRI_Table_Counties.csv through the county store
+        (converted once, memory-mapped afterwards) and exposes composite
         risk metrics plus per-hazard scores for all 18 hazard types.
 
         Returns:
-            Dict keyed by STCOFIPS (state+county FIPS) -> metrics dict.
-            Empty dict if the file does not exist.
+            Mapping keyed by STCOFIPS (state+county FIPS) -> metrics dict,
+            built lazily per county. Empty dict if the file does not exist.
         """
         csv_path = self.nri_dir / "NRI_Table_Counties.csv"
         if not csv_path.exists():
@@ -256,7 +268,6 @@ class HazardProfileBuilder:
             )
             return {}
 
-        county_data: dict[str, dict] = {}
         logger.info("Loading NRI county data from %s", csv_path)
 
         # Detect NRI version from directory structure or filename
@@ -264,47 +275,55 @@ class HazardProfileBuilder:
         # e.g. .../nri/v120/NRI_Table_Counties.zip -> version "NRI_v1.20"
         self._nri_version = self._detect_nri_version(csv_path)
 
-        with open(csv_path, encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            row_count = 0
-            for row in reader:
-                fips = row.get("STCOFIPS", "").strip()
-                fips = fips.zfill(5) if fips else fips
-                if not fips:
-                    continue
+        table = open_county_table(csv_path, text_columns=NRI_TEXT_COLUMNS)
+        hazard_fields = ("RISKS", "EALT", "AFREQ", "EVNTS")
+        read = table.row_reader(
+            ["RISK_SCORE", "RISK_VALUE", "EAL_VALT", "EAL_SCORE", "SOVI_SCORE", "RESL_SCORE"]
+            + [f"{code}_{field}" for code in NRI_HAZARD_CODES for field in hazard_fields],
+            ["COUNTY", "STATE", "RISK_RATNG", "EAL_RATNG", "SOVI_RATNG", "RESL_RATNG"]
+            + [f"{code}_RISKR" for code in NRI_HAZARD_CODES],
+        )
 
-                record: dict = {
-                    "fips": fips,
-                    "county": row.get("COUNTY", ""),
-                    "state": row.get("STATE", ""),
-                    # Composite risk metrics
-                    "risk_score": _safe_float(row.get("RISK_SCORE")),
-                    "risk_rating": row.get("RISK_RATNG", "").strip(),
-                    "risk_value": _safe_float(row.get("RISK_VALUE")),
-                    "eal_total": _safe_float(row.get("EAL_VALT")),
-                    "eal_score": _safe_float(row.get("EAL_SCORE")),
-                    "eal_rating": row.get("EAL_RATNG", "").strip(),
-                    "sovi_score": _safe_float(row.get("SOVI_SCORE")),
-                    "sovi_rating": row.get("SOVI_RATNG", "").strip(),
-                    "resl_score": _safe_float(row.get("RESL_SCORE")),
-                    "resl_rating": row.get("RESL_RATNG", "").strip(),
-                    # Per-hazard metrics
-                    "hazards": {},
+        def make_record(fips: str, row: int) -> dict:
+            values, text = read(row)
+            values = [0.0 if v != v else v for v in values]  # NaN -> _safe_float default
+            (risk_score, risk_value, eal_total, eal_score, sovi_score, resl_score) = values[:6]
+            county, state, risk_rating, eal_rating, sovi_rating, resl_rating = text[:6]
+            record: dict = {
+                "fips": fips,
+                "county": county,
+                "state": state,
+                # Composite risk metrics
+                "risk_score": risk_score,
+                "risk_rating": risk_rating.strip(),
+                "risk_value": risk_value,
+                "eal_total": eal_total,
+                "eal_score": eal_score,
+                "eal_rating": eal_rating.strip(),
+                "sovi_score": sovi_score,
+                "sovi_rating": sovi_rating.strip(),
+                "resl_score": resl_score,
+                "resl_rating": resl_rating.strip(),
+                # Per-hazard metrics
+                "hazards": {},
+            }
+            for i, code in enumerate(NRI_HAZARD_CODES):
+                risk, eal, freq, events = values[6 + 4 * i:10 + 4 * i]
+                record["hazards"][code] = {
+                    "risk_score": risk,
+                    "risk_rating": text[6 + i].strip(),
+                    "eal_total": eal,
+                    "annualized_freq": freq,
+                    "num_events": events,
                 }
+            return record
 
-                for code in NRI_HAZARD_CODES:
-                    record["hazards"][code] = {
-                        "risk_score": _safe_float(row.get(f"{code}_RISKS")),
-                        "risk_rating": row.get(f"{code}_RISKR", "").strip(),
-                        "eal_total": _safe_float(row.get(f"{code}_EALT")),
-                        "annualized_freq": _safe_float(row.get(f"{code}_AFREQ")),
-                        "num_events": _safe_float(row.get(f"{code}_EVNTS")),
-                    }
-
-                county_data[fips] = record
-                row_count += 1
+        county_data = CountyRecords(
+            (fips.strip().zfill(5) if fips.strip() else "" for fips in table.strings("STCOFIPS")),
+            make_record,
+        )
 
-        logger.info("Loaded NRI data for %d counties", row_count)
+        logger.info("Loaded NRI data for %d counties", len(county_data))
         return county_data
 
     def _load_nri_tribal_relational(self) -> dict[str, list[str]]:
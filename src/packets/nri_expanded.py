@@ -20,20 +20,23 @@ Usage:
     print(f"Built {count} NRI expanded profiles")
 """
 
-import bisect
-import csv
 import hashlib
 import json
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
 from src.packets._geo_common import (
     atomic_write_json,
     load_aiannh_crosswalk,
     load_area_weights,
 )
-from src.packets.hazards import NRI_HAZARD_CODES, _safe_float
+from src.packets.county_store import CountyRecords, open_county_table
+from src.packets.hazards import NRI_HAZARD_CODES, NRI_TEXT_COLUMNS
+from src.packets.tribe_matrix import TribeCountyMatrix
 from src.paths import (
     AIANNH_CROSSWALK_PATH,
     NRI_DIR,
@@ -89,6 +92,19 @@ _REQUIRED_HEADERS: frozenset[str] = frozenset({
     "BUILDVALUE",
 })
 
+# County record fields summed (area-weighted) into each Tribe's profile;
+# column order of the batch aggregation metric matrix.
+_NRI_SUM_FIELDS: tuple[str, ...] = (
+    "risk_score",
+    "eal_total",
+    "eal_buildings",
+    "eal_population",
+    "eal_agriculture",
+    "eal_population_equivalence",
+    "sovi_score",
+    "resl_score",
+)
+
 
 # ---------------------------------------------------------------------------
 # -- Public validation function --
@@ -129,6 +145,43 @@ def _compute_sha256(file_path: Path) -> str:
         return hashlib.file_digest(f, "sha256").hexdigest()
 
 
+def _risk_percentiles(sorted_scores: list[float], risk_scores) -> list[float]:
+    """Vectorized national percentile lookup for many risk scores.
+
+    Same rules as NRIExpandedBuilder._get_risk_percentile: bisect_left
+    rank, exact matches use rank / (N-1), scores between two counties are
+    linearly interpolated, and non-positive scores map to 0.0.
+
+    Args:
+        sorted_scores: Ascending national RISK_SCORE base.
+        risk_scores: Scores to look up.
+
+    Returns:
+        Percentiles in [0.0, 100.0], rounded to 2 places.
+    """
+    scores = np.asarray(risk_scores, dtype=np.float64)
+    n = len(sorted_scores)
+    if n == 0:
+        result = np.zeros_like(scores)
+    elif n == 1:
+        result = np.where(scores > 0, 50.0, 0.0)
+    else:
+        base = np.asarray(sorted_scores, dtype=np.float64)
+        rank = np.searchsorted(base, scores, side="left")
+        upper_idx = np.clip(rank, 1, n - 1)
+        lower = base[upper_idx - 1]
+        upper = base[upper_idx]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraction = np.where(upper > lower, (scores - lower) / (upper - lower), 0.0)
+        interpolated = np.minimum(((rank - 1 + fraction) / (n - 1)) * 100.0, 100.0)
+        exact = base[np.minimum(rank, n - 1)] == scores
+        result = np.where(exact, (rank / (n - 1)) * 100.0, interpolated)
+        result = np.where(rank == 0, 0.0, result)
+        result = np.where(rank >= n, 100.0, result)
+    result = np.where(scores <= 0, 0.0, result)
+    return [round(p, 2) for p in result.tolist()]
+
+
 # ---------------------------------------------------------------------------
 # -- NRIExpandedBuilder --
 # ---------------------------------------------------------------------------
@@ -159,6 +212,9 @@ class NRIExpandedBuilder:
         output_dir: Directory for per-Tribe NRI expanded JSON files.
     """
 
+    # (county data, fips -> row, county x metric matrix) for batch aggregation
+    _metric_matrix: tuple[Mapping[str, dict], dict[str, int], np.ndarray] | None = None
+
     def __init__(self, config: dict) -> None:
         """Initialize the builder.
 
@@ -193,7 +249,7 @@ class NRIExpandedBuilder:
         )
 
         # NRI county data (populated by _load_nri_csv)
-        self._county_data: dict[str, dict] = {}
+        self._county_data: Mapping[str, dict] = {}
         self._nri_sha256: str = ""
         self._nri_version: str = "NRI_v1.20"
 
@@ -202,16 +258,18 @@ class NRIExpandedBuilder:
 
     # -- Step 4: Load NRI CSV with version pinning (XCUT-03) --
 
-    def _load_nri_csv(self) -> dict[str, dict]:
+    def _load_nri_csv(self) -> Mapping[str, dict]:
         """Parse the NRI county-level CSV with SHA256 version pinning.
 
-        Computes SHA256 in 64KB chunks for reproducibility. If
-        expected_sha256 is set, compares and logs WARNING on mismatch.
-        Handles Connecticut FIPS remapping for legacy vs planning region.
+        Reads through the columnar county store shared with
+        HazardProfileBuilder; the store is re-validated against the CSV's
+        SHA256 on every open. If expected_sha256 is set, compares and logs
+        WARNING on mismatch. Handles Connecticut FIPS remapping for legacy
+        vs planning region.
 
         Returns:
-            Dict keyed by STCOFIPS -> metrics dict.
-            Empty dict if CSV not found.
+            Mapping keyed by STCOFIPS -> metrics dict, built lazily per
+            county. Empty dict if CSV not found.
         """
         if not self.nri_csv_path.exists():
             logger.warning(
@@ -221,8 +279,10 @@ class NRIExpandedBuilder:
             )
             return {}
 
+        table = open_county_table(self.nri_csv_path, text_columns=NRI_TEXT_COLUMNS)
+
         # SHA256 version pinning (XCUT-03)
-        self._nri_sha256 = _compute_sha256(self.nri_csv_path)
+        self._nri_sha256 = table.sha256
         logger.info("NRI CSV SHA256: %s", self._nri_sha256)
 
         if self.expected_sha256:
@@ -236,98 +296,105 @@ class NRIExpandedBuilder:
             else:
                 logger.info("NRI CSV SHA256 matches expected checksum")
 
-        # Read CSV with BOM handling
-        county_data: dict[str, dict] = {}
-
-        with open(self.nri_csv_path, encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            headers = set(reader.fieldnames or [])
+        # Validate required headers
+        missing = _REQUIRED_HEADERS - set(table.headers)
+        if missing:
+            logger.warning(
+                "NRI CSV missing required headers: %s. "
+                "Some expanded metrics may be unavailable.",
+                sorted(missing),
+            )
 
-            # Validate required headers
-            missing = _REQUIRED_HEADERS - headers
-            if missing:
-                logger.warning(
-                    "NRI CSV missing required headers: %s. "
-                    "Some expanded metrics may be unavailable.",
-                    sorted(missing),
-                )
+        # Detect CT FIPS format in crosswalk to decide remapping direction
+        crosswalk_fips = set()
+        for entries in self._area_weights.values():
+            for entry in entries:
+                fips = entry.get("county_fips", "")
+                if fips.startswith("09"):
+                    crosswalk_fips.add(fips)
 
-            # Detect CT FIPS format in crosswalk to decide remapping direction
-            crosswalk_fips = set()
-            for entries in self._area_weights.values():
-                for entry in entries:
-                    fips = entry.get("county_fips", "")
-                    if fips.startswith("09"):
-                        crosswalk_fips.add(fips)
+        crosswalk_uses_legacy = any(
+            f in CT_LEGACY_TO_PLANNING for f in crosswalk_fips
+        )
+        crosswalk_uses_planning = any(
+            f in CT_PLANNING_TO_LEGACY for f in crosswalk_fips
+        )
 
-            crosswalk_uses_legacy = any(
-                f in CT_LEGACY_TO_PLANNING for f in crosswalk_fips
-            )
-            crosswalk_uses_planning = any(
-                f in CT_PLANNING_TO_LEGACY for f in crosswalk_fips
+        keys: list[str] = []
+        original: dict[str, str] = {}
+        ct_remapped = 0
+
+        for fips in table.strings("STCOFIPS"):
+            fips = fips.strip()
+            fips = fips.zfill(5) if fips else fips
+
+            # CT FIPS handling: remap to match crosswalk format
+            original_fips = fips
+            if fips.startswith("09"):
+                if crosswalk_uses_legacy and fips in CT_PLANNING_TO_LEGACY:
+                    # NRI uses planning, crosswalk uses legacy -> remap to legacy
+                    fips = CT_PLANNING_TO_LEGACY[fips]
+                    ct_remapped += 1
+                elif crosswalk_uses_planning and fips in CT_LEGACY_TO_PLANNING:
+                    # NRI uses legacy, crosswalk uses planning -> remap to planning
+                    fips = CT_LEGACY_TO_PLANNING[fips]
+                    ct_remapped += 1
+            keys.append(fips)
+            if fips:
+                original[fips] = original_fips
+
+        if ct_remapped > 0:
+            logger.info(
+                "Remapped %d Connecticut FIPS codes to match crosswalk format",
+                ct_remapped,
             )
 
-            row_count = 0
-            ct_remapped = 0
+        read = table.row_reader(
+            [
+                "RISK_SCORE", "EAL_VALT", "EAL_VALB", "EAL_VALP", "EAL_VALA",
+                "EAL_VALPE", "SOVI_SCORE", "RESL_SCORE", "POPULATION", "BUILDVALUE",
+            ]
+            + [f"{code}_{field}" for code in NRI_HAZARD_CODES for field in ("EALT", "RISKS")],
+            ["COUNTY", "STATE", "RISK_RATNG"],
+        )
 
-            for row in reader:
-                fips = row.get("STCOFIPS", "").strip()
-                fips = fips.zfill(5) if fips else fips
-                if not fips:
-                    continue
+        def make_record(fips: str, row: int) -> dict:
+            values, (county, state, risk_rating) = read(row)
+            values = [0.0 if v != v else v for v in values]  # NaN -> _safe_float default
+            record: dict = {
+                "fips": fips,
+                "original_fips": original[fips],
+                "county": county,
+                "state": state,
+                # Composite risk
+                "risk_score": values[0],
+                "risk_rating": risk_rating.strip(),
+                # EAL breakdown by consequence type
+                "eal_total": values[1],
+                "eal_buildings": values[2],
+                "eal_population": values[3],
+                "eal_agriculture": values[4],
+                "eal_population_equivalence": values[5],
+                # Social vulnerability and community resilience
+                "sovi_score": values[6],
+                "resl_score": values[7],
+                # Demographics
+                "population": values[8],
+                "building_value": values[9],
+                # Per-hazard EAL for top hazard ranking
+                "hazards": {},
+            }
 
-                # CT FIPS handling: remap to match crosswalk format
-                original_fips = fips
-                if fips.startswith("09"):
-                    if crosswalk_uses_legacy and fips in CT_PLANNING_TO_LEGACY:
-                        # NRI uses planning, crosswalk uses legacy -> remap to legacy
-                        fips = CT_PLANNING_TO_LEGACY[fips]
-                        ct_remapped += 1
-                    elif crosswalk_uses_planning and fips in CT_LEGACY_TO_PLANNING:
-                        # NRI uses legacy, crosswalk uses planning -> remap to planning
-                        fips = CT_LEGACY_TO_PLANNING[fips]
-                        ct_remapped += 1
-
-                record: dict = {
-                    "fips": fips,
-                    "original_fips": original_fips,
-                    "county": row.get("COUNTY", ""),
-                    "state": row.get("STATE", ""),
-                    # Composite risk
-                    "risk_score": _safe_float(row.get("RISK_SCORE")),
-                    "risk_rating": row.get("RISK_RATNG", "").strip(),
-                    # EAL breakdown by consequence type
-                    "eal_total": _safe_float(row.get("EAL_VALT")),
-                    "eal_buildings": _safe_float(row.get("EAL_VALB")),
-                    "eal_population": _safe_float(row.get("EAL_VALP")),
-                    "eal_agriculture": _safe_float(row.get("EAL_VALA")),
-                    "eal_population_equivalence": _safe_float(row.get("EAL_VALPE")),
-                    # Social vulnerability and community resilience
-                    "sovi_score": _safe_float(row.get("SOVI_SCORE")),
-                    "resl_score": _safe_float(row.get("RESL_SCORE")),
-                    # Demographics
-                    "population": _safe_float(row.get("POPULATION")),
-                    "building_value": _safe_float(row.get("BUILDVALUE")),
-                    # Per-hazard EAL for top hazard ranking
-                    "hazards": {},
+            for i, code in enumerate(NRI_HAZARD_CODES):
+                record["hazards"][code] = {
+                    "eal_total": values[10 + 2 * i],
+                    "risk_score": values[11 + 2 * i],
                 }
+            return record
 
-                for code in NRI_HAZARD_CODES:
-                    record["hazards"][code] = {
-                        "eal_total": _safe_float(row.get(f"{code}_EALT")),
-                        "risk_score": _safe_float(row.get(f"{code}_RISKS")),
-                    }
-
-                county_data[fips] = record
-                row_count += 1
-
-            if ct_remapped > 0:
-                logger.info(
-                    "Remapped %d Connecticut FIPS codes to match crosswalk format",
-                    ct_remapped,
-                )
+        county_data = CountyRecords(keys, make_record)
 
-        logger.info("NRI expanded: loaded %d counties", row_count)
+        logger.info("NRI expanded: loaded %d counties", len(county_data))
         self._county_data = county_data
         return county_data
 
@@ -339,7 +406,7 @@ class NRIExpandedBuilder:
         RISK_NPCTL does not exist in NRI v1.20 (18.5-DEC-01). We compute
         percentile as rank / (N-1) * 100 using all counties with RISK_SCORE > 0.
 
-        Uses bisect_left for efficient percentile lookup of arbitrary scores.
+        Lookups use a bisect_left rank (np.searchsorted) over the sorted base.
 
         Special cases:
         - Single county: percentile = 50.0
@@ -374,33 +441,7 @@ class NRIExpandedBuilder:
         Returns:
             Percentile in range [0.0, 100.0].
         """
-        if risk_score <= 0:
-            return 0.0
-
-        n = len(self._sorted_risk_scores)
-        if n == 0:
-            return 0.0
-        if n == 1:
-            return 50.0
-
-        rank = bisect.bisect_left(self._sorted_risk_scores, risk_score)
-
-        # Exact match or boundary: use rank-based percentile
-        if rank >= n:
-            return 100.0
-        if rank == 0:
-            return round((0 / (n - 1)) * 100.0, 2) if self._sorted_risk_scores[0] == risk_score else 0.0
-        if self._sorted_risk_scores[rank] == risk_score:
-            return round((rank / (n - 1)) * 100.0, 2)
-
-        # Interpolated Tribal score between two county scores:
-        # linear interpolation gives more accurate percentile than
-        # rounding to next-higher rank (which systematically overstates).
-        lower = self._sorted_risk_scores[rank - 1]
-        upper = self._sorted_risk_scores[rank]
-        fraction = (risk_score - lower) / (upper - lower) if upper > lower else 0.0
-        percentile = ((rank - 1 + fraction) / (n - 1)) * 100.0
-        return round(min(percentile, 100.0), 2)
+        return _risk_percentiles(self._sorted_risk_scores, [risk_score])[0]
 
     # -- Step 6: Aggregate tribe NRI --
 
@@ -418,114 +459,138 @@ class NRIExpandedBuilder:
         Returns:
             Dict with all NRI expanded fields ready for Pydantic validation.
         """
-        if not self._county_data:
-            return self._empty_profile(tribe_id, "NRI county data not loaded")
-
-        if not geoids:
-            return self._empty_profile(tribe_id, "No AIANNH GEOIDs in crosswalk")
+        return self._aggregate_nri_batch([(tribe_id, geoids)])[0]
 
-        # Collect county weights from area-weighted crosswalk
-        county_weights: dict[str, float] = {}
-        total_possible_weight: float = 0.0
-
-        for geoid in geoids:
-            entries = self._area_weights.get(geoid, [])
-            for entry in entries:
-                fips = entry["county_fips"]
-                weight = entry["weight"]
-                county_weights[fips] = county_weights.get(fips, 0.0) + weight
-                total_possible_weight += weight
-
-        if not county_weights:
-            return self._empty_profile(
-                tribe_id, "No county weights from area crosswalk"
-            )
+    def _aggregate_nri_batch(
+        self,
+        tribes: list[tuple[str, list[str]]],
+    ) -> list[dict]:
+        """Area-weighted aggregation of NRI expanded metrics for many Tribes.
 
-        # Match to available county data
-        matched = [
-            (fips, self._county_data[fips], county_weights[fips])
-            for fips in county_weights
-            if fips in self._county_data
-        ]
+        Builds one TribeCountyMatrix over all Tribes' crosswalk counties and
+        applies it to the county metric matrix in a single pass; national
+        percentiles and top-5 hazard ranking are computed column-wise.
 
-        if not matched:
-            return self._empty_profile(
-                tribe_id,
-                f"Counties identified ({len(county_weights)}) but none in NRI data",
-            )
+        Args:
+            tribes: (tribe_id, AIANNH GEOIDs) pairs.
 
-        # Normalize weights to matched counties only
-        matched_weight = sum(w for _, _, w in matched)
-        if matched_weight == 0:
-            # Equal weight fallback
-            equal_w = 1.0 / len(matched)
-            norm = [(fips, row, equal_w) for fips, row, _ in matched]
-            coverage_pct = 0.0
-        else:
-            norm = [
-                (fips, row, w / matched_weight)
-                for fips, row, w in matched
+        Returns:
+            One profile dict per input pair, in order, ready for Pydantic
+            validation.
+        """
+        if not self._county_data:
+            return [
+                self._empty_profile(tribe_id, "NRI county data not loaded")
+                for tribe_id, _ in tribes
             ]
-            coverage_pct = (
-                matched_weight / total_possible_weight
-                if total_possible_weight > 0
-                else 0.0
-            )
 
-        # Area-weighted aggregation of all expanded metrics
-        risk_score = sum(row["risk_score"] * w for _, row, w in norm)
-        eal_total = sum(row["eal_total"] * w for _, row, w in norm)
-        eal_buildings = sum(row["eal_buildings"] * w for _, row, w in norm)
-        eal_population = sum(row["eal_population"] * w for _, row, w in norm)
-        eal_agriculture = sum(row["eal_agriculture"] * w for _, row, w in norm)
-        eal_pop_equiv = sum(
-            row["eal_population_equivalence"] * w for _, row, w in norm
-        )
-        sovi_score = sum(row["sovi_score"] * w for _, row, w in norm)
-        resl_score = sum(row["resl_score"] * w for _, row, w in norm)
-
-        # National percentile from computed ranking
-        risk_percentile = self._get_risk_percentile(risk_score)
-
-        # Top 5 hazards by EAL (area-weighted)
-        hazard_eals: dict[str, float] = {}
-        for code in NRI_HAZARD_CODES:
-            hazard_eal = sum(
-                row["hazards"].get(code, {}).get("eal_total", 0.0) * w
-                for _, row, w in norm
-            )
-            if hazard_eal > 0:
-                hazard_eals[code] = round(hazard_eal, 2)
+        county_rows, metrics = self._nri_metric_matrix()
+        matrix = TribeCountyMatrix((geoids for _, geoids in tribes), self._area_weights)
+        agg = matrix.aggregate(county_rows, metrics)
+
+        values = agg.values
+        percentiles = _risk_percentiles(self._sorted_risk_scores, values[:, 0])
+
+        # Top 5 hazards by EAL (area-weighted). round() is applied in Python
+        # so ties and values match the per-Tribe rounding exactly.
+        hazard_eals = values[:, len(_NRI_SUM_FIELDS):]
+        present = hazard_eals > 0
+        rounded = np.array(
+            [[round(v, 2) for v in row] for row in hazard_eals.tolist()],
+            dtype=np.float64,
+        ).reshape(hazard_eals.shape)
+        order = np.argsort(
+            np.where(present, -rounded, np.inf), axis=1, kind="stable",
+        )[:, :5]
+        hazard_codes = list(NRI_HAZARD_CODES)
+
+        profiles: list[dict] = []
+        for i, (tribe_id, geoids) in enumerate(tribes):
+            if not geoids:
+                profiles.append(self._empty_profile(tribe_id, "No AIANNH GEOIDs in crosswalk"))
+                continue
+            n_counties = int(matrix.county_counts[i])
+            if not n_counties:
+                profiles.append(self._empty_profile(
+                    tribe_id, "No county weights from area crosswalk"
+                ))
+                continue
+            if not agg.matched[i]:
+                profiles.append(self._empty_profile(
+                    tribe_id,
+                    f"Counties identified ({n_counties}) but none in NRI data",
+                ))
+                continue
 
-        sorted_hazards = sorted(
-            hazard_eals.items(), key=lambda x: x[1], reverse=True
-        )
-        top_hazards = [
-            {
-                "type": NRI_HAZARD_CODES[code],
-                "code": code,
-                "eal_total": eal,
-            }
-            for code, eal in sorted_hazards[:5]
-        ]
+            matched_weight = float(agg.matched_weight[i])
+            total_possible_weight = float(matrix.entry_weight[i])
+            if matched_weight == 0:
+                coverage_pct = 0.0
+            else:
+                coverage_pct = (
+                    matched_weight / total_possible_weight
+                    if total_possible_weight > 0
+                    else 0.0
+                )
 
-        hazard_count = len(hazard_eals)
+            (
+                risk_score, eal_total, eal_buildings, eal_population,
+                eal_agriculture, eal_pop_equiv, sovi_score, resl_score,
+            ) = values[i, :len(_NRI_SUM_FIELDS)].tolist()
 
-        return {
-            "tribe_id": tribe_id,
-            "risk_score": round(risk_score, 2),
-            "risk_percentile": round(risk_percentile, 2),
-            "eal_total": round(eal_total, 2),
-            "eal_buildings": round(eal_buildings, 2),
-            "eal_population": round(eal_population, 2),
-            "eal_agriculture": round(eal_agriculture, 2),
-            "eal_population_equivalence": round(eal_pop_equiv, 2),
-            "community_resilience": round(resl_score, 2),
-            "social_vulnerability_nri": round(sovi_score, 2),
-            "hazard_count": hazard_count,
-            "top_hazards": top_hazards,
-            "coverage_pct": round(min(coverage_pct, 1.0), 4),
-        }
+            top_hazards = [
+                {
+                    "type": NRI_HAZARD_CODES[hazard_codes[j]],
+                    "code": hazard_codes[j],
+                    "eal_total": float(rounded[i, j]),
+                }
+                for j in order[i].tolist()
+                if present[i, j]
+            ]
+
+            profiles.append({
+                "tribe_id": tribe_id,
+                "risk_score": round(risk_score, 2),
+                "risk_percentile": round(percentiles[i], 2),
+                "eal_total": round(eal_total, 2),
+                "eal_buildings": round(eal_buildings, 2),
+                "eal_population": round(eal_population, 2),
+                "eal_agriculture": round(eal_agriculture, 2),
+                "eal_population_equivalence": round(eal_pop_equiv, 2),
+                "community_resilience": round(resl_score, 2),
+                "social_vulnerability_nri": round(sovi_score, 2),
+                "hazard_count": int(present[i].sum()),
+                "top_hazards": top_hazards,
+                "coverage_pct": round(min(coverage_pct, 1.0), 4),
+            })
+
+        return profiles
+
+    def _nri_metric_matrix(self) -> tuple[dict[str, int], np.ndarray]:
+        """Stack county metrics into a county x metric matrix (cached).
+
+        Columns are _NRI_SUM_FIELDS followed by per-hazard eal_total in
+        NRI_HAZARD_CODES order.
+        """
+        cached = self._metric_matrix
+        if cached is not None and cached[0] is self._county_data:
+            return cached[1], cached[2]
+
+        county_rows = {fips: i for i, fips in enumerate(self._county_data)}
+        width = len(_NRI_SUM_FIELDS) + len(NRI_HAZARD_CODES)
+        metrics = np.array(
+            [
+                [record[field] for field in _NRI_SUM_FIELDS]
+                + [
+                    record["hazards"].get(code, {}).get("eal_total", 0.0)
+                    for code in NRI_HAZARD_CODES
+                ]
+                for record in self._county_data.values()
+            ],
+            dtype=np.float64,
+        ).reshape(len(county_rows), width)
+        self._metric_matrix = (self._county_data, county_rows, metrics)
+        return county_rows, metrics
 
     def _empty_profile(self, tribe_id: str, note: str) -> dict:
         """Return a minimal NRI expanded profile when no data is available.
@@ -563,7 +628,7 @@ class NRIExpandedBuilder:
           1. Load NRI CSV with SHA256 checksum
           2. Compute national percentiles
           3. For each Tribe in crosswalk:
-             a. Aggregate area-weighted NRI expanded metrics
+             a. Aggregate area-weighted NRI expanded metrics (one batch)
              b. Validate against NRIExpanded Pydantic schema
              c. Write via atomic write
           4. Generate coverage report
@@ -589,15 +654,17 @@ class NRIExpandedBuilder:
         files_written = 0
         validation_errors = 0
 
+        # Step 6: Aggregate all Tribes in one batch
+        tribes: list[tuple[str, list[str]]] = []
         for tribe_id, geoids in self._tribe_to_geoids.items():
             # Path traversal guard
             safe_id = Path(tribe_id).name
             if safe_id != tribe_id or ".." in tribe_id:
                 logger.warning("Skipping suspicious tribe_id: %r", tribe_id)
                 continue
+            tribes.append((tribe_id, geoids))
 
-            # Step 6: Aggregate
-            profile_data = self._aggregate_tribe_nri(tribe_id, geoids)
+        for (tribe_id, _), profile_data in zip(tribes, self._aggregate_nri_batch(tribes)):
 
             # Remove note field before Pydantic validation (not in schema)
             note = profile_data.pop("note", None)
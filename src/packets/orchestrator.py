@@ -15,6 +15,7 @@ Supports regional document generation for 8 regions:
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import re
@@ -24,12 +25,18 @@ from pathlib import Path
 
 from dataclasses import asdict
 
-from src.packets.change_tracker import PacketChangeTracker
+from src.packets.award_store import AwardCacheStore
+from src.packets.change_tracker import PacketChangeTracker, document_fingerprint
 from src.packets.confidence import section_confidence
 from src.packets.context import TribePacketContext
 from src.packets.congress import CongressionalMapper
 from src.packets.doc_types import DOC_A, DOC_B, DocumentTypeConfig
-from src.packets.docx_engine import DocxEngine
+from src.packets.docx_engine import (
+    RENDER_STAGES,
+    DocxEngine,
+    render_timings,
+    renderer_digest,
+)
 from src.packets.ecoregion import EcoregionMapper
 from src.packets.economic import EconomicImpactCalculator, TribeEconomicSummary
 from src.packets.registry import TribalRegistry
@@ -44,6 +51,7 @@ from src.paths import (
 )
 from src.utils import format_dollars
 from src.packets.agent_review import AgentReviewOrchestrator
+from src.packets.bill_index import BillIndex
 from src.packets.relevance import ProgramRelevanceFilter
 
 logger = logging.getLogger(__name__)
@@ -53,6 +61,15 @@ _MAX_CACHE_SIZE_BYTES: int = 10 * 1024 * 1024  # 10 MB
 _TRIBE_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 
 
+def _stat_signature(path: Path) -> str:
+    """``size:mtime_ns`` of a file, or ``missing``."""
+    try:
+        st = path.stat()
+    except OSError:
+        return "missing"
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
 def _sanitize_tribe_id(tribe_id: str) -> str:
     """Validate tribe_id contains only safe characters for file paths.
 
@@ -90,6 +107,7 @@ class PacketOrchestrator:
         config: dict,
         programs: list[dict],
         enable_agent_review: bool = False,
+        force: bool = False,
     ) -> None:
         """Initialize the orchestrator with config and program inventory.
 
@@ -98,10 +116,14 @@ class PacketOrchestrator:
             programs: List of program dicts from program_inventory.json.
             enable_agent_review: Enable the 3-pass agent review cycle for
                 DOCX Hot Sheet production. Default ``False`` (opt-in).
+            force: Re-render Doc A/B even when a document's input
+                fingerprint matches the one stored with the packet state.
         """
         self.config = config
         self.programs = {p["id"]: p for p in programs}
         self.enable_agent_review = enable_agent_review
+        self.force = force
+        self._renderer_digest: str | None = None
         self.registry = TribalRegistry(config)
         self.congress = CongressionalMapper(config)
         self.ecoregion = EcoregionMapper(config)
@@ -112,6 +134,9 @@ class PacketOrchestrator:
         self.award_cache_dir = Path(raw) if raw else AWARD_CACHE_DIR
         if not self.award_cache_dir.is_absolute():
             self.award_cache_dir = PROJECT_ROOT / self.award_cache_dir
+        self.award_store = AwardCacheStore(
+            self.award_cache_dir, max_record_bytes=_MAX_CACHE_SIZE_BYTES,
+        )
 
         raw = packets_cfg.get("hazards", {}).get("cache_dir")
         self.hazard_cache_dir = Path(raw) if raw else HAZARD_PROFILES_DIR
@@ -124,6 +149,7 @@ class PacketOrchestrator:
 
         # Phase 15: Congressional intelligence cache (lazy-loaded)
         self._congressional_intel: dict | None = None
+        self._bill_index: BillIndex | None = None
 
     def run_single_tribe(self, tribe_name: str) -> None:
         """Resolve a single Tribe by name and display its packet context.
@@ -186,16 +212,27 @@ class PacketOrchestrator:
                 logger.error("Failed to generate DOCX for %s: %s", tribe["name"], exc)
                 print(f"\n  DOCX generation failed: {exc}")
 
-    def run_all_tribes(self) -> dict:
+    def run_all_tribes(self, workers: int = 1) -> dict:
         """Generate multi-doc packets for all Tribes, regional docs, and quality review.
 
         Generates Doc A + Doc B per Tribe (based on data completeness),
         Doc C + Doc D per region (8 regions), a strategic overview,
         and runs automated quality review on all outputs.
 
+        Args:
+            workers: Number of worker processes for the per-Tribe context
+                build + Doc A/B render stage. ``1`` (default) runs
+                in-process, one Tribe after another. Values above 1 fan
+                Tribes out across a process pool; each worker builds its
+                own orchestrator once and returns the built context so
+                regional docs can reuse it. The same worker count is
+                used for the final quality review.
+
         Returns:
-            dict with keys: success, errors, total, duration_s,
-            doc_a_count, doc_b_count, regional_results, quality_report_path
+            dict with keys: success, errors, total, duration_s, workers,
+            doc_a_count, doc_b_count, regional_results, quality_report_path,
+            render_timings (documents saved plus seconds per DocxEngine
+            stage, summed across worker processes)
         """
         import gc
         import time
@@ -204,6 +241,7 @@ class PacketOrchestrator:
 
         all_tribes = self.registry.get_all()
         total = len(all_tribes)
+        workers = max(1, min(int(workers), total or 1))
         start = time.monotonic()
         success_count = 0
         error_count = 0
@@ -211,29 +249,68 @@ class PacketOrchestrator:
         doc_a_count = 0
         doc_b_count = 0
         prebuilt_contexts: dict[str, "TribePacketContext"] = {}
+        timings_at_start = render_timings()
+        worker_timings = dict.fromkeys(timings_at_start, 0)
 
-        for i, tribe in enumerate(all_tribes, 1):
+        def _record(tribe: dict, context, paths, error) -> None:
+            nonlocal success_count, error_count, doc_a_count, doc_b_count
             elapsed = time.monotonic() - start
-            print(f"[{i}/{total}] {tribe['name']}...", end="", flush=True)
-            try:
-                context = self._build_context(tribe)
-                prebuilt_contexts[tribe["tribe_id"]] = context
-                paths = self.generate_tribal_docs(context, tribe)
-                for p in paths:
-                    if "internal" in str(p):
-                        doc_a_count += 1
-                    elif "congressional" in str(p):
-                        doc_b_count += 1
-                print(f" OK ({len(paths)} docs, {elapsed:.0f}s)")
-                success_count += 1
-            except Exception as exc:
-                print(f" ERROR: {exc}")
-                logger.error("Failed: %s: %s", tribe["name"], exc)
+            if error is not None:
+                print(f" ERROR: {error}")
+                logger.error("Failed: %s: %s", tribe["name"], error)
                 error_count += 1
                 error_tribes.append(tribe["name"])
-            finally:
-                if i % 25 == 0:
-                    gc.collect()
+                return
+            prebuilt_contexts[tribe["tribe_id"]] = context
+            for p in paths:
+                if "internal" in str(p):
+                    doc_a_count += 1
+                elif "congressional" in str(p):
+                    doc_b_count += 1
+            print(f" OK ({len(paths)} docs, {elapsed:.0f}s)")
+            success_count += 1
+
+        if workers == 1:
+            for i, tribe in enumerate(all_tribes, 1):
+                print(f"[{i}/{total}] {tribe['name']}...", end="", flush=True)
+                try:
+                    context, paths = self._build_and_render_tribe(tribe)
+                    _record(tribe, context, paths, None)
+                except Exception as exc:
+                    _record(tribe, None, [], exc)
+                finally:
+                    if i % 25 == 0:
+                        gc.collect()
+        else:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            print(f"Rendering {total} Tribes across {workers} worker processes",
+                  flush=True)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_batch_worker,
+                initargs=(
+                    self.config,
+                    list(self.programs.values()),
+                    self.enable_agent_review,
+                    self.force,
+                ),
+            ) as pool:
+                futures = {
+                    pool.submit(_run_batch_worker, tribe): tribe
+                    for tribe in all_tribes
+                }
+                for i, future in enumerate(as_completed(futures), 1):
+                    tribe = futures[future]
+                    print(f"[{i}/{total}] {tribe['name']}...", end="", flush=True)
+                    try:
+                        context, paths, error, timings = future.result()
+                        for key, value in timings.items():
+                            worker_timings[key] += value
+                    except Exception as exc:
+                        # Worker crash (e.g. BrokenProcessPool) -- isolate per Tribe
+                        context, paths, error = None, [], exc
+                    _record(tribe, context, paths, error)
 
         # Regional documents (Doc C + Doc D)
         print("\nGenerating Regional Documents...", flush=True)
@@ -265,7 +342,7 @@ class PacketOrchestrator:
         print("\nRunning Quality Review...", flush=True)
         quality_report_path = None
         try:
-            reviewer = DocumentQualityReviewer()
+            reviewer = DocumentQualityReviewer(workers=workers)
             batch_result = reviewer.review_batch(output_dir)
             report = reviewer.generate_report(batch_result)
             quality_report_path = output_dir / "quality_report.md"
@@ -281,11 +358,21 @@ class PacketOrchestrator:
             logger.error("Quality review failed: %s", exc)
 
         duration = time.monotonic() - start
+        timings_at_end = render_timings()
+        batch_timings = {
+            key: timings_at_end[key] - timings_at_start[key] + worker_timings[key]
+            for key in timings_at_start
+        }
         print("\n--- Batch Complete ---")
         print(f"Total: {total} | Success: {success_count} | Errors: {error_count}")
         print(f"Doc A (internal): {doc_a_count} | Doc B (congressional): {doc_b_count}")
         print(f"Regional: {sum(1 for v in regional_results.values() if v)} regions")
-        print(f"Duration: {duration:.0f}s")
+        print(f"Duration: {duration:.0f}s ({workers} worker{'s' if workers != 1 else ''})")
+        if batch_timings["documents"]:
+            print(
+                f"Render: {batch_timings['documents']} docs | "
+                + " | ".join(f"{stage} {batch_timings[stage]:.1f}s" for stage in RENDER_STAGES)
+            )
         if error_tribes:
             print(f"Failed: {', '.join(error_tribes[:10])}")
             if len(error_tribes) > 10:
@@ -296,12 +383,32 @@ class PacketOrchestrator:
             "errors": error_count,
             "total": total,
             "duration_s": duration,
+            "workers": workers,
             "doc_a_count": doc_a_count,
             "doc_b_count": doc_b_count,
             "regional_results": regional_results,
             "quality_report_path": quality_report_path,
+            "render_timings": batch_timings,
         }
 
+    def _build_and_render_tribe(
+        self, tribe: dict
+    ) -> tuple[TribePacketContext, list[Path]]:
+        """Build one Tribe's context and render its Doc A/B packet.
+
+        The unit of work for ``run_all_tribes``, shared by the in-process
+        loop and the process-pool workers.
+
+        Args:
+            tribe: Tribe dict from the registry.
+
+        Returns:
+            Tuple of (built context, generated document paths).
+        """
+        context = self._build_context(tribe)
+        paths = self.generate_tribal_docs(context, tribe)
+        return context, paths
+
     def _load_tribe_cache(self, cache_dir: Path, tribe_id: str) -> dict:
         """Load a per-Tribe JSON cache file. Returns empty dict if not found.
 
@@ -355,7 +462,7 @@ class PacketOrchestrator:
         representatives = delegation.get("representatives", []) if delegation else []
 
         # Award data (Phase 6)
-        award_data = self._load_tribe_cache(self.award_cache_dir, tribe_id)
+        award_data = self.award_store.get(tribe_id) or {}
         awards = award_data.get("awards", [])
 
         # Hazard profile (Phase 6)
@@ -607,6 +714,21 @@ class PacketOrchestrator:
 
         return self._congressional_intel
 
+    def get_bill_index(self) -> BillIndex:
+        """Return the BillIndex for the loaded congressional intel.
+
+        Built once per loaded intel file and shared by per-Tribe filtering
+        and the RegionalAggregator. Rebuilt if the intel cache is reloaded.
+
+        Returns:
+            BillIndex over ``bills`` (empty if no intel is available).
+        """
+        bills = self._load_congressional_intel().get("bills", []) or []
+        if self._bill_index is None or self._bill_index.bills is not bills:
+            self._bill_index = BillIndex(bills)
+            logger.debug("Indexed %d congressional bills", len(bills))
+        return self._bill_index
+
     def _filter_bills_for_tribe(
         self,
         context: TribePacketContext,
@@ -619,6 +741,9 @@ class PacketOrchestrator:
           - sponsor/cosponsor includes Tribe's delegation members
           - bill affects the Tribe's state(s)
 
+        Resolved as a union over BillIndex postings rather than a scan of
+        every bill.
+
         Args:
             context: TribePacketContext with delegation and state data.
             relevant_program_ids: Optional list of program IDs the Tribe
@@ -627,52 +752,23 @@ class PacketOrchestrator:
         Returns:
             List of bill dicts sorted by relevance_score descending.
         """
-        intel = self._load_congressional_intel()
-        all_bills = intel.get("bills", [])
-        if not all_bills:
+        index = self.get_bill_index()
+        if not len(index):
             return []
 
-        # Build sets for fast lookup
-        tribe_states = set(context.states or [])
         tribe_bioguides: set[str] = set()
-        for senator in (context.senators or []):
-            bg = senator.get("bioguide_id", "")
+        for member in (context.senators or []) + (context.representatives or []):
+            bg = member.get("bioguide_id", "")
             if bg:
                 tribe_bioguides.add(bg)
-        for rep in (context.representatives or []):
-            bg = rep.get("bioguide_id", "")
-            if bg:
-                tribe_bioguides.add(bg)
-
-        relevant_ids = set(relevant_program_ids or [])
 
-        matched_bills: list[dict] = []
-        for bill in all_bills:
-            # Check program overlap
-            bill_programs = set(bill.get("matched_programs", []))
-            has_program_match = bool(
-                relevant_ids and bill_programs & relevant_ids
-            )
+        matched_bills = index.bills_for(
+            bioguides=tribe_bioguides,
+            states=set(context.states or []),
+            program_ids=set(relevant_program_ids or []),
+        )
 
-            # Check sponsor/cosponsor overlap
-            has_delegation_match = False
-            sponsor = bill.get("sponsor", {}) or {}
-            if sponsor.get("bioguide_id") in tribe_bioguides:
-                has_delegation_match = True
-            if not has_delegation_match:
-                for cs in bill.get("cosponsors", []):
-                    if cs.get("bioguide_id") in tribe_bioguides:
-                        has_delegation_match = True
-                        break
-
-            # Check state overlap
-            sponsor_state = sponsor.get("state", "")
-            has_state_match = sponsor_state in tribe_states
-
-            if has_program_match or has_delegation_match or has_state_match:
-                matched_bills.append(bill)
-
-        # Sort by relevance_score descending
+        # Sort by relevance_score descending (stable, so ties keep file order)
         matched_bills.sort(
             key=lambda b: b.get("relevance_score", 0), reverse=True
         )
@@ -693,9 +789,8 @@ class PacketOrchestrator:
         Returns:
             Dict mapping bioguide_id to {sponsored: [...], cosponsored: [...]}.
         """
-        intel = self._load_congressional_intel()
-        all_bills = intel.get("bills", [])
-        if not all_bills:
+        index = self.get_bill_index()
+        if not len(index):
             return {}
 
         # Collect bioguide IDs for Tribe's delegation
@@ -730,21 +825,22 @@ class PacketOrchestrator:
         if not tribe_members:
             return {}
 
-        # Scan all bills for sponsor/cosponsor matches
-        for bill in all_bills:
-            bill_ref = {
-                "bill_id": bill.get("bill_id", ""),
-                "title": bill.get("title", ""),
-            }
-            sponsor = bill.get("sponsor", {}) or {}
-            sp_bg = sponsor.get("bioguide_id", "")
-            if sp_bg in tribe_members:
-                tribe_members[sp_bg]["sponsored"].append(bill_ref)
+        # Look up each member's postings; one shared ref per bill
+        refs: dict[int, dict] = {}
+
+        def bill_ref(bill: dict) -> dict:
+            ref = refs.get(id(bill))
+            if ref is None:
+                ref = refs[id(bill)] = {
+                    "bill_id": bill.get("bill_id", ""),
+                    "title": bill.get("title", ""),
+                }
+            return ref
 
-            for cs in bill.get("cosponsors", []):
-                cs_bg = cs.get("bioguide_id", "")
-                if cs_bg in tribe_members:
-                    tribe_members[cs_bg]["cosponsored"].append(bill_ref)
+        for bg, info in tribe_members.items():
+            sponsored, cosponsored = index.member_activity(bg)
+            info["sponsored"].extend(bill_ref(b) for b in sponsored)
+            info["cosponsored"].extend(bill_ref(b) for b in cosponsored)
 
         # Filter to members with any activity
         result: dict[str, dict] = {}
@@ -843,11 +939,7 @@ class PacketOrchestrator:
         structural_asks = self._load_structural_asks()
 
         # Change tracking (OPS-03)
-        raw_state = self.config.get("packets", {}).get("state_dir")
-        state_dir = Path(raw_state) if raw_state else PACKET_STATE_DIR
-        if not state_dir.is_absolute():
-            state_dir = PROJECT_ROOT / state_dir
-        tracker = PacketChangeTracker(state_dir=state_dir)
+        tracker = PacketChangeTracker(state_dir=self._get_state_dir())
         previous_state = tracker.load_previous(context.tribe_id)
         current_state = tracker.compute_current(context, self.programs)
 
@@ -941,12 +1033,7 @@ class PacketOrchestrator:
         Returns:
             Path to generated .docx file.
         """
-        # Determine output subdirectory
-        base_dir = self._get_output_dir()
-        if doc_type_config.is_internal:
-            output_dir = base_dir / "internal"
-        else:
-            output_dir = base_dir / "congressional"
+        output_dir = self._doc_output_dir(doc_type_config)
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Create config with overridden output dir
@@ -976,6 +1063,23 @@ class PacketOrchestrator:
         )
         return path
 
+    def _doc_output_dir(self, doc_type_config: DocumentTypeConfig) -> Path:
+        """Subdirectory (internal/ or congressional/) for a Tribe document type."""
+        subdir = "internal" if doc_type_config.is_internal else "congressional"
+        return self._get_output_dir() / subdir
+
+    def _get_state_dir(self) -> Path:
+        """Get the packet state directory (change tracking) from config.
+
+        Returns:
+            Path to the packet state directory.
+        """
+        raw_state = self.config.get("packets", {}).get("state_dir")
+        state_dir = Path(raw_state) if raw_state else PACKET_STATE_DIR
+        if not state_dir.is_absolute():
+            state_dir = PROJECT_ROOT / state_dir
+        return state_dir
+
     def _get_output_dir(self) -> Path:
         """Get the base output directory from config.
 
@@ -1006,8 +1110,12 @@ class PacketOrchestrator:
             doc_types: Optional list of DocumentTypeConfig to generate.
                 If None, auto-selects based on data completeness.
 
+        A document whose input fingerprint matches the one stored with the
+        Tribe's packet state, and whose file still exists, is not
+        re-rendered (unless ``force``); its existing path is returned.
+
         Returns:
-            List of Paths to generated .docx files.
+            List of Paths to generated (or unchanged) .docx files.
         """
         # Compute shared data once
         economic_summary = self._enrich_context_with_economics(context)
@@ -1021,11 +1129,7 @@ class PacketOrchestrator:
         structural_asks = self._load_structural_asks()
 
         # Change tracking
-        raw_state = self.config.get("packets", {}).get("state_dir")
-        state_dir = Path(raw_state) if raw_state else PACKET_STATE_DIR
-        if not state_dir.is_absolute():
-            state_dir = PROJECT_ROOT / state_dir
-        tracker = PacketChangeTracker(state_dir=state_dir)
+        tracker = PacketChangeTracker(state_dir=self._get_state_dir())
         previous_state = tracker.load_previous(context.tribe_id)
         current_state = tracker.compute_current(context, self.programs)
 
@@ -1042,8 +1146,36 @@ class PacketOrchestrator:
             else:
                 doc_types = [DOC_B]
 
+        if self._renderer_digest is None:
+            self._renderer_digest = renderer_digest()
+        stored = (previous_state or {}).get("doc_fingerprints") or {}
+        fingerprints: dict[str, str] = {}
+
         paths: list[Path] = []
+        rendered = 0
         for dtc in doc_types:
+            fingerprint = document_fingerprint(
+                context, dtc.doc_type, self._renderer_digest,
+                relevant=relevant,
+                omitted=omitted,
+                economic_summary=economic_summary,
+                structural_asks=structural_asks,
+            )
+            fingerprints[dtc.doc_type] = fingerprint
+            existing = self._doc_output_dir(dtc) / Path(
+                dtc.format_filename(context.tribe_id)
+            ).name
+            if (
+                not self.force
+                and stored.get(dtc.doc_type) == fingerprint
+                and existing.exists()
+            ):
+                logger.debug(
+                    "Doc %s for %s unchanged, skipping render",
+                    dtc.doc_type, context.tribe_id,
+                )
+                paths.append(existing)
+                continue
             path = self._generate_single_doc(
                 context=context,
                 tribe=tribe,
@@ -1056,9 +1188,17 @@ class PacketOrchestrator:
                 previous_date=previous_date,
             )
             paths.append(path)
-
-        # Persist current state after successful generation
-        tracker.save_current(context.tribe_id, current_state)
+            rendered += 1
+
+        # Persist current state after successful generation. When every
+        # document was skipped the stored state (and its generated_at,
+        # the "Since Last Packet" baseline) already describes the files.
+        if rendered:
+            current_state["doc_fingerprints"] = fingerprints
+            tracker.save_current(context.tribe_id, current_state)
+        else:
+            logger.info("Packet inputs for %s unchanged, skipped render",
+                        context.tribe_id)
 
         return paths
 
@@ -1126,8 +1266,15 @@ class PacketOrchestrator:
     ) -> dict[str, list[Path]]:
         """Generate Doc C + Doc D for all 8 regions.
 
-        Pre-aggregates all Tribe contexts, then generates 2 documents per
-        region (internal InterTribal strategy + congressional overview).
+        Extracts one TribeRegionalRow per Tribe, then generates 2 documents
+        per region (internal InterTribal strategy + congressional overview).
+
+        Rows and per-region digests persist in the packet state directory
+        between runs. Without prebuilt contexts, a Tribe whose inputs
+        (registry entry, award and hazard caches, shared congressional and
+        ecoregion data) are unchanged reuses its stored row instead of
+        rebuilding its context. A region whose digest is unchanged and
+        whose Doc C/D files exist is not re-rendered (unless ``force``).
 
         Args:
             skip_context_build: If True, skip building contexts (use
@@ -1140,31 +1287,54 @@ class PacketOrchestrator:
             Dict mapping region_id to [path_c, path_d] for each region.
         """
         from src.packets.doc_types import DOC_C, DOC_D
-        from src.packets.regional import RegionalAggregator
+        from src.packets.regional import RegionalAggregator, TribeRegionalRow
         from src.paths import REGIONAL_CONFIG_PATH
 
-        # Step 1: Build all TribePacketContexts
+        aggregator = RegionalAggregator(
+            regional_config_path=REGIONAL_CONFIG_PATH,
+            registry=self.registry,
+            bill_index=self.get_bill_index(),
+        )
+        state_path = self._get_state_dir() / "regional" / "regional_state.json"
+        aggregator.load_state(state_path)
+
+        # Step 1: One row per Tribe (from prebuilt contexts, stored rows
+        # with matching input signatures, or freshly built contexts)
+        rows: dict[str, TribeRegionalRow] = {}
+        signatures: dict[str, str] = {}
         if prebuilt_contexts is not None:
-            all_contexts = prebuilt_contexts
+            for tribe_id, ctx in prebuilt_contexts.items():
+                rows[tribe_id] = TribeRegionalRow.from_context(ctx)
         else:
-            all_contexts = {}
-            all_tribes = self.registry.get_all()
-            for tribe in all_tribes:
+            shared_signature = self._shared_input_signature()
+            for tribe in self.registry.get_all():
+                tribe_id = tribe["tribe_id"]
                 try:
-                    ctx = self._build_context(tribe)
-                    all_contexts[tribe["tribe_id"]] = ctx
+                    signature = self._tribe_input_signature(tribe, shared_signature)
+                    row = aggregator.cached_row(tribe_id, signature)
+                    if row is None:
+                        row = TribeRegionalRow.from_context(self._build_context(tribe))
+                    rows[tribe_id] = row
+                    signatures[tribe_id] = signature
                 except Exception as exc:
                     logger.warning(
                         "Failed to build context for %s: %s",
-                        tribe.get("name", tribe.get("tribe_id", "?")),
+                        tribe.get("name", tribe_id or "?"),
                         exc,
                     )
-
-        # Step 2: Create aggregator
-        aggregator = RegionalAggregator(
-            regional_config_path=REGIONAL_CONFIG_PATH,
-            registry=self.registry,
-        )
+        changed = aggregator.update_rows(rows, signatures)
+        logger.info("Regional rows: %d Tribes, %d changed since last run",
+                    len(rows), len(changed))
+
+        if self._renderer_digest is None:
+            self._renderer_digest = renderer_digest()
+        # Overlap committee_bills come from the whole intel file, not from
+        # any one Tribe's row, so the intel file is part of every region's salt
+        salt = hashlib.sha256(
+            (self._renderer_digest + json.dumps(
+                self.programs, sort_keys=True, default=str,
+            ) + _stat_signature(CONGRESSIONAL_INTEL_PATH)).encode("utf-8")
+        ).hexdigest()
 
         results: dict[str, list[Path]] = {}
 
@@ -1172,24 +1342,30 @@ class PacketOrchestrator:
             try:
                 # Get Tribe IDs for this region
                 tribe_ids = aggregator.get_tribe_ids_for_region(region_id)
-                skipped = [
-                    tid for tid in tribe_ids if tid not in all_contexts
-                ]
+                skipped = [tid for tid in tribe_ids if tid not in rows]
                 if skipped:
                     logger.warning(
                         "Region %s: skipping %d Tribes with missing context: %s",
                         region_id, len(skipped), skipped[:5],
                     )
-                region_contexts = [
-                    all_contexts[tid]
-                    for tid in tribe_ids
-                    if tid in all_contexts
+
+                digest = aggregator.region_digest(region_id, salt=salt)
+                existing = [
+                    self._regional_doc_path(region_id, dtc) for dtc in (DOC_C, DOC_D)
                 ]
+                if (
+                    not self.force
+                    and aggregator.region_digests.get(region_id) == digest
+                    and all(p.exists() for p in existing)
+                ):
+                    results[region_id] = existing
+                    logger.info("Regional docs for %s unchanged, skipped render",
+                                region_id)
+                    continue
 
                 # Aggregate
-                regional_ctx = aggregator.aggregate(
-                    region_id, region_contexts
-                )
+                region_frame = aggregator.region_frame(region_id)
+                regional_ctx = aggregator.aggregate(region_id, region_frame)
 
                 # Generate Doc C (internal)
                 path_c = self._generate_regional_doc(
@@ -1202,10 +1378,11 @@ class PacketOrchestrator:
                 )
 
                 results[region_id] = [path_c, path_d]
+                aggregator.region_digests[region_id] = digest
                 logger.info(
                     "Regional docs for %s: %d Tribes aggregated",
                     region_id,
-                    len(region_contexts),
+                    len(region_frame),
                 )
             except Exception as exc:
                 logger.error(
@@ -1213,10 +1390,61 @@ class PacketOrchestrator:
                     region_id,
                     exc,
                 )
+                aggregator.region_digests.pop(region_id, None)
                 results[region_id] = []
 
+        try:
+            aggregator.save_state(state_path)
+        except OSError as exc:
+            logger.warning("Failed to save regional state %s: %s", state_path, exc)
+
         return results
 
+    def _shared_input_signature(self) -> str:
+        """Stat signature of data files every Tribe context reads.
+
+        Covers the congressional cache (delegations), congressional intel
+        (bills), and ecoregion config.
+
+        Returns:
+            Hex digest string.
+        """
+        h = hashlib.sha256()
+        for path in (
+            self.congress.data_path,
+            CONGRESSIONAL_INTEL_PATH,
+            Path(self.ecoregion._data_path),
+        ):
+            h.update(f"{path}|{_stat_signature(path)}|".encode("utf-8"))
+        return h.hexdigest()
+
+    def _tribe_input_signature(self, tribe: dict, shared_signature: str) -> str:
+        """Signature of everything ``_build_context`` reads for one Tribe.
+
+        Args:
+            tribe: Tribe dict from the registry.
+            shared_signature: ``_shared_input_signature()`` for this run.
+
+        Returns:
+            Hex digest string.
+        """
+        tribe_id = _sanitize_tribe_id(tribe["tribe_id"])
+        h = hashlib.sha256(shared_signature.encode("utf-8"))
+        h.update(json.dumps(tribe, sort_keys=True, default=str).encode("utf-8"))
+        h.update(self.award_store.signature(tribe_id).encode("utf-8"))
+        h.update(_stat_signature(self.hazard_cache_dir / f"{tribe_id}.json").encode("utf-8"))
+        return h.hexdigest()
+
+    def _regional_doc_path(
+        self, region_id: str, doc_type_config: DocumentTypeConfig,
+    ) -> Path:
+        """Output path ``_generate_regional_doc`` saves a region's document to."""
+        subdir = "internal" if doc_type_config.is_internal else "congressional"
+        return (
+            self._get_output_dir() / "regional" / subdir
+            / Path(doc_type_config.format_filename(region_id)).name
+        )
+
     def _generate_regional_doc(
         self,
         regional_ctx,
@@ -1234,11 +1462,6 @@ class PacketOrchestrator:
         Returns:
             Path to the generated .docx file.
         """
-        import os
-        import tempfile
-
-        from docx import Document as DocxDocument
-
         from src.packets.docx_regional_sections import (
             render_regional_appendix,
             render_regional_award_landscape,
@@ -1248,25 +1471,26 @@ class PacketOrchestrator:
             render_regional_executive_summary,
             render_regional_hazard_synthesis,
         )
-        from src.packets.docx_styles import StyleManager
 
-        # Create document with styles
-        document = DocxDocument()
-        style_manager = StyleManager(document)
-
-        # Configure page margins
-        from docx.shared import Inches
+        # Determine output path
+        output_dir = self._regional_doc_path(
+            regional_ctx.region_id, doc_type_config
+        ).parent
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-        for section in document.sections:
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
+        doc_config = dict(self.config)
+        doc_config["packets"] = dict(doc_config.get("packets", {}))
+        doc_config["packets"]["output_dir"] = str(output_dir)
 
-        # Apply doc-type-specific headers/footers
+        # Regional docs start from the blank styled prototype (1-inch
+        # margins, HS-* styles) rather than the Hot Sheet template
         engine = DocxEngine(
-            self.config, self.programs, doc_type_config=doc_type_config
+            doc_config, self.programs, template_path=False,
+            doc_type_config=doc_type_config,
         )
+        document, style_manager = engine.create_document()
+
+        # Apply doc-type-specific headers/footers
         engine._setup_header_footer(
             document,
             header_text=doc_type_config.format_header(
@@ -1277,54 +1501,32 @@ class PacketOrchestrator:
         )
 
         # Render regional sections
-        render_regional_cover_page(
-            document, regional_ctx, style_manager, doc_type_config
-        )
-        render_regional_executive_summary(
-            document, regional_ctx, style_manager, doc_type_config
-        )
-        render_regional_congressional_section(
-            document, regional_ctx, style_manager, doc_type_config
-        )
-        render_regional_hazard_synthesis(
-            document, regional_ctx, style_manager
-        )
-        render_regional_award_landscape(
-            document, regional_ctx, style_manager
-        )
-        render_regional_delegation(
-            document, regional_ctx, style_manager, doc_type_config
-        )
-        render_regional_appendix(
-            document, regional_ctx, style_manager
-        )
-
-        # Determine output path
-        base_dir = self._get_output_dir()
-        if doc_type_config.is_internal:
-            output_dir = base_dir / "regional" / "internal"
-        else:
-            output_dir = base_dir / "regional" / "congressional"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        with engine.timed("section_render"):
+            render_regional_cover_page(
+                document, regional_ctx, style_manager, doc_type_config
+            )
+            render_regional_executive_summary(
+                document, regional_ctx, style_manager, doc_type_config
+            )
+            render_regional_congressional_section(
+                document, regional_ctx, style_manager, doc_type_config
+            )
+            render_regional_hazard_synthesis(
+                document, regional_ctx, style_manager
+            )
+            render_regional_award_landscape(
+                document, regional_ctx, style_manager
+            )
+            render_regional_delegation(
+                document, regional_ctx, style_manager, doc_type_config
+            )
+            render_regional_appendix(
+                document, regional_ctx, style_manager
+            )
 
+        # Atomic write (DocxEngine.save)
         filename = doc_type_config.format_filename(regional_ctx.region_id)
-        output_path = output_dir / filename
-
-        # Atomic write
-        tmp_fd = tempfile.NamedTemporaryFile(
-            dir=str(output_dir), suffix=".docx", delete=False
-        )
-        tmp_name = tmp_fd.name
-        tmp_fd.close()
-        try:
-            document.save(tmp_name)
-            os.replace(tmp_name, str(output_path))
-        except Exception:
-            try:
-                os.unlink(tmp_name)
-            except OSError:
-                pass
-            raise
+        output_path = engine.save(document, Path(filename).stem)
 
         logger.info(
             "Generated regional %s doc for %s: %s",
@@ -1333,3 +1535,45 @@ class PacketOrchestrator:
             output_path,
         )
         return output_path
+
+
+# ----------------------------------------------------------------------
+# Process-pool batch workers (run_all_tribes(workers > 1))
+# ----------------------------------------------------------------------
+
+_WORKER_ORCHESTRATOR: PacketOrchestrator | None = None
+"""Per-process orchestrator, built once by ``_init_batch_worker``."""
+
+
+def _init_batch_worker(
+    config: dict, programs: list[dict], enable_agent_review: bool,
+    force: bool = False,
+) -> None:
+    """Process-pool initializer: load registry/congress/ecoregion data once per worker."""
+    global _WORKER_ORCHESTRATOR
+    _WORKER_ORCHESTRATOR = PacketOrchestrator(
+        config, programs, enable_agent_review=enable_agent_review, force=force,
+    )
+
+
+def _run_batch_worker(
+    tribe: dict,
+) -> tuple[TribePacketContext | None, list[Path], str | None, dict]:
+    """Build and render one Tribe inside a pool worker.
+
+    Exceptions are caught here so a single Tribe failure is reported
+    back as an error string instead of poisoning the pool.
+
+    Returns:
+        Tuple of (context, paths, error, timings). ``error`` is None on
+        success; ``timings`` is this Tribe's share of the worker's
+        ``render_timings()``.
+    """
+    before = render_timings()
+    try:
+        context, paths = _WORKER_ORCHESTRATOR._build_and_render_tribe(tribe)
+        result = context, paths, None
+    except Exception as exc:
+        result = None, [], f"{type(exc).__name__}: {exc}"
+    after = render_timings()
+    return (*result, {key: after[key] - before[key] for key in before})
@@ -8,6 +8,11 @@ Operates on generated DOCX files, scanning paragraph text for prohibited
 patterns. Returns structured results enabling automated pass/fail gating
 in the batch generation pipeline.
 
+Documents are read by streaming ``word/document.xml`` out of the DOCX zip
+with lxml iterparse instead of loading the whole package with python-docx,
+and all literal patterns are matched in a single compiled pass.
+``review_batch`` can spread documents across a process pool.
+
 Air gap enforced: no organizational names, tool names, or generation
 attribution appear in any document surface.
 """
@@ -16,11 +21,14 @@ from __future__ import annotations
 
 import logging
 import re
+import zipfile
 from dataclasses import dataclass
 from pathlib import Path
 
-from docx import Document
+from docx.oxml.ns import qn
+from lxml import etree
 
+from src.text_matching import KeywordMatcher
 from src.packets.doc_types import DOC_A, DOC_B, DOC_C, DOC_D, DocumentTypeConfig
 
 logger = logging.getLogger(__name__)
@@ -87,6 +95,98 @@ class BatchReviewResult:
     failed_documents: list[ReviewResult]
 
 
+# ---------------------------------------------------------------------------
+# Streaming DOCX reader
+# ---------------------------------------------------------------------------
+
+_W_BODY = qn("w:body")
+_W_P = qn("w:p")
+_W_R = qn("w:r")
+_W_T = qn("w:t")
+_W_HYPERLINK = qn("w:hyperlink")
+_W_BR = qn("w:br")
+_W_TYPE = qn("w:type")
+
+# Run inner-content elements and their text, as python-docx renders them
+# for ``Paragraph.text`` (w:br depends on its type, see _run_text).
+_RUN_TEXT: dict[str, str] = {
+    qn("w:tab"): "\t",
+    qn("w:ptab"): "\t",
+    qn("w:cr"): "\n",
+    qn("w:noBreakHyphen"): "-",
+}
+
+# Lowercase phrases the marking/completeness checks look for.
+_FIXED_PHRASES = ("confidential", "for congressional", "executive summary")
+
+
+@dataclass
+class _DocumentScan:
+    """What the review checks need from one document body."""
+
+    text: str
+    paragraph_count: int
+    page_breaks: int
+
+
+def _run_text(run) -> str:
+    """Text of a ``w:r`` element, matching python-docx ``Run.text``."""
+    parts: list[str] = []
+    for child in run:
+        tag = child.tag
+        if tag == _W_T:
+            parts.append(child.text or "")
+        elif tag == _W_BR:
+            if child.get(_W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            text = _RUN_TEXT.get(tag)
+            if text:
+                parts.append(text)
+    return "".join(parts)
+
+
+def _scan_docx(docx_path: Path) -> _DocumentScan:
+    """Stream body paragraphs out of a DOCX without building a Document.
+
+    Mirrors ``Document.paragraphs`` (direct ``w:p`` children of
+    ``w:body``), ``Paragraph.text`` (runs and hyperlink runs), and the
+    page-break estimate, which counts body runs whose XML holds a
+    ``w:br`` with ``w:type="page"``. Processed paragraphs are cleared as
+    the parse goes, so memory stays flat regardless of document size.
+    """
+    texts: list[str] = []
+    page_breaks = 0
+    with zipfile.ZipFile(docx_path) as zf, zf.open("word/document.xml") as xml:
+        for _, p in etree.iterparse(
+            xml, events=("end",), tag=_W_P, resolve_entities=False
+        ):
+            parent = p.getparent()
+            if parent is None or parent.tag != _W_BODY:
+                continue
+            parts: list[str] = []
+            for child in p:
+                if child.tag == _W_R:
+                    parts.append(_run_text(child))
+                    if next(child.iter(_W_BR), None) is not None and (
+                        'w:type="page"' in etree.tostring(child, encoding="unicode")
+                    ):
+                        page_breaks += 1
+                elif child.tag == _W_HYPERLINK:
+                    parts.extend(_run_text(r) for r in child if r.tag == _W_R)
+            texts.append("".join(parts))
+
+            p.clear(keep_tail=True)
+            while p.getprevious() is not None:
+                del parent[0]
+
+    return _DocumentScan(
+        text=" ".join(texts),
+        paragraph_count=len(texts),
+        page_breaks=page_breaks,
+    )
+
+
 # ---------------------------------------------------------------------------
 # DocumentQualityReviewer
 # ---------------------------------------------------------------------------
@@ -153,6 +253,33 @@ class DocumentQualityReviewer:
         "data not available",
     ]
 
+    def __init__(self, workers: int = 1) -> None:
+        """Compile the review patterns once.
+
+        Literal patterns from all three lists, plus the fixed phrases used
+        by the marking and completeness checks, go into one KeywordMatcher
+        so each document's text is scanned once. Only genuine regexes in
+        INTERNAL_ONLY_PATTERNS are searched separately.
+
+        Args:
+            workers: Worker processes used by ``review_batch``. ``1``
+                (default) reviews in-process.
+        """
+        self.workers = max(1, int(workers))
+        self._internal_regexes = {
+            pattern: re.compile(pattern)
+            for pattern in self.INTERNAL_ONLY_PATTERNS
+            if re.escape(pattern).replace("\\ ", " ") != pattern
+        }
+        literals = [
+            pattern for pattern in self.INTERNAL_ONLY_PATTERNS
+            if pattern not in self._internal_regexes
+        ]
+        literals += [pattern.lower() for pattern in self.AIR_GAP_VIOLATIONS]
+        literals += [pattern.lower() for pattern in self.PLACEHOLDER_PATTERNS]
+        literals += list(_FIXED_PHRASES)
+        self._matcher = KeywordMatcher({kw: [kw] for kw in literals})
+
     def review_document(
         self,
         docx_path: Path,
@@ -171,16 +298,20 @@ class DocumentQualityReviewer:
         Returns:
             ReviewResult with pass/fail and list of issues.
         """
-        doc = Document(str(docx_path))
-        all_text = " ".join(p.text for p in doc.paragraphs)
-        all_text_lower = all_text.lower()
+        scan = _scan_docx(docx_path)
+        all_text_lower = scan.text.lower()
+        found = self._matcher.count(all_text_lower)
+
+        def contains(phrase: str) -> bool:
+            return found[phrase] > 0
 
         issues: list[ReviewIssue] = []
 
         # Check 1: Audience leakage (congressional docs only)
         if doc_type_config.is_congressional:
             for pattern in self.INTERNAL_ONLY_PATTERNS:
-                if re.search(pattern, all_text_lower):
+                regex = self._internal_regexes.get(pattern)
+                if regex.search(all_text_lower) if regex else contains(pattern):
                     issues.append(
                         ReviewIssue(
                             category="audience_leakage",
@@ -194,7 +325,7 @@ class DocumentQualityReviewer:
 
         # Check 2: Air gap violations (all docs)
         for pattern in self.AIR_GAP_VIOLATIONS:
-            if pattern.lower() in all_text_lower:
+            if contains(pattern.lower()):
                 issues.append(
                     ReviewIssue(
                         category="air_gap",
@@ -205,7 +336,7 @@ class DocumentQualityReviewer:
 
         # Check 3: Placeholder text
         for pattern in self.PLACEHOLDER_PATTERNS:
-            if pattern.lower() in all_text_lower:
+            if contains(pattern.lower()):
                 issues.append(
                     ReviewIssue(
                         category="placeholder",
@@ -216,7 +347,7 @@ class DocumentQualityReviewer:
 
         # Check 4: Confidential marking correctness
         if doc_type_config.confidential:
-            if "confidential" not in all_text_lower:
+            if not contains("confidential"):
                 issues.append(
                     ReviewIssue(
                         category="formatting",
@@ -225,10 +356,7 @@ class DocumentQualityReviewer:
                     )
                 )
         else:
-            if (
-                "confidential" in all_text_lower
-                and "for congressional" not in all_text_lower
-            ):
+            if contains("confidential") and not contains("for congressional"):
                 issues.append(
                     ReviewIssue(
                         category="formatting",
@@ -238,20 +366,20 @@ class DocumentQualityReviewer:
                 )
 
         # Check 5: Minimum content (not an empty shell)
-        if len(doc.paragraphs) < 20:
+        if scan.paragraph_count < 20:
             issues.append(
                 ReviewIssue(
                     category="content",
                     severity="warning",
                     message=(
-                        f"Document has only {len(doc.paragraphs)} paragraphs "
+                        f"Document has only {scan.paragraph_count} paragraphs "
                         f"(expected 20+)"
                     ),
                 )
             )
 
         # Check 6: Has executive summary
-        if "executive summary" not in all_text_lower:
+        if not contains("executive summary"):
             issues.append(
                 ReviewIssue(
                     category="content",
@@ -261,15 +389,8 @@ class DocumentQualityReviewer:
             )
 
         # Check 7: MAX_PAGES enforcement (Hot Sheets only)
-        # Estimate page count via page breaks + section breaks
-        page_breaks = sum(
-            1
-            for p in doc.paragraphs
-            for run in p.runs
-            if run._r.xml and "w:br" in run._r.xml and 'w:type="page"' in run._r.xml
-        )
         # Each document starts on page 1, so total pages = breaks + 1
-        estimated_pages = page_breaks + 1
+        estimated_pages = scan.page_breaks + 1
         if estimated_pages > 2:
             issues.append(
                 ReviewIssue(
@@ -291,6 +412,31 @@ class DocumentQualityReviewer:
             passed=passed,
         )
 
+    def _review_or_error(
+        self,
+        docx_path: Path,
+        doc_type_config: DocumentTypeConfig,
+    ) -> ReviewResult:
+        """Review one document, turning any failure into a critical issue."""
+        try:
+            return self.review_document(docx_path, doc_type_config)
+        except Exception as exc:
+            logger.warning(
+                "Failed to review %s: %s", docx_path, exc
+            )
+            return ReviewResult(
+                path=docx_path,
+                doc_type=doc_type_config.doc_type,
+                issues=[
+                    ReviewIssue(
+                        category="error",
+                        severity="critical",
+                        message=f"Review failed: {exc}",
+                    )
+                ],
+                passed=False,
+            )
+
     def review_batch(
         self,
         output_dir: Path,
@@ -351,29 +497,24 @@ class DocumentQualityReviewer:
                     (docx_path, doc_type_config_map["regional_congressional"])
                 )
 
-        # Review all documents
-        results: list[ReviewResult] = []
-        for docx_path, dtc in review_targets:
-            try:
-                result = self.review_document(docx_path, dtc)
-                results.append(result)
-            except Exception as exc:
-                logger.warning(
-                    "Failed to review %s: %s", docx_path, exc
-                )
-                results.append(
-                    ReviewResult(
-                        path=docx_path,
-                        doc_type=dtc.doc_type,
-                        issues=[
-                            ReviewIssue(
-                                category="error",
-                                severity="critical",
-                                message=f"Review failed: {exc}",
-                            )
-                        ],
-                        passed=False,
-                    )
+        # Review all documents (results stay in target order)
+        workers = min(self.workers, len(review_targets))
+        if workers <= 1:
+            results = [
+                self._review_or_error(docx_path, dtc)
+                for docx_path, dtc in review_targets
+            ]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            chunksize = max(1, len(review_targets) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_review_worker,
+                initargs=(self,),
+            ) as pool:
+                results = list(
+                    pool.map(_review_worker, review_targets, chunksize=chunksize)
                 )
 
         # Aggregate results
@@ -495,3 +636,24 @@ class DocumentQualityReviewer:
         lines.append("")
 
         return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Process-pool workers
+# ---------------------------------------------------------------------------
+
+_WORKER_REVIEWER: DocumentQualityReviewer | None = None
+
+
+def _init_review_worker(reviewer: DocumentQualityReviewer) -> None:
+    """Install the parent's reviewer (patterns already compiled) in a worker."""
+    global _WORKER_REVIEWER
+    _WORKER_REVIEWER = reviewer
+
+
+def _review_worker(
+    target: tuple[Path, DocumentTypeConfig],
+) -> ReviewResult:
+    """Review one (path, doc type) target inside a worker process."""
+    docx_path, doc_type_config = target
+    return _WORKER_REVIEWER._review_or_error(docx_path, doc_type_config)
@@ -0,0 +1,243 @@
+"""Columnar frame of TribeRegionalRows for regional statistics.
+
+RegionalAggregator used to answer every regional metric by walking a list
+of Tribes and their nested hazard/delegation records. RegionFrame lays the
+same data out once as arrays, one row per Tribe:
+
+    award_total   float64 [n]
+    has_awards    bool    [n]   (also has_hazard, has_delegation)
+    composite     float64 [n]   NRI composite risk score, NaN when absent
+    economics     float64 [n, 4]
+    hazard_rank   int8    [n, H]  1-based position in the Tribe's top-5,
+                                  0 when the hazard is not listed
+    hazard_score  float64 [n, H]  risk score, NaN when absent/non-numeric
+    member_order  int16   [n, M]  1-based position in the Tribe's
+                                  delegation, 0 when not a member
+    senator       bool    [n, M]  Tribe x legislator incidence by role
+    representative bool   [n, M]
+
+Hazard types (H) and legislators (M) are columns in first-seen order, so
+rankings that break ties by encounter order match the list-walking code.
+A hazard type listed twice in one Tribe's top-5 keeps its first listing.
+Regional statistics are column reductions and incidence counts; a region
+or any other grouping of Tribes is ``frame.take(positions)`` of a frame
+built once over every Tribe.
+
+Sums over Tribes go through Python's built-in ``sum`` (``ordered_sum``),
+so regional totals equal those of the list-walking code on every Python
+version; ``np.sum`` and ``np.cumsum`` round differently from the
+compensated float ``sum`` of Python 3.12+.
+
+Usage:
+    frame = RegionFrame.from_rows(rows)
+    region = frame.take([0, 3, 7])
+    counts = region.hazard_tribe_counts()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.packets.regional import TribeRegionalRow
+
+
+def ordered_sum(values: np.ndarray) -> np.ndarray | float:
+    """Sum along axis 0 with the built-in ``sum``, one column at a time.
+
+    Returns 0.0 (or a zero row) for an empty input.
+    """
+    if values.ndim > 1:
+        return np.array([sum(column) for column in values.T.tolist()], dtype=float)
+    return float(sum(values.tolist()))
+
+
+class RegionFrame:
+    """Tribe-by-metric arrays for a set of Tribes.
+
+    Build with ``from_rows``; see the module docstring for the layout.
+
+    Attributes:
+        tribe_ids: Tribe identifier per row.
+        summaries: RegionalContext.tribes entry per row.
+        hazard_types: Hazard type per hazard column.
+        member_keys: bioguide_id (or formatted_name) per legislator column.
+        member_info: member_name/role/committees per legislator column,
+            from the first Tribe that lists the member.
+        members: Each row's ``[key, role, info]`` delegation list.
+    """
+
+    def __init__(
+        self,
+        tribe_ids: list[str],
+        summaries: list[dict],
+        award_total: np.ndarray,
+        has_awards: np.ndarray,
+        has_hazard: np.ndarray,
+        has_delegation: np.ndarray,
+        composite: np.ndarray,
+        economics: np.ndarray,
+        hazard_types: list[str],
+        hazard_rank: np.ndarray,
+        hazard_score: np.ndarray,
+        member_keys: list[str],
+        member_info: list[dict],
+        members: list[list],
+        member_order: np.ndarray,
+        senator: np.ndarray,
+        representative: np.ndarray,
+    ) -> None:
+        self.tribe_ids = tribe_ids
+        self.summaries = summaries
+        self.award_total = award_total
+        self.has_awards = has_awards
+        self.has_hazard = has_hazard
+        self.has_delegation = has_delegation
+        self.composite = composite
+        self.economics = economics
+        self.hazard_types = hazard_types
+        self.hazard_rank = hazard_rank
+        self.hazard_score = hazard_score
+        self.member_keys = member_keys
+        self.member_info = member_info
+        self.members = members
+        self.member_order = member_order
+        self.senator = senator
+        self.representative = representative
+
+    def __len__(self) -> int:
+        return len(self.tribe_ids)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence["TribeRegionalRow"]) -> "RegionFrame":
+        """Lay out TribeRegionalRows as columns, one pass over the rows."""
+        n = len(rows)
+        hazard_col: dict[str, int] = {}
+        member_col: dict[str, int] = {}
+        member_info: list[dict] = []
+        hazard_cells: list[tuple[int, int, int, float]] = []
+        member_cells: list[tuple[int, int, int, bool]] = []
+
+        for i, row in enumerate(rows):
+            for rank, (htype, score) in enumerate(row.top_hazards, start=1):
+                j = hazard_col.setdefault(htype, len(hazard_col))
+                hazard_cells.append((i, j, rank, np.nan if score is None else score))
+            for pos, (key, role, info) in enumerate(row.members, start=1):
+                j = member_col.get(key)
+                if j is None:
+                    j = member_col[key] = len(member_info)
+                    member_info.append(info)
+                member_cells.append((i, j, pos, role == "Senator"))
+
+        hazard_rank = np.zeros((n, len(hazard_col)), dtype=np.int8)
+        hazard_score = np.full((n, len(hazard_col)), np.nan)
+        for i, j, rank, score in reversed(hazard_cells):  # first listing wins
+            hazard_rank[i, j] = rank
+            hazard_score[i, j] = score
+
+        member_order = np.zeros((n, len(member_info)), dtype=np.int16)
+        senator = np.zeros((n, len(member_info)), dtype=bool)
+        representative = np.zeros((n, len(member_info)), dtype=bool)
+        for i, j, pos, is_senator in reversed(member_cells):
+            member_order[i, j] = pos
+            (senator if is_senator else representative)[i, j] = True
+
+        return cls(
+            tribe_ids=[row.tribe_id for row in rows],
+            summaries=[row.summary for row in rows],
+            award_total=np.array([row.award_total for row in rows], dtype=np.float64),
+            has_awards=np.array([row.has_awards for row in rows], dtype=bool),
+            has_hazard=np.array([row.has_hazard for row in rows], dtype=bool),
+            has_delegation=np.array([row.has_delegation for row in rows], dtype=bool),
+            composite=np.array(
+                [np.nan if row.composite_risk is None else row.composite_risk
+                 for row in rows],
+                dtype=np.float64,
+            ),
+            economics=np.array(
+                [row.economics for row in rows], dtype=np.float64,
+            ).reshape(n, 4),
+            hazard_types=list(hazard_col),
+            hazard_rank=hazard_rank,
+            hazard_score=hazard_score,
+            member_keys=list(member_col),
+            member_info=member_info,
+            members=[row.members for row in rows],
+            member_order=member_order,
+            senator=senator,
+            representative=representative,
+        )
+
+    def take(self, positions: Sequence[int]) -> "RegionFrame":
+        """Frame of the given rows, in the given order.
+
+        Hazard and legislator columns no Tribe in the subset uses are
+        dropped, so column order stays first-seen within the subset.
+        """
+        idx = np.asarray(positions, dtype=np.intp)
+        hazard_rank = self.hazard_rank[idx]
+        member_order = self.member_order[idx]
+        members = [self.members[i] for i in idx]
+        hazard_cols, _, _ = _first_seen_columns(hazard_rank)
+        member_cols, first_row, first_pos = _first_seen_columns(member_order)
+        return RegionFrame(
+            tribe_ids=[self.tribe_ids[i] for i in idx],
+            summaries=[self.summaries[i] for i in idx],
+            award_total=self.award_total[idx],
+            has_awards=self.has_awards[idx],
+            has_hazard=self.has_hazard[idx],
+            has_delegation=self.has_delegation[idx],
+            composite=self.composite[idx],
+            economics=self.economics[idx],
+            hazard_types=[self.hazard_types[j] for j in hazard_cols],
+            hazard_rank=hazard_rank[:, hazard_cols],
+            hazard_score=self.hazard_score[idx][:, hazard_cols],
+            member_keys=[self.member_keys[j] for j in member_cols],
+            member_info=[
+                members[r][p - 1][2] for r, p in zip(first_row, first_pos)
+            ],
+            members=members,
+            member_order=member_order[:, member_cols],
+            senator=self.senator[idx][:, member_cols],
+            representative=self.representative[idx][:, member_cols],
+        )
+
+    # -- Reductions -----------------------------------------------------------
+
+    def hazard_tribe_counts(self) -> np.ndarray:
+        """Tribes listing each hazard column in their top-5."""
+        return (self.hazard_rank > 0).sum(axis=0)
+
+    def hazard_mean_scores(self) -> tuple[np.ndarray, np.ndarray]:
+        """(score sum, scored Tribe count) per hazard column."""
+        scored = ~np.isnan(self.hazard_score)
+        totals = ordered_sum(np.where(scored, self.hazard_score, 0.0))
+        return np.asarray(totals, dtype=np.float64).reshape(-1), scored.sum(axis=0)
+
+    def member_tribe_counts(self) -> np.ndarray:
+        """Tribes each legislator column serves."""
+        return (self.member_order > 0).sum(axis=0)
+
+
+def _first_seen_columns(
+    order: np.ndarray,
+) -> tuple[np.ndarray, list[int], list[int]]:
+    """Used columns of a 1-based position matrix, in first-seen order.
+
+    A column is first seen in the first row that uses it, at that row's
+    position for it; columns are sorted by (row, position).
+
+    Returns:
+        Tuple of (columns, first row per column, position in that row).
+    """
+    incidence = order > 0
+    cols = np.flatnonzero(incidence.any(axis=0))
+    if len(cols) == 0:
+        return cols, [], []
+    first_row = incidence[:, cols].argmax(axis=0)
+    first_pos = order[first_row, cols]
+    sort = np.lexsort((first_pos, first_row))
+    return cols[sort], first_row[sort].tolist(), first_pos[sort].tolist()
@@ -11,21 +11,38 @@ Tribe-to-region assignment uses state overlap: a Tribe belongs to a region if
 any of its states appear in the region's states list. A Tribe can appear in
 multiple regions if it spans multiple states. The cross-cutting region (empty
 states list) includes ALL Tribes unconditionally.
+
+Each Tribe's share of the regional aggregates is extracted once into a
+TribeRegionalRow. Between batch runs the aggregator persists those rows
+with a digest per region (``load_state`` / ``save_state``), so a changed
+Tribe only re-extracts its own row and only the regions containing it get
+a new digest -- the cross-cutting region reduces its cached rows instead
+of re-reading every Tribe context.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-from collections import Counter
-from dataclasses import dataclass, field
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Sequence, Union
+
+import numpy as np
 
+from src.packets.bill_index import BillIndex
 from src.packets.context import TribePacketContext
+from src.packets.region_frame import RegionFrame, ordered_sum
 
 logger = logging.getLogger(__name__)
 
+REGIONAL_STATE_FORMAT: int = 2
+"""Bumped when TribeRegionalRow changes; older state files are ignored."""
+
 
 @dataclass
 class RegionalContext:
@@ -110,6 +127,147 @@ class RegionalContext:
     generated_at: str = ""
 
 
+@dataclass
+class TribeRegionalRow:
+    """One Tribe's contribution to every regional aggregate.
+
+    Extracted once from a TribePacketContext so regional reductions never
+    dig through nested award/hazard/delegation dicts again, and small
+    enough to persist between batch runs.
+
+    Attributes:
+        tribe_id: Tribe identifier.
+        summary: Tribe summary dict for RegionalContext.tribes
+            (tribe_id, tribe_name, states, congressional_intel).
+        award_total: Sum of numeric award obligations.
+        has_awards: Tribe has at least one award record.
+        has_hazard: Tribe has an NRI composite risk score.
+        has_delegation: Tribe has senators or representatives.
+        composite_risk: Positive NRI composite risk score, or None.
+        top_hazards: ``[type, risk_score or None]`` for the first five
+            typed top hazards.
+        members: ``[key, role, info]`` per delegation member, senators
+            first (key is bioguide_id, else formatted_name).
+        economics: ``[impact_low, impact_high, jobs_low, jobs_high]``.
+        digest: SHA256 of the fields above.
+    """
+
+    tribe_id: str
+    summary: dict = field(default_factory=dict)
+    award_total: float = 0.0
+    has_awards: bool = False
+    has_hazard: bool = False
+    has_delegation: bool = False
+    composite_risk: float | None = None
+    top_hazards: list[list] = field(default_factory=list)
+    members: list[list] = field(default_factory=list)
+    economics: list[float] = field(default_factory=lambda: [0.0, 0.0, 0.0, 0.0])
+    digest: str = ""
+
+    @classmethod
+    def from_context(cls, ctx: TribePacketContext) -> "TribeRegionalRow":
+        """Extract a Tribe's regional contribution from its context."""
+        award_total = sum(
+            a.get("obligation", 0.0)
+            for a in ctx.awards
+            if isinstance(a.get("obligation"), (int, float))
+        )
+
+        nri = RegionalAggregator._extract_nri(ctx)
+        composite = nri.get("composite", {}) if nri else {}
+        risk_score = composite.get("risk_score")
+        top_hazards = []
+        for hazard in RegionalAggregator._extract_top_hazards(ctx)[:5]:
+            htype = hazard.get("type", "")
+            if not htype:
+                continue
+            score = hazard.get("risk_score", 0.0)
+            top_hazards.append([htype, score if isinstance(score, (int, float)) else None])
+
+        members = []
+        for role, people in (
+            ("Senator", ctx.senators or []),
+            ("Representative", ctx.representatives or []),
+        ):
+            for person in people:
+                key = person.get("bioguide_id") or person.get("formatted_name", "")
+                if not key:
+                    continue
+                members.append([key, role, {
+                    "member_name": person.get(
+                        "formatted_name", person.get("name", key)
+                    ),
+                    "role": role,
+                    "committees": [
+                        c.get("committee_name", "")
+                        for c in person.get("committees", [])
+                    ],
+                    "committee_ids": [
+                        c.get("committee_id", "")
+                        for c in person.get("committees", [])
+                    ],
+                }])
+
+        econ = ctx.economic_impact or {}
+        row = cls(
+            tribe_id=ctx.tribe_id,
+            summary={
+                "tribe_id": ctx.tribe_id,
+                "tribe_name": ctx.tribe_name,
+                "states": ctx.states,
+                "congressional_intel": ctx.congressional_intel,
+            },
+            award_total=award_total,
+            has_awards=bool(ctx.awards),
+            has_hazard=bool(nri) and bool(risk_score),
+            has_delegation=bool(ctx.senators or ctx.representatives),
+            composite_risk=(
+                risk_score
+                if isinstance(risk_score, (int, float)) and risk_score > 0
+                else None
+            ),
+            top_hazards=top_hazards,
+            members=members,
+            economics=[
+                econ.get("total_impact_low", 0.0),
+                econ.get("total_impact_high", 0.0),
+                econ.get("total_jobs_low", 0.0),
+                econ.get("total_jobs_high", 0.0),
+            ],
+        )
+        row.digest = row.compute_digest()
+        return row
+
+    def compute_digest(self) -> str:
+        """SHA256 over every field except ``digest``."""
+        payload = asdict(self)
+        payload.pop("digest")
+        return hashlib.sha256(json.dumps(
+            payload, sort_keys=True, separators=(",", ":"), default=str,
+        ).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TribeRegionalRow":
+        """Rebuild a row persisted with ``asdict``."""
+        return cls(**data)
+
+
+RegionInput = Union[
+    RegionFrame, Sequence[TribePacketContext], Sequence[TribeRegionalRow]
+]
+"""What the aggregation helpers accept: a frame, or contexts/rows to frame."""
+
+
+def _as_frame(contexts: RegionInput) -> RegionFrame:
+    """RegionFrame for contexts or rows (frames pass through unchanged)."""
+    if isinstance(contexts, RegionFrame):
+        return contexts
+    return RegionFrame.from_rows([
+        c if isinstance(c, TribeRegionalRow) else TribeRegionalRow.from_context(c)
+        for c in contexts
+    ])
+
+
 class RegionalAggregator:
     """Aggregates Tribe-level data into regional contexts for Doc C/D generation.
 
@@ -125,22 +283,48 @@ class RegionalAggregator:
         )
         tribe_ids = aggregator.get_tribe_ids_for_region("pnw")
         regional_ctx = aggregator.aggregate("pnw", tribe_contexts)
+
+    Incremental use across batch runs::
+
+        aggregator.load_state(state_path)
+        changed = aggregator.update_rows(
+            {tid: TribeRegionalRow.from_context(ctx) for tid, ctx in contexts.items()}
+        )
+        for region_id in aggregator.regions_for_tribes(changed):
+            regional_ctx = aggregator.aggregate(
+                region_id, aggregator.region_frame(region_id)
+            )
+        aggregator.save_state(state_path)
     """
 
     def __init__(
         self,
         regional_config_path: Path,
         registry,
+        bill_index: BillIndex | None = None,
     ) -> None:
         """Load regional config and prepare for aggregation.
 
         Args:
             regional_config_path: Path to regional_config.json.
-            registry: TribalRegistry instance with get_all() method.
+            registry: TribalRegistry instance (get_all, get_ids_by_state).
+            bill_index: Optional BillIndex shared with the orchestrator.
+                When given, delegation overlap entries count the tracked
+                bills referred to each member's committees.
         """
         self.config = json.loads(regional_config_path.read_text(encoding="utf-8"))
         self.registry = registry
+        self.bill_index = bill_index
         self._tribe_region_cache: dict[str, list[str]] = {}
+        self._all_tribe_ids: list[str] | None = None
+        self._registry_pos: dict[str, int] = {}
+
+        # Incremental state (load_state / update_rows / save_state)
+        self.rows: dict[str, TribeRegionalRow] = {}
+        self.signatures: dict[str, str] = {}
+        self.region_digests: dict[str, str] = {}
+        self._frame: RegionFrame | None = None
+        self._frame_pos: dict[str, int] = {}
 
     def get_region_ids(self) -> list[str]:
         """Return all region IDs from config.
@@ -168,73 +352,76 @@ class RegionalAggregator:
         region_cfg = self.config.get("regions", {}).get(region_id, {})
         region_states = set(region_cfg.get("states", []))
 
-        all_tribes = self.registry.get_all()
+        all_ids = self._index_registry()
 
         if not region_states:
             # Crosscutting region: all Tribes
-            result = [t["tribe_id"] for t in all_tribes]
+            result = list(all_ids)
         else:
-            result = [
-                t["tribe_id"]
-                for t in all_tribes
-                if set(t.get("states", [])) & region_states
-            ]
+            ids: set[str] = set()
+            for state in region_states:
+                ids.update(self.registry.get_ids_by_state(state))
+            result = sorted(ids, key=self._registry_pos.__getitem__)
 
         self._tribe_region_cache[region_id] = result
         return result
 
+    def _index_registry(self) -> list[str]:
+        """Build the registry-order tribe_id list once.
+
+        Region lookups union the registry's per-state tribe_id index
+        (``get_ids_by_state``) and restore registry order from the
+        positions recorded here, instead of scanning every Tribe.
+
+        Returns:
+            All tribe_ids in registry order.
+        """
+        if self._all_tribe_ids is None:
+            self._all_tribe_ids = [tribe["tribe_id"] for tribe in self.registry.get_all()]
+            self._registry_pos = {
+                tribe_id: pos for pos, tribe_id in reversed(list(enumerate(self._all_tribe_ids)))
+            }
+        return self._all_tribe_ids
+
     def aggregate(
         self,
         region_id: str,
-        tribe_contexts: list[TribePacketContext],
+        tribe_contexts: RegionInput,
     ) -> RegionalContext:
         """Aggregate multiple TribePacketContexts into a RegionalContext.
 
         Args:
             region_id: Region identifier.
-            tribe_contexts: List of TribePacketContext objects for Tribes
-                assigned to this region.
+            tribe_contexts: TribePacketContexts, their TribeRegionalRows,
+                or a RegionFrame (e.g. ``region_frame(region_id)``) for
+                Tribes assigned to this region.
 
         Returns:
             Fully populated RegionalContext for the region.
         """
         region_cfg = self.config.get("regions", {}).get(region_id, {})
+        frame = _as_frame(tribe_contexts)
 
         # Awards aggregation
-        total_awards, award_coverage = self._aggregate_awards(tribe_contexts)
+        total_awards, award_coverage = self._aggregate_awards(frame)
 
         # Hazard synthesis
-        top_shared = self._find_shared_hazards(tribe_contexts)
-        composite_risk = self._compute_composite_risk(tribe_contexts)
-        hazard_coverage = sum(
-            1 for ctx in tribe_contexts if self._has_hazard_data(ctx)
-        )
+        top_shared = self._find_shared_hazards(frame)
+        composite_risk = self._compute_composite_risk(frame)
+        hazard_coverage = int(frame.has_hazard.sum())
 
         # Congressional delegation overlap
-        overlap, total_sens, total_reps = self._find_delegation_overlap(
-            tribe_contexts
-        )
-        congressional_coverage = sum(
-            1 for ctx in tribe_contexts
-            if ctx.senators or ctx.representatives
-        )
+        overlap, total_sens, total_reps = self._find_delegation_overlap(frame)
+        congressional_coverage = int(frame.has_delegation.sum())
 
         # Economic aggregation
-        economic_agg = self._aggregate_economics(tribe_contexts)
+        economic_agg = self._aggregate_economics(frame)
 
         # Coverage gaps
-        no_awards, no_hazards, no_delegation = self._identify_gaps(tribe_contexts)
+        no_awards, no_hazards, no_delegation = self._identify_gaps(frame)
 
         # Tribe summaries (include congressional_intel for regional bill aggregation)
-        tribes_list = [
-            {
-                "tribe_id": ctx.tribe_id,
-                "tribe_name": ctx.tribe_name,
-                "states": ctx.states,
-                "congressional_intel": ctx.congressional_intel,
-            }
-            for ctx in tribe_contexts
-        ]
+        tribes_list = [dict(summary) for summary in frame.summaries]
 
         return RegionalContext(
             region_id=region_id,
@@ -244,7 +431,7 @@ class RegionalAggregator:
             treaty_trust_angle=region_cfg.get("treaty_trust_angle", ""),
             key_programs=region_cfg.get("key_programs", []),
             states=region_cfg.get("states", []),
-            tribe_count=len(tribe_contexts),
+            tribe_count=len(frame),
             tribes=tribes_list,
             total_awards=total_awards,
             award_coverage=award_coverage,
@@ -262,243 +449,303 @@ class RegionalAggregator:
             generated_at=datetime.now(timezone.utc).isoformat(),
         )
 
+    # ------------------------------------------------------------------
+    # Incremental aggregation across batch runs
+    # ------------------------------------------------------------------
+
+    def load_state(self, path: Path) -> None:
+        """Load rows, input signatures, and region digests from a prior run.
+
+        Missing, corrupt, or old-format state files leave the aggregator
+        empty (everything counts as changed).
+
+        Args:
+            path: State file written by ``save_state``.
+        """
+        if not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("format") != REGIONAL_STATE_FORMAT:
+                logger.info("Regional state %s has an old format, ignoring", path)
+                return
+            rows = {
+                tid: TribeRegionalRow.from_dict(raw)
+                for tid, raw in data.get("rows", {}).items()
+            }
+        except (json.JSONDecodeError, OSError, TypeError, AttributeError) as exc:
+            logger.warning("Regional state %s unreadable: %s", path, exc)
+            return
+        self.rows = rows
+        self._frame = None
+        self.signatures = dict(data.get("signatures", {}))
+        self.region_digests = dict(data.get("region_digests", {}))
+
+    def save_state(self, path: Path) -> None:
+        """Persist rows, input signatures, and region digests atomically.
+
+        Args:
+            path: Destination state file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": REGIONAL_STATE_FORMAT,
+            "rows": {tid: asdict(row) for tid, row in self.rows.items()},
+            "signatures": self.signatures,
+            "region_digests": self.region_digests,
+        }
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"), default=str)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def cached_row(self, tribe_id: str, signature: str) -> TribeRegionalRow | None:
+        """Row stored for ``tribe_id`` if it was extracted from the same inputs.
+
+        Args:
+            tribe_id: Tribe identifier.
+            signature: Input signature the caller computed for this Tribe.
+
+        Returns:
+            The stored row, or None when absent or built from other inputs.
+        """
+        if self.signatures.get(tribe_id) != signature:
+            return None
+        return self.rows.get(tribe_id)
+
+    def update_rows(
+        self,
+        rows: dict[str, TribeRegionalRow],
+        signatures: dict[str, str] | None = None,
+    ) -> set[str]:
+        """Replace the current Tribe rows, reporting which Tribes changed.
+
+        Tribes absent from ``rows`` are dropped (their context failed to
+        build), matching how ``aggregate`` skips missing Tribes.
+
+        Args:
+            rows: tribe_id -> row for every Tribe with a context this run.
+            signatures: Optional tribe_id -> input signature, stored for
+                ``cached_row`` lookups on the next run.
+
+        Returns:
+            Set of tribe_ids that were added, removed, or changed.
+        """
+        changed = {
+            tid for tid, row in rows.items()
+            if tid not in self.rows or self.rows[tid].digest != row.digest
+        }
+        changed.update(tid for tid in self.rows if tid not in rows)
+        self.rows = dict(rows)
+        self._frame = None
+        self.signatures = {
+            tid: sig for tid, sig in (signatures or {}).items() if tid in rows
+        }
+        return changed
+
+    def regions_for_tribes(self, tribe_ids: set[str]) -> set[str]:
+        """Region IDs containing at least one of ``tribe_ids``."""
+        return {
+            region_id for region_id in self.get_region_ids()
+            if tribe_ids.intersection(self.get_tribe_ids_for_region(region_id))
+        }
+
+    def region_rows(self, region_id: str) -> list[TribeRegionalRow]:
+        """Current rows for a region's Tribes, in registry order."""
+        return [
+            self.rows[tid]
+            for tid in self.get_tribe_ids_for_region(region_id)
+            if tid in self.rows
+        ]
+
+    def region_frame(self, region_id: str) -> RegionFrame:
+        """Columnar frame of a region's current rows, in registry order.
+
+        Slices one frame built over every current row, so all regions
+        (and any other grouping of Tribes) share a single pass over them.
+        """
+        if self._frame is None:
+            self._frame = RegionFrame.from_rows(list(self.rows.values()))
+            self._frame_pos = {tid: i for i, tid in enumerate(self.rows)}
+        return self._frame.take([
+            self._frame_pos[tid]
+            for tid in self.get_tribe_ids_for_region(region_id)
+            if tid in self._frame_pos
+        ])
+
+    def region_digest(self, region_id: str, salt: str = "") -> str:
+        """Digest of everything a region's Doc C/D is rendered from.
+
+        Combines the region's config entry with its Tribes' row digests,
+        so only regions that contain a changed Tribe get a new digest.
+
+        Args:
+            region_id: Region identifier.
+            salt: Extra render inputs (renderer version, programs).
+
+        Returns:
+            Hex digest string.
+        """
+        region_cfg = self.config.get("regions", {}).get(region_id, {})
+        h = hashlib.sha256(f"{REGIONAL_STATE_FORMAT}|{salt}|{region_id}|".encode("utf-8"))
+        h.update(json.dumps(region_cfg, sort_keys=True).encode("utf-8"))
+        for row in self.region_rows(region_id):
+            h.update(row.digest.encode("ascii"))
+        return h.hexdigest()
+
     # ------------------------------------------------------------------
     # Private aggregation helpers
     # ------------------------------------------------------------------
 
-    def _aggregate_awards(
-        self, contexts: list[TribePacketContext]
-    ) -> tuple[float, int]:
+    def _aggregate_awards(self, contexts: RegionInput) -> tuple[float, int]:
         """Sum awards and count Tribes with at least one award.
 
         Args:
-            contexts: List of TribePacketContext objects.
+            contexts: TribePacketContexts, TribeRegionalRows, or a RegionFrame.
 
         Returns:
             Tuple of (total_awards, tribes_with_awards_count).
         """
-        total = 0.0
-        coverage = 0
-        for ctx in contexts:
-            tribe_total = sum(
-                a.get("obligation", 0.0)
-                for a in ctx.awards
-                if isinstance(a.get("obligation"), (int, float))
-            )
-            total += tribe_total
-            if ctx.awards:
-                coverage += 1
-        return total, coverage
-
-    def _find_shared_hazards(
-        self, contexts: list[TribePacketContext]
-    ) -> list[dict]:
+        frame = _as_frame(contexts)
+        return ordered_sum(frame.award_total), int(frame.has_awards.sum())
+
+    def _find_shared_hazards(self, contexts: RegionInput) -> list[dict]:
         """Find hazards affecting the most Tribes in the region.
 
         Counts how many Tribes have each hazard type in their top-5, then
         returns the top 5 hazards ranked by Tribe count. Ties are broken
-        by average risk score (descending).
+        by average risk score (descending), then by first appearance.
 
         Args:
-            contexts: List of TribePacketContext objects.
+            contexts: TribePacketContexts, TribeRegionalRows, or a RegionFrame.
 
         Returns:
             List of dicts with hazard_type, tribe_count, avg_score.
         """
-        hazard_tribes: Counter = Counter()
-        hazard_scores: dict[str, list[float]] = {}
-
-        for ctx in contexts:
-            top_hazards = self._extract_top_hazards(ctx)
-            for hazard in top_hazards[:5]:
-                htype = hazard.get("type", "")
-                if not htype:
-                    continue
-                hazard_tribes[htype] += 1
-                score = hazard.get("risk_score", 0.0)
-                if isinstance(score, (int, float)):
-                    hazard_scores.setdefault(htype, []).append(score)
+        frame = _as_frame(contexts)
+        counts = frame.hazard_tribe_counts()
+        totals, scored = frame.hazard_mean_scores()
+        avg = np.divide(
+            totals, scored, out=np.zeros_like(totals), where=scored > 0,
+        )
 
-        # Rank by tribe count, then by average score
+        # Rank by tribe count, then by average score; a stable sort keeps
+        # first-seen column order for full ties
         ranked = sorted(
-            hazard_tribes.items(),
-            key=lambda x: (
-                x[1],
-                sum(hazard_scores.get(x[0], [0.0]))
-                / max(len(hazard_scores.get(x[0], [1])), 1),
-            ),
+            range(len(frame.hazard_types)),
+            key=lambda j: (counts[j], avg[j]),
             reverse=True,
         )
 
-        result = []
-        for htype, count in ranked[:5]:
-            scores = hazard_scores.get(htype, [])
-            avg = sum(scores) / len(scores) if scores else 0.0
-            result.append({
-                "hazard_type": htype,
-                "tribe_count": count,
-                "avg_score": round(avg, 2),
-            })
-        return result
+        return [
+            {
+                "hazard_type": frame.hazard_types[j],
+                "tribe_count": int(counts[j]),
+                "avg_score": round(float(avg[j]), 2),
+            }
+            for j in ranked[:5]
+        ]
 
-    def _compute_composite_risk(
-        self, contexts: list[TribePacketContext]
-    ) -> float:
+    def _compute_composite_risk(self, contexts: RegionInput) -> float:
         """Compute average composite risk score across Tribes with data.
 
         Args:
-            contexts: List of TribePacketContext objects.
+            contexts: TribePacketContexts, TribeRegionalRows, or a RegionFrame.
 
         Returns:
             Average composite NRI risk score, or 0.0 if no data.
         """
-        scores = []
-        for ctx in contexts:
-            nri = self._extract_nri(ctx)
-            composite = nri.get("composite", {}) if nri else {}
-            risk_score = composite.get("risk_score")
-            if isinstance(risk_score, (int, float)) and risk_score > 0:
-                scores.append(risk_score)
-        return round(sum(scores) / len(scores), 2) if scores else 0.0
+        frame = _as_frame(contexts)
+        scores = frame.composite[~np.isnan(frame.composite)]
+        return round(ordered_sum(scores) / len(scores), 2) if len(scores) else 0.0
 
     def _find_delegation_overlap(
-        self, contexts: list[TribePacketContext]
+        self, contexts: RegionInput
     ) -> tuple[list[dict], int, int]:
         """Find congressional members serving multiple Tribes in the region.
 
         Identifies members (by bioguide_id or formatted_name) who appear in
         more than one Tribe's delegation. Returns overlap list ranked by
-        Tribe count, plus unique senator and representative counts.
+        Tribe count, plus unique senator and representative counts. With a
+        bill_index, each entry also carries ``committee_bills``: tracked
+        bills referred to any of the member's committees.
 
         Args:
-            contexts: List of TribePacketContext objects.
+            contexts: TribePacketContexts, TribeRegionalRows, or a RegionFrame.
 
         Returns:
             Tuple of (overlap_list, total_unique_senators, total_unique_reps).
         """
-        # Track member -> set of tribe_ids they serve
-        member_tribes: dict[str, set[str]] = {}
-        member_info: dict[str, dict] = {}
-        unique_senators: set[str] = set()
-        unique_reps: set[str] = set()
-
-        for ctx in contexts:
-            for senator in (ctx.senators or []):
-                key = senator.get("bioguide_id") or senator.get(
-                    "formatted_name", ""
-                )
-                if not key:
-                    continue
-                member_tribes.setdefault(key, set()).add(ctx.tribe_id)
-                if key not in member_info:
-                    member_info[key] = {
-                        "member_name": senator.get(
-                            "formatted_name", senator.get("name", key)
-                        ),
-                        "role": "Senator",
-                        "committees": [
-                            c.get("committee_name", "")
-                            for c in senator.get("committees", [])
-                        ],
-                    }
-                unique_senators.add(key)
-
-            for rep in (ctx.representatives or []):
-                key = rep.get("bioguide_id") or rep.get(
-                    "formatted_name", ""
-                )
-                if not key:
-                    continue
-                member_tribes.setdefault(key, set()).add(ctx.tribe_id)
-                if key not in member_info:
-                    member_info[key] = {
-                        "member_name": rep.get(
-                            "formatted_name", rep.get("name", key)
-                        ),
-                        "role": "Representative",
-                        "committees": [
-                            c.get("committee_name", "")
-                            for c in rep.get("committees", [])
-                        ],
-                    }
-                unique_reps.add(key)
-
-        # Build overlap list for members serving 2+ Tribes
+        frame = _as_frame(contexts)
+        counts = frame.member_tribe_counts()
+        incidence = frame.member_order > 0
+        tribe_ids = np.array(frame.tribe_ids, dtype=object)
+
+        # Members serving 2+ Tribes, in first-seen column order
         overlap = []
-        for key, tribe_set in member_tribes.items():
-            if len(tribe_set) >= 2:
-                info = member_info.get(key, {})
-                overlap.append({
-                    "member_name": info.get("member_name", key),
-                    "role": info.get("role", "Unknown"),
-                    "tribe_count": len(tribe_set),
-                    "tribe_ids": sorted(tribe_set),
-                    "committees": info.get("committees", []),
-                })
+        for j in np.flatnonzero(counts >= 2):
+            key = frame.member_keys[j]
+            info = frame.member_info[j]
+            entry = {
+                "member_name": info.get("member_name", key),
+                "role": info.get("role", "Unknown"),
+                "tribe_count": int(counts[j]),
+                "tribe_ids": sorted(tribe_ids[incidence[:, j]]),
+                "committees": info.get("committees", []),
+            }
+            if self.bill_index is not None:
+                entry["committee_bills"] = len(
+                    self.bill_index.committee_positions(info.get("committee_ids", []))
+                )
+            overlap.append(entry)
 
         # Sort by tribe_count descending
         overlap.sort(key=lambda x: x["tribe_count"], reverse=True)
 
-        return overlap, len(unique_senators), len(unique_reps)
+        return (
+            overlap,
+            int(frame.senator.any(axis=0).sum()),
+            int(frame.representative.any(axis=0).sum()),
+        )
 
-    def _aggregate_economics(
-        self, contexts: list[TribePacketContext]
-    ) -> dict:
+    def _aggregate_economics(self, contexts: RegionInput) -> dict:
         """Sum economic impact across all Tribes in region.
 
         Uses economic_impact data from each TribePacketContext. Falls back
         to zeros if economic_impact is not populated.
 
         Args:
-            contexts: List of TribePacketContext objects.
+            contexts: TribePacketContexts, TribeRegionalRows, or a RegionFrame.
 
         Returns:
             Dict with total_low, total_high, total_jobs_low, total_jobs_high.
         """
-        total_low = 0.0
-        total_high = 0.0
-        total_jobs_low = 0.0
-        total_jobs_high = 0.0
-
-        for ctx in contexts:
-            econ = ctx.economic_impact or {}
-            total_low += econ.get("total_impact_low", 0.0)
-            total_high += econ.get("total_impact_high", 0.0)
-            total_jobs_low += econ.get("total_jobs_low", 0.0)
-            total_jobs_high += econ.get("total_jobs_high", 0.0)
-
-        return {
-            "total_low": round(total_low, 2),
-            "total_high": round(total_high, 2),
-            "total_jobs_low": round(total_jobs_low, 2),
-            "total_jobs_high": round(total_jobs_high, 2),
-        }
+        totals = ordered_sum(_as_frame(contexts).economics)
+        keys = ("total_low", "total_high", "total_jobs_low", "total_jobs_high")
+        return {key: round(float(value), 2) for key, value in zip(keys, totals)}
 
     def _identify_gaps(
-        self, contexts: list[TribePacketContext]
+        self, contexts: RegionInput
     ) -> tuple[list[str], list[str], list[str]]:
         """Identify Tribes missing awards, hazards, or delegation data.
 
         Args:
-            contexts: List of TribePacketContext objects.
+            contexts: TribePacketContexts, TribeRegionalRows, or a RegionFrame.
 
         Returns:
             Tuple of (tribes_without_awards, tribes_without_hazards,
             tribes_without_delegation) -- each a list of tribe_id strings.
         """
-        no_awards = []
-        no_hazards = []
-        no_delegation = []
-
-        for ctx in contexts:
-            if not ctx.awards:
-                no_awards.append(ctx.tribe_id)
-            if not self._has_hazard_data(ctx):
-                no_hazards.append(ctx.tribe_id)
-            if not ctx.senators and not ctx.representatives:
-                no_delegation.append(ctx.tribe_id)
-
-        return no_awards, no_hazards, no_delegation
+        frame = _as_frame(contexts)
+        ids = frame.tribe_ids
+        return tuple(
+            [ids[i] for i in np.flatnonzero(~flags)]
+            for flags in (frame.has_awards, frame.has_hazard, frame.has_delegation)
+        )
 
     # ------------------------------------------------------------------
     # Hazard profile extraction helpers
@@ -8,6 +8,13 @@ resolution uses a 3-tier approach:
   Tier 2: Substring match across name + alternate_names
   Tier 3: Fuzzy fallback using rapidfuzz WRatio (weighted ratio)
 
+On first load the registry builds three indexes so hot-path callers
+(award matching, regional assignment) never scan the Tribe list:
+tribe_id -> record, lowercase official name -> record, and
+state -> tribe_ids. Accessors share the loaded records instead of
+returning fresh copies: get_by_id wraps them in read-only views, and
+get_all returns the records themselves, which callers must not mutate.
+
 Usage:
     registry = TribalRegistry({})
     tribe = registry.resolve("Navajo Nation")           # Exact -> dict
@@ -18,7 +25,9 @@ Usage:
 
 import json
 import logging
+from collections.abc import Mapping, Sequence
 from pathlib import Path
+from types import MappingProxyType
 
 from src.paths import PROJECT_ROOT, TRIBAL_REGISTRY_PATH
 
@@ -51,6 +60,10 @@ class TribalRegistry:
             self.data_path = PROJECT_ROOT / self.data_path
 
         self._tribes: list[dict] = []
+        self._tribes_view: tuple[dict, ...] = ()
+        self._by_id: dict[str, dict] = {}
+        self._by_name: dict[str, dict] = {}
+        self._by_state: dict[str, tuple[str, ...]] = {}
         self._loaded: bool = False
         self._search_corpus: list[tuple[str, int]] | None = None
 
@@ -81,6 +94,7 @@ class TribalRegistry:
             raise
 
         self._tribes = data.get("tribes", [])
+        self._build_indexes()
         self._loaded = True
 
         metadata = data.get("metadata", {})
@@ -115,11 +129,11 @@ class TribalRegistry:
         if not q:
             return None
 
-        # Tier 1: Exact match on official name
-        for tribe in self._tribes:
-            if tribe["name"].lower() == q:
-                logger.debug("Tier 1 exact match: %s", tribe["name"])
-                return dict(tribe)
+        # Tier 1: Exact match on official name (O(1) via name index)
+        tribe = self._by_name.get(q)
+        if tribe is not None:
+            logger.debug("Tier 1 exact match: %s", tribe["name"])
+            return dict(tribe)
 
         # Tier 2: Substring match across name + alternate_names
         candidates: list[dict] = []
@@ -246,29 +260,71 @@ class TribalRegistry:
 
         return matched
 
-    def get_all(self) -> list[dict]:
+    def get_all(self) -> Sequence[dict]:
         """Return all tribes in the registry.
 
         Returns:
-            List of all tribe dicts.
+            Read-only sequence (tuple) of all tribe dicts in registry
+            order. The tuple is built once at load time and shared
+            between callers. The records in it are the registry's own
+            dicts (left as plain dicts so they pickle to --workers
+            processes and serialize into input fingerprints): callers
+            must not mutate them. Copy with ``dict(tribe)`` to modify.
         """
         self._load()
-        return list(self._tribes)
+        return self._tribes_view
 
-    def get_by_id(self, tribe_id: str) -> dict | None:
+    def get_by_id(self, tribe_id: str) -> Mapping | None:
         """Look up a tribe by its tribe_id.
 
         Args:
             tribe_id: The tribe_id to look up (e.g., "epa_100000171").
 
         Returns:
-            The tribe dict, or None if not found.
+            Read-only mapping view of the tribe record, or None if not
+            found. Use ``dict(...)`` for a mutable copy.
+        """
+        self._load()
+        tribe = self._by_id.get(tribe_id)
+        return MappingProxyType(tribe) if tribe is not None else None
+
+    def get_ids_by_state(self, state: str) -> tuple[str, ...]:
+        """Return the tribe_ids with land in a state, in registry order.
+
+        States match exactly as stored in the registry, like the set
+        intersection this index replaces.
+
+        Args:
+            state: Two-letter state abbreviation (e.g., "AZ").
+
+        Returns:
+            Tuple of tribe_id strings (empty if none).
         """
         self._load()
+        return self._by_state.get(state, ())
+
+    def _build_indexes(self) -> None:
+        """Build the id, name, and state indexes over ``self._tribes``.
+
+        The name index keeps the first record for a duplicated official
+        name, matching the first-hit semantics of a linear scan.
+        """
+        by_id: dict[str, dict] = {}
+        by_name: dict[str, dict] = {}
+        by_state: dict[str, list[str]] = {}
         for tribe in self._tribes:
-            if tribe["tribe_id"] == tribe_id:
-                return dict(tribe)
-        return None
+            tribe_id = tribe["tribe_id"]
+            by_id.setdefault(tribe_id, tribe)
+            by_name.setdefault(tribe["name"].lower(), tribe)
+            for state in tribe.get("states", []):
+                ids = by_state.setdefault(state, [])
+                if not ids or ids[-1] != tribe_id:
+                    ids.append(tribe_id)
+
+        self._tribes_view = tuple(self._tribes)
+        self._by_id = by_id
+        self._by_name = by_name
+        self._by_state = {state: tuple(ids) for state, ids in by_state.items()}
 
     def _build_search_corpus(self) -> list[tuple[str, int]]:
         """Build the search corpus for fuzzy matching.
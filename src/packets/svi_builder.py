@@ -20,19 +20,23 @@ Usage:
     print(f"Built {count} SVI profiles")
 """
 
-import csv
 import json
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
+
 from src.packets._geo_common import (
     atomic_write_json,
     atomic_write_text,
     load_aiannh_crosswalk,
     load_area_weights,
 )
+from src.packets.county_store import CountyRecords, open_county_table
 from src.packets.hazards import _safe_float
+from src.packets.tribe_matrix import TribeCountyMatrix
 from src.paths import (
     AIANNH_CROSSWALK_PATH,
     OUTPUTS_DIR,
@@ -74,6 +78,14 @@ SVI_THEME_NAMES: dict[str, str] = {
 }
 """Human-readable names for included SVI themes."""
 
+_SVI_TEXT_COLUMNS: tuple[str, ...] = ("STCNTY", "FIPS", "STATE", "ST_ABBR", "COUNTY", "LOCATION")
+"""SVI columns kept as text in the county store (FIPS keeps leading zeros)."""
+
+_SVI_SUM_FIELDS: tuple[str, ...] = (
+    "rpl_theme1", "rpl_theme2", "rpl_theme4", "f_theme1", "f_theme2", "f_theme4",
+)
+"""County fields area-weighted into each Tribe (batch metric matrix columns)."""
+
 
 # ---------------------------------------------------------------------------
 # -- Helper functions --
@@ -117,7 +129,7 @@ class SVIProfileBuilder:
       2. _load_crosswalk
       3. _load_area_weights
       4. _load_svi_csv (data ingest)
-      5. _aggregate_tribe_svi (per-Tribe aggregation)
+      5. _aggregate_tribe_svi (per-Tribe aggregation, batched)
       6. (no USFS equivalent -- single data source)
       7. build_all_profiles (orchestration)
       8. _atomic_write
@@ -129,6 +141,9 @@ class SVIProfileBuilder:
         crosswalk_path: Path to aiannh_tribe_crosswalk.json.
     """
 
+    # (county data, fips -> row, county x metric matrix) for batch aggregation
+    _metric_matrix: tuple[Mapping[str, dict], dict[str, int], np.ndarray] | None = None
+
     def __init__(self, config: dict) -> None:
         """Initialize the SVI builder.
 
@@ -165,10 +180,12 @@ class SVIProfileBuilder:
 
     # -- Step 4: Load SVI CSV --
 
-    def _load_svi_csv(self) -> dict[str, dict]:
+    def _load_svi_csv(self) -> Mapping[str, dict]:
         """Parse the CDC SVI 2022 county-level CSV file.
 
-        Opens with encoding="utf-8-sig" to handle BOM. Extracts per county:
+        Reads through the columnar county store (see county_store), which
+        converts the CSV once and re-validates it by SHA256 on each open.
+        Extracts per county:
         - RPL_THEME1 (Socioeconomic Status percentile)
         - RPL_THEME2 (Household Characteristics percentile)
         - RPL_THEME4 (Housing Type & Transportation percentile)
@@ -182,8 +199,8 @@ class SVIProfileBuilder:
         Zero-pads FIPS to 5 digits.
 
         Returns:
-            Dict keyed by county FIPS (5-digit, zero-padded) -> SVI metrics dict.
-            Empty dict if the file does not exist.
+            Mapping keyed by county FIPS (5-digit, zero-padded) -> SVI metrics
+            dict, built lazily per county. Empty dict if the file does not exist.
         """
         if not self.svi_csv_path.exists():
             logger.warning(
@@ -194,82 +211,70 @@ class SVIProfileBuilder:
             )
             return {}
 
-        county_data: dict[str, dict] = {}
         logger.info("Loading SVI 2022 county data from %s", self.svi_csv_path)
 
-        with open(self.svi_csv_path, encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            headers = reader.fieldnames or []
-            headers_upper = {h.upper(): h for h in headers}
-
-            # FIPS column: try STCNTY first, then FIPS
-            fips_col = None
-            for candidate in ["STCNTY", "FIPS"]:
-                if candidate in headers_upper:
-                    fips_col = headers_upper[candidate]
-                    break
-
-            if fips_col is None:
-                logger.error(
-                    "SVI CSV at %s has no STCNTY or FIPS column. "
-                    "Headers: %s",
-                    self.svi_csv_path,
-                    headers,
-                )
-                return {}
-
-            logger.info("SVI CSV using FIPS column: %s", fips_col)
-
-            row_count = 0
-            sentinel_count = 0
-            for row in reader:
-                fips = row.get(fips_col, "").strip()
-                fips = fips.zfill(5) if fips else fips
-                if not fips:
-                    continue
-
-                # Extract theme percentiles with -999 sentinel handling
-                rpl_theme1 = _safe_svi_float(row.get("RPL_THEME1"))
-                rpl_theme2 = _safe_svi_float(row.get("RPL_THEME2"))
-                rpl_theme4 = _safe_svi_float(row.get("RPL_THEME4"))
-                rpl_themes = _safe_svi_float(row.get("RPL_THEMES"))
-
-                # Flag counts
-                f_theme1 = int(_safe_svi_float(row.get("F_THEME1"), default=0.0))
-                f_theme2 = int(_safe_svi_float(row.get("F_THEME2"), default=0.0))
-                f_theme4 = int(_safe_svi_float(row.get("F_THEME4"), default=0.0))
-
-                # Population
-                e_totpop = _safe_svi_float(row.get("E_TOTPOP"), default=0.0)
-
-                # Track sentinel occurrences for diagnostics
-                raw_vals = [
-                    row.get("RPL_THEME1", ""),
-                    row.get("RPL_THEME2", ""),
-                    row.get("RPL_THEME4", ""),
-                ]
-                for rv in raw_vals:
-                    if str(rv).strip() == "-999":
-                        sentinel_count += 1
-
-                record: dict = {
-                    "fips": fips,
-                    "rpl_theme1": rpl_theme1,
-                    "rpl_theme2": rpl_theme2,
-                    "rpl_theme4": rpl_theme4,
-                    "rpl_themes": rpl_themes,  # reference only, not used in composite
-                    "e_totpop": e_totpop,
-                    "f_theme1": f_theme1,
-                    "f_theme2": f_theme2,
-                    "f_theme4": f_theme4,
-                }
+        table = open_county_table(self.svi_csv_path, text_columns=_SVI_TEXT_COLUMNS)
+        headers_upper = {h.upper(): h for h in table.headers}
+
+        # FIPS column: try STCNTY first, then FIPS
+        fips_col = None
+        for candidate in ["STCNTY", "FIPS"]:
+            if candidate in headers_upper:
+                fips_col = headers_upper[candidate]
+                break
+
+        if fips_col is None:
+            logger.error(
+                "SVI CSV at %s has no STCNTY or FIPS column. "
+                "Headers: %s",
+                self.svi_csv_path,
+                table.headers,
+            )
+            return {}
 
-                county_data[fips] = record
-                row_count += 1
+        logger.info("SVI CSV using FIPS column: %s", fips_col)
+
+        keys = [
+            fips.strip().zfill(5) if fips.strip() else ""
+            for fips in table.strings(fips_col)
+        ]
+
+        # Track sentinel occurrences for diagnostics
+        has_fips = np.array([bool(k) for k in keys], dtype=bool)
+        sentinel_count = sum(
+            int(np.count_nonzero((table.floats(col) == -999) & has_fips))
+            for col in ("RPL_THEME1", "RPL_THEME2", "RPL_THEME4")
+        )
+
+        read = table.row_reader([
+            "RPL_THEME1", "RPL_THEME2", "RPL_THEME4", "RPL_THEMES",
+            "F_THEME1", "F_THEME2", "F_THEME4", "E_TOTPOP",
+        ])
+
+        def make_record(fips: str, row: int) -> dict:
+            values, _ = read(row)
+            # NaN and the -999 sentinel -> _safe_svi_float default
+            (
+                rpl_theme1, rpl_theme2, rpl_theme4, rpl_themes,
+                f_theme1, f_theme2, f_theme4, e_totpop,
+            ) = [0.0 if v != v or v == -999 else v for v in values]
+            return {
+                "fips": fips,
+                "rpl_theme1": rpl_theme1,
+                "rpl_theme2": rpl_theme2,
+                "rpl_theme4": rpl_theme4,
+                "rpl_themes": rpl_themes,  # reference only, not used in composite
+                "e_totpop": e_totpop,
+                "f_theme1": int(f_theme1),
+                "f_theme2": int(f_theme2),
+                "f_theme4": int(f_theme4),
+            }
+
+        county_data = CountyRecords(keys, make_record)
 
         logger.info(
             "Loaded SVI data for %d counties (%d sentinel -999 values replaced)",
-            row_count,
+            int(has_fips.sum()),
             sentinel_count,
         )
         return county_data
@@ -280,7 +285,7 @@ class SVIProfileBuilder:
         self,
         tribe_id: str,
         tribe: dict,
-        county_data: dict[str, dict],
+        county_data: Mapping[str, dict],
     ) -> dict:
         """Aggregate SVI data for a single Tribe using area-weighted averaging.
 
@@ -306,136 +311,135 @@ class SVIProfileBuilder:
             Dict with SVI profile data including themes, composite, coverage,
             and data gaps. Returns empty/gap profile if no data matched.
         """
-        if not county_data:
-            return self._empty_svi_result("SVI county data not loaded")
-
-        # Step 1: Find AIANNH GEOIDs for this Tribe
-        geoids = self._tribe_to_geoids.get(tribe_id, [])
-
-        # Step 2: Collect county weights from area-weighted crosswalk
-        county_weights: dict[str, float] = {}  # fips -> weight
-        total_crosswalk_counties = 0
-
-        if geoids and self._area_weights:
-            for geoid in geoids:
-                entries = self._area_weights.get(geoid, [])
-                for entry in entries:
-                    fips = entry["county_fips"]
-                    weight = entry["weight"]
-                    # If same county appears via multiple GEOIDs, sum the weights
-                    county_weights[fips] = county_weights.get(fips, 0.0) + weight
-                    total_crosswalk_counties += 1
-
-        if not county_weights:
-            return self._empty_svi_result(
-                "No county crosswalk entries found for this Tribe"
-            )
+        return self._aggregate_svi_batch([(tribe_id, tribe)], county_data)[0]
 
-        # Step 3: Collect matching county SVI records
-        matched_records: list[dict] = []
-        for fips in county_weights:
-            if fips in county_data:
-                record = county_data[fips]
-                # Skip counties where ALL 3 included themes are 0.0
-                if (record["rpl_theme1"] == 0.0
-                        and record["rpl_theme2"] == 0.0
-                        and record["rpl_theme4"] == 0.0):
-                    continue
-                matched_records.append(record)
-
-        if not matched_records:
-            return self._empty_svi_result(
-                f"Counties identified ({len(county_weights)}) but none had non-zero SVI theme data"
-            )
+    def _aggregate_svi_batch(
+        self,
+        tribes: list[tuple[str, dict]],
+        county_data: Mapping[str, dict],
+    ) -> list[dict]:
+        """Aggregate SVI data for many Tribes in one pass.
 
-        # Step 4: Normalize weights to matched counties only
-        total_w = sum(
-            county_weights.get(r["fips"], 0.0) for r in matched_records
-        )
-        if total_w == 0:
-            # Equal weight fallback
-            total_w = len(matched_records)
-            norm_weights = {r["fips"]: 1.0 / total_w for r in matched_records}
-        else:
-            norm_weights = {
-                r["fips"]: county_weights.get(r["fips"], 0.0) / total_w
-                for r in matched_records
-            }
+        Same rules as _aggregate_tribe_svi, computed with a single
+        TribeCountyMatrix over every Tribe's crosswalk counties.
 
-        # Step 5: Area-weighted theme averages
-        weighted_theme1 = round(
-            sum(r["rpl_theme1"] * norm_weights[r["fips"]] for r in matched_records), 4
-        )
-        weighted_theme2 = round(
-            sum(r["rpl_theme2"] * norm_weights[r["fips"]] for r in matched_records), 4
-        )
-        weighted_theme4 = round(
-            sum(r["rpl_theme4"] * norm_weights[r["fips"]] for r in matched_records), 4
-        )
+        Args:
+            tribes: (tribe_id, tribe dict from registry) pairs.
+            county_data: Full SVI county data dict keyed by FIPS.
 
-        # Weighted flag counts (rounded to nearest int)
-        weighted_f1 = round(
-            sum(r["f_theme1"] * norm_weights[r["fips"]] for r in matched_records)
-        )
-        weighted_f2 = round(
-            sum(r["f_theme2"] * norm_weights[r["fips"]] for r in matched_records)
-        )
-        weighted_f4 = round(
-            sum(r["f_theme4"] * norm_weights[r["fips"]] for r in matched_records)
+        Returns:
+            One SVI result dict per input pair, in order.
+        """
+        if not county_data:
+            return [
+                self._empty_svi_result("SVI county data not loaded")
+                for _ in tribes
+            ]
+
+        # Steps 1-2: AIANNH GEOIDs -> county FIPS + summed area weights
+        matrix = TribeCountyMatrix(
+            (self._tribe_to_geoids.get(tribe_id, []) for tribe_id, _ in tribes),
+            self._area_weights,
         )
 
-        # Step 6: Custom 3-theme composite = mean(theme1, theme2, theme4)
-        # NEVER use RPL_THEMES (which includes Theme 3)
-        composite = round(
-            (weighted_theme1 + weighted_theme2 + weighted_theme4) / 3.0, 4
-        )
+        # Steps 3-5: Match counties with non-zero theme data, normalize
+        # weights to them, and take area-weighted theme and flag averages
+        county_rows, metrics = self._svi_metric_matrix(county_data)
+        # Skip counties where ALL 3 included themes are 0.0
+        has_themes = (metrics[:, :3] != 0.0).any(axis=1)
+        agg = matrix.aggregate(county_rows, metrics, include=has_themes)
+
+        results: list[dict] = []
+        for i, (_, tribe) in enumerate(tribes):
+            n_counties = int(matrix.county_counts[i])
+            if not n_counties:
+                results.append(self._empty_svi_result(
+                    "No county crosswalk entries found for this Tribe"
+                ))
+                continue
+            if not agg.matched[i]:
+                results.append(self._empty_svi_result(
+                    f"Counties identified ({n_counties}) but none had non-zero SVI theme data"
+                ))
+                continue
 
-        # Step 7: Coverage percentage (area-weight-based, matching NRI builder)
-        total_possible_weight = sum(county_weights.values())
-        matched_weight = sum(
-            county_weights.get(r["fips"], 0.0) for r in matched_records
-        )
-        coverage_pct = round(
-            matched_weight / total_possible_weight
-            if total_possible_weight > 0
-            else 0.0,
-            4,
-        )
+            theme1, theme2, theme4, f1, f2, f4 = agg.values[i].tolist()
+            weighted_theme1 = round(theme1, 4)
+            weighted_theme2 = round(theme2, 4)
+            weighted_theme4 = round(theme4, 4)
 
-        # Step 8: Data gap detection
-        data_gaps: list[str] = []
-        if coverage_pct < 0.5:
-            data_gaps.append(DataGapType.MISSING_SVI)
+            # Step 6: Custom 3-theme composite = mean(theme1, theme2, theme4)
+            # NEVER use RPL_THEMES (which includes Theme 3)
+            composite = round(
+                (weighted_theme1 + weighted_theme2 + weighted_theme4) / 3.0, 4
+            )
 
-        # Check for Alaska partial coverage
-        tribe_states = tribe.get("states", [])
-        if "AK" in tribe_states and coverage_pct < 1.0:
-            data_gaps.append(DataGapType.ALASKA_PARTIAL)
+            # Step 7: Coverage percentage (area-weight-based, matching NRI builder)
+            total_possible_weight = float(matrix.county_weight[i])
+            matched_weight = float(agg.matched_weight[i])
+            coverage_pct = round(
+                matched_weight / total_possible_weight
+                if total_possible_weight > 0
+                else 0.0,
+                4,
+            )
 
-        return {
-            "themes": {
-                "theme1": {
-                    "percentile": weighted_theme1,
-                    "flag_count": weighted_f1,
-                    "name": SVI_THEME_NAMES["theme1"],
-                },
-                "theme2": {
-                    "percentile": weighted_theme2,
-                    "flag_count": weighted_f2,
-                    "name": SVI_THEME_NAMES["theme2"],
-                },
-                "theme4": {
-                    "percentile": weighted_theme4,
-                    "flag_count": weighted_f4,
-                    "name": SVI_THEME_NAMES["theme4"],
+            # Step 8: Data gap detection
+            data_gaps: list[str] = []
+            if coverage_pct < 0.5:
+                data_gaps.append(DataGapType.MISSING_SVI)
+
+            # Check for Alaska partial coverage
+            tribe_states = tribe.get("states", [])
+            if "AK" in tribe_states and coverage_pct < 1.0:
+                data_gaps.append(DataGapType.ALASKA_PARTIAL)
+
+            results.append({
+                "themes": {
+                    "theme1": {
+                        "percentile": weighted_theme1,
+                        "flag_count": round(f1),
+                        "name": SVI_THEME_NAMES["theme1"],
+                    },
+                    "theme2": {
+                        "percentile": weighted_theme2,
+                        "flag_count": round(f2),
+                        "name": SVI_THEME_NAMES["theme2"],
+                    },
+                    "theme4": {
+                        "percentile": weighted_theme4,
+                        "flag_count": round(f4),
+                        "name": SVI_THEME_NAMES["theme4"],
+                    },
                 },
-            },
-            "composite": composite,
-            "coverage_pct": coverage_pct,
-            "counties_matched": len(matched_records),
-            "counties_in_crosswalk": len(county_weights),
-            "data_gaps": data_gaps,
-        }
+                "composite": composite,
+                "coverage_pct": coverage_pct,
+                "counties_matched": int(agg.matched[i]),
+                "counties_in_crosswalk": n_counties,
+                "data_gaps": data_gaps,
+            })
+
+        return results
+
+    def _svi_metric_matrix(
+        self,
+        county_data: Mapping[str, dict],
+    ) -> tuple[dict[str, int], np.ndarray]:
+        """Stack county SVI metrics into a county x metric matrix (cached).
+
+        Columns are _SVI_SUM_FIELDS.
+        """
+        cached = self._metric_matrix
+        if cached is not None and cached[0] is county_data:
+            return cached[1], cached[2]
+
+        county_rows = {fips: i for i, fips in enumerate(county_data)}
+        metrics = np.array(
+            [[record[field] for field in _SVI_SUM_FIELDS] for record in county_data.values()],
+            dtype=np.float64,
+        ).reshape(len(county_rows), len(_SVI_SUM_FIELDS))
+        self._metric_matrix = (county_data, county_rows, metrics)
+        return county_rows, metrics
 
     def _empty_svi_result(self, note: str) -> dict:
         """Return a minimal SVI result when no data is available.
@@ -479,12 +483,12 @@ class SVIProfileBuilder:
 
         Main orchestration method:
           1. Load SVI county data from CSV
-          2. For each Tribe:
-             a. Aggregate SVI themes (area-weighted)
-             b. Compute custom 3-theme composite
-             c. Validate against SVIProfile Pydantic model
-             d. Write JSON cache file (atomic)
-          3. Generate coverage report
+          2. Aggregate SVI themes and the custom 3-theme composite for all
+             Tribes (area-weighted, one batch)
+          3. For each Tribe:
+             a. Validate against SVIProfile Pydantic model
+             b. Write JSON cache file (atomic)
+          4. Generate coverage report
 
         Single-writer-per-tribe_id assumption: this method writes one JSON
         file per tribe_id sequentially.
@@ -513,12 +517,18 @@ class SVIProfileBuilder:
         # Per-state tracking for coverage report
         state_stats: dict[str, dict] = {}
 
+        tribes: list[tuple[str, dict]] = []
         for tribe in all_tribes:
             tribe_id = Path(tribe["tribe_id"]).name
             if tribe_id != tribe["tribe_id"] or ".." in tribe_id:
                 logger.warning("Skipping suspicious tribe_id: %r", tribe["tribe_id"])
                 continue
+            tribes.append((tribe_id, tribe))
+
+        # Aggregate SVI for all Tribes in one batch
+        svi_results = self._aggregate_svi_batch(tribes, county_data)
 
+        for (tribe_id, tribe), svi_result in zip(tribes, svi_results):
             tribe_states = tribe.get("states", [])
 
             # Initialize per-state tracking
@@ -531,11 +541,6 @@ class SVIProfileBuilder:
                     }
                 state_stats[st]["total"] += 1
 
-            # Aggregate SVI for this Tribe
-            svi_result = self._aggregate_tribe_svi(
-                tribe_id, tribe, county_data,
-            )
-
             has_data = svi_result.get("counties_matched", 0) > 0
             if has_data:
                 matched_count += 1
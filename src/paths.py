@@ -72,6 +72,9 @@ AIANNH_CROSSWALK_PATH: Path = DATA_DIR / "aiannh_tribe_crosswalk.json"
 CONGRESSIONAL_INTEL_PATH: Path = DATA_DIR / "congressional_intel.json"
 """Congressional intelligence cache with bill detail and relevance scores."""
 
+BILL_DETAIL_CACHE_PATH: Path = DATA_DIR / "bill_detail_cache.json"
+"""Congress.gov bill sub-resources (actions, cosponsors, subjects, text) keyed by bill and updateDate."""
+
 # ---------------------------------------------------------------------------
 # -- Data Paths (subdirectories) --
 # ---------------------------------------------------------------------------
@@ -86,7 +89,8 @@ TRIBAL_COUNTY_WEIGHTS_PATH: Path = NRI_DIR / "tribal_county_area_weights.json"
 """Pre-computed area-weighted AIANNH-to-county crosswalk."""
 
 AWARD_CACHE_DIR: Path = DATA_DIR / "award_cache"
-"""Per-Tribe USASpending award history JSON files (592 files)."""
+"""Per-Tribe USASpending award history: the awards.jsonl store (see
+src/packets/award_store.py) or legacy per-Tribe JSON files."""
 
 HAZARD_PROFILES_DIR: Path = DATA_DIR / "hazard_profiles"
 """Per-Tribe FEMA NRI + USFS hazard profile JSON files (592 files)."""
@@ -144,12 +148,30 @@ CFDA_TRACKER_PATH: Path = OUTPUTS_DIR / ".cfda_tracker.json"
 MONITOR_STATE_PATH: Path = OUTPUTS_DIR / ".monitor_state.json"
 """Hot Sheets divergence state persistence."""
 
+SCAN_STATE_PATH: Path = OUTPUTS_DIR / ".scan_state.json"
+"""Per-source high-water marks for ``--incremental`` scans."""
+
+GRAPH_SNAPSHOT_PATH: Path = OUTPUTS_DIR / ".graph_snapshot.npz"
+"""Compact binary copy of LATEST-GRAPH.json for ``--graph-from-snapshot``."""
+
+RESILIENCE_STATE_PATH: Path = OUTPUTS_DIR / ".resilience_state.json"
+"""Per-source circuit-breaker state and Retry-After deadlines across runs."""
+
+HTTP_CACHE_DIR: Path = OUTPUTS_DIR / ".http_cache"
+"""Request-level HTTP response cache (one JSON file per request)."""
+
 ARCHIVE_DIR: Path = OUTPUTS_DIR / "archive"
 """Archived briefings and results from previous scans."""
 
 PACKETS_OUTPUT_DIR: Path = OUTPUTS_DIR / "packets"
 """Generated per-Tribe DOCX advocacy packets."""
 
+PROFILES_DIR: Path = OUTPUTS_DIR / "profiles"
+"""``--profile`` run records and Chrome trace-event files."""
+
+PROFILE_HISTORY_PATH: Path = PROFILES_DIR / "history.json"
+"""Per-stage wall times of recent ``--profile`` runs (regression baseline)."""
+
 # ---------------------------------------------------------------------------
 # -- Docs Paths --
 # ---------------------------------------------------------------------------
@@ -206,7 +228,10 @@ def _sanitize_tribe_id(tribe_id: str) -> str:
 
 
 def award_cache_path(tribe_id: str) -> Path:
-    """Return the award cache JSON path for a specific Tribe."""
+    """Return the legacy per-Tribe award cache JSON path for a specific Tribe.
+
+    AwardCacheStore reads this file for any Tribe missing from awards.jsonl.
+    """
     return AWARD_CACHE_DIR / f"{_sanitize_tribe_id(tribe_id)}.json"
 
 
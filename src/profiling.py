@@ -0,0 +1,383 @@
+"""Stage-level profiler for the scan pipeline (``--profile``).
+
+``run_pipeline`` wraps each stage (ingest, score, change detection, graph,
+monitors, decision engine, report) and ``run_scan`` wraps each scraper in
+``profiler.span(...)``. A span records:
+
+    wall_s        wall-clock seconds (time.perf_counter)
+    cpu_s         process CPU seconds (time.process_time)
+    peak_rss_mb   process peak RSS at the end of the span
+    rss_growth_mb how much the span raised the peak
+    items         items the span produced, when it sets ``span.items``
+    items_per_s   items / wall_s
+
+Scrapers run concurrently on one event loop, so their spans overlap and
+their CPU time is the whole process's CPU during the span. A scraper with
+high wall time and low CPU time is waiting on its API.
+
+A profiled run writes three files to ``outputs/profiles``:
+
+    profile-<stamp>.json        run record (spans plus totals)
+    profile-<stamp>.trace.json  Chrome trace-event file; open it in
+                                ui.perfetto.dev or chrome://tracing
+    history.json                wall time per span for recent runs
+
+``ProfileHistory.regressions`` flags spans whose wall time exceeds the
+median of the last N runs by the configured ratio.
+
+``profile_imports`` (``--import-profile``) reruns the CLI command under
+``python -X importtime`` and prints its slowest imports, each with the
+project module that pulled it in.
+
+Usage:
+    profiler = StageProfiler()
+    with profiler.span("score") as span:
+        scored = scorer.score_items(raw_items)
+        span.items = len(scored)
+    paths = profiler.write(PROFILES_DIR)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterable
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FORMAT: int = 1
+
+HISTORY_WINDOW: int = 10
+"""Runs the regression check compares against (median of the last N)."""
+
+HISTORY_LIMIT: int = 90
+"""Runs kept in history.json."""
+
+REGRESSION_RATIO: float = 1.5
+"""A span regresses when its wall time exceeds the median by this factor."""
+
+MIN_REGRESSION_S: float = 0.25
+"""Ignore regressions smaller than this many seconds (timer noise)."""
+
+IMPORT_PROFILE_TOP: int = 25
+"""Imports listed by ``--import-profile``."""
+
+_IMPORTTIME_PREFIX = "import time:"
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MiB (None if unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class Span:
+    """Measurements for one stage or scraper."""
+
+    name: str
+    kind: str = "stage"
+    start_s: float = 0.0
+    wall_s: float = 0.0
+    cpu_s: float = 0.0
+    peak_rss_mb: float | None = None
+    rss_growth_mb: float | None = None
+    items: int | None = None
+    items_per_s: float | None = None
+    error: str | None = None
+    lane: int = field(default=0, repr=False)
+
+
+class StageProfiler:
+    """Collects Spans for one pipeline run.
+
+    A disabled profiler (``StageProfiler(enabled=False)``) hands out spans
+    but records nothing, so callers do not need to branch on ``--profile``.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.spans: list[Span] = []
+        self.started_at = datetime.now(timezone.utc)
+        self._t0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+        self._open_lanes: set[int] = set()
+
+    @contextmanager
+    def span(self, name: str, kind: str = "stage"):
+        """Time the body; set ``.items`` on the yielded Span for throughput."""
+        rec = Span(name=name, kind=kind)
+        if not self.enabled:
+            yield rec
+            return
+        lane = 0 if kind == "stage" else min(
+            i for i in range(1, len(self._open_lanes) + 2) if i not in self._open_lanes
+        )
+        if lane:
+            self._open_lanes.add(lane)
+        rss_before = peak_rss_mb()
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield rec
+        except BaseException as exc:
+            rec.error = type(exc).__name__
+            raise
+        finally:
+            rec.lane = lane
+            rec.start_s = start - self._t0
+            rec.wall_s = time.perf_counter() - start
+            rec.cpu_s = time.process_time() - cpu_start
+            rec.peak_rss_mb = peak_rss_mb()
+            if rss_before is not None and rec.peak_rss_mb is not None:
+                rec.rss_growth_mb = rec.peak_rss_mb - rss_before
+            if rec.items is not None and rec.wall_s > 0:
+                rec.items_per_s = rec.items / rec.wall_s
+            self._open_lanes.discard(lane)
+            self.spans.append(rec)
+
+    def record(self) -> dict:
+        """The run record: spans in start order plus run totals."""
+        spans = sorted(self.spans, key=lambda s: s.start_s)
+        return {
+            "format": PROFILE_FORMAT,
+            "started_at": self.started_at.isoformat(),
+            "argv": sys.argv[1:],
+            "total": {
+                "wall_s": time.perf_counter() - self._t0,
+                "cpu_s": time.process_time() - self._cpu0,
+                "peak_rss_mb": peak_rss_mb(),
+            },
+            "spans": [
+                {k: v for k, v in asdict(s).items() if k != "lane"} for s in spans
+            ],
+        }
+
+    def trace_events(self) -> dict:
+        """Chrome trace-event JSON (complete events, microseconds).
+
+        Pipeline stages share one track; overlapping scrapers get a track
+        each so concurrent fetches render side by side.
+        """
+        pid = os.getpid()
+        events: list[dict] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": 0,
+             "args": {"name": "pipeline"}},
+        ]
+        lanes = sorted({s.lane for s in self.spans if s.lane})
+        events.extend(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": lane,
+             "args": {"name": f"scrapers {lane}"}}
+            for lane in lanes
+        )
+        for s in sorted(self.spans, key=lambda s: s.start_s):
+            args = {"cpu_s": round(s.cpu_s, 6)}
+            for key in ("peak_rss_mb", "rss_growth_mb", "items", "items_per_s", "error"):
+                value = getattr(s, key)
+                if value is not None:
+                    args[key] = value
+            events.append({
+                "name": s.name, "cat": s.kind, "ph": "X", "pid": pid, "tid": s.lane,
+                "ts": round(s.start_s * 1e6), "dur": round(s.wall_s * 1e6), "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, out_dir: Path, record: dict | None = None) -> dict[str, Path]:
+        """Write the run record (``record()`` unless given) and trace file.
+
+        Returns:
+            Dict with "record" and "trace" paths.
+        """
+        stamp = self.started_at.strftime("%Y%m%dT%H%M%SZ")
+        paths = {
+            "record": out_dir / f"profile-{stamp}.json",
+            "trace": out_dir / f"profile-{stamp}.trace.json",
+        }
+        _write_json(paths["record"], record or self.record(), indent=2)
+        _write_json(paths["trace"], self.trace_events())
+        logger.info("Profile written to %s (trace: %s)", paths["record"], paths["trace"])
+        return paths
+
+
+class ProfileHistory:
+    """Rolling wall-time history of profiled runs (``history.json``).
+
+    Args:
+        path: History file.
+        window: Earlier runs the regression check takes the median over.
+        ratio: Wall time over ``ratio * median`` is a regression.
+        min_seconds: Regressions smaller than this are ignored.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        window: int = HISTORY_WINDOW,
+        ratio: float = REGRESSION_RATIO,
+        min_seconds: float = MIN_REGRESSION_S,
+    ) -> None:
+        self.path = path
+        self.window = window
+        self.ratio = ratio
+        self.min_seconds = min_seconds
+        self.runs: list[dict] = []
+        if path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.runs = json.load(f).get("runs", [])
+            except (json.JSONDecodeError, OSError, AttributeError) as exc:
+                logger.warning("Profile history %s unreadable, starting over: %s", path, exc)
+
+    @staticmethod
+    def _key(span: dict) -> str:
+        return f"{span['kind']}:{span['name']}"
+
+    def regressions(self, record: dict) -> list[dict]:
+        """Spans in ``record`` slower than the median of the last N runs.
+
+        A span needs at least three earlier measurements to be judged.
+        """
+        recent = self.runs[-self.window:]
+        flagged = []
+        for span in record["spans"]:
+            key = self._key(span)
+            past = [run["wall_s"][key] for run in recent if key in run.get("wall_s", {})]
+            if len(past) < 3:
+                continue
+            median = statistics.median(past)
+            if span["wall_s"] > median * self.ratio and span["wall_s"] - median >= self.min_seconds:
+                flagged.append({
+                    "name": span["name"],
+                    "kind": span["kind"],
+                    "wall_s": span["wall_s"],
+                    "median_s": median,
+                    "runs": len(past),
+                    "ratio": span["wall_s"] / median if median > 0 else None,
+                })
+        return flagged
+
+    def append(self, record: dict) -> None:
+        """Add a run and save, keeping the last HISTORY_LIMIT runs."""
+        wall: dict[str, float] = {}
+        for span in record["spans"]:
+            key = self._key(span)
+            wall[key] = wall.get(key, 0.0) + span["wall_s"]
+        self.runs.append({
+            "started_at": record["started_at"],
+            "argv": record.get("argv", []),
+            "total_wall_s": record["total"]["wall_s"],
+            "wall_s": wall,
+        })
+        self.runs = self.runs[-HISTORY_LIMIT:]
+        _write_json(self.path, {"format": PROFILE_FORMAT, "runs": self.runs}, indent=2)
+
+
+def _write_json(path: Path, data: dict, indent: int | None = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, default=str)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+@dataclass
+class ImportTiming:
+    """One module's line from ``python -X importtime``."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    via: str | None = None
+
+
+def parse_importtime(lines: Iterable[str]) -> list[ImportTiming]:
+    """Parse ``-X importtime`` stderr, ignoring every other line.
+
+    ``via`` is the innermost ``src.`` module among a module's importers,
+    i.e. the project code that pulled it in.
+    """
+    timings = []
+    for line in lines:
+        if not line.startswith(_IMPORTTIME_PREFIX):
+            continue
+        fields = line[len(_IMPORTTIME_PREFIX):].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:  # column header
+            continue
+        name = fields[2].rstrip()
+        module = name.lstrip(" ")
+        depth = max(0, (len(name) - len(module) - 1) // 2)
+        timings.append(ImportTiming(module, self_us, cumulative_us, depth))
+
+    # importtime prints children before their parent; walking the lines in
+    # reverse visits each importer before the modules it imported.
+    importers: list[str] = []
+    for timing in reversed(timings):
+        del importers[timing.depth:]
+        timing.via = next((m for m in reversed(importers) if m.startswith("src.")), None)
+        importers.append(timing.module)
+    return timings
+
+
+def format_import_profile(timings: list[ImportTiming], top: int = IMPORT_PROFILE_TOP) -> str:
+    """The ``top`` imports by cumulative time, as a table."""
+    total_ms = sum(t.cumulative_us for t in timings if t.depth == 0) / 1000
+    lines = [
+        f"Slowest imports ({total_ms:.1f} ms total, {len(timings)} modules):",
+        f"  {'cumul':>9} {'self':>9}  {'module':<40} via",
+    ]
+    for t in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        lines.append(
+            f"  {t.cumulative_us / 1000:>7.1f}ms {t.self_us / 1000:>7.1f}ms  "
+            f"{t.module:<40} {t.via or ''}".rstrip()
+        )
+    return "\n".join(lines)
+
+
+def profile_imports(argv: list[str], top: int = IMPORT_PROFILE_TOP) -> int:
+    """Run ``python -m src.main *argv`` under ``-X importtime``; print the slowest imports.
+
+    The command runs for real, so the profile covers the modules that mode
+    imports lazily as well as at startup. Its output passes through; only
+    the importtime lines are taken out of stderr.
+
+    Returns:
+        The command's exit code.
+    """
+    cmd = [sys.executable, "-X", "importtime", "-m", "src.main", *argv]
+    import_lines = []
+    with subprocess.Popen(cmd, stderr=subprocess.PIPE, text=True) as proc:
+        for line in proc.stderr:
+            if line.startswith(_IMPORTTIME_PREFIX):
+                import_lines.append(line)
+            else:
+                sys.stderr.write(line)
+    print()
+    print(format_import_profile(parse_importtime(import_lines), top))
+    return proc.returncode
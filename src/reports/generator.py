@@ -10,6 +10,7 @@ import logging
 import shutil
 from datetime import datetime, timezone
 from src.paths import ARCHIVE_DIR, CI_HISTORY_PATH, OUTPUTS_DIR
+from src.graph.adjacency import EdgeIndex
 
 logger = logging.getLogger(__name__)
 
@@ -206,7 +207,7 @@ class ReportGenerator:
             return []
 
         nodes = graph_data.get("nodes", {})
-        edges = graph_data.get("edges", [])
+        index = EdgeIndex.for_graph(graph_data)
 
         # Find structural ask nodes (id starts with "ask_")
         asks = {
@@ -227,10 +228,7 @@ class ReportGenerator:
             target = ask.get("target", "")
 
             # Find programs this ask ADVANCES
-            program_ids = [
-                e["target"] for e in edges
-                if e["source"] == ask_id and e["type"] == "ADVANCES"
-            ]
+            program_ids = index.targets(ask_id, "ADVANCES")
             program_names = []
             for pid in program_ids:
                 prog = self.programs.get(pid)
@@ -238,10 +236,7 @@ class ReportGenerator:
                     program_names.append(prog["name"])
 
             # Find barriers this ask mitigates
-            barrier_ids = [
-                e["source"] for e in edges
-                if e["target"] == ask_id and e["type"] == "MITIGATED_BY"
-            ]
+            barrier_ids = index.sources(ask_id, "MITIGATED_BY")
             barrier_descs = []
             for bid in barrier_ids:
                 bar = nodes.get(bid, {})
@@ -385,7 +380,7 @@ class ReportGenerator:
     def _format_graph_barriers(self, graph_data: dict) -> list[str]:
         """Format barrier/lever relationships from the knowledge graph."""
         nodes = graph_data.get("nodes", {})
-        edges = graph_data.get("edges", [])
+        index = EdgeIndex.for_graph(graph_data)
 
         barriers = {nid: n for nid, n in nodes.items()
                     if n.get("_type") == "BarrierNode"}
@@ -403,8 +398,7 @@ class ReportGenerator:
             sev_badge = f" [{severity}]" if severity else ""
 
             # Find which programs are blocked by this barrier
-            blocked_pids = [e["source"] for e in edges
-                            if e["target"] == bar_id and e["type"] == "BLOCKED_BY"]
+            blocked_pids = index.sources(bar_id, "BLOCKED_BY")
             blocked_names = []
             for pid in blocked_pids:
                 prog = self.programs.get(pid)
@@ -412,8 +406,7 @@ class ReportGenerator:
                     blocked_names.append(prog["name"])
 
             # Find levers that mitigate this barrier
-            lever_ids = [e["target"] for e in edges
-                         if e["source"] == bar_id and e["type"] == "MITIGATED_BY"]
+            lever_ids = index.targets(bar_id, "MITIGATED_BY")
             lever_descs = []
             for lid in lever_ids:
                 lever = nodes.get(lid, {})
@@ -433,7 +426,7 @@ class ReportGenerator:
     def _format_graph_authorities(self, graph_data: dict) -> list[str]:
         """Format statutory authority relationships from the knowledge graph."""
         nodes = graph_data.get("nodes", {})
-        edges = graph_data.get("edges", [])
+        index = EdgeIndex.for_graph(graph_data)
 
         authorities = {nid: n for nid, n in nodes.items()
                        if n.get("_type") == "AuthorityNode"}
@@ -453,8 +446,7 @@ class ReportGenerator:
             durability = auth.get("durability", "")
 
             # Find programs authorized by this authority
-            auth_pids = [e["source"] for e in edges
-                         if e["target"] == auth_id and e["type"] == "AUTHORIZED_BY"]
+            auth_pids = index.sources(auth_id, "AUTHORIZED_BY")
             prog_names = []
             for pid in auth_pids:
                 prog = self.programs.get(pid)
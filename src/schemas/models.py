@@ -8,7 +8,7 @@ Data sources modeled:
 - program_inventory.json -> ProgramRecord
 - policy_tracking.json -> PolicyPosition
 - tribal_registry.json -> TribeRecord
-- award_cache/*.json -> AwardCacheFile (containing FundingRecord items)
+- award_cache/awards.jsonl records -> AwardCacheFile (containing FundingRecord items)
 - hazard_profiles/*.json -> HazardProfile
 - congressional_cache.json -> CongressionalDelegate, CongressionalDelegation
 """
@@ -459,7 +459,7 @@ class TribeRecord(BaseModel):
         return v
 
 
-# ── Funding Record (award_cache/*.json) ──
+# ── Funding Record (award_cache/awards.jsonl) ──
 
 class FundingRecord(BaseModel):
     """Individual USAspending award record for a Tribal Nation.
@@ -528,9 +528,10 @@ class FiscalYearRange(BaseModel):
 
 
 class AwardCacheFile(BaseModel):
-    """Per-Tribe award cache file structure.
+    """Per-Tribe award cache record structure.
 
-    Maps to a complete award_cache/{tribe_id}.json file.
+    Maps to one Tribe's record in the award store (award_cache/awards.jsonl,
+    or a legacy award_cache/{tribe_id}.json file for Tribes it lacks).
     Contains the Tribe identity, award records, yearly obligation
     breakdowns, CFDA summaries, and a funding trend indicator.
     """
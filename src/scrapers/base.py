@@ -3,8 +3,15 @@
 All scrapers inherit from this class to get:
 - Configurable User-Agent header for federal API compliance
 - Exponential backoff with retry on transient failures
-- Circuit breaker: fail fast when an API is down (RESL-01)
+- Circuit breaker: fail fast when an API is down (RESL-01), with its
+  state and 429 Retry-After deadlines optionally persisted across runs
+- Hedged GETs past the source's p95 latency, and a per-scan deadline
 - Config-driven retry/backoff parameters (RESL-02)
+- Shared connection pool and per-host token-bucket rate governor, plus an
+  optional hourly request quota persisted across runs
+- Per-source concurrency cap for scrapers that fan out requests
+- Request-level on-disk response cache with ETag/Last-Modified revalidation
+- Incremental fetch windows: scan only records newer than a high-water mark
 - Graceful degradation: returns cached data on full failure
 - Zombie CFDA detection: flags programs returning 0 results for >30 days
 """
@@ -12,11 +19,28 @@ All scrapers inherit from this class to get:
 import asyncio
 import logging
 import random
-from datetime import datetime, timezone
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 
 import aiohttp
 
-from src.scrapers.circuit_breaker import CircuitBreaker, CircuitOpenError  # noqa: F401
+from src.paths import HTTP_CACHE_DIR, RESILIENCE_STATE_PATH, resolve_path
+from src.scrapers.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState  # noqa: F401
+from src.scrapers.http_cache import ResponseCache
+from src.scrapers.http_pool import HOST_GOVERNOR, USER_AGENT, shared_session
+from src.scrapers.latency import (
+    HEDGE_MIN_DELAY,
+    HEDGE_MIN_SAMPLES,
+    HEDGE_PERCENTILE,
+    LATENCY_WINDOW,
+    LatencyTracker,
+    ScanDeadlineExceeded,
+    hedged,
+)
+from src.scrapers.rate_limiter import HourlyQuota, TokenBucket
+from src.scrapers.resilience_state import ResilienceStateStore
 
 
 logger = logging.getLogger(__name__)
@@ -25,12 +49,22 @@ _ALLOWED_METHODS: frozenset[str] = frozenset(
     {"get", "post", "put", "patch", "delete", "head", "options"}
 )
 
-USER_AGENT = "TCR-Policy-Scanner/1.0 (Tribal Climate Resilience; automated-scan)"
 DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30)
 MAX_RETRIES = 3
 BACKOFF_BASE = 2  # seconds
 
 
+@dataclass
+class _Reply:
+    """What the retry loop needs from one HTTP response."""
+
+    status: int
+    body: dict | None
+    headers: Mapping[str, str]
+    request_info: object
+    history: tuple
+
+
 class BaseScraper:
     """Shared resilience patterns for all scrapers.
 
@@ -42,9 +76,22 @@ class BaseScraper:
                 backward compatibility.
     """
 
+    # Subclasses whose scan() accepts ``since`` and filters server-side by
+    # publication/update date set this to True (see run_scan --incremental).
+    supports_incremental = False
+
+    # Request rate for this source's host when the config sets none
+    # (sources.<name>.requests_per_second). None leaves the host ungoverned.
+    default_requests_per_second: float | None = None
+
+    # Rolling one-hour request quota for this source's host when the config
+    # sets none (sources.<name>.requests_per_hour). None means no quota.
+    default_requests_per_hour: int | None = None
+
     def __init__(self, source_name: str, config: dict | None = None):
         self.source_name = source_name
         self._headers = {"User-Agent": USER_AGENT}
+        self.scan_window = (config or {}).get("scan_window_days", 14)
 
         # Read resilience config (or use hardcoded defaults)
         resilience = (config or {}).get("resilience", {})
@@ -63,9 +110,162 @@ class BaseScraper:
             recovery_timeout=cb_config.get("recovery_timeout", 60),
         )
 
-    def _create_session(self) -> aiohttp.ClientSession:
-        """Create an aiohttp session with proper User-Agent."""
-        return aiohttp.ClientSession(headers=self._headers)
+        # Breaker state and Retry-After deadlines carried over from earlier
+        # runs (resilience.persist_state), so a run against an API that was
+        # down a few minutes ago starts OPEN instead of retrying from scratch
+        self._resilience_state: ResilienceStateStore | None = None
+        if resilience.get("persist_state"):
+            state_path = (
+                resolve_path(resilience["state_path"])
+                if resilience.get("state_path") else RESILIENCE_STATE_PATH
+            )
+            self._resilience_state = ResilienceStateStore.shared(state_path)
+            self._resilience_state.restore_breaker(self._circuit_breaker)
+
+        # Per-source latency window, hedged GETs (resilience.hedging) and the
+        # scan deadline run_scan sets (monotonic seconds; None = no deadline)
+        hedge_cfg = resilience.get("hedging", {})
+        self.hedging = bool(hedge_cfg.get("enabled", False))
+        self.hedge_percentile = hedge_cfg.get("percentile", HEDGE_PERCENTILE)
+        self.hedge_min_samples = hedge_cfg.get("min_samples", HEDGE_MIN_SAMPLES)
+        self.hedge_min_delay = hedge_cfg.get("min_delay", HEDGE_MIN_DELAY)
+        self._latency = LatencyTracker.for_source(
+            source_name, hedge_cfg.get("window", LATENCY_WINDOW),
+        )
+        self.deadline: float | None = None
+        self.deadline_exceeded = False
+
+        # Per-host rate limit (sources.<name>.requests_per_second). The bucket
+        # is registered with HOST_GOVERNOR under the source's base_url host,
+        # so every scraper and script calling that host shares one budget.
+        # Every HTTP attempt in _request_with_retry takes a token.
+        source_cfg = (config or {}).get("sources", {}).get(source_name, {})
+        rps = source_cfg.get("requests_per_second", self.default_requests_per_second)
+        burst = source_cfg.get("burst")
+        self._rate_limiter: TokenBucket | None = None
+        if rps and source_cfg.get("base_url"):
+            self._rate_limiter = HOST_GOVERNOR.register(source_cfg["base_url"], rps, burst)
+        elif rps:
+            self._rate_limiter = TokenBucket(rps, capacity=burst)
+
+        # Hourly quota (sources.<name>.requests_per_hour), shared per host
+        # like the bucket. With persist_state its per-minute counts are
+        # restored here and saved as requests go out, so back-to-back runs
+        # draw from the same hour.
+        per_hour = source_cfg.get("requests_per_hour", self.default_requests_per_hour)
+        self._quota: HourlyQuota | None = None
+        if per_hour and source_cfg.get("base_url"):
+            self._quota = HOST_GOVERNOR.register_quota(source_cfg["base_url"], per_hour)
+        elif per_hour:
+            self._quota = HourlyQuota(per_hour)
+        if self._quota is not None and self._resilience_state is not None:
+            self._resilience_state.restore_quota(source_name, self._quota)
+
+        # Per-source cap on requests in flight (sources.<name>.max_concurrency),
+        # enforced by scrapers that fan out through _slots()
+        self.max_concurrency = max(1, int(source_cfg.get("max_concurrency", 4)))
+        self._request_slots: tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
+
+        # Request-level response cache (top-level "http_cache" section).
+        # Off unless enabled; sources.<name>.cache_ttl_seconds overrides
+        # the default TTL, and a TTL of 0 means always revalidate.
+        cache_cfg = (config or {}).get("http_cache", {})
+        self.cache_ttl = float(
+            source_cfg.get("cache_ttl_seconds", cache_cfg.get("default_ttl_seconds", 0))
+        )
+        self._response_cache: ResponseCache | None = None
+        if cache_cfg.get("enabled"):
+            cache_dir = (
+                resolve_path(cache_cfg["dir"]) if cache_cfg.get("dir") else HTTP_CACHE_DIR
+            )
+            self._response_cache = ResponseCache.shared(
+                cache_dir, int(cache_cfg.get("max_mb", 256) * 1024 * 1024),
+            )
+
+    def _window_start(self, since: datetime | None = None) -> datetime:
+        """Return the start of the fetch window.
+
+        Normally ``scan_window_days`` before now. In incremental mode the
+        caller passes the source's high-water mark as ``since``; it is used
+        when it falls inside the window, so a stale mark degrades to a
+        full-window scan rather than an unbounded one.
+        """
+        start = datetime.now(timezone.utc) - timedelta(days=self.scan_window)
+        if since is not None:
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            if since > start:
+                return since
+        return start
+
+    def _slots(self) -> asyncio.Semaphore:
+        """Return the request semaphore for the running event loop.
+
+        Created lazily (and recreated per loop) because callers drive the
+        scraper through separate ``asyncio.run`` invocations.
+        """
+        loop = asyncio.get_running_loop()
+        if self._request_slots is None or self._request_slots[0] is not loop:
+            self._request_slots = (loop, asyncio.Semaphore(self.max_concurrency))
+        return self._request_slots[1]
+
+    def _create_session(self):
+        """Borrow the process-wide pooled session (see http_pool.shared_session).
+
+        Use as ``async with self._create_session() as session``. This
+        scraper's own headers are added per request in _request_with_retry.
+        """
+        return shared_session()
+
+    def _check_deadline(self, needed: float = 0.0) -> None:
+        """Raise ScanDeadlineExceeded if less than ``needed`` seconds are left."""
+        if self.deadline is not None and self.deadline - time.monotonic() <= needed:
+            self.deadline_exceeded = True
+            raise ScanDeadlineExceeded(self.source_name)
+
+    def _deadline_bounded(self, kwargs: dict) -> dict:
+        """``kwargs`` with the request timeout cut to the time left before the deadline."""
+        if self.deadline is None:
+            return kwargs
+        left = self.deadline - time.monotonic()
+        timeout = kwargs["timeout"]
+        if timeout.total is not None and timeout.total <= left:
+            return kwargs
+        return {**kwargs, "timeout": aiohttp.ClientTimeout(total=left)}
+
+    def _hedge_delay(self, timeout: aiohttp.ClientTimeout) -> float | None:
+        """Seconds before a GET is hedged, or None not to hedge it."""
+        delay = self._latency.hedge_delay(
+            self.hedge_percentile, self.hedge_min_samples, self.hedge_min_delay,
+        )
+        if delay is None or (timeout.total is not None and delay >= timeout.total):
+            return None
+        return delay
+
+    async def _acquire_quota(self) -> None:
+        """Count one request against the hourly quota, waiting if it is spent."""
+        quota = self._quota
+        wait = quota.delay()
+        if wait > 0:
+            self._check_deadline(wait)
+            logger.warning(
+                "%s: hourly quota of %d requests spent, waiting %.0fs",
+                self.source_name, quota.limit, wait,
+            )
+        await quota.acquire()
+        if self._resilience_state is not None:
+            self._resilience_state.record_quota(
+                self.source_name, quota, force=quota.delay() > 0,
+            )
+
+    def _record_outcome(self, success: bool) -> None:
+        """Feed a request's final outcome to the breaker and persist it."""
+        if success:
+            self._circuit_breaker.record_success()
+        else:
+            self._circuit_breaker.record_failure()
+        if self._resilience_state is not None:
+            self._resilience_state.record_breaker(self._circuit_breaker)
 
     async def _request_with_retry(
         self, session: aiohttp.ClientSession, method: str, url: str,
@@ -76,62 +276,141 @@ class BaseScraper:
         The circuit breaker wraps the entire retry loop: it checks once at entry
         and records success/failure based on the final outcome. Retries happen
         inside CLOSED state; the breaker trips when ALL retries are exhausted.
+
+        With the response cache enabled, a cached response younger than
+        ``cache_ttl`` is returned without touching the network; an older one
+        is revalidated with its ETag/Last-Modified, and a 304 serves it.
+
+        With hedging enabled, a GET still pending at the source's latency
+        percentile is sent a second time and the first answer wins. When
+        run_scan has set ``deadline``, attempts, backoffs and Retry-After
+        waits that would overrun it raise ScanDeadlineExceeded instead;
+        that does not count as a breaker failure (see latency.py).
         """
         if retries is None:
             retries = self.max_retries
 
-        # Circuit breaker gate: fail fast if API is known to be down
+        method_lower = method.lower()
+        if method_lower not in _ALLOWED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        cache = self._response_cache
+        cache_key = cached = None
+        if cache is not None:
+            payload = {k: kwargs[k] for k in ("params", "json", "data") if k in kwargs}
+            cache_key = cache.key(method_lower, url, payload)
+            cached = await asyncio.to_thread(cache.get, cache_key)
+            if cached is not None:
+                if cache.is_fresh(cached, self.cache_ttl):
+                    logger.debug("%s: cache hit %s", self.source_name, url)
+                    return cached["body"]
+                validators = cache.conditional_headers(cached)
+                if validators:
+                    kwargs["headers"] = {**kwargs.get("headers", {}), **validators}
+
+        # Circuit breaker gate: fail fast if API is known to be down.
+        # A HALF_OPEN breaker gets one attempt as its recovery probe.
         if not self._circuit_breaker.is_call_permitted:
             raise CircuitOpenError(self.source_name)
+        if self._circuit_breaker.state == CircuitState.HALF_OPEN:
+            retries = 1
+
+        # Honour a Retry-After that an earlier run (or scraper) received
+        if self._resilience_state is not None:
+            hold = self._resilience_state.retry_after_remaining(self.source_name)
+            if hold > 0:
+                self._check_deadline(hold)
+                logger.info("%s: holding %.0fs for an earlier Retry-After", self.source_name, hold)
+                if self._rate_limiter is not None:
+                    self._rate_limiter.defer(hold)
+                else:
+                    await asyncio.sleep(hold)
 
         kwargs.setdefault("timeout", self.request_timeout)
+        kwargs["headers"] = {**self._headers, **kwargs.get("headers", {})}
         last_error = None
-        method_lower = method.lower()
-        if method_lower not in _ALLOWED_METHODS:
-            raise ValueError(f"Unsupported HTTP method: {method}")
         request_fn = getattr(session, method_lower)
+        latency = self._latency
+        hedge = self.hedging and method_lower == "get"
+
+        async def send(attempt_kwargs: dict) -> _Reply:
+            """One HTTP exchange; error statuses the loop handles are returned."""
+            if self._quota is not None:
+                await self._acquire_quota()
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
+            start = time.monotonic()
+            async with request_fn(url, **attempt_kwargs) as resp:
+                body = None
+                if resp.status not in (429, 403) and not (resp.status == 304 and cached is not None):
+                    resp.raise_for_status()
+                    body = await resp.json()
+                if resp.status not in (429, 403):
+                    latency.observe(time.monotonic() - start)
+                return _Reply(resp.status, body, resp.headers, resp.request_info, resp.history)
 
         attempt = 0
         rate_limit_hits = 0
         while attempt < retries:
+            self._check_deadline()
+            attempt_kwargs = self._deadline_bounded(kwargs)
             try:
-                async with request_fn(url, **kwargs) as resp:
-                    if resp.status == 429:
-                        rate_limit_hits += 1
-                        if rate_limit_hits > retries:
-                            logger.error(
-                                "%s: too many 429 responses (%d), giving up",
-                                self.source_name, rate_limit_hits,
-                            )
-                            raise aiohttp.ClientResponseError(
-                                resp.request_info, resp.history, status=429,
-                            )
-                        raw_retry = resp.headers.get("Retry-After", "")
-                        try:
-                            retry_after = max(1, min(int(raw_retry), self.backoff_max))
-                        except (ValueError, TypeError):
-                            retry_after = min(
-                                self.backoff_base ** (attempt + 2), self.backoff_max
-                            )
-                        logger.warning(
-                            "%s: 429 rate limited, waiting %ds",
-                            self.source_name, retry_after,
+                delay = self._hedge_delay(attempt_kwargs["timeout"]) if hedge else None
+                if delay is not None:
+                    reply = await hedged(lambda: send(attempt_kwargs), delay, latency)
+                else:
+                    reply = await send(attempt_kwargs)
+                if reply.status == 429:
+                    rate_limit_hits += 1
+                    if rate_limit_hits > retries:
+                        logger.error(
+                            "%s: too many 429 responses (%d), giving up",
+                            self.source_name, rate_limit_hits,
+                        )
+                        raise aiohttp.ClientResponseError(
+                            reply.request_info, reply.history, status=429,
                         )
-                        await asyncio.sleep(retry_after)
-                        continue  # Do NOT increment attempt for server-requested delay
-                    elif resp.status == 403:
-                        logger.warning(
-                            "%s: 403 Forbidden, attempt %d/%d",
-                            self.source_name, attempt + 1, retries,
+                    raw_retry = reply.headers.get("Retry-After", "")
+                    try:
+                        retry_after = max(1, min(int(raw_retry), self.backoff_max))
+                    except (ValueError, TypeError):
+                        retry_after = min(
+                            self.backoff_base ** (attempt + 2), self.backoff_max
                         )
-                        last_error = aiohttp.ClientResponseError(
-                            resp.request_info, resp.history, status=403,
+                    logger.warning(
+                        "%s: 429 rate limited, waiting %ds",
+                        self.source_name, retry_after,
+                    )
+                    if self._rate_limiter is not None:
+                        # Hold every task sharing this budget, not just this one
+                        self._rate_limiter.defer(retry_after)
+                    if self._resilience_state is not None:
+                        self._resilience_state.record_retry_after(self.source_name, retry_after)
+                    self._check_deadline(retry_after)
+                    await asyncio.sleep(retry_after)
+                    continue  # Do NOT increment attempt for server-requested delay
+                elif reply.status == 403:
+                    logger.warning(
+                        "%s: 403 Forbidden, attempt %d/%d",
+                        self.source_name, attempt + 1, retries,
+                    )
+                    last_error = aiohttp.ClientResponseError(
+                        reply.request_info, reply.history, status=403,
+                    )
+                elif reply.status == 304 and cached is not None:
+                    logger.debug("%s: not modified %s", self.source_name, url)
+                    await asyncio.to_thread(cache.refresh, cache_key, cached)
+                    self._record_outcome(success=True)
+                    return cached["body"]
+                else:
+                    self._record_outcome(success=True)
+                    if cache is not None:
+                        await asyncio.to_thread(
+                            cache.put, cache_key, reply.body,
+                            etag=reply.headers.get("ETag"),
+                            last_modified=reply.headers.get("Last-Modified"),
                         )
-                    else:
-                        resp.raise_for_status()
-                        result = await resp.json()
-                        self._circuit_breaker.record_success()
-                        return result
+                    return reply.body
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 last_error = e
                 logger.warning(
@@ -140,12 +419,14 @@ class BaseScraper:
                 )
 
             attempt += 1
-            backoff = self.backoff_base ** attempt + random.uniform(0, 1)
-            logger.info("%s: retrying in %.1fs...", self.source_name, backoff)
-            await asyncio.sleep(backoff)
+            if attempt < retries:
+                backoff = self.backoff_base ** attempt + random.uniform(0, 1)
+                self._check_deadline(backoff)
+                logger.info("%s: retrying in %.1fs...", self.source_name, backoff)
+                await asyncio.sleep(backoff)
 
         # All retries exhausted -- record failure for circuit breaker
-        self._circuit_breaker.record_failure()
+        self._record_outcome(success=False)
         logger.error(
             "%s: all %d retries exhausted, last error: %s",
             self.source_name, retries, last_error,
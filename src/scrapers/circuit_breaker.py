@@ -15,6 +15,10 @@ The breaker wraps the entire retry loop in BaseScraper._request_with_retry.
 Retries happen inside CLOSED state; the breaker trips only when ALL retries
 are exhausted. This prevents cascading failures to downed federal APIs while
 still allowing aggressive retry on transient errors.
+
+``snapshot()`` and ``restore()`` carry the state across processes (see
+src/scrapers/resilience_state.py). The last failure time travels as an
+age in seconds, so the breaker's own clock can stay monotonic.
 """
 
 import enum
@@ -142,6 +146,40 @@ class CircuitBreaker:
                 self.failure_threshold,
             )
 
+    def snapshot(self) -> dict:
+        """State to persist between runs.
+
+        Returns:
+            Dict with ``state`` (CircuitState value), ``failure_count`` and
+            ``seconds_since_failure`` (None if no failure is recorded).
+        """
+        failed = self._failure_count > 0 or self._state != CircuitState.CLOSED
+        return {
+            "state": self._state.value,
+            "failure_count": self._failure_count,
+            "seconds_since_failure": self._clock() - self._last_failure_time if failed else None,
+        }
+
+    def restore(
+        self,
+        state: CircuitState,
+        failure_count: int,
+        seconds_since_failure: float | None,
+    ) -> None:
+        """Resume from a ``snapshot()`` taken by an earlier run.
+
+        An OPEN breaker whose recovery timeout has since elapsed reports
+        HALF_OPEN on the next ``state`` read, as it would have in-process.
+        """
+        self._state = state
+        self._failure_count = failure_count
+        if seconds_since_failure is not None:
+            self._last_failure_time = self._clock() - max(0.0, seconds_since_failure)
+        logger.info(
+            "%s: circuit breaker restored %s (%d failures)",
+            self.name, state.name, failure_count,
+        )
+
     def reset(self) -> None:
         """Reset the breaker to CLOSED state with zero counters.
 
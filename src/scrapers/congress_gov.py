@@ -9,9 +9,13 @@ Integration strategy: filters for 119th Congress, searches for Tribal AND
 """
 
 import asyncio
+import contextlib
+import json
 import logging
 import os
-from datetime import datetime, timedelta, timezone
+import tempfile
+from datetime import datetime
+from pathlib import Path
 from urllib.parse import urlencode
 
 from src.scrapers.base import BaseScraper
@@ -37,6 +41,14 @@ LEGISLATIVE_QUERIES = [
 class CongressGovScraper(BaseScraper):
     """Scrapes the Congress.gov API for legislative items."""
 
+    supports_incremental = True
+    # Congress.gov allows 5,000 requests/hour per key. The hourly quota
+    # enforces that (with headroom for counts a crash leaves unsaved), so
+    # the per-second rate only smooths bursts: a cold build's ~500
+    # requests finish in under a minute.
+    default_requests_per_second = 10
+    default_requests_per_hour = 4900
+
     def __init__(self, config: dict):
         super().__init__("congress_gov", config=config)
         src = config["sources"]["congress_gov"]
@@ -44,16 +56,24 @@ class CongressGovScraper(BaseScraper):
         self.authority_weight = src["authority_weight"]
         self.api_key = os.environ.get(src.get("key_env_var", "CONGRESS_API_KEY"), "")
         self.search_queries = config.get("search_queries", [])
-        self.scan_window = config.get("scan_window_days", 14)
         if self.api_key:
             self._headers["X-Api-Key"] = self.api_key
+        # "<congress>-<type>-<number>" -> {"version": updateDate, "parts": {...}}
+        self._detail_cache: dict[str, dict] = {}
+
+    async def scan(self, since: datetime | None = None) -> list[dict]:
+        """Run targeted + broad queries against Congress.gov.
 
-    async def scan(self) -> list[dict]:
-        """Run targeted + broad queries against Congress.gov."""
+        Args:
+            since: Optional high-water mark; only bills updated on or after
+                this date (and within the scan window) are requested.
+        """
         if not self.api_key:
             logger.warning("Congress.gov: CONGRESS_API_KEY not set, skipping")
             return []
 
+        from_date = self._window_start(since).strftime("%Y-%m-%dT00:00:00Z")
+
         all_items = []
         seen_keys = set()
 
@@ -62,7 +82,8 @@ class CongressGovScraper(BaseScraper):
             for lq in LEGISLATIVE_QUERIES:
                 try:
                     items = await self._search_congress(
-                        session, lq["term"], bill_type=lq["type"], congress=119
+                        session, lq["term"], bill_type=lq["type"], congress=119,
+                        from_date=from_date,
                     )
                     for item in items:
                         key = item["source_id"]
@@ -74,12 +95,11 @@ class CongressGovScraper(BaseScraper):
                         "Error searching Congress.gov for '%s' (%s)",
                         lq["term"], lq["type"],
                     )
-                await asyncio.sleep(0.3)
 
             # Broad keyword queries
             for query in self.search_queries:
                 try:
-                    items = await self._search(session, query)
+                    items = await self._search(session, query, from_date=from_date)
                     for item in items:
                         key = item["source_id"]
                         if key not in seen_keys:
@@ -87,7 +107,6 @@ class CongressGovScraper(BaseScraper):
                             all_items.append(item)
                 except Exception:
                     logger.exception("Error searching Congress.gov for '%s'", query)
-                await asyncio.sleep(0.3)
 
         logger.info("Congress.gov: collected %d unique items", len(all_items))
         return all_items
@@ -95,18 +114,19 @@ class CongressGovScraper(BaseScraper):
     # Pagination constants
     _PAGE_LIMIT = 250        # Congress.gov API max per page
     _SAFETY_CAP = 2500       # 10 pages max per query
-    _PAGE_DELAY = 0.3        # seconds between page fetches
 
     async def _search_congress(
         self, session, term: str,
-        bill_type: str = "", congress: int = 119,
+        bill_type: str = "", congress: int = 119, from_date: str | None = None,
     ) -> list[dict]:
         """Search for bills in a specific Congress and bill type.
 
         Paginates through all available results using offset-based pagination.
         Safety cap at 2,500 results (10 pages) to prevent runaway queries.
+        ``from_date`` defaults to the start of the scan window.
         """
-        from_date = (datetime.now(timezone.utc) - timedelta(days=self.scan_window)).strftime("%Y-%m-%dT00:00:00Z")
+        if from_date is None:
+            from_date = self._window_start().strftime("%Y-%m-%dT00:00:00Z")
 
         # Congress-specific bill endpoint
         endpoint = f"{self.base_url}/bill/{congress}"
@@ -152,7 +172,6 @@ class CongressGovScraper(BaseScraper):
                 break
 
             offset += self._PAGE_LIMIT
-            await asyncio.sleep(self._PAGE_DELAY)
 
         if total_count is None:
             total_count = len(all_bills)
@@ -169,13 +188,15 @@ class CongressGovScraper(BaseScraper):
 
         return [self._normalize(bill) for bill in all_bills]
 
-    async def _search(self, session, query: str) -> list[dict]:
+    async def _search(self, session, query: str, from_date: str | None = None) -> list[dict]:
         """Execute a broad search query against the bill endpoint.
 
         Paginates through all available results using offset-based pagination.
         Safety cap at 2,500 results (10 pages) to prevent runaway queries.
+        ``from_date`` defaults to the start of the scan window.
         """
-        from_date = (datetime.now(timezone.utc) - timedelta(days=self.scan_window)).strftime("%Y-%m-%dT00:00:00Z")
+        if from_date is None:
+            from_date = self._window_start().strftime("%Y-%m-%dT00:00:00Z")
 
         all_bills: list[dict] = []
         offset = 0
@@ -216,7 +237,6 @@ class CongressGovScraper(BaseScraper):
                 break
 
             offset += self._PAGE_LIMIT
-            await asyncio.sleep(self._PAGE_DELAY)
 
         if total_count is None:
             total_count = len(all_bills)
@@ -233,14 +253,37 @@ class CongressGovScraper(BaseScraper):
 
         return [self._normalize(bill) for bill in all_bills]
 
+    # Bill sub-resources hydrated alongside the main record: (name, path)
+    _DETAIL_SUBRESOURCES = (
+        ("actions", "actions?limit=250"),
+        ("cosponsors", "cosponsors?limit=250"),
+        ("subjects", "subjects?limit=250"),
+        ("text", "text?limit=20"),
+    )
+
+    async def _get(self, session, url: str) -> dict:
+        """GET one URL, holding a concurrency slot for its duration."""
+        async with self._slots():
+            return await self._request_with_retry(session, "GET", url)
+
+    @staticmethod
+    def _detail_key(congress: int, bill_type: str, bill_number: str) -> str:
+        """Detail cache key: "<congress>-<type>-<number>"."""
+        return f"{congress}-{bill_type.lower()}-{bill_number}"
+
     async def _fetch_bill_detail(
         self, session, congress: int, bill_type: str, bill_number: str,
     ) -> dict:
         """Fetch full bill detail including sponsors, actions, cosponsors, subjects, text.
 
-        Queries 4 sub-endpoints of the Congress.gov API v3 for a specific bill:
-        /actions, /cosponsors, /subjects, /text. The main bill record includes
-        sponsor info inline.
+        Fetches the main bill record (sponsor info inline), then the 4
+        sub-endpoints /actions, /cosponsors, /subjects, /text concurrently
+        under the source's ``max_concurrency`` limit.
+
+        Sub-resources are cached per bill and keyed by the record's
+        ``updateDateIncludingText`` (or ``updateDate``): Congress.gov bumps
+        it whenever any of them changes, so an unchanged bill is hydrated
+        with a single request. Only fully successful fetches are cached.
 
         Args:
             session: aiohttp ClientSession.
@@ -256,76 +299,122 @@ class CongressGovScraper(BaseScraper):
         base = f"{self.base_url}/bill/{congress}/{bill_type.lower()}/{bill_number}"
 
         # Main bill detail (includes sponsor inline)
-        detail = await self._request_with_retry(session, "GET", base)
+        detail = await self._get(session, base)
         bill = detail.get("bill", {})
 
-        # Sub-endpoint fetches with individual error handling
-        actions = []
-        cosponsors = []
-        subjects = []
-        policy_area = {}
-        text_versions = []
+        cache_key = self._detail_key(congress, bill_type, bill_number)
+        version = bill.get("updateDateIncludingText") or bill.get("updateDate")
+        cached = self._detail_cache.get(cache_key)
+        if version and cached and cached.get("version") == version:
+            return {"bill": bill, **cached["parts"]}
 
-        try:
-            actions_data = await self._request_with_retry(
-                session, "GET", f"{base}/actions?limit=250"
-            )
-            actions = actions_data.get("actions", [])
-        except Exception:
-            logger.warning(
-                "Failed to fetch actions for %s-%s-%s",
-                congress, bill_type, bill_number,
-            )
+        # Sub-endpoint fetches with individual error handling
+        responses = await asyncio.gather(
+            *(self._get(session, f"{base}/{path}") for _, path in self._DETAIL_SUBRESOURCES),
+            return_exceptions=True,
+        )
+        parts: dict = {
+            "actions": [],
+            "cosponsors": [],
+            "subjects": [],
+            "policy_area": {},
+            "text_versions": [],
+        }
+        complete = True
+        for (name, _), data in zip(self._DETAIL_SUBRESOURCES, responses):
+            if isinstance(data, BaseException):
+                if not isinstance(data, Exception):
+                    raise data
+                logger.warning(
+                    "Failed to fetch %s for %s-%s-%s",
+                    name, congress, bill_type, bill_number,
+                )
+                complete = False
+            elif name == "subjects":
+                subj = data.get("subjects", {})
+                parts["subjects"] = subj.get("legislativeSubjects", [])
+                parts["policy_area"] = subj.get("policyArea", {})
+            elif name == "text":
+                parts["text_versions"] = data.get("textVersions", [])
+            else:
+                parts[name] = data.get(name, [])
+
+        if version and complete:
+            self._detail_cache[cache_key] = {"version": version, "parts": parts}
+
+        return {"bill": bill, **parts}
+
+    async def fetch_bill_details(
+        self, session, bills: list[tuple[int, str, str]],
+    ) -> list[dict | Exception]:
+        """Hydrate several bills concurrently.
+
+        At most ``max_concurrency`` bills are in progress at once; every
+        request still takes a slot from the source-wide limit and a token
+        from the rate limiter.
 
-        await asyncio.sleep(0.3)
+        Args:
+            session: aiohttp ClientSession.
+            bills: (congress, bill_type, bill_number) triples.
 
-        try:
-            cosponsors_data = await self._request_with_retry(
-                session, "GET", f"{base}/cosponsors?limit=250"
-            )
-            cosponsors = cosponsors_data.get("cosponsors", [])
-        except Exception:
-            logger.warning(
-                "Failed to fetch cosponsors for %s-%s-%s",
-                congress, bill_type, bill_number,
-            )
+        Returns:
+            One entry per input triple, in order: the _fetch_bill_detail
+            dict, or the exception raised fetching that bill.
+        """
+        bill_slots = asyncio.Semaphore(self.max_concurrency)
 
-        await asyncio.sleep(0.3)
+        async def hydrate(congress: int, bill_type: str, bill_number: str) -> dict:
+            async with bill_slots:
+                return await self._fetch_bill_detail(session, congress, bill_type, bill_number)
 
-        try:
-            subjects_data = await self._request_with_retry(
-                session, "GET", f"{base}/subjects?limit=250"
-            )
-            subj = subjects_data.get("subjects", {})
-            subjects = subj.get("legislativeSubjects", [])
-            policy_area = subj.get("policyArea", {})
-        except Exception:
-            logger.warning(
-                "Failed to fetch subjects for %s-%s-%s",
-                congress, bill_type, bill_number,
-            )
+        return await asyncio.gather(
+            *(hydrate(*bill) for bill in bills), return_exceptions=True,
+        )
 
-        await asyncio.sleep(0.3)
+    def load_detail_cache(self, path: Path) -> int:
+        """Load cached bill sub-resources written by save_detail_cache.
 
+        Returns:
+            Number of cached bills loaded (0 if the file is missing or invalid).
+        """
         try:
-            text_data = await self._request_with_retry(
-                session, "GET", f"{base}/text?limit=20"
-            )
-            text_versions = text_data.get("textVersions", [])
-        except Exception:
-            logger.warning(
-                "Failed to fetch text for %s-%s-%s",
-                congress, bill_type, bill_number,
-            )
+            with open(path, encoding="utf-8") as f:
+                bills = json.load(f).get("bills", {})
+        except (OSError, json.JSONDecodeError, AttributeError) as exc:
+            if not isinstance(exc, FileNotFoundError):
+                logger.warning("Ignoring unreadable bill detail cache %s: %s", path, exc)
+            return 0
+        self._detail_cache.update(bills)
+        return len(bills)
+
+    def save_detail_cache(
+        self, path: Path, keep: list[tuple[int, str, str]] | None = None,
+    ) -> None:
+        """Write cached bill sub-resources atomically (one entry per bill).
 
-        return {
-            "bill": bill,
-            "actions": actions,
-            "cosponsors": cosponsors,
-            "subjects": subjects,
-            "policy_area": policy_area,
-            "text_versions": text_versions,
-        }
+        Args:
+            path: Cache file.
+            keep: Optional (congress, bill_type, bill_number) triples. When
+                given, entries for any other bill are dropped first, so the
+                cache holds only the bills the current build hydrates.
+        """
+        if keep is not None:
+            wanted = {self._detail_key(*bill) for bill in keep}
+            self._detail_cache = {
+                key: entry for key, entry in self._detail_cache.items() if key in wanted
+            }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_fd, tmp_name = tempfile.mkstemp(
+            dir=str(path.parent), suffix=".tmp", prefix=f"{path.stem}_",
+        )
+        try:
+            with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
+                json.dump({"bills": self._detail_cache}, f, ensure_ascii=False)
+            os.replace(tmp_name, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
 
     def _normalize(self, item: dict) -> dict:
         """Map Congress.gov fields to the standard schema."""
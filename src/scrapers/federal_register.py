@@ -8,9 +8,8 @@ and Barrier nodes in the knowledge graph. Also detects Information
 Collection Requests (ICR/PRA) as bureaucratic friction signals.
 """
 
-import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from urllib.parse import urlencode
 
 from src.scrapers.base import BaseScraper
@@ -43,18 +42,25 @@ class FederalRegisterScraper(BaseScraper):
     # Pagination constants
     _PER_PAGE = 50           # Federal Register default page size
     _MAX_PAGES = 20          # Safety cap: 20 pages = 1,000 results max
-    _PAGE_DELAY = 0.3        # seconds between page fetches
+
+    supports_incremental = True
+    # ~3 req/s, the pace of the fixed 0.3s page gaps this replaces
+    default_requests_per_second = 3
 
     def __init__(self, config: dict):
         super().__init__("federal_register", config=config)
         self.base_url = config["sources"]["federal_register"]["base_url"]
         self.authority_weight = config["sources"]["federal_register"]["authority_weight"]
         self.search_queries = config.get("search_queries", [])
-        self.scan_window = config.get("scan_window_days", 14)
 
-    async def scan(self) -> list[dict]:
-        """Run all search queries against the Federal Register API."""
-        start_date = (datetime.now(timezone.utc) - timedelta(days=self.scan_window)).strftime("%Y-%m-%d")
+    async def scan(self, since: datetime | None = None) -> list[dict]:
+        """Run all search queries against the Federal Register API.
+
+        Args:
+            since: Optional high-water mark; only documents published on or
+                after this date (and within the scan window) are requested.
+        """
+        start_date = self._window_start(since).strftime("%Y-%m-%d")
         all_items = []
         seen_urls = set()
 
@@ -69,7 +75,6 @@ class FederalRegisterScraper(BaseScraper):
                             all_items.append(item)
                 except Exception:
                     logger.exception("Error searching Federal Register for '%s'", query)
-                await asyncio.sleep(0.5)
 
             # Agency-specific sweep for Tribal-relevant agencies
             try:
@@ -141,7 +146,6 @@ class FederalRegisterScraper(BaseScraper):
                 break
 
             page += 1
-            await asyncio.sleep(self._PAGE_DELAY)
 
         if total_count and len(all_items) < total_count and page < self._MAX_PAGES:
             logger.warning(
@@ -208,7 +212,6 @@ class FederalRegisterScraper(BaseScraper):
                 break
 
             page += 1
-            await asyncio.sleep(self._PAGE_DELAY)
 
         if total_count and len(all_items) < total_count and page < self._MAX_PAGES:
             logger.warning(
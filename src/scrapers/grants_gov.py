@@ -9,10 +9,9 @@ force-include grants where Tribal governments are eligible even when
 keyword density is low. Tracks zombie CFDAs.
 """
 
-import asyncio
 import json
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 
 from src.scrapers.base import BaseScraper, check_zombie_cfda
 from src.scrapers.cfda_map import CFDA_TO_PROGRAM
@@ -39,18 +38,29 @@ class GrantsGovScraper(BaseScraper):
     # Pagination constants
     _ROWS_PER_PAGE = 50      # Grants.gov rows per request
     _SAFETY_CAP = 1000       # Max results per query (20 pages)
-    _PAGE_DELAY = 0.3        # seconds between page fetches
+
+    supports_incremental = True
+    # ~3 req/s, the pace of the fixed 0.3s page gaps this replaces
+    default_requests_per_second = 3
 
     def __init__(self, config: dict):
         super().__init__("grants_gov", config=config)
         self.base_url = config["sources"]["grants_gov"]["base_url"]
         self.authority_weight = config["sources"]["grants_gov"]["authority_weight"]
         self.search_queries = config.get("search_queries", [])
-        self.scan_window = config.get("scan_window_days", 14)
         self._zombie_warnings: list[dict] = []
 
-    async def scan(self) -> list[dict]:
-        """Run CFDA + keyword searches against Grants.gov."""
+    async def scan(self, since: datetime | None = None) -> list[dict]:
+        """Run CFDA + keyword searches against Grants.gov.
+
+        Args:
+            since: Optional high-water mark. When given, CFDA queries are
+                also restricted to opportunities posted on or after it, and
+                the zombie CFDA tracker is left untouched (an empty delta is
+                not evidence that a listing has gone dormant).
+        """
+        posted_from = self._window_start(since).strftime("%m/%d/%Y")
+        cfda_posted_from = posted_from if since is not None else None
         all_items = []
         seen_ids = set()
 
@@ -61,34 +71,36 @@ class GrantsGovScraper(BaseScraper):
             # CFDA-based targeted queries
             for cfda, program_id in CFDA_NUMBERS.items():
                 try:
-                    items = await self._search_cfda(session, cfda, program_id)
+                    items = await self._search_cfda(
+                        session, cfda, program_id, posted_from=cfda_posted_from,
+                    )
                     for item in items:
                         if item["source_id"] not in seen_ids:
                             seen_ids.add(item["source_id"])
                             all_items.append(item)
-                    # Zombie CFDA check
-                    warning = check_zombie_cfda(cfda, len(items), cfda_tracker)
-                    if warning:
-                        self._zombie_warnings.append(warning)
-                        logger.warning("ZOMBIE CFDA: %s", warning["warning"])
+                    # Zombie CFDA check (full scans only)
+                    if cfda_posted_from is None:
+                        warning = check_zombie_cfda(cfda, len(items), cfda_tracker)
+                        if warning:
+                            self._zombie_warnings.append(warning)
+                            logger.warning("ZOMBIE CFDA: %s", warning["warning"])
                 except Exception:
                     logger.exception("Error searching Grants.gov for CFDA %s", cfda)
-                await asyncio.sleep(0.3)
 
             # Keyword-based broad queries
             for query in self.search_queries:
                 try:
-                    items = await self._search(session, query)
+                    items = await self._search(session, query, posted_from=posted_from)
                     for item in items:
                         if item["source_id"] not in seen_ids:
                             seen_ids.add(item["source_id"])
                             all_items.append(item)
                 except Exception:
                     logger.exception("Error searching Grants.gov for '%s'", query)
-                await asyncio.sleep(0.3)
 
         # Save tracker
-        self._save_cfda_tracker(cfda_tracker)
+        if cfda_posted_from is None:
+            self._save_cfda_tracker(cfda_tracker)
 
         logger.info("Grants.gov: collected %d unique items", len(all_items))
         if self._zombie_warnings:
@@ -99,11 +111,15 @@ class GrantsGovScraper(BaseScraper):
     def zombie_warnings(self) -> list[dict]:
         return self._zombie_warnings
 
-    async def _search_cfda(self, session, cfda: str, program_id: str) -> list[dict]:
+    async def _search_cfda(
+        self, session, cfda: str, program_id: str, posted_from: str | None = None,
+    ) -> list[dict]:
         """Search by CFDA / Assistance Listing number with full pagination.
 
         Paginates through all results using startRecordNum offset.
         Safety cap at 1,000 results to prevent runaway queries.
+        ``posted_from`` (MM/DD/YYYY) is only set for incremental scans; a
+        full scan returns every open opportunity for the listing.
         """
         url = f"{self.base_url}/api/search2"
         all_results: list[dict] = []
@@ -118,6 +134,8 @@ class GrantsGovScraper(BaseScraper):
                 "rows": self._ROWS_PER_PAGE,
                 "startRecordNum": start_record,
             }
+            if posted_from:
+                payload["postedFrom"] = posted_from
             resp = await self._request_with_retry(session, "POST", url, json=payload)
             data = resp.get("data", resp)
             results = data.get("oppHits", [])
@@ -143,7 +161,6 @@ class GrantsGovScraper(BaseScraper):
                 break
 
             start_record += self._ROWS_PER_PAGE
-            await asyncio.sleep(self._PAGE_DELAY)
 
         if hit_count is None:
             hit_count = len(all_results)
@@ -160,13 +177,15 @@ class GrantsGovScraper(BaseScraper):
 
         return [self._normalize(item, cfda=cfda, matched_program=program_id) for item in all_results]
 
-    async def _search(self, session, query: str) -> list[dict]:
+    async def _search(self, session, query: str, posted_from: str | None = None) -> list[dict]:
         """Execute a keyword search query with full pagination.
 
         Paginates through all results using startRecordNum offset.
         Safety cap at 1,000 results to prevent runaway queries.
+        ``posted_from`` (MM/DD/YYYY) defaults to the start of the scan window.
         """
-        posted_from = (datetime.now(timezone.utc) - timedelta(days=self.scan_window)).strftime("%m/%d/%Y")
+        if posted_from is None:
+            posted_from = self._window_start().strftime("%m/%d/%Y")
         url = f"{self.base_url}/api/search2"
         all_results: list[dict] = []
         start_record = 0
@@ -206,7 +225,6 @@ class GrantsGovScraper(BaseScraper):
                 break
 
             start_record += self._ROWS_PER_PAGE
-            await asyncio.sleep(self._PAGE_DELAY)
 
         if hit_count is None:
             hit_count = len(all_results)
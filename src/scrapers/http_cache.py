@@ -0,0 +1,215 @@
+"""On-disk HTTP response cache with conditional revalidation.
+
+``BaseScraper._request_with_retry`` consults this cache before every
+request. Entries are keyed by a hash of method + URL + request payload
+(query params / JSON body) and store the decoded JSON body together with
+the response's ``ETag`` and ``Last-Modified`` validators:
+
+  - younger than the source's TTL: served without a network round trip
+  - older: revalidated with ``If-None-Match`` / ``If-Modified-Since``;
+    a 304 refreshes the entry and serves the stored body
+
+One JSON file per entry lives under the cache directory. Reads and 304s
+bump the file's mtime, and the directory is held under a byte budget by
+evicting least-recently-used files first.
+
+The scraper calls ``get``/``put``/``refresh`` through ``asyncio.to_thread``,
+so file I/O and eviction scans never block the event loop that all
+scrapers share. A lock serializes writes and the running size total
+across those worker threads.
+
+Configured by the top-level ``http_cache`` section of scanner_config.json
+(``enabled``, ``max_mb``, ``dir``, ``default_ttl_seconds``) and the
+per-source ``sources.<name>.cache_ttl_seconds``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Eviction trims the cache to this fraction of its budget, so a full cache
+# is not rescanned on every subsequent write.
+_EVICT_TO = 0.9
+
+# Shared instances keyed by resolved directory (see ResponseCache.shared)
+_SHARED: dict[str, "ResponseCache"] = {}
+
+
+class ResponseCache:
+    """Size-bounded LRU cache of JSON HTTP responses.
+
+    Args:
+        directory: Where entry files are stored (created on first write).
+        max_bytes: Total size budget for entry files.
+        clock: Callable returning wall-clock seconds. Defaults to time.time.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int,
+        clock: Callable[[], float] | None = None,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max(0, int(max_bytes))
+        self._clock = clock or time.time
+        self._total_bytes: int | None = None  # computed lazily on first write
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, directory: Path, max_bytes: int) -> "ResponseCache":
+        """Return the process-wide cache for ``directory``.
+
+        Scrapers running concurrently share one instance, so the size
+        budget and running total cover all of them. If a later caller asks
+        for a different budget, the larger one is kept (and logged), so no
+        caller's entries are evicted below the budget it configured.
+        """
+        key = str(Path(directory).resolve())
+        cache = _SHARED.get(key)
+        if cache is None:
+            cache = _SHARED[key] = cls(directory, max_bytes)
+        elif int(max_bytes) != cache.max_bytes:
+            budget = max(cache.max_bytes, int(max_bytes))
+            logger.warning(
+                "HTTP cache %s requested with a %d-byte budget, already open with %d; using %d",
+                directory, int(max_bytes), cache.max_bytes, budget,
+            )
+            cache.max_bytes = budget
+        return cache
+
+    @staticmethod
+    def key(method: str, url: str, payload: dict | None = None) -> str:
+        """Cache key for a request: SHA256 of method, URL and payload."""
+        raw = json.dumps(
+            [method.upper(), url, payload or {}], sort_keys=True, default=str,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        """Return the stored entry, or None.
+
+        Entries have keys ``stored_at``, ``etag``, ``last_modified`` and
+        ``body``. A hit marks the entry as recently used.
+        """
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Discarding unreadable HTTP cache entry %s: %s", path.name, exc)
+            self._remove(path)
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry
+
+    def is_fresh(self, entry: dict, ttl: float) -> bool:
+        """True if ``entry`` was stored or revalidated less than ``ttl`` seconds ago."""
+        return ttl > 0 and self._clock() - entry.get("stored_at", 0.0) < ttl
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict[str, str]:
+        """Revalidation headers for ``entry`` (empty if it has no validators)."""
+        headers: dict[str, str] = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(
+        self,
+        key: str,
+        body,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Store a response body with its validators, then enforce the budget."""
+        entry = {
+            "stored_at": self._clock(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "body": body,
+        }
+        path = self._path(key)
+        with self._lock:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                old_size = path.stat().st_size if path.exists() else 0
+                fd, tmp = tempfile.mkstemp(dir=str(self.directory), suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(entry, f, ensure_ascii=False)
+                    os.replace(tmp, path)
+                except BaseException:
+                    self._remove(Path(tmp))
+                    raise
+                new_size = path.stat().st_size
+            except OSError as exc:
+                logger.warning("Could not write HTTP cache entry %s: %s", path.name, exc)
+                return
+
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += new_size - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def refresh(self, key: str, entry: dict) -> None:
+        """Restart the TTL of ``entry`` after a 304 Not Modified."""
+        self.put(key, entry.get("body"), entry.get("etag"), entry.get("last_modified"))
+
+    def _scan_size(self) -> int:
+        total = 0
+        for path in self.directory.glob("*.json"):
+            with contextlib.suppress(OSError):
+                total += path.stat().st_size
+        return total
+
+    def _evict(self) -> None:
+        """Delete least-recently-used entries until under the budget."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            with contextlib.suppress(OSError):
+                st = path.stat()
+                entries.append((st.st_mtime, st.st_size, path))
+        entries.sort(key=lambda e: e[0])
+
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * _EVICT_TO
+        evicted = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            if self._remove(path):
+                total -= size
+                evicted += 1
+        self._total_bytes = total
+        if evicted:
+            logger.info("HTTP cache: evicted %d entries (%d bytes kept)", evicted, total)
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
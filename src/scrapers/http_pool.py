@@ -0,0 +1,239 @@
+"""Process-wide HTTP connection pool and per-host rate governor.
+
+Every scraper and network script draws its ``aiohttp.ClientSession`` from
+``shared_session()``. Within one event loop the session (and its
+connector) is shared and reference-counted: the four scrapers launched
+together by ``run_scan`` reuse the same keep-alive connections and DNS
+cache, and the session closes when the last user exits.
+
+``HOST_GOVERNOR`` holds one token bucket per host (see rate_limiter.py),
+so every request to ``api.congress.gov`` draws from the same budget,
+whether it comes from a scraper or a script; hosts with an hourly quota
+also share one ``HourlyQuota``. It also keeps per-host
+request, error, 429 and latency counters for every pooled session.
+
+Connector limits come from the top-level ``http_pool`` section of
+scanner_config.json (``limit``, ``limit_per_host``, ``dns_cache_ttl``,
+``keepalive_timeout``). ``run_scan`` applies them once per scan with
+``configure_pool()``; constructing a scraper leaves them alone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from src.scrapers.rate_limiter import HourlyQuota, TokenBucket
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "TCR-Policy-Scanner/1.0 (Tribal Climate Resilience; automated-scan)"
+
+# Connector settings; overridden by configure_pool()
+_POOL_SETTINGS: dict = {
+    "limit": 64,
+    "limit_per_host": 8,
+    "dns_cache_ttl": 300,
+    "keepalive_timeout": 30,
+}
+
+# Event loop -> [session, users]
+_SESSIONS: dict[asyncio.AbstractEventLoop, list] = {}
+
+
+def _host(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+@dataclass
+class HostStats:
+    """Request counters for one host."""
+
+    requests: int = 0
+    errors: int = 0
+    throttled: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+
+class HostGovernor:
+    """Per-host token buckets and request counters.
+
+    Hosts are ungoverned until ``register()`` gives them a rate; requests
+    to them pass straight through ``acquire()``.
+    """
+
+    def __init__(self):
+        self._buckets: dict[str, TokenBucket] = {}
+        self._quotas: dict[str, HourlyQuota] = {}
+        self._stats: dict[str, HostStats] = {}
+
+    def register(self, url: str, rate: float, burst: float | None = None) -> TokenBucket:
+        """Set the request rate for ``url``'s host and return its bucket.
+
+        A host has one bucket for the life of the process, so every caller
+        and every task already waiting keep drawing from the same budget.
+        If callers ask for different rates, the most restrictive rate and
+        burst win: a stricter registration tightens the bucket in place,
+        and a looser one is logged and ignored.
+        """
+        host = _host(url)
+        capacity = float(burst) if burst else max(1.0, float(rate))
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(rate, capacity=capacity)
+        elif float(rate) < bucket.rate or capacity < bucket.capacity:
+            logger.info(
+                "%s: tightening rate limit from %.3g/s (burst %.3g) to %.3g/s (burst %.3g)",
+                host, bucket.rate, bucket.capacity,
+                min(bucket.rate, float(rate)), min(bucket.capacity, capacity),
+            )
+            bucket.limit_to(rate, capacity)
+        elif float(rate) != bucket.rate or capacity != bucket.capacity:
+            logger.warning(
+                "%s: ignoring rate limit %.3g/s (burst %.3g); keeping stricter %.3g/s (burst %.3g)",
+                host, float(rate), capacity, bucket.rate, bucket.capacity,
+            )
+        return bucket
+
+    def register_quota(self, url: str, per_hour: int) -> HourlyQuota:
+        """Set the hourly request quota for ``url``'s host and return it.
+
+        Like ``register()``, one quota per host for the life of the
+        process; a lower limit tightens it in place.
+        """
+        host = _host(url)
+        quota = self._quotas.get(host)
+        if quota is None:
+            quota = self._quotas[host] = HourlyQuota(per_hour)
+        elif int(per_hour) < quota.limit:
+            logger.info(
+                "%s: tightening hourly quota from %d to %d", host, quota.limit, int(per_hour),
+            )
+            quota.limit = int(per_hour)
+        return quota
+
+    def bucket(self, url: str) -> TokenBucket | None:
+        """The bucket governing ``url``'s host, or None if ungoverned."""
+        return self._buckets.get(_host(url))
+
+    async def acquire(self, url: str) -> None:
+        """Wait for a request token for ``url``'s host."""
+        bucket = self._buckets.get(_host(url))
+        if bucket is not None:
+            await bucket.acquire()
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Hold every request to ``url``'s host for ``seconds`` (429 Retry-After)."""
+        bucket = self._buckets.get(_host(url))
+        if bucket is not None:
+            bucket.defer(seconds)
+
+    def record(self, host: str, latency: float, status: int | None) -> None:
+        """Count one request; ``status`` None means it raised."""
+        stats = self._stats.setdefault(host, HostStats())
+        stats.requests += 1
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+        if status is None or status >= 500:
+            stats.errors += 1
+        elif status == 429:
+            stats.throttled += 1
+
+    def stats(self) -> dict[str, HostStats]:
+        """Counters per host since start (or the last reset)."""
+        return dict(self._stats)
+
+    def log_summary(self) -> None:
+        """Log one line of counters per host."""
+        for host, s in sorted(self._stats.items()):
+            logger.info(
+                "HTTP %s: %d requests, %d errors, %d throttled, "
+                "latency mean %.0fms max %.0fms",
+                host, s.requests, s.errors, s.throttled,
+                s.mean_latency * 1000, s.max_latency * 1000,
+            )
+
+    def reset(self) -> None:
+        """Drop all buckets, quotas and counters."""
+        self._buckets.clear()
+        self._quotas.clear()
+        self._stats.clear()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """aiohttp tracing hooks that feed ``record()``."""
+        governor = self
+        trace = aiohttp.TraceConfig()
+
+        async def on_start(session, ctx, params):
+            ctx.start = asyncio.get_running_loop().time()
+
+        async def on_end(session, ctx, params):
+            elapsed = asyncio.get_running_loop().time() - ctx.start
+            governor.record(params.url.host or "", elapsed, params.response.status)
+
+        async def on_exception(session, ctx, params):
+            elapsed = asyncio.get_running_loop().time() - ctx.start
+            governor.record(params.url.host or "", elapsed, None)
+
+        trace.on_request_start.append(on_start)
+        trace.on_request_end.append(on_end)
+        trace.on_request_exception.append(on_exception)
+        return trace
+
+
+HOST_GOVERNOR = HostGovernor()
+
+
+def configure_pool(config: dict | None) -> None:
+    """Apply the ``http_pool`` config section to sessions created from now on."""
+    section = (config or {}).get("http_pool", {})
+    for key in _POOL_SETTINGS:
+        if key in section:
+            _POOL_SETTINGS[key] = section[key]
+
+
+def _new_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=_POOL_SETTINGS["limit"],
+        limit_per_host=_POOL_SETTINGS["limit_per_host"],
+        ttl_dns_cache=_POOL_SETTINGS["dns_cache_ttl"],
+        keepalive_timeout=_POOL_SETTINGS["keepalive_timeout"],
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={"User-Agent": USER_AGENT},
+        trace_configs=[HOST_GOVERNOR.trace_config()],
+    )
+
+
+@contextlib.asynccontextmanager
+async def shared_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """Borrow the running loop's pooled session.
+
+    The first borrower creates it; it is closed when the last one exits.
+    Per-caller headers (API keys) belong on each request, not the session.
+    """
+    loop = asyncio.get_running_loop()
+    entry = _SESSIONS.get(loop)
+    if entry is None or entry[0].closed:
+        entry = _SESSIONS[loop] = [_new_session(), 0]
+    entry[1] += 1
+    try:
+        yield entry[0]
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0:
+            if _SESSIONS.get(loop) is entry:
+                del _SESSIONS[loop]
+            await entry[0].close()
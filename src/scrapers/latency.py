@@ -0,0 +1,183 @@
+"""Tail-latency controls for scraper requests: hedging and the scan deadline.
+
+Federal Register and Congress.gov answer most requests quickly. A few
+answers take many times longer, and those slow requests used to set the
+length of the whole scan. Two controls in BaseScraper._request_with_retry
+address this:
+
+    hedging         Each source keeps a rolling window of response times
+                    (``LatencyTracker.for_source``). When a GET has not
+                    answered by the source's p95, a duplicate is sent and
+                    whichever answers first is used; the other is
+                    cancelled. When the hedge wins, the original's elapsed
+                    time so far is recorded too, so the slow requests that
+                    trigger hedging still count toward the percentile. Only
+                    idempotent GETs are hedged, and only once the window
+                    holds ``min_samples`` responses.
+    scan deadline   run_scan gives every scraper the same monotonic
+                    deadline (``resilience.scan_deadline_seconds``). The
+                    retry loop shortens attempt timeouts to the time left
+                    and does not start attempts, backoffs or Retry-After
+                    waits that would overrun it. Instead it raises
+                    ScanDeadlineExceeded, and run_scan serves the source
+                    cache for whatever the scan did not fetch.
+
+Config (``resilience`` section of scanner_config.json):
+
+    "scan_deadline_seconds": 900,
+    "hedging": {"enabled": true, "percentile": 95, "min_samples": 20,
+                "min_delay": 0.25, "window": 200}
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+HEDGE_PERCENTILE: float = 95.0
+"""Latency percentile after which a GET is hedged."""
+
+HEDGE_MIN_SAMPLES: int = 20
+"""Responses a source needs before its percentile is trusted for hedging."""
+
+HEDGE_MIN_DELAY: float = 0.25
+"""Never hedge sooner than this many seconds (protects fast APIs)."""
+
+LATENCY_WINDOW: int = 200
+"""Recent responses kept per source."""
+
+_TRACKERS: dict[str, "LatencyTracker"] = {}
+
+
+class ScanDeadlineExceeded(Exception):
+    """Raised when a request cannot finish before the scan deadline.
+
+    Attributes:
+        source_name: The scraper source that ran out of time.
+    """
+
+    def __init__(self, source_name: str):
+        self.source_name = source_name
+        super().__init__(f"Scan deadline reached for '{source_name}'")
+
+
+class LatencyTracker:
+    """Rolling response-time window for one source, plus hedge counters.
+
+    Args:
+        window: Most recent response times kept.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=max(1, window))
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    @classmethod
+    def for_source(cls, source_name: str, window: int = LATENCY_WINDOW) -> "LatencyTracker":
+        """Return the process-wide tracker for ``source_name``."""
+        tracker = _TRACKERS.get(source_name)
+        if tracker is None:
+            tracker = _TRACKERS[source_name] = cls(window)
+        return tracker
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def observe(self, seconds: float) -> None:
+        """Record one response time."""
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """Nearest-rank ``q``th percentile (None while the window is empty)."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    @property
+    def p50(self) -> float | None:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float | None:
+        return self.percentile(95)
+
+    def hedge_delay(
+        self,
+        percentile: float = HEDGE_PERCENTILE,
+        min_samples: int = HEDGE_MIN_SAMPLES,
+        min_delay: float = HEDGE_MIN_DELAY,
+    ) -> float | None:
+        """Seconds to wait before hedging, or None if there is too little data."""
+        if len(self._samples) < min_samples:
+            return None
+        return max(min_delay, self.percentile(percentile))
+
+
+async def hedged(send: Callable[[], Awaitable[T]], delay: float, tracker: LatencyTracker) -> T:
+    """Await ``send()``; if it is still pending after ``delay``, race a second call.
+
+    The first call to return wins and the other is cancelled. A call that
+    raises leaves the race to the other one; if both raise, the last error
+    propagates. When the hedge wins, the cancelled first call's elapsed time
+    is observed as a (censored) sample: it took at least that long, and
+    leaving it out would pull the percentile down after every hedge.
+    """
+    start = time.monotonic()
+    tasks: list[asyncio.Future] = []
+    error: BaseException | None = None
+    try:
+        first = asyncio.ensure_future(send())
+        tasks.append(first)
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done:
+            return first.result()
+
+        tracker.hedged += 1
+        second = asyncio.ensure_future(send())
+        tasks.append(second)
+        pending = {first, second}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.cancelled():
+                    error = asyncio.CancelledError()
+                    continue
+                if task.exception() is None:
+                    if task is second:
+                        tracker.hedge_wins += 1
+                        if not first.done():
+                            tracker.observe(time.monotonic() - start)
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        # Also reached when the caller is cancelled mid-wait (a scan
+        # deadline): no call may outlive it holding a pooled connection.
+        leftover = [task for task in tasks if not task.done()]
+        for task in leftover:
+            task.cancel()
+        if leftover:
+            await asyncio.gather(*leftover, return_exceptions=True)
+
+
+def log_summary() -> None:
+    """Log one latency/hedging line per source seen this process."""
+    for source, tracker in sorted(_TRACKERS.items()):
+        if not len(tracker):
+            continue
+        logger.info(
+            "Latency %s: p50 %.0fms p95 %.0fms over %d responses, "
+            "%d hedged (%d won by the hedge)",
+            source, tracker.p50 * 1000, tracker.p95 * 1000, len(tracker),
+            tracker.hedged, tracker.hedge_wins,
+        )
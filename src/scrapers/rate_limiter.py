@@ -0,0 +1,169 @@
+"""Token-bucket rate limiter for concurrent scraper requests.
+
+Replaces fixed ``asyncio.sleep`` gaps between requests with a shared
+budget: the bucket refills at ``rate`` tokens per second up to
+``capacity``, and every HTTP attempt takes one token. Concurrent tasks
+drawing from the same bucket are collectively held to the configured
+request rate, while short bursts (up to ``capacity``) go out immediately.
+
+A server-requested pause (429 ``Retry-After``) is applied to the whole
+bucket via ``defer()``, so every task sharing it backs off together
+instead of each discovering the limit with its own 429.
+
+``HourlyQuota`` enforces a rolling one-hour request count on top of the
+bucket (Congress.gov allows 5,000 requests per hour per key). The bucket
+only smooths bursts; the quota is what keeps a fast rate from spending
+more than the hour allows. Its counts are per wall-clock minute, so they
+can be persisted and carried over to the next run (resilience_state.py).
+"""
+
+import asyncio
+import math
+import time
+from collections.abc import Callable, Mapping
+
+
+class TokenBucket:
+    """Async token bucket with injectable clock for testing.
+
+    Args:
+        rate: Tokens added per second (sustained requests per second).
+        capacity: Maximum burst size. Defaults to ``max(1, rate)``.
+        clock: Callable returning monotonic time in seconds.
+               Defaults to time.monotonic. Inject a mock for deterministic tests.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        clock: Callable[[], float] | None = None,
+    ):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._clock = clock or time.monotonic
+
+        self._tokens = self.capacity
+        self._updated = self._clock()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update, capped at capacity."""
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Take a token without waiting. Returns False if none is available."""
+        now = self._clock()
+        if now < self._blocked_until:
+            return False
+        self._refill(now)
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    def delay(self) -> float:
+        """Seconds until a token could next be available (0.0 if one is ready)."""
+        now = self._clock()
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        self._refill(now)
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self.rate
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        while not self.try_acquire():
+            await asyncio.sleep(self.delay())
+
+    def limit_to(self, rate: float, capacity: float) -> None:
+        """Lower the rate and/or burst in place; never raises either.
+
+        Tasks already waiting on this bucket keep waiting on it, now at
+        the stricter budget.
+        """
+        self._refill(self._clock())
+        self.rate = min(self.rate, float(rate))
+        self.capacity = min(self.capacity, float(capacity))
+        self._tokens = min(self._tokens, self.capacity)
+
+    def defer(self, seconds: float) -> None:
+        """Block all acquirers for ``seconds`` (e.g. a 429 Retry-After)."""
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+
+class HourlyQuota:
+    """Rolling one-hour request quota, counted per wall-clock minute.
+
+    A request made during minute ``m`` counts until the end of minute
+    ``m + 60``, so the quota errs on the side of waiting a little long.
+
+    Args:
+        limit: Requests allowed in any rolling hour.
+        clock: Callable returning wall-clock time in seconds.
+               Defaults to time.time. Inject a mock for deterministic tests.
+    """
+
+    def __init__(self, limit: int, clock: Callable[[], float] | None = None):
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+        self.limit = int(limit)
+        self._clock = clock or time.time
+        self._minutes: dict[int, int] = {}
+
+    def _prune(self, now: float) -> int:
+        """Drop minutes older than the rolling hour; return requests still counted."""
+        oldest = math.floor(now / 60) - 60
+        for minute in [m for m in self._minutes if m < oldest]:
+            del self._minutes[minute]
+        return sum(self._minutes.values())
+
+    def used(self) -> int:
+        """Requests counted in the current rolling hour."""
+        return self._prune(self._clock())
+
+    def try_acquire(self) -> bool:
+        """Count one request if the quota allows it. Returns False if spent."""
+        now = self._clock()
+        if self._prune(now) >= self.limit:
+            return False
+        minute = math.floor(now / 60)
+        self._minutes[minute] = self._minutes.get(minute, 0) + 1
+        return True
+
+    def delay(self) -> float:
+        """Seconds until a request could next be counted (0.0 if one is free)."""
+        now = self._clock()
+        used = self._prune(now)
+        if used < self.limit:
+            return 0.0
+        for minute in sorted(self._minutes):
+            used -= self._minutes[minute]
+            if used < self.limit:
+                return max(0.0, (minute + 61) * 60 - now)
+        return 0.0
+
+    async def acquire(self) -> None:
+        """Wait until the quota allows a request, then count it."""
+        while not self.try_acquire():
+            await asyncio.sleep(self.delay())
+
+    def snapshot(self) -> dict[str, int]:
+        """Per-minute counts for the current rolling hour (JSON-ready)."""
+        self._prune(self._clock())
+        return {str(minute): count for minute, count in sorted(self._minutes.items())}
+
+    def restore(self, minutes: Mapping[str, int]) -> None:
+        """Merge counts from ``snapshot()`` (e.g. an earlier run), keeping the larger."""
+        for key, count in minutes.items():
+            try:
+                minute, count = int(key), int(count)
+            except (ValueError, TypeError):
+                continue
+            self._minutes[minute] = max(self._minutes.get(minute, 0), count)
+        self._prune(self._clock())
@@ -0,0 +1,202 @@
+"""Circuit-breaker, Retry-After and hourly-quota state persisted across runs.
+
+A CircuitBreaker lives in memory for one scraper instance, so every cron
+run used to start CLOSED. Against an API that was already down, each run
+then spent ``max_retries`` backoffs per request before the breaker
+tripped again. With ``resilience.persist_state`` enabled, each source's
+breaker, its latest 429 ``Retry-After`` deadline and, for sources with
+``requests_per_hour``, its per-minute request counts are written to
+``outputs/.resilience_state.json``:
+
+    {"sources": {"congress_gov": {
+        "state": "open", "failure_count": 5,
+        "last_failure_at": "2026-02-10T14:03:11+00:00",
+        "retry_after_until": null,
+        "quota_minutes": {"29512442": 180, "29512443": 96},
+        "updated_at": "2026-02-10T14:03:11+00:00"}}}
+
+The next run restores the breaker from that file. While it is still OPEN,
+requests raise CircuitOpenError at once and run_scan falls back to the
+source cache. Once ``recovery_timeout`` has passed since the last
+failure, the breaker is HALF_OPEN and a single-attempt probe decides
+whether it closes. A Retry-After deadline still in the future holds the
+source's requests until it passes. Restored quota counts make the hourly
+budget span runs: a build started ten minutes after one that spent 4,000
+requests has about 1,000 left, not 5,000.
+
+Times are stored as wall-clock timestamps (injectable ``clock``, default
+time.time). The breaker keeps its monotonic clock; the two meet through
+the age of the last failure (CircuitBreaker.snapshot / restore).
+Concurrent scrapers share one store per file (``shared``). A save
+rewrites only the sources this process changed, on top of what is on
+disk. Quota counts are saved at most once every ``QUOTA_SAVE_INTERVAL``
+seconds, so a crash can leave that many seconds of requests uncounted;
+the configured hourly limit should leave headroom for them.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.paths import RESILIENCE_STATE_PATH
+from src.scrapers.circuit_breaker import CircuitBreaker, CircuitState
+from src.scrapers.rate_limiter import HourlyQuota
+
+logger = logging.getLogger(__name__)
+
+_SHARED: dict[str, "ResilienceStateStore"] = {}
+
+QUOTA_SAVE_INTERVAL: float = 1.0
+"""Minimum seconds between saves of one source's quota counts."""
+
+
+def _to_iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def _from_iso(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (ValueError, TypeError):
+        return None
+
+
+class ResilienceStateStore:
+    """Per-source breaker state and Retry-After deadlines in one JSON file.
+
+    Args:
+        path: State file. Defaults to ``RESILIENCE_STATE_PATH``.
+        clock: Callable returning wall-clock seconds. Defaults to time.time.
+    """
+
+    def __init__(self, path: Path | None = None, clock: Callable[[], float] | None = None):
+        self.path = Path(path or RESILIENCE_STATE_PATH)
+        self._clock = clock or time.time
+        self._sources: dict[str, dict] = self._load()
+        self._quota_saved: dict[str, float] = {}
+
+    @classmethod
+    def shared(cls, path: Path | None = None) -> "ResilienceStateStore":
+        """Return the process-wide store for ``path``."""
+        key = str(Path(path or RESILIENCE_STATE_PATH).resolve())
+        store = _SHARED.get(key)
+        if store is None:
+            store = _SHARED[key] = cls(path)
+        return store
+
+    def _load(self) -> dict[str, dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                sources = json.load(f).get("sources", {})
+            return sources if isinstance(sources, dict) else {}
+        except (json.JSONDecodeError, OSError, AttributeError):
+            logger.warning("Resilience state at %s is corrupt, starting fresh", self.path)
+            return {}
+
+    # -- Circuit breaker ------------------------------------------------------
+
+    def restore_breaker(self, breaker: CircuitBreaker) -> None:
+        """Load ``breaker.name``'s persisted state into ``breaker``, if any."""
+        entry = self._sources.get(breaker.name)
+        if not entry:
+            return
+        try:
+            state = CircuitState(entry.get("state", "closed"))
+            failure_count = int(entry.get("failure_count", 0))
+        except (ValueError, TypeError):
+            logger.warning("%s: ignoring unreadable breaker state %r", breaker.name, entry)
+            return
+        if state == CircuitState.CLOSED and failure_count == 0:
+            return
+        last_failure = _from_iso(entry.get("last_failure_at"))
+        age = self._clock() - last_failure if last_failure is not None else None
+        breaker.restore(state, failure_count, age)
+
+    def record_breaker(self, breaker: CircuitBreaker) -> None:
+        """Persist ``breaker``'s state if it differs from what is stored."""
+        snap = breaker.snapshot()
+        entry = self._sources.get(breaker.name, {})
+        if (
+            entry.get("state", "closed") == snap["state"]
+            and entry.get("failure_count", 0) == snap["failure_count"]
+        ):
+            return
+        now = self._clock()
+        age = snap["seconds_since_failure"]
+        entry.update({
+            "state": snap["state"],
+            "failure_count": snap["failure_count"],
+            "last_failure_at": _to_iso(now - age) if age is not None else None,
+        })
+        self._put(breaker.name, entry, now)
+
+    # -- Retry-After ----------------------------------------------------------
+
+    def record_retry_after(self, source: str, seconds: float) -> None:
+        """Remember that ``source`` asked for no requests for ``seconds``."""
+        now = self._clock()
+        entry = self._sources.get(source, {})
+        until = now + seconds
+        current = _from_iso(entry.get("retry_after_until"))
+        if current is not None and current >= until:
+            return
+        entry["retry_after_until"] = _to_iso(until)
+        self._put(source, entry, now)
+
+    def retry_after_remaining(self, source: str) -> float:
+        """Seconds left on ``source``'s latest Retry-After (0.0 if none)."""
+        until = _from_iso(self._sources.get(source, {}).get("retry_after_until"))
+        if until is None:
+            return 0.0
+        return max(0.0, until - self._clock())
+
+    # -- Hourly quota ---------------------------------------------------------
+
+    def restore_quota(self, source: str, quota: HourlyQuota) -> None:
+        """Merge ``source``'s persisted request counts into ``quota``."""
+        minutes = self._sources.get(source, {}).get("quota_minutes")
+        if isinstance(minutes, dict):
+            quota.restore(minutes)
+
+    def record_quota(self, source: str, quota: HourlyQuota, force: bool = False) -> None:
+        """Persist ``quota``'s counts for ``source`` (throttled unless ``force``)."""
+        now = self._clock()
+        if not force and now - self._quota_saved.get(source, float("-inf")) < QUOTA_SAVE_INTERVAL:
+            return
+        self._quota_saved[source] = now
+        entry = self._sources.get(source, {})
+        entry["quota_minutes"] = quota.snapshot()
+        self._put(source, entry, now)
+
+    # -- Persistence ----------------------------------------------------------
+
+    def _put(self, source: str, entry: dict, now: float) -> None:
+        entry["updated_at"] = _to_iso(now)
+        self._sources[source] = entry
+        try:
+            self._save(source)
+        except OSError as exc:
+            logger.warning("Could not save resilience state to %s: %s", self.path, exc)
+
+    def _save(self, source: str) -> None:
+        """Write ``source``'s entry over the current file contents (atomic)."""
+        on_disk = self._load()
+        on_disk[source] = self._sources[source]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"sources": on_disk}, f, indent=2)
+            os.replace(tmp, self.path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
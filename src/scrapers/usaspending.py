@@ -42,34 +42,120 @@ TRIBAL_AWARD_TYPE_CODES = [code for group in TRIBAL_AWARD_TYPE_CODE_GROUPS for c
 
 
 class USASpendingScraper(BaseScraper):
-    """Scrapes USASpending.gov for actual obligation data by CFDA."""
+    """Scrapes USASpending.gov for actual obligation data by CFDA.
+
+    Queries fan out concurrently across CFDA x fiscal year x award type
+    group. Three per-source settings in ``sources.usaspending`` bound the
+    fan-out:
+
+      - ``max_concurrency``: requests in flight at once (default 4)
+      - ``requests_per_second`` / ``burst``: the host's token bucket, shared
+        through HOST_GOVERNOR and applied to every HTTP attempt in
+        ``_request_with_retry`` (default 5 rps)
+      - ``page_prefetch``: pages requested together once ``page_metadata``
+        reports ``hasNext`` (default 1 = strictly sequential paging)
+    """
+
+    default_requests_per_second = 5
 
     def __init__(self, config: dict):
         super().__init__("usaspending", config=config)
         src = config["sources"].get("usaspending", {})
         self.base_url = src.get("base_url", "https://api.usaspending.gov/api/v2")
         self.authority_weight = src.get("authority_weight", 0.7)
+        self.page_prefetch = max(1, int(src.get("page_prefetch", 1)))
 
     async def scan(self) -> list[dict]:
-        """Query obligations for each tracked CFDA number."""
-        all_items = []
-
+        """Query obligations for each tracked CFDA number (concurrently)."""
         async with self._create_session() as session:
-            for cfda, program_id in CFDA_TO_PROGRAM.items():
-                try:
-                    items = await self._fetch_obligations(session, cfda, program_id)
-                    all_items.extend(items)
-                except Exception:
-                    logger.exception("Error fetching USASpending for CFDA %s", cfda)
-                await asyncio.sleep(0.3)
+            results = await asyncio.gather(*(
+                self._fetch_obligations_safe(session, cfda, program_id)
+                for cfda, program_id in CFDA_TO_PROGRAM.items()
+            ))
 
+        all_items = [item for items in results for item in items]
         logger.info("USASpending: collected %d obligation records", len(all_items))
         return all_items
 
+    async def _fetch_obligations_safe(
+        self, session: aiohttp.ClientSession, cfda: str, program_id: str,
+    ) -> list[dict]:
+        """Per-CFDA isolation wrapper for scan(): log and return [] on error."""
+        try:
+            return await self._fetch_obligations(session, cfda, program_id)
+        except Exception:
+            logger.exception("Error fetching USASpending for CFDA %s", cfda)
+            return []
+
     # Pagination constants for obligation scan
     _OBLIGATION_LIMIT = 100   # Results per page for obligation queries
     _OBLIGATION_SAFETY_CAP = 5000  # Max results per CFDA (50 pages)
-    _OBLIGATION_DELAY = 0.3   # seconds between page fetches
+
+    # ── Bounded-concurrency fetch engine ──
+
+    async def _post_page(
+        self, session: aiohttp.ClientSession, url: str, payload: dict,
+    ) -> dict:
+        """POST one search page, holding a concurrency slot for its duration."""
+        async with self._slots():
+            return await self._request_with_retry(session, "POST", url, json=payload)
+
+    async def _paginate(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        build_payload,
+        label: str,
+        max_pages: int,
+        max_results: int | None = None,
+    ) -> tuple[list[dict], bool]:
+        """Collect every page of a spending_by_award query.
+
+        Page 1 is fetched alone. While ``page_metadata.hasNext`` is true the
+        next ``page_prefetch`` pages are requested together and consumed in
+        page order; anything after the first empty, final, or failed page
+        is discarded, so results match strictly sequential paging.
+
+        Args:
+            session: Active aiohttp session.
+            url: spending_by_award endpoint URL.
+            build_payload: Callable mapping a page number to the POST body.
+            label: Query description for log messages.
+            max_pages: Last page number that may be fetched.
+            max_results: Optional cap on collected results.
+
+        Returns:
+            Tuple of (results, truncated). ``truncated`` is True when a cap
+            stopped pagination while the API still reported more pages.
+        """
+        all_results: list[dict] = []
+        next_page = 1
+        while next_page <= max_pages:
+            window = list(range(
+                next_page, min(next_page + self.page_prefetch, max_pages + 1),
+            )) if next_page > 1 else [1]
+            responses = await asyncio.gather(
+                *(self._post_page(session, url, build_payload(p)) for p in window),
+                return_exceptions=True,
+            )
+            for page, data in zip(window, responses):
+                if isinstance(data, BaseException):
+                    logger.warning(
+                        "USASpending: failed fetching %s page %d: %s",
+                        label, page, data,
+                    )
+                    return all_results, False
+                results = data.get("results", [])
+                if not results:
+                    return all_results, False
+                all_results.extend(results)
+                has_next = data.get("page_metadata", {}).get("hasNext", False)
+                if not has_next:
+                    return all_results, False
+                if max_results is not None and len(all_results) >= max_results:
+                    return all_results, True
+            next_page = window[-1] + 1
+        return all_results, True
 
     async def _fetch_obligations(
         self, session: aiohttp.ClientSession, cfda: str, program_id: str,
@@ -80,11 +166,9 @@ class USASpendingScraper(BaseScraper):
         Safety cap at 5,000 results (50 pages) to prevent runaway queries.
         """
         url = f"{self.base_url}/search/spending_by_award/"
-        all_results: list[dict] = []
-        page = 1
 
-        while True:
-            payload = {
+        def build_payload(page: int) -> dict:
+            return {
                 "filters": {
                     "time_period": [{"start_date": FISCAL_YEAR_START, "end_date": FISCAL_YEAR_END}],
                     "award_type_codes": ["02", "03", "04", "05"],  # Grants
@@ -101,36 +185,18 @@ class USASpendingScraper(BaseScraper):
                 "order": "desc",
             }
 
-            try:
-                data = await self._request_with_retry(session, "POST", url, json=payload)
-            except Exception:
-                logger.warning("USASpending: could not fetch CFDA %s page %d, skipping", cfda, page)
-                break
-
-            results = data.get("results", [])
-            if not results:
-                break
-
-            all_results.extend(results)
-
-            # Check for more pages
-            page_meta = data.get("page_metadata", {})
-            has_next = page_meta.get("hasNext", False)
-
-            if not has_next:
-                break
-
-            # Safety cap check
-            if len(all_results) >= self._OBLIGATION_SAFETY_CAP:
-                logger.warning(
-                    "USASpending: safety cap %d reached for CFDA %s obligations, "
-                    "results may be truncated",
-                    self._OBLIGATION_SAFETY_CAP, cfda,
-                )
-                break
-
-            page += 1
-            await asyncio.sleep(self._OBLIGATION_DELAY)
+        all_results, truncated = await self._paginate(
+            session, url, build_payload,
+            label=f"CFDA {cfda} obligations",
+            max_pages=MAX_PAGES * 2,
+            max_results=self._OBLIGATION_SAFETY_CAP,
+        )
+        if truncated:
+            logger.warning(
+                "USASpending: safety cap %d reached for CFDA %s obligations, "
+                "results may be truncated",
+                self._OBLIGATION_SAFETY_CAP, cfda,
+            )
 
         logger.info(
             "USASpending: fetched %d obligation records for CFDA %s",
@@ -139,6 +205,41 @@ class USASpendingScraper(BaseScraper):
 
         return [self._normalize(item, cfda, program_id) for item in all_results]
 
+    def _tribal_award_payload(
+        self, cfda: str, type_group: list[str], page: int,
+        time_period: list[dict] | None = None,
+    ) -> dict:
+        """Build a spending_by_award payload for Tribal government recipients."""
+        filters: dict = {
+            "award_type_codes": type_group,
+            "program_numbers": [cfda],
+            "recipient_type_names": [
+                "indian_native_american_tribal_government"
+            ],
+        }
+        if time_period is not None:
+            filters["time_period"] = time_period
+        return {
+            "filters": filters,
+            "fields": [
+                "Award ID",
+                "Recipient Name",
+                "Award Amount",
+                "Total Obligation",
+                "Start Date",
+                "End Date",
+                "Description",
+                "CFDA Number",
+                "Awarding Agency",
+                "recipient_id",
+            ],
+            "subawards": False,
+            "page": page,
+            "limit": 100,
+            "sort": "Award Amount",
+            "order": "desc",
+        }
+
     async def fetch_tribal_awards_for_cfda(
         self, session: aiohttp.ClientSession, cfda: str,
     ) -> list[dict]:
@@ -147,7 +248,8 @@ class USASpendingScraper(BaseScraper):
         Queries USASpending spending_by_award endpoint filtered to
         indian_native_american_tribal_government recipients. Issues separate
         queries per award type group (grants vs. direct payments) since the
-        API requires award_type_codes from a single group per request.
+        API requires award_type_codes from a single group per request; the
+        groups are fetched concurrently and concatenated in group order.
 
         Args:
             session: Active aiohttp session.
@@ -157,70 +259,25 @@ class USASpendingScraper(BaseScraper):
             List of raw award result dicts from USASpending API.
         """
         url = f"{self.base_url}/search/spending_by_award/"
-        all_results: list[dict] = []
-
-        for type_group in TRIBAL_AWARD_TYPE_CODE_GROUPS:
-            page = 1
-            while True:
-                payload = {
-                    "filters": {
-                        "award_type_codes": type_group,
-                        "program_numbers": [cfda],
-                        "recipient_type_names": [
-                            "indian_native_american_tribal_government"
-                        ],
-                    },
-                    "fields": [
-                        "Award ID",
-                        "Recipient Name",
-                        "Award Amount",
-                        "Total Obligation",
-                        "Start Date",
-                        "End Date",
-                        "Description",
-                        "CFDA Number",
-                        "Awarding Agency",
-                        "recipient_id",
-                    ],
-                    "subawards": False,
-                    "page": page,
-                    "limit": 100,
-                    "sort": "Award Amount",
-                    "order": "desc",
-                }
-
-                try:
-                    data = await self._request_with_retry(
-                        session, "POST", url, json=payload,
-                    )
-                except Exception:
-                    logger.warning(
-                        "USASpending: failed fetching Tribal awards for CFDA %s "
-                        "page %d (types %s)",
-                        cfda, page, type_group,
-                        exc_info=True,
-                    )
-                    break
 
-                results = data.get("results", [])
-                if not results:
-                    break
-
-                all_results.extend(results)
-
-                page_meta = data.get("page_metadata", {})
-                if not page_meta.get("hasNext", False):
-                    break
-
-                page += 1
+        async def fetch_group(type_group: list[str]) -> list[dict]:
+            results, truncated = await self._paginate(
+                session, url,
+                lambda page: self._tribal_award_payload(cfda, type_group, page),
+                label=f"Tribal awards for CFDA {cfda} (types {type_group})",
+                max_pages=MAX_PAGES - 1,
+            )
+            if truncated:
+                logger.warning(
+                    "USASpending: hit page cap %d for CFDA %s",
+                    MAX_PAGES, cfda,
+                )
+            return results
 
-                # Safety page cap (BUG-016)
-                if page >= MAX_PAGES:
-                    logger.warning(
-                        "USASpending: hit page cap %d for CFDA %s",
-                        MAX_PAGES, cfda,
-                    )
-                    break
+        groups = await asyncio.gather(
+            *(fetch_group(g) for g in TRIBAL_AWARD_TYPE_CODE_GROUPS)
+        )
+        all_results = [r for group in groups for r in group]
 
         logger.info(
             "USASpending: fetched %d Tribal awards for CFDA %s",
@@ -231,29 +288,29 @@ class USASpendingScraper(BaseScraper):
     async def fetch_all_tribal_awards(self) -> dict[str, list[dict]]:
         """Fetch Tribal awards for all 14 tracked CFDAs.
 
-        Iterates each CFDA in CFDA_TO_PROGRAM, calls
-        fetch_tribal_awards_for_cfda for each, with rate limiting
-        between requests. Catches exceptions per-CFDA so one failure
-        does not abort the entire batch.
+        Fans out across every CFDA in CFDA_TO_PROGRAM concurrently; the
+        request semaphore and token bucket bound the actual load. Catches
+        exceptions per-CFDA so one failure does not abort the entire batch.
 
         Returns:
             Dict keyed by CFDA number -> list of raw award dicts.
         """
-        awards_by_cfda: dict[str, list[dict]] = {}
+        async def fetch_one(session: aiohttp.ClientSession, cfda: str) -> list[dict]:
+            try:
+                return await self.fetch_tribal_awards_for_cfda(session, cfda)
+            except Exception:
+                logger.exception(
+                    "USASpending: error fetching Tribal awards for CFDA %s, "
+                    "continuing with empty list",
+                    cfda,
+                )
+                return []
 
         async with self._create_session() as session:
-            for cfda in CFDA_TO_PROGRAM:
-                try:
-                    results = await self.fetch_tribal_awards_for_cfda(session, cfda)
-                    awards_by_cfda[cfda] = results
-                except Exception:
-                    logger.exception(
-                        "USASpending: error fetching Tribal awards for CFDA %s, "
-                        "continuing with empty list",
-                        cfda,
-                    )
-                    awards_by_cfda[cfda] = []
-                await asyncio.sleep(0.5)
+            results = await asyncio.gather(
+                *(fetch_one(session, cfda) for cfda in CFDA_TO_PROGRAM)
+            )
+        awards_by_cfda = dict(zip(CFDA_TO_PROGRAM, results))
 
         total = sum(len(v) for v in awards_by_cfda.values())
         logger.info(
@@ -270,7 +327,8 @@ class USASpendingScraper(BaseScraper):
         Queries the USASpending spending_by_award endpoint filtered to
         indian_native_american_tribal_government recipients. Issues separate
         queries per award type group (grants vs. direct payments) since the
-        API requires award_type_codes from a single group per request.
+        API requires award_type_codes from a single group per request; the
+        groups are fetched concurrently and concatenated in group order.
 
         Federal fiscal year N runs from October 1 of year N-1 through
         September 30 of year N.
@@ -284,75 +342,29 @@ class USASpendingScraper(BaseScraper):
             List of raw award dicts, each with an injected ``_fiscal_year`` field.
         """
         url = f"{self.base_url}/search/spending_by_award/"
-        start_date = f"{fy - 1}-10-01"
-        end_date = f"{fy}-09-30"
-        all_results: list[dict] = []
-
-        for type_group in TRIBAL_AWARD_TYPE_CODE_GROUPS:
-            page = 1
-            while True:
-                payload = {
-                    "filters": {
-                        "award_type_codes": type_group,
-                        "program_numbers": [cfda],
-                        "recipient_type_names": [
-                            "indian_native_american_tribal_government"
-                        ],
-                        "time_period": [
-                            {"start_date": start_date, "end_date": end_date}
-                        ],
-                    },
-                    "fields": [
-                        "Award ID",
-                        "Recipient Name",
-                        "Award Amount",
-                        "Total Obligation",
-                        "Start Date",
-                        "End Date",
-                        "Description",
-                        "CFDA Number",
-                        "Awarding Agency",
-                        "recipient_id",
-                    ],
-                    "subawards": False,
-                    "page": page,
-                    "limit": 100,
-                    "sort": "Award Amount",
-                    "order": "desc",
-                }
-
-                try:
-                    data = await self._request_with_retry(
-                        session, "POST", url, json=payload,
-                    )
-                except Exception:
-                    logger.warning(
-                        "USASpending: failed fetching Tribal awards for CFDA %s "
-                        "FY%d page %d (types %s)",
-                        cfda, fy, page, type_group,
-                    )
-                    break
-
-                results = data.get("results", [])
-                if not results:
-                    break
-
-                all_results.extend(results)
-
-                page_meta = data.get("page_metadata", {})
-                if not page_meta.get("hasNext", False):
-                    break
-
-                page += 1
+        time_period = [{"start_date": f"{fy - 1}-10-01", "end_date": f"{fy}-09-30"}]
+
+        async def fetch_group(type_group: list[str]) -> list[dict]:
+            results, truncated = await self._paginate(
+                session, url,
+                lambda page: self._tribal_award_payload(
+                    cfda, type_group, page, time_period=time_period,
+                ),
+                label=f"Tribal awards for CFDA {cfda} FY{fy} (types {type_group})",
+                max_pages=100,  # 100 pages * 100 results = 10K records per group
+            )
+            if truncated:
+                logger.warning(
+                    "USASpending: CFDA %s FY%d reached page 100 (10K records) "
+                    "for types %s. Results may be truncated.",
+                    cfda, fy, type_group,
+                )
+            return results
 
-                # Safety: 100 pages * 100 results = 10K records per group
-                if page > 100:
-                    logger.warning(
-                        "USASpending: CFDA %s FY%d reached page 100 (10K records) "
-                        "for types %s. Results may be truncated.",
-                        cfda, fy, type_group,
-                    )
-                    break
+        groups = await asyncio.gather(
+            *(fetch_group(g) for g in TRIBAL_AWARD_TYPE_CODE_GROUPS)
+        )
+        all_results = [r for group in groups for r in group]
 
         # Inject fiscal year into each result for downstream processing
         for result in all_results:
@@ -369,9 +381,11 @@ class USASpendingScraper(BaseScraper):
     ) -> dict[str, list[dict]]:
         """Fetch Tribal awards for all CFDAs across a multi-year fiscal year range.
 
-        Queries each (CFDA, fiscal year) pair sequentially with rate limiting
-        to respect API limits. Catches exceptions per-(CFDA, FY) so one failure
-        does not abort the entire batch.
+        Fans out every (CFDA, fiscal year) pair concurrently; the request
+        semaphore and token bucket bound the actual load. Catches exceptions
+        per-(CFDA, FY) so one failure does not abort the entire batch.
+        Results are assembled per CFDA in fiscal-year order regardless of
+        completion order.
 
         Single-writer-per-tribe_id assumption: this method is not designed for
         concurrent invocation with overlapping CFDA sets.
@@ -391,27 +405,36 @@ class USASpendingScraper(BaseScraper):
         if fy_start is None:
             fy_start = FISCAL_YEAR_INT - 4
 
+        pairs = [
+            (cfda, fy)
+            for cfda in CFDA_TO_PROGRAM
+            for fy in range(fy_start, fy_end + 1)
+        ]
+
+        async def fetch_one(
+            session: aiohttp.ClientSession, cfda: str, fy: int,
+        ) -> list[dict]:
+            try:
+                return await self.fetch_tribal_awards_by_year(session, cfda, fy)
+            except Exception:
+                logger.exception(
+                    "USASpending: error fetching Tribal awards for "
+                    "CFDA %s FY%d, continuing",
+                    cfda, fy,
+                )
+                return []
+
+        async with self._create_session() as session:
+            results = await asyncio.gather(
+                *(fetch_one(session, cfda, fy) for cfda, fy in pairs)
+            )
+
         awards_by_cfda: dict[str, list[dict]] = {
             cfda: [] for cfda in CFDA_TO_PROGRAM
         }
-        query_count = 0
-
-        async with self._create_session() as session:
-            for cfda in CFDA_TO_PROGRAM:
-                for fy in range(fy_start, fy_end + 1):
-                    try:
-                        results = await self.fetch_tribal_awards_by_year(
-                            session, cfda, fy,
-                        )
-                        awards_by_cfda[cfda].extend(results)
-                    except Exception:
-                        logger.exception(
-                            "USASpending: error fetching Tribal awards for "
-                            "CFDA %s FY%d, continuing",
-                            cfda, fy,
-                        )
-                    query_count += 1
-                    await asyncio.sleep(0.5)
+        for (cfda, _fy), awards in zip(pairs, results):
+            awards_by_cfda[cfda].extend(awards)
+        query_count = len(pairs)
 
         total = sum(len(v) for v in awards_by_cfda.values())
         fy_count = fy_end - fy_start + 1
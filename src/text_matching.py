@@ -0,0 +1,93 @@
+"""Shared text matching for the scan scorer and the packet reviewer.
+
+KeywordMatcher compiles any number of keyword groups into one regex so a
+text is scanned once, however many keywords there are. It is used by
+src.analysis.relevance (scoring scanned items) and
+src.packets.quality_review (checking rendered DOCX text). It lives here so
+neither layer imports the other.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Hashable
+
+
+class KeywordMatcher:
+    """Single-pass multi-keyword matcher with ``kw in text`` semantics.
+
+    Keywords from any number of groups are merged into one trie-shaped
+    regex. At each match position the regex yields the longest keyword
+    starting there; every shorter keyword that is a prefix of it is also
+    present at that position, so overlapping and nested keywords are all
+    found. ``count()`` returns, per group, how many of that group's
+    keywords (with repeats) occur anywhere in the text -- exactly what
+    ``sum(1 for kw in group if kw in text)`` would give.
+
+    Args:
+        groups: Mapping of group key to keyword list. Keywords are
+            matched case-sensitively; callers lowercase both sides.
+    """
+
+    def __init__(self, groups: dict[Hashable, list[str]]):
+        # keyword -> [(group, multiplicity), ...]
+        weights: dict[str, Counter] = {}
+        self._always: Counter = Counter()
+        for group, keywords in groups.items():
+            for kw in keywords:
+                if kw:
+                    weights.setdefault(kw, Counter())[group] += 1
+                else:
+                    self._always[group] += 1  # "" is in every string
+        self._weights = {kw: list(c.items()) for kw, c in weights.items()}
+
+        # For each keyword, itself plus every other keyword that prefixes it
+        self._implied = {
+            kw: [other for other in weights if kw.startswith(other)]
+            for kw in weights
+        }
+
+        trie: dict = {}
+        for kw in weights:
+            node = trie
+            for ch in kw:
+                node = node.setdefault(ch, {})
+            node[""] = True
+        self._pattern = re.compile(self._trie_regex(trie)) if weights else None
+
+    @classmethod
+    def _trie_regex(cls, node: dict) -> str:
+        """Render a trie as a regex that greedily prefers the longest keyword."""
+        branches = [
+            re.escape(ch) + cls._trie_regex(child)
+            for ch, child in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ""
+        alt = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return "(?:" + alt + ")?"
+        return alt
+
+    def count(self, text: str) -> Counter:
+        """Return keyword hit counts per group for ``text``."""
+        hits = Counter(self._always)
+        if self._pattern is None:
+            return hits
+
+        longest: set[str] = set()
+        search = self._pattern.search
+        pos = 0
+        while True:
+            m = search(text, pos)
+            if m is None:
+                break
+            longest.add(m.group())
+            pos = m.start() + 1
+
+        present: set[str] = set()
+        for kw in longest:
+            present.update(self._implied[kw])
+        for kw in present:
+            for group, n in self._weights[kw]:
+                hits[group] += n
+        return hits
@@ -0,0 +1,71 @@
+"""Shared test doubles for the scraper and resilience tests.
+
+- MockClock: deterministic clock injected into CircuitBreaker,
+  TokenBucket and ResponseCache
+- FakeResponse / FakeSession: aiohttp stand-ins for
+  BaseScraper._request_with_retry
+"""
+
+import asyncio
+
+
+class MockClock:
+    """Deterministic, manually advanced clock. Zero real sleeps."""
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+
+    def __call__(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        self._now += seconds
+
+
+class FakeResponse:
+    """aiohttp response context manager with a fixed status and JSON body.
+
+    Args:
+        status: HTTP status; 400+ raises from ``raise_for_status``.
+        headers: Response headers (e.g. Retry-After).
+        delay: Seconds to sleep on entry, to simulate a slow response.
+        body: JSON body (defaults to ``{"ok": True}``).
+    """
+
+    def __init__(self, status=200, headers=None, delay=0.0, body=None):
+        self.status = status
+        self.headers = headers or {}
+        self.delay = delay
+        self.body = body if body is not None else {"ok": True}
+        self.request_info = None
+        self.history = ()
+
+    async def __aenter__(self):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            import aiohttp
+            raise aiohttp.ClientConnectionError(f"HTTP {self.status}")
+
+    async def json(self):
+        return self.body
+
+
+class FakeSession:
+    """Answers requests with queued responses (the last one repeats)."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def _next(self, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+
+    get = post = _next
@@ -5,7 +5,8 @@ and messaging framework content while Doc B (congressional overview)
 excludes all strategy content and provides evidence-only Key Ask boxes.
 
 Also tests orchestrator multi-doc generation: complete-data Tribes
-produce both Doc A and Doc B; partial-data Tribes produce Doc B only.
+produce both Doc A and Doc B; partial-data Tribes produce Doc B only;
+documents with unchanged input fingerprints are not re-rendered.
 
 All tests use tmp_path fixtures with mock data -- no network or real
 data files required.
@@ -13,7 +14,9 @@ data files required.
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
+from unittest.mock import patch
 
 from docx import Document as DocxDocument
 
@@ -549,6 +552,59 @@ class TestOrchestratorMultiDoc:
         assert len(congressional_files) == 1
 
 
+class TestUnchangedInputsSkip:
+    """Doc A/B renders are skipped when their input fingerprint is unchanged."""
+
+    def _run(self, tmp_path, context=None, **kwargs):
+        from src.packets.orchestrator import PacketOrchestrator
+
+        config = _make_orchestrator_config(tmp_path, tmp_path / "packets")
+        orch = PacketOrchestrator(config, _mock_programs(), **kwargs)
+        tribe = {"tribe_id": "epa_001", "name": "Alpha Tribe", "states": ["WA", "OR"]}
+        with patch.object(
+            orch, "_generate_single_doc", wraps=orch._generate_single_doc,
+        ) as render:
+            paths = orch.generate_tribal_docs(context or _mock_context(), tribe)
+        return paths, render.call_count
+
+    def test_second_run_skips_render(self, tmp_path):
+        first, rendered = self._run(tmp_path)
+        assert rendered == 2
+        state = json.loads(
+            (tmp_path / "packet_state" / "epa_001.json").read_text(encoding="utf-8")
+        )
+        assert set(state["doc_fingerprints"]) == {"A", "B"}
+
+        second, rendered = self._run(tmp_path)
+        assert rendered == 0
+        assert second == first
+
+    def test_changed_input_rerenders(self, tmp_path):
+        self._run(tmp_path)
+        context = _mock_context()
+        context.awards = context.awards + [
+            {"award_id": "NEW-1", "cfda": "15.156", "obligation": 5000.0},
+        ]
+        _, rendered = self._run(tmp_path, context=context)
+        assert rendered == 2
+
+    def test_generated_at_does_not_change_fingerprint(self, tmp_path):
+        self._run(tmp_path)
+        context = _mock_context()
+        context.generated_at = "2030-01-01T00:00:00+00:00"
+        _, rendered = self._run(tmp_path, context=context)
+        assert rendered == 0
+
+    def test_force_and_missing_file_rerender(self, tmp_path):
+        paths, _ = self._run(tmp_path)
+        _, rendered = self._run(tmp_path, force=True)
+        assert rendered == 2
+
+        paths[0].unlink()
+        _, rendered = self._run(tmp_path)
+        assert rendered == 1
+
+
 # ===========================================================================
 # Air gap compliance test
 # ===========================================================================
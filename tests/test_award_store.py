@@ -0,0 +1,131 @@
+"""Tests for the single-file award cache store (src/packets/award_store.py).
+
+Covers:
+- Bulk write / random-access read round trip
+- Appends superseding earlier records
+- Stale or missing index rebuilt from the data file
+- Fallback to, and precedence over, legacy per-Tribe JSON files
+- Writes leaving the legacy files they supersede in place
+- The committed store and the legacy award_cache_path helper
+- Record signatures and the size limit
+- Coverage script reading the store
+"""
+
+import json
+
+import pytest
+
+from src.packets.award_store import INDEX_FILENAME, AwardCacheStore
+
+
+def _record(tribe_id, total=0.0):
+    return {"tribe_id": tribe_id, "tribe_name": tribe_id.upper(), "awards": [],
+            "total_obligation": total, "award_count": 0}
+
+
+class TestStoreReadWrite:
+    """write_all / append / get."""
+
+    def test_round_trip(self, tmp_path):
+        store = AwardCacheStore(tmp_path)
+        assert store.write_all(_record(t, i) for i, t in enumerate(["a", "b", "c"])) == 3
+
+        reader = AwardCacheStore(tmp_path)
+        assert reader.get("b") == _record("b", 1)
+        assert reader.get("missing") is None
+        assert reader.tribe_ids() == ["a", "b", "c"]
+        assert "c" in reader and "missing" not in reader
+
+    def test_append_supersedes(self, tmp_path):
+        store = AwardCacheStore(tmp_path)
+        store.write_all([_record("a"), _record("b")])
+        before = store.signature("a")
+        store.append([_record("a", 5.0), _record("d", 1.0)])
+
+        reader = AwardCacheStore(tmp_path)
+        assert reader.get("a")["total_obligation"] == 5.0
+        assert reader.get("d") == _record("d", 1.0)
+        assert reader.signature("a") != before
+        assert reader.signature("b") == store.signature("b")
+
+    def test_rewrite_replaces_everything(self, tmp_path):
+        store = AwardCacheStore(tmp_path)
+        store.write_all([_record("a"), _record("b")])
+        store.get("a")  # hold a read handle across the rewrite
+        store.write_all([_record("c")])
+        assert store.tribe_ids() == ["c"]
+        assert store.get("a") is None
+
+    def test_stale_index_is_rebuilt(self, tmp_path):
+        store = AwardCacheStore(tmp_path)
+        store.write_all([_record("a"), _record("b")])
+        # An append interrupted before the index was updated
+        with open(store.data_path, "ab") as f:
+            f.write(json.dumps(_record("a", 9.0)).encode() + b"\n")
+        assert AwardCacheStore(tmp_path).get("a")["total_obligation"] == 9.0
+
+        (tmp_path / INDEX_FILENAME).unlink()
+        assert AwardCacheStore(tmp_path).tribe_ids() == ["a", "b"]
+
+
+class TestLegacyLayout:
+    """Per-Tribe ``{tribe_id}.json`` files written before the store."""
+
+    def test_fallback_and_precedence(self, tmp_path):
+        (tmp_path / "old.json").write_text(json.dumps(_record("old", 2.0)), encoding="utf-8")
+        (tmp_path / "a.json").write_text(json.dumps(_record("a", 7.0)), encoding="utf-8")
+        store = AwardCacheStore(tmp_path)
+        assert store.get("old")["total_obligation"] == 2.0
+        assert store.signature("old").startswith("file:")
+
+        store.write_all([_record("a")])
+        assert store.get("a")["total_obligation"] == 0.0
+        assert store.tribe_ids() == ["a", "old"]
+        assert store.get("../a") is None
+
+    def test_writes_leave_legacy_files_in_place(self, tmp_path):
+        for tribe_id in ("a", "b"):
+            (tmp_path / f"{tribe_id}.json").write_text(json.dumps(_record(tribe_id, 3.0)), encoding="utf-8")
+        store = AwardCacheStore(tmp_path)
+
+        store.write_all([_record("a")])
+        store.append([_record("b", 1.0)])
+        assert (tmp_path / "a.json").exists() and (tmp_path / "b.json").exists()
+        assert store.get("a")["total_obligation"] == 0.0
+        assert store.get("b")["total_obligation"] == 1.0
+        assert store.tribe_ids() == ["a", "b"]
+
+    def test_award_cache_path_names_the_legacy_file(self, tmp_path):
+        from src.paths import AWARD_CACHE_DIR, award_cache_path
+
+        assert award_cache_path("epa_1") == AWARD_CACHE_DIR / "epa_1.json"
+        with pytest.raises(ValueError):
+            award_cache_path("../epa_1")
+
+    def test_checked_in_store_covers_every_tribe(self):
+        from src.paths import AWARD_CACHE_DIR
+
+        store = AwardCacheStore(AWARD_CACHE_DIR)
+        assert len(store._load_index()) == 592
+        assert store.tribe_ids() == sorted(store._load_index())
+
+    def test_size_limit_and_corrupt_files(self, tmp_path):
+        (tmp_path / "bad.json").write_text("{not json", encoding="utf-8")
+        store = AwardCacheStore(tmp_path, max_record_bytes=64)
+        store.write_all([_record("big", 1.0), {"tribe_id": "tiny"}])
+        assert store.get("bad") is None
+        assert store.get("big") is None
+        assert store.get("tiny") == {"tribe_id": "tiny"}
+
+
+class TestCoverageScript:
+    """scripts/validate_coverage.py over a store."""
+
+    def test_analyze_awards_reads_store(self, tmp_path):
+        from scripts.validate_coverage import analyze_awards
+
+        AwardCacheStore(tmp_path).write_all([_record("a", 10.0), _record("b")])
+        result = analyze_awards(tmp_path)
+        assert result["total"] == 2
+        assert result["populated"] == 1
+        assert result["zero_ids"] == ["b"]
@@ -11,12 +11,15 @@ Covers:
 
 import json
 
+import pytest
+
 from src.packets.awards import (
     TribalAwardMatcher,
     _compute_trend,
     _determine_award_fy,
     _is_consortium,
 )
+from src.packets.award_store import AwardCacheStore
 
 
 # ── Fixtures ──
@@ -60,6 +63,13 @@ def _make_matcher(tmp_path, tribes, aliases=None):
     return TribalAwardMatcher(config)
 
 
+def _read_cache(tmp_path, tribe_id):
+    """Read a Tribe's record back from the award store."""
+    record = AwardCacheStore(tmp_path / "award_cache").get(tribe_id)
+    assert record is not None
+    return record
+
+
 SAMPLE_TRIBES = [
     {
         "tribe_id": "epa_001",
@@ -405,11 +415,7 @@ class TestWriteCacheEnhancedSchema:
         count = matcher.write_cache(matched, fy_start=2022, fy_end=2026)
         assert count == 1
 
-        cache_path = tmp_path / "award_cache" / "epa_001.json"
-        assert cache_path.exists()
-
-        with open(cache_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_cache(tmp_path, "epa_001")
 
         # Core fields
         assert data["tribe_id"] == "epa_001"
@@ -442,9 +448,7 @@ class TestWriteCacheEnhancedSchema:
         count = matcher.write_cache(matched, fy_start=2022, fy_end=2026)
         assert count == 1
 
-        cache_path = tmp_path / "award_cache" / "epa_001.json"
-        with open(cache_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_cache(tmp_path, "epa_001")
 
         assert data["award_count"] == 0
         assert data["total_obligation"] == 0.0
@@ -483,9 +487,7 @@ class TestWriteCacheEnhancedSchema:
         }
 
         matcher.write_cache(matched, fy_start=2022, fy_end=2026)
-        cache_path = tmp_path / "award_cache" / "epa_001.json"
-        with open(cache_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_cache(tmp_path, "epa_001")
 
         assert data["trend"] == "increasing"
 
@@ -494,9 +496,7 @@ class TestWriteCacheEnhancedSchema:
         matcher = _make_matcher(tmp_path, SAMPLE_TRIBES[:1])
         matcher.write_cache({}, fy_start=2022, fy_end=2026)
 
-        cache_path = tmp_path / "award_cache" / "epa_001.json"
-        with open(cache_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_cache(tmp_path, "epa_001")
 
         assert data["trend"] == "none"
 
@@ -527,9 +527,7 @@ class TestWriteCacheEnhancedSchema:
         }
 
         matcher.write_cache(matched, fy_start=2022, fy_end=2026)
-        cache_path = tmp_path / "award_cache" / "epa_001.json"
-        with open(cache_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_cache(tmp_path, "epa_001")
 
         yearly = data["yearly_obligations"]
         assert yearly["2024"] == 150000.0  # FY24-A + FY24-B
@@ -553,19 +551,15 @@ class TestWriteCacheEnhancedSchema:
         }
 
         count = matcher.write_cache(matched, fy_start=2022, fy_end=2026)
-        assert count == 3  # One file per Tribe
+        assert count == 3  # One record per Tribe
 
         # Navajo has awards
-        navajo_path = tmp_path / "award_cache" / "epa_001.json"
-        with open(navajo_path, "r", encoding="utf-8") as f:
-            navajo = json.load(f)
+        navajo = _read_cache(tmp_path, "epa_001")
         assert navajo["award_count"] == 1
         assert "no_awards_context" not in navajo
 
         # Muckleshoot has no awards
-        muck_path = tmp_path / "award_cache" / "epa_002.json"
-        with open(muck_path, "r", encoding="utf-8") as f:
-            muck = json.load(f)
+        muck = _read_cache(tmp_path, "epa_002")
         assert muck["award_count"] == 0
         assert "no_awards_context" in muck
 
@@ -659,3 +653,132 @@ class TestMatchAllAwardsConsortium:
 
         matcher.match_all_awards(awards_by_cfda)
         assert matcher._last_consortium_awards == []
+
+
+# ── Tier 2 blocked fuzzy matching ──
+
+
+def _reference_tier2(tribes, recipient_name, recipient_state, threshold):
+    """Unblocked registry scan that Tier 2 matching must reproduce exactly."""
+    from rapidfuzz import fuzz
+
+    normalized = recipient_name.strip().lower()
+    best_match, best_score = None, 0.0
+    for tribe in tribes:
+        for name in [tribe["name"]] + tribe.get("alternate_names", []):
+            score = fuzz.token_sort_ratio(normalized, name.lower())
+            if score < threshold:
+                continue
+            if recipient_state and tribe.get("states"):
+                if recipient_state.upper() not in tribe["states"]:
+                    continue
+            if score > best_score:
+                best_score, best_match = score, tribe
+    return best_match["tribe_id"] if best_match else None
+
+
+BLOCKING_TRIBES = SAMPLE_TRIBES + [
+    {
+        "tribe_id": "epa_004",
+        "name": "Muckleshoot Indian Tribe",  # same name, different state
+        "states": ["OR"],
+        "alternate_names": [],
+    },
+    {
+        "tribe_id": "epa_005",
+        "name": "Navajo Nation Chapter",
+        "states": [],  # no states: never filtered by state guard
+        "alternate_names": ["Navajo Chapter Nation"],
+    },
+    {
+        "tribe_id": "epa_006",
+        "name": "Standing Rock Sioux Tribe of North Dakota",
+        "states": ["ND"],
+        "alternate_names": ["Standing Rock Sioux"],
+    },
+]
+
+BLOCKING_RECIPIENTS = [
+    ("NAVAJO NATION", None),
+    ("NAVAJO NATION, AZ", "AZ"),
+    ("Navajo Nation", "WA"),
+    ("NAVAJO NATON", "NM"),
+    ("MUCKLESHOOT INDIAN TRIBE", None),
+    ("MUCKLESHOOT INDIAN TRIBE", "OR"),
+    ("muckleshoot indian tribe", "wa"),
+    ("INDIAN TRIBE MUCKLESHOOT", "WA"),
+    ("STANDING ROCK SIOUX", "SD"),
+    ("STANDING ROCK SIOUX", "ND"),
+    ("STANDING ROCK SIOUX TRIBE", None),
+    ("NAVAJO CHAPTER NATION", "TX"),
+    ("COMPLETELY UNRELATED RECIPIENT", None),
+    ("COMPLETELY UNRELATED RECIPIENT", "AZ"),
+]
+
+
+class TestBlockedFuzzyMatching:
+    """Tier 2 blocking, batch scoring, and memo reproduce the full scan."""
+
+    def test_matches_reference_scan(self, tmp_path):
+        matcher = _make_matcher(tmp_path, BLOCKING_TRIBES)
+        for threshold in (70, 85, 95):
+            matcher.fuzzy_threshold = threshold
+            for name, state in BLOCKING_RECIPIENTS:
+                result = matcher.match_recipient_to_tribe(name, state)
+                got = result["tribe_id"] if result else None
+                expected = _reference_tier2(BLOCKING_TRIBES, name, state, threshold)
+                assert got == expected, (name, state, threshold)
+
+    def test_batch_prime_matches_reference_scan(self, tmp_path):
+        matcher = _make_matcher(tmp_path, BLOCKING_TRIBES)
+        queries = {
+            (name.strip().lower(), state.upper() if state else None)
+            for name, state in BLOCKING_RECIPIENTS
+        }
+        matcher._prime_fuzzy_memo(queries)
+        for name, state in BLOCKING_RECIPIENTS:
+            key = (name.strip().lower(), state.upper() if state else None, 85)
+            cached = matcher._fuzzy_memo[key]
+            got = cached["tribe_id"] if cached else None
+            assert got == _reference_tier2(BLOCKING_TRIBES, name, state, 85), (name, state)
+
+    def test_candidates_respect_state_guard(self, tmp_path):
+        matcher = _make_matcher(tmp_path, BLOCKING_TRIBES)
+        index = matcher._fuzzy_index()
+        positions = index.candidates("muckleshoot indian tribe", "OR", 85)
+        assert {index.tribes[p]["tribe_id"] for p in positions} == {"epa_004"}
+
+    def test_candidates_skip_unrelated_names(self, tmp_path):
+        matcher = _make_matcher(tmp_path, BLOCKING_TRIBES)
+        index = matcher._fuzzy_index()
+        positions = index.candidates("navajo naton", None, 85)
+        assert positions and len(positions) < len(index.names)
+        assert {index.tribes[p]["tribe_id"] for p in positions} <= {"epa_001", "epa_005"}
+        assert index.candidates("completely unrelated recipient", None, 85) == []
+
+    def test_tier2_match_is_read_only(self, tmp_path):
+        matcher = _make_matcher(tmp_path, SAMPLE_TRIBES)
+        tribe = matcher.match_recipient_to_tribe("NAVAJO NATON", "AZ")
+        assert tribe["tribe_id"] == "epa_001"
+        with pytest.raises(TypeError):
+            tribe["name"] = "Changed"
+
+    def test_repeat_recipients_use_memo(self, tmp_path, monkeypatch):
+        matcher = _make_matcher(tmp_path, SAMPLE_TRIBES)
+        index = matcher._fuzzy_index()
+        calls = []
+        original = index.candidates
+
+        def counting_candidates(normalized, state, threshold):
+            calls.append(normalized)
+            return original(normalized, state, threshold)
+
+        monkeypatch.setattr(index, "candidates", counting_candidates)
+        awards = {
+            cfda: [{"Award ID": f"{cfda}-{i}", "Recipient Name": "NAVAJO NATON"}
+                   for i in range(3)]
+            for cfda in ("15.156", "97.047")
+        }
+        matched = matcher.match_all_awards(awards)
+        assert len(matched["epa_001"]) == 6
+        assert calls == ["navajo naton"]  # one batch-scoring pass, then memo hits
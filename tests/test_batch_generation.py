@@ -222,6 +222,7 @@ def _build_batch_config(tmp_path: Path, tribe_count: int) -> dict:
             "ecoregion": {"data_path": str(tmp_path / "ecoregion_config.json")},
             "congressional_cache": {"data_path": str(tmp_path / "congressional_cache.json")},
             "output_dir": str(output_dir),
+            "state_dir": str(tmp_path / "packet_state"),
             "awards": {
                 "alias_path": str(tmp_path / "tribal_aliases.json"),
                 "cache_dir": str(award_dir),
@@ -374,6 +375,8 @@ class TestBatchGeneration:
         assert result["total"] == 3
         assert result["duration_s"] > 0
         assert result["success"] + result["errors"] == result["total"]
+        assert result["render_timings"]["documents"] >= 3
+        assert result["render_timings"]["save"] > 0
 
     def test_batch_strategic_overview_called(self, batch_config_3):
         """generate_strategic_overview() is called once after batch."""
@@ -387,6 +390,72 @@ class TestBatchGeneration:
         orch.generate_strategic_overview.assert_called_once()
 
 
+class TestParallelBatchGeneration:
+    """Tests for run_all_tribes(workers=N) process-pool mode."""
+
+    def test_parallel_matches_sequential_counts(self, batch_config_3):
+        """Process-pool mode produces the same docs and counters as serial mode."""
+        orch = _make_orchestrator(batch_config_3)
+        orch.generate_strategic_overview = MagicMock(
+            return_value=Path("STRATEGIC-OVERVIEW.docx")
+        )
+
+        result = orch.run_all_tribes(workers=2)
+
+        congressional_dir = batch_config_3["output_dir"] / "congressional"
+        assert len(list(congressional_dir.glob("*.docx"))) == 3
+        assert result["workers"] == 2
+        assert result["success"] == 3
+        assert result["errors"] == 0
+        assert result["doc_b_count"] == 3
+        # Per-Tribe render timings come back from the workers
+        assert result["render_timings"]["documents"] >= 3
+        assert result["render_timings"]["template_clone"] > 0
+
+    def test_parallel_returns_contexts_for_regional_docs(self, batch_config_3):
+        """Contexts built in workers are handed back to generate_regional_docs."""
+        orch = _make_orchestrator(batch_config_3)
+        orch.generate_strategic_overview = MagicMock(
+            return_value=Path("STRATEGIC-OVERVIEW.docx")
+        )
+        orch.generate_regional_docs = MagicMock(return_value={})
+
+        orch.run_all_tribes(workers=2)
+
+        contexts = orch.generate_regional_docs.call_args.kwargs["prebuilt_contexts"]
+        assert sorted(contexts) == ["epa_001", "epa_002", "epa_003"]
+        assert contexts["epa_002"].tribe_name == "Test Tribe 2"
+
+    def test_parallel_error_isolation(self, batch_config_3):
+        """A Tribe failing inside a worker is counted without halting others."""
+        registry_path = batch_config_3["tmp_path"] / "tribal_registry.json"
+        registry = json.loads(registry_path.read_text(encoding="utf-8"))
+        registry["tribes"][1]["tribe_id"] = "bad id!"  # rejected by _sanitize_tribe_id
+        _write_json(registry_path, registry)
+
+        orch = _make_orchestrator(batch_config_3)
+        orch.generate_strategic_overview = MagicMock(
+            return_value=Path("STRATEGIC-OVERVIEW.docx")
+        )
+
+        result = orch.run_all_tribes(workers=2)
+
+        assert result["success"] == 2
+        assert result["errors"] == 1
+        assert result["total"] == 3
+
+    def test_workers_clamped_to_tribe_count(self, batch_config_3):
+        """Requesting more workers than Tribes does not over-provision."""
+        orch = _make_orchestrator(batch_config_3)
+        orch.generate_strategic_overview = MagicMock(
+            return_value=Path("STRATEGIC-OVERVIEW.docx")
+        )
+
+        result = orch.run_all_tribes(workers=16)
+
+        assert result["workers"] == 3
+
+
 class TestSingleTribeGeneration:
     """OPS-02 verification: run_single_tribe() produces full DOCX."""
 
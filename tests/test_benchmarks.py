@@ -0,0 +1,132 @@
+"""Tests for the benchmark suite (benchmarks/).
+
+Covers:
+- SyntheticWorld determinism and scaling
+- Written world files load through the pipeline classes
+- Scenarios run at tiny scale and report item counts
+- Baseline comparison: regressions, parameter mismatch, CLI exit codes
+"""
+
+import json
+from datetime import date
+
+import pytest
+
+from benchmarks.run import compare, main, run_suite, time_scenario
+from benchmarks.scenarios import SCENARIOS, BenchContext
+from benchmarks.synthetic import BASE_TRIBES, SyntheticWorld
+
+TODAY = date(2026, 3, 1)
+
+
+@pytest.fixture(scope="module")
+def tiny_world():
+    return SyntheticWorld(scale=0.02, seed=3, today=TODAY)
+
+
+class TestSyntheticWorld:
+    """SyntheticWorld generation."""
+
+    def test_same_seed_same_data(self, tiny_world):
+        again = SyntheticWorld(scale=0.02, seed=3, today=TODAY)
+        assert again.tribes == tiny_world.tribes
+        assert again.scan_items == tiny_world.scan_items
+        assert again.awards_by_cfda == tiny_world.awards_by_cfda
+        assert again.bills == tiny_world.bills
+
+    def test_different_seed_differs(self, tiny_world):
+        other = SyntheticWorld(scale=0.02, seed=4, today=TODAY)
+        assert other.scan_items != tiny_world.scan_items
+
+    def test_sizes_scale_linearly(self, tiny_world):
+        sizes = tiny_world.sizes()
+        assert sizes["tribes"] == round(BASE_TRIBES * 0.02)
+        assert sizes["scan_items"] == 40 and sizes["awards"] == 80 and sizes["bills"] == 6
+        assert len({t["tribe_id"] for t in tiny_world.tribes}) == sizes["tribes"]
+        assert len({t["name"] for t in tiny_world.tribes}) == sizes["tribes"]
+
+    def test_programs_copied_with_unique_ids_past_inventory(self):
+        world = SyntheticWorld(scale=2.5, seed=1, today=TODAY)
+        ids = [p["id"] for p in world.programs]
+        assert len(ids) == len(set(ids)) > 18
+
+    def test_cosponsors_are_delegation_members(self, tiny_world):
+        for bill in tiny_world.bills:
+            assert bill["cosponsor_count"] == len(bill["cosponsors"])
+            assert all(c["bioguide_id"] in tiny_world.members for c in bill["cosponsors"])
+
+    def test_written_files_load(self, tiny_world, tmp_path):
+        from src.packets.award_store import AwardCacheStore
+        from src.packets.registry import TribalRegistry
+
+        files = tiny_world.write(tmp_path, tribes=tiny_world.tribes[:3])
+        registry = TribalRegistry({"packets": {"tribal_registry": {"data_path": str(files.registry)}}})
+        assert len(registry.get_all()) == 3
+        store = AwardCacheStore(files.award_cache_dir)
+        assert sorted(store.tribe_ids()) == sorted(t["tribe_id"] for t in tiny_world.tribes[:3])
+        assert len(list(files.hazard_dir.glob("*.json"))) == 3
+
+
+class TestScenarios:
+    """Scenario setup/run at tiny scale."""
+
+    def test_cheap_scenarios_report_items(self, tiny_world, tmp_path):
+        ctx = BenchContext(world=tiny_world, root=tmp_path)
+        assert SCENARIOS["score_items"].setup(ctx)() == 40
+        assert SCENARIOS["graph_build"].setup(ctx)() == len(ctx.scored())
+        assert SCENARIOS["match_awards"].setup(ctx)() == 80
+
+    def test_packet_scenarios(self, tiny_world, tmp_path):
+        ctx = BenchContext(world=tiny_world, root=tmp_path, packet_fraction=0.1)
+        assert SCENARIOS["run_all_tribes"].setup(ctx)() == 2
+        assert SCENARIOS["review_batch"].setup(ctx)() > 0
+        assert not (tmp_path / "world").exists()
+
+    def test_time_scenario(self):
+        calls = []
+        result = time_scenario(lambda: calls.append(1) or 10, repeat=3, warmup=2)
+        assert len(calls) == 5 and len(result["runs"]) == 3
+        assert result["items"] == 10 and result["min_s"] <= result["median_s"]
+
+
+class TestCompare:
+    """compare / main --compare."""
+
+    @staticmethod
+    def _results(scale=1.0, **medians):
+        return {
+            "params": {"scale": scale, "seed": 7, "packet_fraction": 0.1, "workers": 1},
+            "scenarios": {n: {"median_s": m} for n, m in medians.items()},
+        }
+
+    def test_flags_only_slowdowns_above_threshold(self):
+        base = self._results(score_items=1.0, graph_build=1.0, match_awards=1.0)
+        current = self._results(score_items=1.1, graph_build=1.5, match_awards=0.5, review_batch=9.0)
+        regressions = compare(current, base, threshold=0.2)
+        assert [r["scenario"] for r in regressions] == ["graph_build"]
+        assert regressions[0]["change"] == pytest.approx(0.5)
+
+    def test_parameter_mismatch_raises(self):
+        with pytest.raises(ValueError, match="scale"):
+            compare(self._results(scale=10.0, graph_build=1.0), self._results(graph_build=1.0))
+
+    def test_cli_exit_codes(self, tmp_path, capsys):
+        results = run_suite(["score_items"], scale=0.01, repeat=1, warmup=0)
+        assert results["sizes"]["tribes"] == 6
+        base = tmp_path / "base.json"
+        slow = dict(results, scenarios={"score_items": {"median_s": 1e-9}})
+        base.write_text(json.dumps(slow), encoding="utf-8")
+        out = tmp_path / "out.json"
+
+        args = ["--scenario", "score_items", "--scale", "0.01", "--repeat", "1",
+                "--output", str(out), "--compare", str(base)]
+        assert main(args) == 1
+        assert "REGRESSION: score_items" in capsys.readouterr().out
+        assert json.loads(out.read_text(encoding="utf-8"))["params"]["scale"] == 0.01
+
+        base.write_text(json.dumps(dict(slow, params={**slow["params"], "seed": 1})), encoding="utf-8")
+        assert main(args) == 2
+
+        slow["scenarios"]["score_items"]["median_s"] = 1e6
+        base.write_text(json.dumps(slow), encoding="utf-8")
+        assert main(args) == 0
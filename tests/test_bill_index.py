@@ -0,0 +1,210 @@
+"""Tests for the congressional bill inverted index.
+
+BillIndex-backed ``_filter_bills_for_tribe`` and ``_get_delegation_activity``
+must return exactly what a scan of every bill returns, including ordering
+of relevance ties and repeated cosponsor listings.
+"""
+
+import json
+import random
+from unittest.mock import MagicMock
+
+from src.packets.bill_index import BillIndex
+from src.packets.context import TribePacketContext
+from src.packets.orchestrator import PacketOrchestrator
+from src.packets.regional import RegionalAggregator
+
+
+def _bill(bill_id, sponsor_bg="", state="", cosponsors=(), programs=(),
+          score=0.5, committees=()):
+    return {
+        "bill_id": bill_id,
+        "title": f"Title {bill_id}",
+        "sponsor": {"bioguide_id": sponsor_bg, "state": state, "name": sponsor_bg},
+        "cosponsors": [{"bioguide_id": bg} for bg in cosponsors],
+        "matched_programs": list(programs),
+        "relevance_score": score,
+        "committees": list(committees),
+    }
+
+
+def _orchestrator(bills: list[dict]) -> PacketOrchestrator:
+    orch = PacketOrchestrator.__new__(PacketOrchestrator)
+    orch._congressional_intel = {"metadata": {}, "bills": bills}
+    orch._bill_index = None
+    return orch
+
+
+def _context(states, senators=(), reps=()):
+    return TribePacketContext(
+        tribe_id="t1", tribe_name="Tribe One", states=list(states),
+        senators=[{"bioguide_id": bg, "formatted_name": bg,
+                   "committees": [{"committee_name": "SCIA"}] if bg == "S1" else []}
+                  for bg in senators],
+        representatives=[{"bioguide_id": bg, "formatted_name": bg}
+                         for bg in reps],
+    )
+
+
+def _naive_filter(bills, context, relevant_program_ids=None):
+    """Pre-index filtering logic."""
+    states = set(context.states or [])
+    bioguides = {m["bioguide_id"] for m in context.senators + context.representatives
+                 if m.get("bioguide_id")}
+    relevant = set(relevant_program_ids or [])
+    matched = []
+    for bill in bills:
+        sponsor = bill.get("sponsor", {}) or {}
+        if (
+            (relevant and set(bill.get("matched_programs", [])) & relevant)
+            or sponsor.get("bioguide_id") in bioguides
+            or any(cs.get("bioguide_id") in bioguides for cs in bill.get("cosponsors", []))
+            or sponsor.get("state", "") in states
+        ):
+            matched.append(bill)
+    matched.sort(key=lambda b: b.get("relevance_score", 0), reverse=True)
+    return matched
+
+
+def _naive_activity(bills, context):
+    """Pre-index delegation activity (sponsored/cosponsored bill IDs)."""
+    members = [m["bioguide_id"] for m in context.senators + context.representatives]
+    result = {bg: ([], []) for bg in members}
+    for bill in bills:
+        sp = (bill.get("sponsor", {}) or {}).get("bioguide_id", "")
+        if sp in result:
+            result[sp][0].append(bill["bill_id"])
+        for cs in bill.get("cosponsors", []):
+            if cs.get("bioguide_id") in result:
+                result[cs["bioguide_id"]][1].append(bill["bill_id"])
+    return result
+
+
+class TestBillIndex:
+    """Posting-list lookups."""
+
+    def test_positions_union_in_file_order(self):
+        bills = [
+            _bill("a", sponsor_bg="S1"),
+            _bill("b", state="WA"),
+            _bill("c", cosponsors=["R1"]),
+            _bill("d", programs=["bia_tcr"]),
+            _bill("e", sponsor_bg="X9", state="TX"),
+        ]
+        index = BillIndex(bills)
+        assert index.positions_for(bioguides={"S1", "R1"}, states={"WA"},
+                                   program_ids={"bia_tcr"}) == [0, 1, 2, 3]
+        assert index.bills_for() == []
+
+    def test_member_activity_keeps_repeated_cosponsor_listings(self):
+        index = BillIndex([_bill("a", sponsor_bg="S1", cosponsors=["S1", "R1", "R1"])])
+        sponsored, cosponsored = index.member_activity("R1")
+        assert sponsored == []
+        assert [b["bill_id"] for b in cosponsored] == ["a", "a"]
+
+    def test_committee_lookup_by_name_code_or_cache_id(self):
+        bills = [
+            _bill("a", committees=[{"name": "Indian Affairs", "systemCode": "slia00"}]),
+            {"bill_id": "b", "committees": {"item": [{"name": "Indian Affairs"}]}},
+            _bill("c", committees=[{"name": "Interior", "systemCode": "hsii24"}]),
+        ]
+        index = BillIndex(bills)
+        assert [b["bill_id"] for b in index.bills_for_committee("Indian Affairs")] == ["a", "b"]
+        assert [b["bill_id"] for b in index.bills_for_committee("slia00")] == ["a"]
+        assert [b["bill_id"] for b in index.bills_for_committee("SLIA")] == ["a"]
+        assert index.committee_positions(["HSII24", "SLIA", ""]) == [0, 2]
+
+    def test_missing_sponsor_state_not_posted(self):
+        index = BillIndex([_bill("a"), {"bill_id": "b", "sponsor": {"state": None}}])
+        assert index._by_state == {}
+
+
+class TestOrchestratorUsesIndex:
+    """Per-Tribe results match the full-scan implementation."""
+
+    def test_randomized_equivalence(self):
+        rng = random.Random(11)
+        members = ["S1", "S2", "R1", "R2", "R3", ""]
+        states = ["WA", "OR", "AK", ""]
+        bills = [
+            _bill(
+                f"b{i}",
+                sponsor_bg=rng.choice(members),
+                state=rng.choice(states),
+                cosponsors=rng.sample(members, rng.randint(0, 3)) * rng.randint(1, 2),
+                programs=rng.sample(["bia_tcr", "fema_bric", "epa_gap"], rng.randint(0, 2)),
+                score=rng.choice([0.2, 0.5, 0.8]),
+            )
+            for i in range(120)
+        ]
+        orch = _orchestrator(bills)
+        for _ in range(40):
+            context = _context(
+                rng.sample(["WA", "OR", "AK", "TX"], rng.randint(0, 2)),
+                senators=rng.sample(["S1", "S2", "S3"], rng.randint(0, 2)),
+                reps=rng.sample(["R1", "R2", "R9"], rng.randint(0, 1)),
+            )
+            programs = rng.choice([None, ["fema_bric"], ["bia_tcr", "epa_gap"]])
+
+            got = orch._filter_bills_for_tribe(context, programs)
+            assert [b["bill_id"] for b in got] == [
+                b["bill_id"] for b in _naive_filter(bills, context, programs)
+            ]
+
+            activity = orch._get_delegation_activity(context)
+            for bg, (sponsored, cosponsored) in _naive_activity(bills, context).items():
+                if not (sponsored or cosponsored or bg == "S1"):
+                    assert bg not in activity
+                    continue
+                assert [r["bill_id"] for r in activity[bg]["sponsored"]] == sponsored
+                assert [r["bill_id"] for r in activity[bg]["cosponsored"]] == cosponsored
+
+    def test_index_built_once_and_rebuilt_on_reload(self):
+        orch = _orchestrator([_bill("a", state="WA")])
+        first = orch.get_bill_index()
+        orch._filter_bills_for_tribe(_context(["WA"]))
+        assert orch.get_bill_index() is first
+
+        orch._congressional_intel = {"bills": [_bill("b", state="WA")]}
+        assert [b["bill_id"] for b in orch._filter_bills_for_tribe(_context(["WA"]))] == ["b"]
+
+    def test_no_intel_returns_empty(self):
+        orch = _orchestrator([])
+        assert orch._filter_bills_for_tribe(_context(["WA"], senators=["S1"])) == []
+        assert orch._get_delegation_activity(_context(["WA"], senators=["S1"])) == {}
+
+
+class TestRegionalAggregatorReuse:
+    """RegionalAggregator counts committee bills from a shared index."""
+
+    def test_overlap_carries_committee_bill_counts(self, tmp_path):
+        config = tmp_path / "regional_config.json"
+        config.write_text(json.dumps({"regions": {"pnw": {"states": ["WA"]}}}),
+                          encoding="utf-8")
+        index = BillIndex([
+            _bill("a", committees=[{"name": "Indian Affairs", "systemCode": "slia00"}]),
+            _bill("b", committees=[
+                {"name": "Indian Affairs", "systemCode": "slia00"},
+                {"name": "Appropriations", "systemCode": "ssap00"},
+            ]),
+            _bill("c", committees=[{"name": "Energy", "systemCode": "sseg00"}]),
+        ])
+        senator = {
+            "bioguide_id": "S1", "formatted_name": "Sen. One",
+            "committees": [
+                {"committee_id": "SLIA", "committee_name": "Senate Committee on Indian Affairs"},
+                {"committee_id": "SSAP", "committee_name": "Senate Committee on Appropriations"},
+            ],
+        }
+        contexts = [
+            TribePacketContext(tribe_id=tid, tribe_name=tid, states=["WA"], senators=[senator])
+            for tid in ("t1", "t2")
+        ]
+
+        overlap, _, _ = RegionalAggregator(
+            config, MagicMock(), bill_index=index,
+        )._find_delegation_overlap(contexts)
+        assert overlap[0]["committee_bills"] == 2
+
+        overlap, _, _ = RegionalAggregator(config, MagicMock())._find_delegation_overlap(contexts)
+        assert "committee_bills" not in overlap[0]
@@ -12,7 +12,11 @@ from unittest.mock import MagicMock
 import pytest
 from docx import Document
 
-from src.packets.change_tracker import MAX_STATE_FILE_SIZE, PacketChangeTracker
+from src.packets.change_tracker import (
+    MAX_STATE_FILE_SIZE,
+    PacketChangeTracker,
+    document_fingerprint,
+)
 from src.packets.context import TribePacketContext
 from src.packets.docx_sections import render_change_tracking
 
@@ -409,3 +413,28 @@ class TestComputeCurrentIntegration:
         assert state["program_states"]["prog_a"] == "active"
         assert state["program_states"]["prog_b"] == "at_risk"
         assert state["advocacy_goal"] == "renewal"
+
+
+# ---------------------------------------------------------------------------
+# Per-document input fingerprint
+# ---------------------------------------------------------------------------
+
+
+class TestDocumentFingerprint:
+    def test_stable_and_input_sensitive(self) -> None:
+        ctx = _make_context(awards=[{"obligation": 100.0}])
+        base = document_fingerprint(ctx, "A", "r1", relevant=[{"id": "prog_a"}])
+        assert base == document_fingerprint(ctx, "A", "r1", relevant=[{"id": "prog_a"}])
+        assert base != document_fingerprint(ctx, "B", "r1", relevant=[{"id": "prog_a"}])
+        assert base != document_fingerprint(ctx, "A", "r2", relevant=[{"id": "prog_a"}])
+        assert base != document_fingerprint(ctx, "A", "r1", relevant=[{"id": "prog_b"}])
+
+        changed = _make_context(awards=[{"obligation": 200.0}])
+        assert base != document_fingerprint(changed, "A", "r1", relevant=[{"id": "prog_a"}])
+
+    def test_ignores_generated_at(self) -> None:
+        a = _make_context()
+        b = _make_context()
+        a.generated_at = "2026-01-01T00:00:00+00:00"
+        b.generated_at = "2026-02-01T00:00:00+00:00"
+        assert document_fingerprint(a, "A", "r") == document_fingerprint(b, "A", "r")
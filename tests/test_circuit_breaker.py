@@ -6,29 +6,25 @@ Covers all 4 state transitions:
   HALF_OPEN -> CLOSED (successful probe)
   HALF_OPEN -> OPEN (failed probe)
 
-Plus config integration with BaseScraper, per-source cache, and health checks.
+Plus config integration with BaseScraper, breaker and Retry-After state
+persisted across runs, per-source cache, and health checks.
 """
 
+import asyncio
 import json
 import logging
 import os
+import time
 from datetime import datetime, timedelta, timezone
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
-from src.scrapers.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
-
-
-class MockClock:
-    """Deterministic clock for circuit breaker testing. Zero real sleeps."""
-
-    def __init__(self, start: float = 0.0):
-        self._now = start
-
-    def __call__(self) -> float:
-        return self._now
+import pytest
 
-    def advance(self, seconds: float) -> None:
-        self._now += seconds
+from src.scrapers.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from src.scrapers.latency import ScanDeadlineExceeded
+from src.scrapers.rate_limiter import HourlyQuota
+from src.scrapers.resilience_state import ResilienceStateStore
+from tests.conftest import FakeResponse, FakeSession, MockClock
 
 
 # ── State machine unit tests ──
@@ -264,6 +260,218 @@ class TestBaseScraperCircuitBreakerIntegration:
         assert scraper.backoff_base >= 1
 
 
+# ── Persisted state across runs ──
+
+
+def _persisting_config(tmp_path, **resilience):
+    return {"resilience": {
+        "persist_state": True, "state_path": str(tmp_path / "state.json"),
+        "max_retries": 3, "circuit_breaker": {"failure_threshold": 1, "recovery_timeout": 60},
+        **resilience,
+    }}
+
+
+def _request(scraper, session):
+    return asyncio.run(scraper._request_with_retry(session, "GET", "http://api.invalid/x"))
+
+
+class TestBreakerSnapshot:
+    """CircuitBreaker.snapshot / restore."""
+
+    def test_round_trip_keeps_failure_age(self):
+        clock = MockClock(start=1000.0)
+        cb = CircuitBreaker("src", failure_threshold=2, recovery_timeout=60, clock=clock)
+        cb.record_failure()
+        cb.record_failure()
+        clock.advance(15)
+        snap = cb.snapshot()
+        assert snap == {"state": "open", "failure_count": 2, "seconds_since_failure": 15.0}
+
+        other_clock = MockClock(start=5.0)  # a new process's monotonic clock
+        restored = CircuitBreaker("src", recovery_timeout=60, clock=other_clock)
+        restored.restore(CircuitState.OPEN, 2, snap["seconds_since_failure"])
+        assert restored.state == CircuitState.OPEN
+        other_clock.advance(45)
+        assert restored.state == CircuitState.HALF_OPEN
+
+    def test_clean_breaker_has_no_failure_age(self):
+        assert CircuitBreaker("src", clock=MockClock()).snapshot()["seconds_since_failure"] is None
+
+
+class TestResilienceStateStore:
+    """ResilienceStateStore persistence with an injected wall clock."""
+
+    def test_open_breaker_survives_restart(self, tmp_path):
+        wall = MockClock(start=1_700_000_000.0)
+        path = tmp_path / "state.json"
+        cb = CircuitBreaker("congress_gov", failure_threshold=1, recovery_timeout=600, clock=MockClock())
+        cb.record_failure()
+        ResilienceStateStore(path, clock=wall).record_breaker(cb)
+
+        wall.advance(120)  # next cron run two minutes later
+        fresh = CircuitBreaker("congress_gov", recovery_timeout=600, clock=MockClock(start=50.0))
+        ResilienceStateStore(path, clock=wall).restore_breaker(fresh)
+        assert fresh.state == CircuitState.OPEN
+
+        wall.advance(600)
+        later = CircuitBreaker("congress_gov", recovery_timeout=600, clock=MockClock())
+        ResilienceStateStore(path, clock=wall).restore_breaker(later)
+        assert later.state == CircuitState.HALF_OPEN
+
+    def test_recovery_clears_stored_failures(self, tmp_path):
+        path = tmp_path / "state.json"
+        store = ResilienceStateStore(path, clock=MockClock(start=1e9))
+        cb = CircuitBreaker("src", failure_threshold=5, clock=MockClock())
+        cb.record_failure()
+        store.record_breaker(cb)
+        cb.record_success()
+        store.record_breaker(cb)
+
+        entry = json.loads(path.read_text(encoding="utf-8"))["sources"]["src"]
+        assert entry["state"] == "closed" and entry["failure_count"] == 0
+        assert entry["last_failure_at"] is None
+
+    def test_unchanged_closed_breaker_not_written(self, tmp_path):
+        path = tmp_path / "state.json"
+        ResilienceStateStore(path).record_breaker(CircuitBreaker("src", clock=MockClock()))
+        assert not path.exists()
+
+    def test_retry_after_deadline(self, tmp_path):
+        wall = MockClock(start=1e9)
+        path = tmp_path / "state.json"
+        ResilienceStateStore(path, clock=wall).record_retry_after("grants_gov", 90)
+
+        wall.advance(30)
+        store = ResilienceStateStore(path, clock=wall)
+        assert store.retry_after_remaining("grants_gov") == pytest.approx(60)
+        assert store.retry_after_remaining("usaspending") == 0.0
+        wall.advance(100)
+        assert store.retry_after_remaining("grants_gov") == 0.0
+
+    def test_save_keeps_other_processes_sources(self, tmp_path):
+        path = tmp_path / "state.json"
+        first = ResilienceStateStore(path, clock=MockClock(start=1e9))
+        second = ResilienceStateStore(path, clock=MockClock(start=1e9))
+        first.record_retry_after("a", 10)
+        second.record_retry_after("b", 10)
+        assert set(json.loads(path.read_text(encoding="utf-8"))["sources"]) == {"a", "b"}
+
+    def test_quota_counts_carry_over_to_next_run(self, tmp_path):
+        wall = MockClock(start=1e9)
+        path = tmp_path / "state.json"
+        quota = HourlyQuota(100, clock=wall)
+        for _ in range(30):
+            quota.try_acquire()
+        ResilienceStateStore(path, clock=wall).record_quota("congress_gov", quota, force=True)
+
+        wall.advance(600)
+        next_run = HourlyQuota(100, clock=wall)
+        ResilienceStateStore(path, clock=wall).restore_quota("congress_gov", next_run)
+        assert next_run.used() == 30
+
+    def test_quota_saves_are_throttled(self, tmp_path):
+        wall = MockClock(start=1e9)
+        path = tmp_path / "state.json"
+        store = ResilienceStateStore(path, clock=wall)
+        quota = HourlyQuota(100, clock=wall)
+
+        def saved():
+            entry = json.loads(path.read_text(encoding="utf-8"))["sources"]["src"]
+            return sum(entry["quota_minutes"].values())
+
+        quota.try_acquire()
+        store.record_quota("src", quota)
+        quota.try_acquire()
+        store.record_quota("src", quota)
+        assert saved() == 1
+        store.record_quota("src", quota, force=True)
+        assert saved() == 2
+
+    def test_corrupt_file_starts_fresh(self, tmp_path, caplog):
+        path = tmp_path / "state.json"
+        path.write_text("{nope", encoding="utf-8")
+        with caplog.at_level(logging.WARNING):
+            store = ResilienceStateStore(path)
+        assert store.retry_after_remaining("a") == 0.0
+        assert "corrupt" in caplog.text
+
+
+class TestScraperPersistedState:
+    """BaseScraper with resilience.persist_state."""
+
+    @pytest.fixture(autouse=True)
+    def _no_sleep(self):
+        with patch("src.scrapers.base.asyncio.sleep", new=AsyncMock()) as sleep:
+            self.sleep = sleep
+            yield
+
+    def test_next_run_fails_fast_while_open(self, tmp_path):
+        from src.scrapers.base import BaseScraper
+
+        config = _persisting_config(tmp_path)
+        failing = FakeSession(FakeResponse(503))
+        with pytest.raises(Exception):
+            _request(BaseScraper("api", config), failing)
+        assert failing.calls == 3
+
+        with patch.dict("src.scrapers.resilience_state._SHARED", clear=True):
+            next_run = BaseScraper("api", config)  # reloads the file like a new process
+            assert next_run._circuit_breaker.state == CircuitState.OPEN
+            untouched = FakeSession(FakeResponse(200))
+            with pytest.raises(CircuitOpenError):
+                _request(next_run, untouched)
+        assert untouched.calls == 0
+
+    def test_half_open_probe_is_single_attempt(self, tmp_path):
+        from src.scrapers.base import BaseScraper
+
+        scraper = BaseScraper("api", _persisting_config(tmp_path))
+        scraper._circuit_breaker.restore(CircuitState.HALF_OPEN, 1, 120.0)
+        failing = FakeSession(FakeResponse(503))
+        with pytest.raises(Exception):
+            _request(scraper, failing)
+        assert failing.calls == 1
+        assert scraper._circuit_breaker.state == CircuitState.OPEN
+
+    def test_retry_after_persisted_and_honoured(self, tmp_path):
+        from src.scrapers.base import BaseScraper
+
+        config = _persisting_config(tmp_path)
+        session = FakeSession(FakeResponse(429, {"Retry-After": "45"}), FakeResponse(200))
+        assert _request(BaseScraper("api", config), session) == {"ok": True}
+        self.sleep.assert_awaited_once_with(45)
+
+        with patch.dict("src.scrapers.resilience_state._SHARED", clear=True):
+            self.sleep.reset_mock()
+            _request(BaseScraper("api", config), FakeSession(FakeResponse(200)))
+        (held,), _ = self.sleep.await_args
+        assert 40 < held <= 45
+
+    def test_hourly_quota_spans_runs(self, tmp_path):
+        from src.scrapers.base import BaseScraper
+
+        config = _persisting_config(
+            tmp_path, circuit_breaker={"failure_threshold": 5},
+        )
+        config["sources"] = {"api": {"requests_per_hour": 2}}
+        _request(BaseScraper("api", config), FakeSession(FakeResponse(200)))
+
+        with patch.dict("src.scrapers.resilience_state._SHARED", clear=True):
+            next_run = BaseScraper("api", config)
+            assert next_run._quota.used() == 1
+            _request(next_run, FakeSession(FakeResponse(200)))
+            # The spent quota frees up in about an hour, past the deadline
+            next_run.deadline = time.monotonic() + 30
+            with pytest.raises(ScanDeadlineExceeded):
+                _request(next_run, FakeSession(FakeResponse(200)))
+
+    def test_state_not_persisted_by_default(self, tmp_path):
+        from src.scrapers.base import BaseScraper
+
+        scraper = BaseScraper("api", {"resilience": {"max_retries": 1}})
+        assert scraper._resilience_state is None
+
+
 # ── Per-source cache tests ──
 
 
@@ -0,0 +1,166 @@
+"""Tests for the columnar county store (src/packets/county_store.py).
+
+Covers:
+- Numeric/text column typing and _safe_float-compatible NaN handling
+- FIPS leading zeros preserved as text
+- Store reuse across opens and rebuild when the CSV checksum changes
+- Lazy CountyRecords mapping (last row wins, records built once)
+- HazardProfileBuilder and NRIExpandedBuilder sharing one table
+"""
+
+import csv
+import json
+import math
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.packets import county_store
+from src.packets.county_store import (
+    CountyRecords,
+    open_county_table,
+    store_dir_for,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_table_cache():
+    """Isolate the process-wide table cache between tests."""
+    county_store._TABLES.clear()
+    yield
+    county_store._TABLES.clear()
+
+
+def _write_csv(path: Path, rows: list[list[str]]) -> Path:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+    return path
+
+
+@pytest.fixture
+def county_csv(tmp_path):
+    return _write_csv(tmp_path / "counties.csv", [
+        ["STCOFIPS", "COUNTY", "RISK_SCORE", "RISK_RATNG", "MIXED"],
+        ["01001", "Autauga", "12.5", "Low", "3"],
+        ["06037", "Los Angeles", "", "Very High", "n/a"],
+        ["9001", "Fairfield", "inf", " Moderate ", "4.5"],
+    ])
+
+
+class TestCountyTable:
+    """Column typing and reads."""
+
+    def test_column_kinds(self, county_csv):
+        table = open_county_table(county_csv, text_columns=("stcofips",))
+        assert table.headers == ["STCOFIPS", "COUNTY", "RISK_SCORE", "RISK_RATNG", "MIXED"]
+        assert table.n_rows == 3
+        assert set(table.text_columns) == {"STCOFIPS", "COUNTY", "RISK_RATNG", "MIXED"}
+        assert table.strings("STCOFIPS") == ["01001", "06037", "9001"]
+        with pytest.raises(TypeError):
+            table.strings("RISK_SCORE")
+
+    def test_missing_and_non_numeric_cells_are_nan(self, county_csv):
+        table = open_county_table(county_csv)
+        risk = table.floats("RISK_SCORE")
+        assert risk[0] == 12.5
+        assert math.isnan(risk[1]) and math.isnan(risk[2])
+        mixed = table.floats("MIXED")
+        assert mixed[0] == 3.0 and math.isnan(mixed[1]) and mixed[2] == 4.5
+        assert all(math.isnan(v) for v in table.floats("ABSENT"))
+        assert table.strings("ABSENT") == ["", "", ""]
+
+    def test_row_reader(self, county_csv):
+        table = open_county_table(county_csv, text_columns=("STCOFIPS",))
+        read = table.row_reader(["RISK_SCORE", "MIXED", "ABSENT"], ["RISK_RATNG", "ABSENT"])
+        values, text = read(2)
+        assert math.isnan(values[0]) and values[1] == 4.5 and math.isnan(values[2])
+        assert text == [" Moderate ", ""]
+
+
+class TestStorePersistence:
+    """On-disk store reuse and checksum-driven rebuilds."""
+
+    def test_second_open_reuses_store(self, county_csv):
+        open_county_table(county_csv, text_columns=("STCOFIPS",))
+        county_store._TABLES.clear()
+        with patch.object(county_store, "_build", side_effect=AssertionError("rebuilt")):
+            table = open_county_table(county_csv, text_columns=("STCOFIPS",))
+        assert table.strings("STCOFIPS")[0] == "01001"
+
+    def test_rebuilds_when_csv_changes(self, county_csv):
+        first = open_county_table(county_csv)
+        _write_csv(county_csv, [["STCOFIPS", "RISK_SCORE"], ["02020", "7"]])
+        county_store._TABLES.clear()
+        second = open_county_table(county_csv, text_columns=("STCOFIPS",))
+        assert second.sha256 != first.sha256
+        assert second.n_rows == 1
+        assert second.floats("RISK_SCORE").tolist() == [7.0]
+        store = store_dir_for(county_csv)
+        assert sorted(p.name for p in store.iterdir()) == [
+            "codes-" + second.sha256[:16] + ".npy",
+            "floats-" + second.sha256[:16] + ".npy",
+            "manifest.json",
+        ]
+
+    def test_rebuilds_when_new_text_column_requested(self, county_csv):
+        open_county_table(county_csv)
+        county_store._TABLES.clear()
+        table = open_county_table(county_csv, text_columns=("RISK_SCORE",))
+        assert table.strings("RISK_SCORE") == ["12.5", "", "inf"]
+        manifest = json.loads((store_dir_for(county_csv) / "manifest.json").read_text())
+        assert "RISK_SCORE" in manifest["text_columns"]
+
+    def test_unwritable_store_falls_back_to_memory(self, county_csv):
+        with patch.object(county_store, "_write_store", side_effect=OSError("read-only")):
+            table = open_county_table(county_csv)
+        assert table.floats("RISK_SCORE")[0] == 12.5
+
+
+class TestCountyRecords:
+    """Lazy key -> record mapping."""
+
+    def test_last_row_wins_and_records_are_cached(self):
+        calls = []
+
+        def make_record(key, row):
+            calls.append(row)
+            return {"key": key, "row": row}
+
+        records = CountyRecords(["a", "", "b", "a"], make_record)
+        assert list(records) == ["a", "b"]
+        assert len(records) == 2 and "" not in records
+        assert records["a"] == {"key": "a", "row": 3}
+        assert records["a"] is records["a"]
+        assert calls == [3]
+        with pytest.raises(KeyError):
+            records["zz"]
+
+
+class TestBuildersShareStore:
+    """Both NRI builders read the same opened table."""
+
+    def test_hazard_and_expanded_builders_share_table(self, tmp_path):
+        from src.packets.hazards import HazardProfileBuilder
+        from src.packets.nri_expanded import NRIExpandedBuilder
+
+        csv_path = _write_csv(tmp_path / "NRI_Table_Counties.csv", [
+            ["STCOFIPS", "COUNTY", "STATE", "RISK_SCORE", "RISK_RATNG", "EAL_VALT"],
+            ["06001", "Alameda", "California", "30.5", "High", "1000"],
+        ])
+        hazards = HazardProfileBuilder.__new__(HazardProfileBuilder)
+        hazards.nri_dir = tmp_path
+        expanded = NRIExpandedBuilder.__new__(NRIExpandedBuilder)
+        expanded.nri_csv_path = csv_path
+        expanded.expected_sha256 = None
+        expanded._area_weights = {}
+
+        with patch.object(county_store, "_build", wraps=county_store._build) as build:
+            hazard_data = hazards._load_nri_county_data()
+            expanded_data = expanded._load_nri_csv()
+
+        assert build.call_count == 1
+        assert hazard_data["06001"]["risk_score"] == 30.5
+        assert hazard_data["06001"]["hazards"]["WFIR"]["risk_score"] == 0.0
+        assert expanded_data["06001"]["eal_total"] == 1000.0
+        assert expanded_data["06001"]["risk_rating"] == "High"
@@ -368,6 +368,7 @@ def full_phase7_config(tmp_path):
             "ecoregion": {"data_path": str(tmp_path / "ecoregion_config.json")},
             "congressional_cache": {"data_path": str(tmp_path / "congressional_cache.json")},
             "output_dir": str(output_dir),
+            "state_dir": str(tmp_path / "packet_state"),
             "awards": {
                 "alias_path": str(tmp_path / "tribal_aliases.json"),
                 "cache_dir": str(award_dir),
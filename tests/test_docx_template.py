@@ -421,6 +421,104 @@ class TestDocxEngineTemplateIntegration:
         # Extended styles NOT present (no template)
         assert "HS Column Primary" not in names
 
+    def test_template_parsed_once_per_process(self, tmp_path, monkeypatch):
+        """Repeated create_document() calls clone the cached prototype."""
+        from src.packets import docx_engine
+        from src.packets.docx_engine import DocxEngine
+
+        template_path = tmp_path / "template.docx"
+        build_template(template_path)
+        monkeypatch.setattr(docx_engine, "_PROTOTYPES", {})
+
+        opened = []
+        real_document = docx_engine.Document
+
+        def _counting_document(*args, **kwargs):
+            opened.append(args)
+            return real_document(*args, **kwargs)
+
+        monkeypatch.setattr(docx_engine, "Document", _counting_document)
+        engine = DocxEngine(
+            config={"packets": {"output_dir": str(tmp_path / "output")}},
+            programs={},
+            template_path=template_path,
+        )
+        engine.create_document()
+        engine.create_document()
+        DocxEngine(
+            config={"packets": {"output_dir": str(tmp_path / "output")}},
+            programs={},
+            template_path=template_path,
+        ).create_document()
+
+        assert opened == [(str(template_path),)]
+
+    def test_cloned_documents_are_independent(self, tmp_path):
+        """Content added to one clone never leaks into the next."""
+        from src.packets.docx_engine import DocxEngine
+
+        engine = DocxEngine(
+            config={"packets": {"output_dir": str(tmp_path / "output")}},
+            programs={},
+            template_path=False,
+        )
+        first, _ = engine.create_document()
+        first.add_paragraph("Only in the first document", style="HS Body")
+        first.sections[0].header.paragraphs[0].text = "changed"
+
+        second, sm = engine.create_document()
+        assert sm.doc is second
+        assert not any(p.text for p in second.paragraphs)
+        assert second.sections[0].header.paragraphs[0].text != "changed"
+
+        # Clone round-trips through save/open with styles intact
+        path = engine.save(first, "clone_check")
+        reopened = Document(str(path))
+        assert reopened.paragraphs[-1].style.name == "HS Body"
+
+    def test_clone_failure_falls_back_to_fresh_build(self, tmp_path, monkeypatch):
+        """If python-docx internals change, documents are built from scratch."""
+        from src.packets import docx_engine
+        from src.packets.docx_engine import DocxEngine
+
+        def _broken_clone(prototype):
+            raise AttributeError("_element")
+
+        monkeypatch.setattr(docx_engine, "_clone_document", _broken_clone)
+        monkeypatch.setattr(docx_engine, "_CLONE_FAILED", False)
+        engine = DocxEngine(
+            config={"packets": {"output_dir": str(tmp_path / "output")}},
+            programs={},
+            template_path=False,
+        )
+        first, _ = engine.create_document()
+        second, sm = engine.create_document()
+
+        assert docx_engine._CLONE_FAILED
+        assert first is not second and sm.doc is second
+        assert "HS Title" in {s.name for s in second.styles}
+
+    def test_stage_timings_recorded(self, tmp_path):
+        """create_document/save accumulate per-engine and per-process timings."""
+        from src.packets.docx_engine import RENDER_STAGES, DocxEngine, render_timings
+
+        before = render_timings()
+        engine = DocxEngine(
+            config={"packets": {"output_dir": str(tmp_path / "output")}},
+            programs={},
+            template_path=False,
+        )
+        doc, _ = engine.create_document()
+        with engine.timed("section_render"):
+            doc.add_paragraph("body")
+        engine.save(doc, "timed")
+        after = render_timings()
+
+        assert set(engine.timings) == set(RENDER_STAGES)
+        assert all(engine.timings[stage] > 0 for stage in RENDER_STAGES)
+        assert after["documents"] == before["documents"] + 1
+        assert after["save"] > before["save"]
+
 
 # ---------------------------------------------------------------------------
 # AgentReviewOrchestrator tests
@@ -830,6 +830,68 @@ class TestDocxRendering:
             # Regional config may not exist in test env -- acceptable
             pass
 
+    def test_regional_docs_rerender_only_changed_regions(self, congressional_env):
+        """Doc C/D re-render only for regions containing a changed Tribe."""
+        from unittest.mock import patch
+
+        orch = _make_orchestrator(congressional_env)
+        contexts = {
+            tribe["tribe_id"]: orch._build_context(tribe)
+            for tribe in _mock_registry()["tribes"]
+        }
+
+        def run():
+            with patch.object(
+                orch, "_generate_regional_doc", wraps=orch._generate_regional_doc,
+            ) as render:
+                results = orch.generate_regional_docs(prebuilt_contexts=contexts)
+            rendered = {call.args[0].region_id for call in render.call_args_list}
+            return results, rendered, render.call_count
+
+        first, rendered, calls = run()
+        assert calls == 2 * len(first)
+        assert all(len(paths) == 2 for paths in first.values())
+
+        second, rendered, calls = run()
+        assert calls == 0
+        assert second == first
+
+        contexts["epa_003"].awards = [{"obligation": 42.0, "cfda": "15.156"}]
+        _, rendered, calls = run()
+        assert rendered == {"southwest", "crosscutting"}
+        assert calls == 4
+
+    def test_regional_docs_reuse_rows_without_prebuilt_contexts(self, congressional_env):
+        """Unchanged Tribes reuse stored rows instead of rebuilding contexts."""
+        from unittest.mock import patch
+
+        orch = _make_orchestrator(congressional_env)
+        first = orch.generate_regional_docs()
+
+        with patch.object(orch, "_build_context", wraps=orch._build_context) as build:
+            second = orch.generate_regional_docs()
+        assert build.call_count == 0
+        assert second == first
+
+    def test_regional_docs_rebuild_tribes_changed_in_award_store(self, congressional_env):
+        """A Tribe's award store record supersedes its legacy file."""
+        from unittest.mock import patch
+
+        from src.packets.award_store import AwardCacheStore
+
+        orch = _make_orchestrator(congressional_env)
+        orch.generate_regional_docs()
+
+        AwardCacheStore(orch.award_cache_dir).append([{
+            "tribe_id": "epa_003",
+            "awards": [{"award_id": "a3", "obligation": 42.0, "cfda": "15.156"}],
+        }])
+        orch = _make_orchestrator(congressional_env)
+        with patch.object(orch, "_build_context", wraps=orch._build_context) as build:
+            orch.generate_regional_docs()
+        assert [c.args[0]["tribe_id"] for c in build.call_args_list] == ["epa_003"]
+        assert orch._build_context(build.call_args.args[0]).awards[0]["obligation"] == 42.0
+
     def test_section_ordering_bills_before_delegation(self, congressional_env):
         """Bill intelligence section appears before delegation section."""
         from docx import Document
@@ -0,0 +1,101 @@
+"""Tests for the knowledge graph adjacency index (src/graph/adjacency.py).
+
+Covers:
+- KnowledgeGraph queries answered from the index
+- The index shipped with to_dict() and reused by serialized-graph consumers
+- Edges appended after serialization (monitor THREATENS edges)
+"""
+
+from src.graph.adjacency import EdgeIndex
+from src.graph.builder import KnowledgeGraph
+from src.graph.schema import AdvocacyLeverNode, BarrierNode, Edge, ProgramNode
+
+
+def _graph() -> KnowledgeGraph:
+    graph = KnowledgeGraph()
+    graph.add_node(ProgramNode(id="p1", name="Program 1", agency="BIA"))
+    graph.add_node(ProgramNode(id="p2", name="Program 2", agency="EPA"))
+    graph.add_node(BarrierNode(id="bar_match", description="25% match"))
+    graph.add_node(AdvocacyLeverNode(id="ask_waive", description="Waive match"))
+    graph.add_edge(Edge("p1", "bar_match", "BLOCKED_BY"))
+    graph.add_edge(Edge("p2", "bar_match", "BLOCKED_BY"))
+    graph.add_edge(Edge("bar_match", "ask_waive", "MITIGATED_BY"))
+    graph.add_edge(Edge("ask_waive", "p1", "ADVANCES"))
+    return graph
+
+
+class TestKnowledgeGraphIndex:
+    """In-memory graph queries."""
+
+    def test_barriers_and_levers(self):
+        graph = _graph()
+        assert [b["id"] for b in graph.get_barriers_for_program("p1")] == ["bar_match"]
+        assert [lv["id"] for lv in graph.get_levers_for_barrier("bar_match")] == ["ask_waive"]
+        assert graph.get_barriers_for_program("missing") == []
+
+    def test_in_and_out_edges(self):
+        graph = _graph()
+        assert [e.source_id for e in graph.in_edges("bar_match", "BLOCKED_BY")] == ["p1", "p2"]
+        assert graph.out_edges("bar_match", "BLOCKED_BY") == []
+
+    def test_program_subgraph_keeps_edge_order(self):
+        sub = _graph().get_program_subgraph("p1")
+        assert [(e["source"], e["type"]) for e in sub["edges"]] == [
+            ("p1", "BLOCKED_BY"), ("ask_waive", "ADVANCES"),
+        ]
+        assert set(sub["nodes"]) == {"p1", "bar_match", "ask_waive"}
+
+
+class TestSerializedIndex:
+    """EdgeIndex.for_graph over to_dict() output."""
+
+    def test_to_dict_ships_adjacency(self):
+        data = _graph().to_dict()
+        assert data["adjacency"]["edge_count"] == 4
+        assert data["adjacency"]["in"]["bar_match"]["BLOCKED_BY"] == [0, 1]
+
+        index = EdgeIndex.for_graph(data)
+        assert index.sources("bar_match", "BLOCKED_BY") == ["p1", "p2"]
+        assert index.targets("ask_waive", "ADVANCES") == ["p1"]
+
+    def test_appended_edges_are_indexed(self):
+        data = _graph().to_dict()
+        data["edges"].append({"source": "threat_x", "target": "p2", "type": "THREATENS"})
+
+        index = EdgeIndex.for_graph(data)
+        assert index.sources("p2", "THREATENS") == ["threat_x"]
+        assert data["adjacency"]["edge_count"] == 5
+
+    def test_extending_serialized_index_leaves_graph_intact(self):
+        graph = _graph()
+        data = graph.to_dict()
+        data["edges"].append({"source": "threat_x", "target": "p1", "type": "THREATENS"})
+        EdgeIndex.for_graph(data).add("threat_y", "p1", "THREATENS")
+
+        assert graph.in_edges("p1", "THREATENS") == []
+        graph.add_edge(Edge("bar_match", "ask_waive", "MITIGATED_BY"))
+        assert [e.target_id for e in graph.out_edges("bar_match", "MITIGATED_BY")] == [
+            "ask_waive", "ask_waive",
+        ]
+
+    def test_built_when_absent(self):
+        data = _graph().to_dict()
+        shipped = data.pop("adjacency")
+        index = EdgeIndex.for_graph(data)
+        assert index.to_dict() == shipped
+
+    def test_threatens_edges_keep_index_current(self):
+        from src.monitors import MonitorAlert, MonitorRunner
+
+        data = _graph().to_dict()
+        alert = MonitorAlert(
+            monitor="iija_sunset", severity="WARNING", program_ids=["p1"],
+            title="Sunset", detail="", metadata={
+                "creates_threatens_edge": True, "threat_type": "iija_sunset",
+            },
+        )
+        runner = MonitorRunner.__new__(MonitorRunner)
+        runner._add_threatens_edges(data, [alert, alert])
+
+        assert len(data["edges"]) == 5
+        assert EdgeIndex.for_graph(data).sources("p1", "THREATENS") == ["threat_iija_sunset_p1"]
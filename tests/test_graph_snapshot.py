@@ -0,0 +1,105 @@
+"""Tests for the binary knowledge graph snapshot (src/graph/snapshot.py).
+
+Covers:
+- Round trip equal to the JSON export, including non-node edge endpoints
+- Fingerprint checks and unreadable snapshots
+- build_graph(from_snapshot=True) skipping GraphBuilder on a match and
+  rewriting LATEST-GRAPH.json only when it is missing
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+import src.graph.builder as builder_mod
+import src.main as main_mod
+from src.graph.adjacency import EdgeIndex
+from src.graph.builder import KnowledgeGraph
+from src.graph.schema import BarrierNode, Edge, ObligationNode, ProgramNode
+from src.graph.snapshot import graph_fingerprint, load_snapshot, write_snapshot
+
+
+def _graph_data() -> dict:
+    graph = KnowledgeGraph()
+    graph.add_node(ProgramNode(id="p1", name="Program 1", agency="BIA"))
+    graph.add_node(BarrierNode(id="bar_match", description="25% match"))
+    graph.add_node(ObligationNode(id="obl_1", amount=1250.5, recipient="Tribe A"))
+    graph.add_edge(Edge("p1", "bar_match", "BLOCKED_BY", {"inferred_from": "FR-1"}))
+    graph.add_edge(Edge("p1", "obl_1", "OBLIGATED_BY", {"amount": 1250.5}))
+    graph.add_edge(Edge("epa_1", "eco_arctic", "IN_ECOREGION"))
+    return graph.to_dict()
+
+
+class TestSnapshotRoundTrip:
+    """write_snapshot / load_snapshot."""
+
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_round_trip_matches_json(self, tmp_path, compress):
+        data = _graph_data()
+        path = tmp_path / "g.npz"
+        write_snapshot(data, path, "fp", compress=compress)
+
+        loaded = load_snapshot(path, fingerprint="fp")
+
+        assert loaded == json.loads(json.dumps(data))
+        assert EdgeIndex.for_graph(loaded).targets("epa_1", "IN_ECOREGION") == ["eco_arctic"]
+
+    def test_fingerprint_mismatch_is_ignored(self, tmp_path):
+        path = tmp_path / "g.npz"
+        write_snapshot(_graph_data(), path, "old")
+        assert load_snapshot(path, fingerprint="new") is None
+        assert load_snapshot(path) is not None
+
+    def test_missing_or_corrupt_snapshot(self, tmp_path):
+        assert load_snapshot(tmp_path / "absent.npz") is None
+        bad = tmp_path / "bad.npz"
+        bad.write_bytes(b"not a zip")
+        assert load_snapshot(bad) is None
+
+    def test_fingerprint_tracks_inputs(self, tmp_path):
+        schema = tmp_path / "schema.json"
+        schema.write_text("{}", encoding="utf-8")
+        programs = [{"id": "p1"}]
+        base = graph_fingerprint(programs, [{"a": 1}], schema)
+        assert base == graph_fingerprint(programs, [{"a": 1}], schema)
+        assert base != graph_fingerprint(programs, [{"a": 2}], schema)
+        schema.write_text('{"x": 1}', encoding="utf-8")
+        assert base != graph_fingerprint(programs, [{"a": 1}], schema)
+
+
+class TestBuildGraphFromSnapshot:
+    """--graph-from-snapshot path in src.main.build_graph."""
+
+    def test_reuses_snapshot_when_inputs_unchanged(self, tmp_path):
+        programs = [{"id": "p1", "name": "Program 1", "agency": "BIA"}]
+        with patch.object(main_mod, "LATEST_GRAPH_PATH", tmp_path / "graph.json"), \
+             patch.object(main_mod, "GRAPH_SNAPSHOT_PATH", tmp_path / "graph.npz"):
+            built = main_mod.build_graph(programs, [])
+            assert (tmp_path / "graph.npz").exists()
+
+            with patch.object(builder_mod, "GraphBuilder") as builder:
+                loaded = main_mod.build_graph(programs, [], from_snapshot=True)
+                builder.assert_not_called()
+            assert loaded == json.loads(json.dumps(built))
+
+            with patch.object(builder_mod, "GraphBuilder", wraps=builder_mod.GraphBuilder) as builder:
+                main_mod.build_graph(programs, [{"title": "new"}], from_snapshot=True)
+                builder.assert_called_once()
+
+    def test_snapshot_hit_restores_missing_json(self, tmp_path):
+        programs = [{"id": "p1", "name": "Program 1", "agency": "BIA"}]
+        graph_json = tmp_path / "graph.json"
+        with patch.object(main_mod, "LATEST_GRAPH_PATH", graph_json), \
+             patch.object(main_mod, "GRAPH_SNAPSHOT_PATH", tmp_path / "graph.npz"):
+            main_mod.build_graph(programs, [])
+            graph_json.unlink()
+
+            with patch.object(builder_mod, "GraphBuilder") as builder:
+                loaded = main_mod.build_graph(programs, [], from_snapshot=True)
+                builder.assert_not_called()
+            assert json.loads(graph_json.read_text(encoding="utf-8")) == json.loads(json.dumps(loaded))
+
+            mtime = graph_json.stat().st_mtime_ns
+            main_mod.build_graph(programs, [], from_snapshot=True)
+            assert graph_json.stat().st_mtime_ns == mtime
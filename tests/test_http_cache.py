@@ -0,0 +1,190 @@
+"""Tests for the request-level HTTP response cache (src/scrapers/http_cache.py).
+
+Covers:
+- Key derivation from method, URL and payload
+- LRU eviction under the byte budget; shared() keeps the larger budget
+- BaseScraper integration against a local aiohttp stub: TTL hits,
+  ETag/Last-Modified revalidation, 304 handling, cache I/O off the event
+  loop, and the disabled default
+"""
+
+import asyncio
+import json
+import os
+
+from src.scrapers.base import BaseScraper
+from src.scrapers.http_cache import ResponseCache
+from tests.conftest import MockClock
+
+
+class TestResponseCache:
+    """Storage, keys and eviction."""
+
+    def test_key_covers_method_url_and_payload(self):
+        key = ResponseCache.key
+        assert key("get", "http://x/a") == key("GET", "http://x/a")
+        assert key("GET", "http://x/a") != key("POST", "http://x/a")
+        assert key("GET", "http://x/a") != key("GET", "http://x/b")
+        assert key("POST", "u", {"json": {"a": 1, "b": 2}}) == key(
+            "POST", "u", {"json": {"b": 2, "a": 1}},
+        )
+        assert key("POST", "u", {"json": {"page": 1}}) != key(
+            "POST", "u", {"json": {"page": 2}},
+        )
+
+    def test_roundtrip_and_freshness(self, tmp_path):
+        clock = MockClock(start=1_000_000.0)
+        cache = ResponseCache(tmp_path, 1 << 20, clock=clock)
+        cache.put("k", {"results": [1]}, etag='"v1"', last_modified=None)
+
+        entry = cache.get("k")
+        assert entry["body"] == {"results": [1]}
+        assert cache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+        assert cache.is_fresh(entry, 60)
+        clock.advance(60)
+        assert not cache.is_fresh(entry, 60)
+        assert not cache.is_fresh(entry, 0)
+        assert cache.get("missing") is None
+
+    def test_corrupt_entry_is_discarded(self, tmp_path):
+        (tmp_path / "bad.json").write_text("{not json", encoding="utf-8")
+        cache = ResponseCache(tmp_path, 1 << 20)
+        assert cache.get("bad") is None
+        assert not (tmp_path / "bad.json").exists()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        body = "x" * 1000
+        cache = ResponseCache(tmp_path, 4000)
+        for i, key in enumerate(("a", "b", "c")):
+            cache.put(key, body)
+            os.utime(tmp_path / f"{key}.json", (i, i))
+        cache.get("a")  # touch: "b" is now the oldest
+
+        cache.put("d", body)
+
+        remaining = sorted(p.stem for p in tmp_path.glob("*.json"))
+        assert remaining == ["a", "c", "d"]
+
+
+    def test_shared_keeps_larger_budget(self, tmp_path, monkeypatch, caplog):
+        monkeypatch.setattr("src.scrapers.http_cache._SHARED", {})
+        first = ResponseCache.shared(tmp_path, 1000)
+        assert ResponseCache.shared(tmp_path, 1000) is first
+        assert first.max_bytes == 1000
+
+        assert ResponseCache.shared(tmp_path, 5000) is first
+        assert first.max_bytes == 5000
+        ResponseCache.shared(tmp_path, 2000)
+        assert first.max_bytes == 5000
+        assert "budget" in caplog.text
+
+
+class _StubAPI:
+    """Local JSON endpoint honouring If-None-Match."""
+
+    def __init__(self, changing=False):
+        self.version = 1
+        self.changing = changing  # publish a new version on every request
+        self.hits = 0
+        self.not_modified = 0
+
+    async def handle(self, request):
+        from aiohttp import web
+
+        self.hits += 1
+        if self.changing and self.hits > 1:
+            self.version += 1
+        etag = f'"v{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(
+            {"version": self.version, "q": request.query.get("q")},
+            headers={"ETag": etag, "Last-Modified": "Tue, 01 Jul 2025 00:00:00 GMT"},
+        )
+
+
+def _run(stub, config, calls):
+    """Serve ``stub`` and issue GET /data?q=<q> for each q in ``calls``."""
+    import aiohttp
+    from aiohttp import web
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/data", stub.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        scraper = BaseScraper("stub", config)
+        try:
+            async with aiohttp.ClientSession() as session:
+                return [
+                    await scraper._request_with_retry(
+                        session, "GET", f"http://127.0.0.1:{port}/data", params={"q": q},
+                    )
+                    for q in calls
+                ]
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(run())
+
+
+def _config(tmp_path, ttl):
+    return {
+        "http_cache": {"enabled": True, "dir": str(tmp_path / "cache"), "max_mb": 1},
+        "sources": {"stub": {"cache_ttl_seconds": ttl}},
+    }
+
+
+class TestScraperCache:
+    """_request_with_retry through the response cache."""
+
+    def test_fresh_entry_skips_network(self, tmp_path):
+        stub = _StubAPI()
+        results = _run(stub, _config(tmp_path, 3600), ["a", "a", "b"])
+        assert [r["q"] for r in results] == ["a", "a", "b"]
+        assert stub.hits == 2
+
+    def test_stale_entry_revalidates_with_304(self, tmp_path):
+        stub = _StubAPI()
+        results = _run(stub, _config(tmp_path, 0), ["a", "a"])
+        assert results[0] == results[1] == {"version": 1, "q": "a"}
+        assert stub.hits == 2
+        assert stub.not_modified == 1
+
+    def test_changed_resource_replaces_entry(self, tmp_path):
+        stub = _StubAPI(changing=True)
+        results = _run(stub, _config(tmp_path, 0), ["a", "a"])
+        assert [r["version"] for r in results] == [1, 2]
+        assert stub.not_modified == 0
+
+        entries = list((tmp_path / "cache").glob("*.json"))
+        assert len(entries) == 1
+        stored = json.loads(entries[0].read_text(encoding="utf-8"))
+        assert stored["etag"] == '"v2"'
+        assert stored["last_modified"] == "Tue, 01 Jul 2025 00:00:00 GMT"
+
+    def test_cache_io_runs_off_the_event_loop(self, tmp_path, monkeypatch):
+        import threading
+
+        loop_thread = threading.get_ident()
+        io_threads = []
+        for name in ("get", "put"):
+            original = getattr(ResponseCache, name)
+
+            def spy(self, *args, _original=original, **kwargs):
+                io_threads.append(threading.get_ident())
+                return _original(self, *args, **kwargs)
+            monkeypatch.setattr(ResponseCache, name, spy)
+
+        _run(_StubAPI(), _config(tmp_path, 3600), ["a", "a"])
+        assert io_threads and loop_thread not in io_threads
+
+    def test_disabled_without_config(self, tmp_path):
+        stub = _StubAPI()
+        _run(stub, {}, ["a", "a"])
+        assert stub.hits == 2
+        assert stub.not_modified == 0
@@ -0,0 +1,145 @@
+"""Tests for the shared connection pool and host governor (src/scrapers/http_pool.py).
+
+Covers:
+- One pooled session per event loop, closed by its last borrower
+- Per-host buckets shared across scrapers; conflicting rates keep the strictest
+- Pool settings applied by run_scan, not by scraper constructors
+- Per-host request/latency counters from pooled sessions
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from src.scrapers.base import BaseScraper
+from src.scrapers.http_pool import HOST_GOVERNOR, HostGovernor, shared_session
+
+
+class TestSharedSession:
+    """Reference-counted session per loop."""
+
+    def test_concurrent_borrowers_share_one_session(self):
+        async def run():
+            async with shared_session() as a:
+                async with shared_session() as b:
+                    assert a is b
+                assert not a.closed
+            return a
+
+        assert asyncio.run(run()).closed
+
+    def test_new_session_after_last_borrower_exits(self):
+        async def run():
+            async with shared_session() as first:
+                pass
+            async with shared_session() as second:
+                assert not second.closed
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first is not second
+
+
+class TestHostGovernor:
+    """Bucket registry keyed by host."""
+
+    def test_same_host_shares_bucket(self):
+        governor = HostGovernor()
+        a = governor.register("https://api.example.gov/v3/bill", 3)
+        b = governor.register("https://API.example.gov/v3/member?x=1", 3)
+        assert a is b
+        assert governor.bucket("https://api.example.gov/other") is a
+        assert governor.bucket("https://elsewhere.gov/") is None
+
+    def test_conflicting_rates_keep_most_restrictive(self):
+        governor = HostGovernor()
+        a = governor.register("https://api.example.gov", 3)
+        b = governor.register("https://api.example.gov", 10, burst=10)
+        assert a is b
+        assert (b.rate, b.capacity) == (3, 3)
+
+        c = governor.register("https://api.example.gov", 1, burst=5)
+        assert c is a
+        assert (c.rate, c.capacity) == (1, 3)
+
+    def test_defer_holds_host(self):
+        governor = HostGovernor()
+        bucket = governor.register("https://api.example.gov", 100)
+        governor.defer("https://api.example.gov/x", 30)
+        assert not bucket.try_acquire()
+        governor.defer("https://ungoverned.gov/x", 30)  # no-op
+
+    def test_record_counts_errors_and_throttles(self):
+        governor = HostGovernor()
+        governor.record("h", 0.1, 200)
+        governor.record("h", 0.3, 429)
+        governor.record("h", 0.2, 503)
+        governor.record("h", 0.4, None)
+        stats = governor.stats()["h"]
+        assert (stats.requests, stats.errors, stats.throttled) == (4, 2, 1)
+        assert stats.max_latency == 0.4
+        assert abs(stats.mean_latency - 0.25) < 1e-9
+
+    def test_scrapers_on_same_host_share_budget(self):
+        config = {"sources": {
+            "a": {"base_url": "https://shared.example.gov/v1", "requests_per_second": 7},
+            "b": {"base_url": "https://shared.example.gov/v2", "requests_per_second": 7},
+        }}
+        a = BaseScraper("a", config)
+        b = BaseScraper("b", config)
+        assert a._rate_limiter is b._rate_limiter
+        assert HOST_GOVERNOR.bucket("https://shared.example.gov") is a._rate_limiter
+
+
+class TestPoolSettings:
+    """configure_pool runs once per scan."""
+
+    def test_scraper_constructor_leaves_pool_settings(self, monkeypatch):
+        monkeypatch.setattr("src.scrapers.http_pool._POOL_SETTINGS", {"limit": 64})
+        BaseScraper("x", {"http_pool": {"limit": 2}})
+        from src.scrapers import http_pool
+        assert http_pool._POOL_SETTINGS == {"limit": 64}
+
+    def test_run_scan_applies_pool_settings(self, monkeypatch):
+        from src.main import run_scan
+        from src.scrapers import http_pool
+
+        monkeypatch.setattr(http_pool, "_POOL_SETTINGS", {"limit": 64})
+        with patch.dict("src.main.SCRAPERS", {}, clear=True):
+            asyncio.run(run_scan({"http_pool": {"limit": 2}}, [], []))
+        assert http_pool._POOL_SETTINGS == {"limit": 2}
+
+
+class TestCounters:
+    """Pooled sessions report per-host counters."""
+
+    def test_requests_are_counted(self):
+        from aiohttp import web
+
+        async def handle(request):
+            status = int(request.query.get("status", "200"))
+            return web.json_response({}, status=status)
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/x", handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            try:
+                async with shared_session() as session:
+                    for status in (200, 200, 429):
+                        url = f"http://127.0.0.1:{port}/x?status={status}"
+                        async with session.get(url) as resp:
+                            await resp.read()
+            finally:
+                await runner.cleanup()
+
+        before = HOST_GOVERNOR.stats().get("127.0.0.1")
+        before = (before.requests, before.throttled) if before else (0, 0)
+        asyncio.run(run())
+        after = HOST_GOVERNOR.stats()["127.0.0.1"]
+        assert after.requests - before[0] == 3
+        assert after.throttled - before[1] == 1
+        assert after.max_latency > 0
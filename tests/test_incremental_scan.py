@@ -0,0 +1,264 @@
+"""Tests for incremental scan mode (per-source high-water marks).
+
+Covers HighWaterMarks filtering/advancing/persistence, merge_scored,
+BaseScraper._window_start clamping, scraper ``since`` wiring, and
+run_scan(marks=...) with stubbed scrapers -- no network access.
+"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.analysis.scan_state import HighWaterMarks, merge_scored
+
+
+def _today(offset_days: int = 0) -> str:
+    return (datetime.now(timezone.utc) + timedelta(days=offset_days)).strftime("%Y-%m-%d")
+
+
+def _item(source_id: str, published: str, source: str = "federal_register", **extra) -> dict:
+    item = {"source": source, "source_id": source_id, "published_date": published}
+    item.update(extra)
+    return item
+
+
+# ---------------------------------------------------------------------------
+# HighWaterMarks
+# ---------------------------------------------------------------------------
+
+
+class TestHighWaterMarks:
+    """State handling for per-source marks."""
+
+    def test_unknown_source_has_no_mark(self, tmp_path):
+        marks = HighWaterMarks(state_path=tmp_path / "state.json")
+        assert marks.since("federal_register") is None
+        items = [_item("a", _today())]
+        assert marks.filter_unchanged("federal_register", items) == items
+
+    def test_advance_records_latest_date(self, tmp_path):
+        marks = HighWaterMarks(state_path=tmp_path / "state.json")
+        marks.advance("federal_register", [_item("a", _today(-3)), _item("b", _today(-1))])
+        assert marks.since("federal_register").strftime("%Y-%m-%d") == _today(-1)
+
+    def test_mark_never_moves_past_today_or_backwards(self, tmp_path):
+        marks = HighWaterMarks(state_path=tmp_path / "state.json")
+        marks.advance("grants_gov", [_item("a", _today(-2), source="grants_gov")])
+        marks.advance("grants_gov", [
+            _item("fcst", _today(30), source="grants_gov"),
+            _item("old", _today(-10), source="grants_gov"),
+        ])
+        assert marks.since("grants_gov").strftime("%Y-%m-%d") == _today(-2)
+
+    def test_filter_drops_seen_keeps_new_and_redated(self, tmp_path):
+        marks = HighWaterMarks(state_path=tmp_path / "state.json")
+        marks.advance("congress_gov", [
+            _item("119-HR-1", _today(-2), source="congress_gov"),
+            _item("119-S-5", _today(-2), source="congress_gov"),
+        ])
+        fetched = [
+            _item("119-HR-1", _today(-2), source="congress_gov"),   # unchanged
+            _item("119-S-5", _today(), source="congress_gov"),      # updated
+            _item("119-HR-9", _today(), source="congress_gov"),     # new
+        ]
+        fresh = marks.filter_unchanged("congress_gov", fetched)
+        assert [i["source_id"] for i in fresh] == ["119-S-5", "119-HR-9"]
+
+    def test_save_round_trip_and_prune(self, tmp_path):
+        path = tmp_path / "state.json"
+        marks = HighWaterMarks(state_path=path, scan_window_days=14)
+        marks.advance("federal_register", [
+            _item("recent", _today(-1)),
+            _item("ancient", _today(-60)),
+        ])
+        marks.save()
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert set(data["sources"]["federal_register"]["seen"]) == {"recent"}
+
+        reloaded = HighWaterMarks(state_path=path)
+        assert reloaded.since("federal_register").strftime("%Y-%m-%d") == _today(-1)
+        assert reloaded.filter_unchanged("federal_register", [_item("recent", _today(-1))]) == []
+
+    def test_corrupt_state_starts_fresh(self, tmp_path):
+        path = tmp_path / "state.json"
+        path.write_text("{not json", encoding="utf-8")
+        marks = HighWaterMarks(state_path=path)
+        assert marks.since("federal_register") is None
+
+    def test_rebuild_replaces_previous_mark(self, tmp_path):
+        marks = HighWaterMarks(state_path=tmp_path / "state.json")
+        marks.advance("federal_register", [_item("a", _today())])
+        marks.rebuild("federal_register", [_item("b", _today(-4))])
+        assert marks.since("federal_register").strftime("%Y-%m-%d") == _today(-4)
+        assert marks.filter_unchanged("federal_register", [_item("a", _today())]) != []
+
+
+# ---------------------------------------------------------------------------
+# merge_scored
+# ---------------------------------------------------------------------------
+
+
+class TestMergeScored:
+    """Merging a scored delta into the stored set."""
+
+    def test_unchanged_items_kept_without_rescoring(self):
+        previous = [
+            _item("a", "2026-01-01", relevance_score=0.9),
+            _item("b", "2026-01-02", relevance_score=0.5),
+        ]
+        fresh = [_item("c", "2026-01-03", relevance_score=0.7)]
+        merged = merge_scored(previous, fresh, fresh, set())
+        assert [i["source_id"] for i in merged] == ["a", "c", "b"]
+        assert merged[0] is previous[0]
+
+    def test_updated_item_replaced_even_if_now_below_threshold(self):
+        previous = [_item("a", "2026-01-01", relevance_score=0.9)]
+        fresh_raw = [_item("a", "2026-01-05")]
+        merged = merge_scored(previous, fresh_raw, [], set())
+        assert merged == []
+
+    def test_full_refresh_sources_replaced_wholesale(self):
+        previous = [
+            _item("x", "", source="usaspending", relevance_score=0.6),
+            _item("a", "2026-01-01", relevance_score=0.4),
+        ]
+        fresh = [_item("y", "", source="usaspending", relevance_score=0.8)]
+        merged = merge_scored(previous, fresh, fresh, {"usaspending"})
+        assert [i["source_id"] for i in merged] == ["y", "a"]
+
+
+# ---------------------------------------------------------------------------
+# Scraper since wiring
+# ---------------------------------------------------------------------------
+
+
+def _scraper_config() -> dict:
+    return {
+        "sources": {
+            "federal_register": {"base_url": "https://fr.test", "authority_weight": 0.9},
+            "grants_gov": {"base_url": "https://grants.test", "authority_weight": 0.85},
+        },
+        "search_queries": ["tribal climate"],
+        "scan_window_days": 14,
+    }
+
+
+class TestScraperSince:
+    """Scrapers request only records past the high-water mark."""
+
+    def test_window_start_uses_since_inside_window(self):
+        from src.scrapers.federal_register import FederalRegisterScraper
+        scraper = FederalRegisterScraper(_scraper_config())
+        since = datetime.now(timezone.utc) - timedelta(days=2)
+        assert scraper._window_start(since) == since
+
+    def test_window_start_clamps_stale_since(self):
+        from src.scrapers.federal_register import FederalRegisterScraper
+        scraper = FederalRegisterScraper(_scraper_config())
+        start = scraper._window_start(datetime(2000, 1, 1))
+        expected = datetime.now(timezone.utc) - timedelta(days=14)
+        assert abs((start - expected).total_seconds()) < 5
+
+    def test_federal_register_scan_passes_since_date(self):
+        from src.scrapers.federal_register import FederalRegisterScraper
+        scraper = FederalRegisterScraper(_scraper_config())
+        scraper._search = AsyncMock(return_value=[])
+        scraper._search_by_agencies = AsyncMock(return_value=[])
+        since = datetime.now(timezone.utc) - timedelta(days=1)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            asyncio.run(scraper.scan(since=since))
+
+        assert scraper._search.call_args.args[2] == since.strftime("%Y-%m-%d")
+        assert scraper._search_by_agencies.call_args.args[1] == since.strftime("%Y-%m-%d")
+
+    def test_grants_incremental_filters_cfda_and_skips_zombie_tracker(self):
+        from src.scrapers.grants_gov import GrantsGovScraper
+        scraper = GrantsGovScraper(_scraper_config())
+        scraper._search_cfda = AsyncMock(return_value=[])
+        scraper._search = AsyncMock(return_value=[])
+        scraper._save_cfda_tracker = lambda tracker: pytest.fail("tracker saved")
+        since = datetime.now(timezone.utc) - timedelta(days=1)
+
+        with patch("asyncio.sleep", new_callable=AsyncMock):
+            asyncio.run(scraper.scan(since=since))
+
+        expected = since.strftime("%m/%d/%Y")
+        assert scraper._search_cfda.call_args.kwargs["posted_from"] == expected
+        assert scraper._search.call_args.kwargs["posted_from"] == expected
+        assert scraper.zombie_warnings == []
+
+
+# ---------------------------------------------------------------------------
+# run_scan(marks=...)
+# ---------------------------------------------------------------------------
+
+
+class _FakeIncrementalScraper:
+    supports_incremental = True
+    calls: list = []
+    items: list = []
+    fail = False
+
+    def __init__(self, config):
+        pass
+
+    async def scan(self, since=None):
+        type(self).calls.append(since)
+        if type(self).fail:
+            raise RuntimeError("API down")
+        return list(type(self).items)
+
+
+class TestRunScanIncremental:
+    """run_scan threads marks through scrapers and caches."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_fake(self, tmp_path):
+        _FakeIncrementalScraper.calls = []
+        _FakeIncrementalScraper.fail = False
+        with patch("src.main.OUTPUTS_DIR", tmp_path), \
+             patch.dict("src.main.SCRAPERS", {"fake": _FakeIncrementalScraper}, clear=True):
+            yield
+
+    def test_delta_returned_and_mark_advanced(self, tmp_path):
+        from src.main import run_scan
+        marks = HighWaterMarks(state_path=tmp_path / "state.json")
+        marks.advance("fake", [_item("a", _today(-1), source="fake")])
+        _FakeIncrementalScraper.items = [
+            _item("a", _today(-1), source="fake"),
+            _item("b", _today(), source="fake"),
+        ]
+
+        items = asyncio.run(run_scan({}, [], ["fake"], marks=marks))
+
+        assert [i["source_id"] for i in items] == ["b"]
+        assert _FakeIncrementalScraper.calls[0].strftime("%Y-%m-%d") == _today(-1)
+        assert marks.since("fake").strftime("%Y-%m-%d") == _today()
+
+    def test_delta_merged_into_source_cache(self, tmp_path):
+        from src.main import _save_source_cache, run_scan
+        _save_source_cache("fake", [_item("a", _today(-1), source="fake")])
+        marks = HighWaterMarks(state_path=tmp_path / "state.json")
+        _FakeIncrementalScraper.items = [_item("b", _today(), source="fake")]
+
+        asyncio.run(run_scan({}, [], ["fake"], marks=marks))
+
+        cached = json.loads((tmp_path / ".cache_fake.json").read_text(encoding="utf-8"))
+        assert sorted(i["source_id"] for i in cached["items"]) == ["a", "b"]
+
+    def test_failure_keeps_mark_and_returns_nothing(self, tmp_path):
+        from src.main import _save_source_cache, run_scan
+        _save_source_cache("fake", [_item("a", _today(-1), source="fake")])
+        marks = HighWaterMarks(state_path=tmp_path / "state.json")
+        marks.advance("fake", [_item("a", _today(-1), source="fake")])
+        _FakeIncrementalScraper.fail = True
+
+        items = asyncio.run(run_scan({}, [], ["fake"], marks=marks))
+
+        assert items == []
+        assert marks.since("fake").strftime("%Y-%m-%d") == _today(-1)
@@ -0,0 +1,280 @@
+"""Tests for hedged requests and the scan deadline (src/scrapers/latency.py).
+
+Covers:
+- LatencyTracker percentiles and hedge delay
+- hedged(): first answer wins, errors fall through to the other call
+- hedged(): a cancelled original is recorded as a censored sample
+- BaseScraper hedges slow GETs only once the latency window is warm
+- Scan deadline: no attempts, backoffs or waits past it; no breaker failure
+- run_scan fills a deadline-cut source from cache, or falls back entirely
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.scrapers.base import BaseScraper
+from src.scrapers.circuit_breaker import CircuitState
+from src.scrapers.latency import LatencyTracker, ScanDeadlineExceeded, hedged
+from tests.conftest import FakeResponse, FakeSession
+
+
+@pytest.fixture(autouse=True)
+def _fresh_trackers():
+    with patch.dict("src.scrapers.latency._TRACKERS", clear=True):
+        yield
+
+
+def _scraper(**resilience):
+    return BaseScraper("src", {"resilience": {"backoff_base": 1, **resilience}})
+
+
+def _get(scraper, session, method="GET"):
+    return asyncio.run(scraper._request_with_retry(session, method, "http://api.invalid/x"))
+
+
+class TestLatencyTracker:
+    """Percentiles and hedge delay."""
+
+    def test_percentiles(self):
+        tracker = LatencyTracker()
+        for ms in range(1, 101):
+            tracker.observe(ms / 1000)
+        assert tracker.p50 == pytest.approx(0.050)
+        assert tracker.p95 == pytest.approx(0.095)
+        assert LatencyTracker().p95 is None
+
+    def test_window_keeps_recent_samples(self):
+        tracker = LatencyTracker(window=3)
+        for s in (9.0, 1.0, 1.0, 1.0):
+            tracker.observe(s)
+        assert len(tracker) == 3 and tracker.p95 == 1.0
+
+    def test_hedge_delay_needs_samples_and_has_floor(self):
+        tracker = LatencyTracker()
+        for _ in range(19):
+            tracker.observe(0.01)
+        assert tracker.hedge_delay(min_samples=20) is None
+        tracker.observe(0.01)
+        assert tracker.hedge_delay(min_samples=20, min_delay=0.25) == 0.25
+
+    def test_trackers_shared_per_source(self):
+        assert LatencyTracker.for_source("a") is LatencyTracker.for_source("a")
+        assert LatencyTracker.for_source("a") is not LatencyTracker.for_source("b")
+
+
+class TestHedged:
+    """hedged() race semantics."""
+
+    @staticmethod
+    def _calls(*plan):
+        """send() factory: each call sleeps, then returns or raises per ``plan``."""
+        plan = list(plan)
+
+        async def send():
+            delay, outcome = plan.pop(0)
+            await asyncio.sleep(delay)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return send
+
+    def test_fast_first_call_is_not_hedged(self):
+        tracker = LatencyTracker()
+        send = self._calls((0.0, "first"))
+        assert asyncio.run(hedged(send, 0.5, tracker)) == "first"
+        assert tracker.hedged == 0
+
+    def test_hedge_wins_over_slow_first(self):
+        tracker = LatencyTracker()
+        send = self._calls((5.0, "slow"), (0.0, "hedge"))
+        start = time.monotonic()
+        assert asyncio.run(hedged(send, 0.02, tracker)) == "hedge"
+        assert time.monotonic() - start < 1.0
+        assert (tracker.hedged, tracker.hedge_wins) == (1, 1)
+
+    def test_cancelled_original_recorded_when_hedge_wins(self):
+        tracker = LatencyTracker()
+        send = self._calls((5.0, "slow"), (0.05, "hedge"))
+        assert asyncio.run(hedged(send, 0.02, tracker)) == "hedge"
+        assert len(tracker) == 1
+        assert 0.07 <= tracker.p95 < 1.0
+
+    def test_original_not_recorded_twice_when_it_wins(self):
+        tracker = LatencyTracker()
+        send = self._calls((0.05, "first"), (5.0, "hedge"))
+        assert asyncio.run(hedged(send, 0.01, tracker)) == "first"
+        assert len(tracker) == 0
+
+    def test_failed_call_leaves_race_to_other(self):
+        tracker = LatencyTracker()
+        send = self._calls((0.05, "first"), (0.0, OSError("reset")))
+        assert asyncio.run(hedged(send, 0.01, tracker)) == "first"
+        assert tracker.hedge_wins == 0
+
+    def test_both_failing_raises(self):
+        send = self._calls((0.03, ValueError("a")), (0.0, ValueError("b")))
+        with pytest.raises(ValueError):
+            asyncio.run(hedged(send, 0.01, LatencyTracker()))
+
+    def test_caller_cancelled_before_hedge_cancels_first(self):
+        started = []
+
+        async def send():
+            task = asyncio.current_task()
+            started.append(task)
+            await asyncio.sleep(5.0)
+
+        async def run():
+            outer = asyncio.ensure_future(hedged(send, 1.0, LatencyTracker()))
+            await asyncio.sleep(0.02)
+            outer.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await outer
+
+        asyncio.run(run())
+        assert len(started) == 1 and started[0].cancelled()
+
+    def test_externally_cancelled_call_leaves_race_to_other(self):
+        tracker = LatencyTracker()
+        tasks = []
+
+        async def send():
+            tasks.append(asyncio.current_task())
+            await asyncio.sleep(0.05 if len(tasks) == 2 else 5.0)
+            return len(tasks)
+
+        async def run():
+            outer = asyncio.ensure_future(hedged(send, 0.01, tracker))
+            await asyncio.sleep(0.02)
+            tasks[0].cancel()
+            return await outer
+
+        assert asyncio.run(run()) == 2
+
+
+class TestScraperHedging:
+    """BaseScraper._request_with_retry with resilience.hedging."""
+
+    def test_slow_get_hedged_once_window_is_warm(self):
+        scraper = _scraper(hedging={"enabled": True, "min_samples": 5, "min_delay": 0.01})
+        for _ in range(5):
+            scraper._latency.observe(0.01)
+
+        session = FakeSession(FakeResponse(delay=5.0, body={"v": "slow"}), FakeResponse(body={"v": "hedge"}))
+        assert _get(scraper, session) == {"v": "hedge"}
+        assert session.calls == 2
+        assert scraper._latency.hedge_wins == 1
+        # The hedge's own response time plus the cancelled original's
+        assert len(scraper._latency) == 7
+
+    def test_cold_window_and_post_not_hedged(self):
+        scraper = _scraper(hedging={"enabled": True, "min_samples": 5, "min_delay": 0.01})
+        session = FakeSession(FakeResponse(delay=0.05))
+        _get(scraper, session)
+        assert session.calls == 1
+
+        for _ in range(5):
+            scraper._latency.observe(0.001)
+        session = FakeSession(FakeResponse(delay=0.05))
+        _get(scraper, session, method="POST")
+        assert session.calls == 1
+
+    def test_latency_recorded_without_hedging(self):
+        scraper = _scraper()
+        _get(scraper, FakeSession(FakeResponse()))
+        assert len(scraper._latency) == 1 and scraper._latency.hedged == 0
+
+
+class TestScanDeadline:
+    """BaseScraper.deadline in the retry loop."""
+
+    def test_past_deadline_sends_nothing(self):
+        scraper = _scraper()
+        scraper.deadline = time.monotonic() - 1
+        session = FakeSession(FakeResponse())
+        with pytest.raises(ScanDeadlineExceeded):
+            _get(scraper, session)
+        assert session.calls == 0 and scraper.deadline_exceeded
+
+    def test_backoff_past_deadline_stops_without_breaker_failure(self):
+        scraper = _scraper(circuit_breaker={"failure_threshold": 1})
+        scraper.deadline = time.monotonic() + 0.5  # backoff is >= 1s
+        session = FakeSession(FakeResponse(status=503))
+        with pytest.raises(ScanDeadlineExceeded):
+            _get(scraper, session)
+        assert session.calls == 1
+        assert scraper._circuit_breaker.state == CircuitState.CLOSED
+
+    def test_attempt_timeout_cut_to_time_left(self):
+        scraper = _scraper(request_timeout=30)
+        scraper.deadline = time.monotonic() + 2
+        bounded = scraper._deadline_bounded({"timeout": scraper.request_timeout})
+        assert 0 < bounded["timeout"].total <= 2
+
+        scraper.deadline = time.monotonic() + 60
+        assert scraper._deadline_bounded({"timeout": scraper.request_timeout})["timeout"].total == 30
+
+
+class _PartialScraper:
+    """Fetches one item, then runs out of scan time."""
+
+    supports_incremental = False
+
+    def __init__(self, config):
+        self.deadline = None
+        self.deadline_exceeded = False
+
+    async def scan(self):
+        self.deadline_exceeded = True
+        return [{"source_id": "new", "source": "part"}]
+
+
+class _HangingScraper(_PartialScraper):
+    async def scan(self):
+        await asyncio.sleep(30)
+        return []
+
+
+class TestRunScanDeadline:
+    """run_scan with resilience.scan_deadline_seconds."""
+
+    @pytest.fixture(autouse=True)
+    def _outputs(self, tmp_path):
+        with patch("src.main.OUTPUTS_DIR", tmp_path):
+            yield
+
+    @staticmethod
+    def _seed_cache(tmp_path, source, ids):
+        (tmp_path / f".cache_{source}.json").write_text(json.dumps({
+            "source": source, "cached_at": "2026-01-01T00:00:00+00:00",
+            "items": [{"source_id": i, "source": source, "title": "cached"} for i in ids],
+        }), encoding="utf-8")
+
+    def test_cut_short_source_filled_from_cache(self, tmp_path):
+        from src.main import run_scan
+
+        self._seed_cache(tmp_path, "part", ["new", "old"])
+        config = {"resilience": {"scan_deadline_seconds": 60}}
+        with patch.dict("src.main.SCRAPERS", {"part": _PartialScraper}, clear=True):
+            items = asyncio.run(run_scan(config, [], ["part"]))
+
+        assert [(i["source_id"], i.get("title")) for i in items] == [("new", None), ("old", "cached")]
+        cached = json.loads((tmp_path / ".cache_part.json").read_text(encoding="utf-8"))
+        assert len(cached["items"]) == 2 and cached["cached_at"].startswith("2026-01-01")
+
+    def test_scan_over_deadline_falls_back_to_cache(self, tmp_path):
+        from src.main import run_scan
+
+        self._seed_cache(tmp_path, "hang", ["a"])
+        config = {"resilience": {"scan_deadline_seconds": 0.05}}
+        start = time.monotonic()
+        with patch.dict("src.main.SCRAPERS", {"hang": _HangingScraper}, clear=True), \
+             patch("src.main._SCAN_DEADLINE_GRACE_S", 0.05):
+            items = asyncio.run(run_scan(config, [], ["hang"]))
+
+        assert time.monotonic() - start < 5
+        assert [i["source_id"] for i in items] == ["a"]
@@ -416,6 +416,47 @@ class TestTribalRegistry:
         assert result is not None
         assert "AK" in result["states"]
 
+    def test_get_by_id_missing(self, registry_data: dict) -> None:
+        from src.packets.registry import TribalRegistry
+        reg = TribalRegistry(registry_data)
+        assert reg.get_by_id("epa_999") is None
+
+    def test_get_by_id_is_read_only(self, registry_data: dict) -> None:
+        from src.packets.registry import TribalRegistry
+        reg = TribalRegistry(registry_data)
+        result = reg.get_by_id("epa_001")
+        with pytest.raises(TypeError):
+            result["name"] = "Changed"
+        assert reg.get_by_id("epa_001")["name"] == "Alpha Tribe of Arizona"
+
+    def test_get_all_is_shared_read_only_view(self, registry_data: dict) -> None:
+        from src.packets.registry import TribalRegistry
+        reg = TribalRegistry(registry_data)
+        first = reg.get_all()
+        assert isinstance(first, tuple)
+        assert first is reg.get_all()
+
+    def test_get_all_records_are_shared_not_copied(self, registry_data: dict) -> None:
+        """get_all() hands out the registry's own records: copy before mutating."""
+        from src.packets.registry import TribalRegistry
+        reg = TribalRegistry(registry_data)
+        record = reg.get_all()[0]
+        assert record is reg.get_all()[0]
+        assert dict(reg.get_by_id(record["tribe_id"])) == record
+
+        copy = dict(record)
+        copy["name"] = "Changed"
+        assert reg.get_all()[0]["name"] == "Alpha Tribe of Arizona"
+        assert reg.get_by_id(record["tribe_id"])["name"] == "Alpha Tribe of Arizona"
+
+    def test_get_ids_by_state(self, registry_data: dict) -> None:
+        from src.packets.registry import TribalRegistry
+        reg = TribalRegistry(registry_data)
+        assert reg.get_ids_by_state("OK") == ("epa_002", "epa_003")
+        assert reg.get_ids_by_state("TX") == ("epa_003",)
+        assert reg.get_ids_by_state("tx") == ()
+        assert reg.get_ids_by_state("WY") == ()
+
 
 # ===========================================================================
 # CONG-01, CONG-02: TestCongressionalMapper
@@ -556,9 +597,14 @@ class TestPacketOrchestrator:
     """Tests for PacketOrchestrator integration."""
 
     @pytest.fixture
-    def full_config(self, registry_data: dict, ecoregion_data: dict, congress_data: dict) -> dict:
-        """Merge all sub-configs into one."""
-        merged = {"packets": {}}
+    def full_config(
+        self, tmp_path: Path, registry_data: dict, ecoregion_data: dict, congress_data: dict,
+    ) -> dict:
+        """Merge all sub-configs into one, with outputs under tmp_path."""
+        merged = {"packets": {
+            "output_dir": str(tmp_path / "outputs" / "packets"),
+            "state_dir": str(tmp_path / "packet_state"),
+        }}
         merged["packets"].update(registry_data.get("packets", {}))
         merged["packets"].update(ecoregion_data.get("packets", {}))
         merged["packets"].update(congress_data.get("packets", {}))
@@ -797,19 +843,19 @@ class TestTribalAwardMatcher:
         assert result["epa_001"][0]["obligation"] == 500000.0
 
     def test_write_cache_zero_awards(self, award_config: dict) -> None:
-        """Verify zero-award Tribes get cache file with no_awards_context field."""
+        """Verify zero-award Tribes get a cache record with no_awards_context field."""
+        from src.packets.award_store import AwardCacheStore
         from src.packets.awards import TribalAwardMatcher
         matcher = TribalAwardMatcher(award_config)
 
         # No awards matched to any Tribe
         count = matcher.write_cache({})
-        assert count == 4  # All 4 Tribes get cache files
+        assert count == 4  # All 4 Tribes get cache records
 
-        # Check a specific Tribe's cache file
-        cache_file = Path(award_config["packets"]["awards"]["cache_dir"]) / "epa_001.json"
-        assert cache_file.exists()
-        with open(cache_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Check a specific Tribe's cache record
+        store = AwardCacheStore(Path(award_config["packets"]["awards"]["cache_dir"]))
+        data = store.get("epa_001")
+        assert data is not None
         assert data["awards"] == []
         assert data["award_count"] == 0
         assert "no_awards_context" in data
@@ -817,6 +863,7 @@ class TestTribalAwardMatcher:
 
     def test_write_cache_numeric_amounts(self, award_config: dict) -> None:
         """Verify award amounts are stored as float, not string."""
+        from src.packets.award_store import AwardCacheStore
         from src.packets.awards import TribalAwardMatcher
         matcher = TribalAwardMatcher(award_config)
 
@@ -828,9 +875,7 @@ class TestTribalAwardMatcher:
         }
         matcher.write_cache(matched)
 
-        cache_file = Path(award_config["packets"]["awards"]["cache_dir"]) / "epa_001.json"
-        with open(cache_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = AwardCacheStore(Path(award_config["packets"]["awards"]["cache_dir"])).get("epa_001")
         assert isinstance(data["total_obligation"], float)
         assert data["total_obligation"] == 750000.0
         assert data["award_count"] == 2
@@ -12,7 +12,9 @@ cap truncation, and error recovery for each scraper.
 from __future__ import annotations
 
 import asyncio
+import json
 import os
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -447,6 +449,113 @@ class TestCongressGovPagination:
         assert result["cosponsors"] == []
         assert result["subjects"] == []
 
+    @staticmethod
+    def _detail_responder(update_date="2025-03-01", fail=()):
+        """Fake _request_with_retry answering bill detail URLs, tracking concurrency."""
+        state = {"calls": [], "in_flight": 0, "peak": 0}
+
+        async def respond(session, method, url, **kwargs):
+            state["calls"].append(url)
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            tail = url.rsplit("/", 1)[-1].split("?")[0]
+            if tail in fail:
+                raise RuntimeError(f"{tail} failed")
+            if tail.isdigit():
+                return {"bill": {"number": tail, "updateDate": update_date}}
+            if tail == "subjects":
+                return {"subjects": {"legislativeSubjects": [{"name": "Native Americans"}]}}
+            if tail == "text":
+                return {"textVersions": [{"type": "Introduced"}]}
+            return {tail: [{"url": url}]}
+
+        return respond, state
+
+    def test_fetch_bill_detail_subresources_concurrent(self):
+        """The 4 sub-endpoints are requested together, within max_concurrency."""
+        scraper = self._make_scraper()
+        scraper.max_concurrency = 3
+        respond, state = self._detail_responder()
+        scraper._request_with_retry = respond
+
+        result = asyncio.run(scraper._fetch_bill_detail(MagicMock(), 119, "hr", "12"))
+
+        assert len(state["calls"]) == 5
+        assert state["calls"][0].endswith("/bill/119/hr/12")
+        assert state["peak"] == 3
+        assert result["text_versions"] == [{"type": "Introduced"}]
+
+    def test_fetch_bill_detail_cached_by_update_date(self):
+        """Unchanged bills reuse sub-resources; a new updateDate refetches them."""
+        scraper = self._make_scraper()
+        respond, state = self._detail_responder()
+        scraper._request_with_retry = respond
+
+        first = asyncio.run(scraper._fetch_bill_detail(MagicMock(), 119, "hr", "12"))
+        second = asyncio.run(scraper._fetch_bill_detail(MagicMock(), 119, "hr", "12"))
+        assert len(state["calls"]) == 6
+        assert second == first
+
+        respond, state = self._detail_responder(update_date="2025-04-01")
+        scraper._request_with_retry = respond
+        asyncio.run(scraper._fetch_bill_detail(MagicMock(), 119, "hr", "12"))
+        assert len(state["calls"]) == 5
+
+    def test_fetch_bill_detail_partial_failure_not_cached(self):
+        """A failed sub-endpoint leaves the bill out of the cache."""
+        scraper = self._make_scraper()
+        respond, state = self._detail_responder(fail=("cosponsors",))
+        scraper._request_with_retry = respond
+
+        asyncio.run(scraper._fetch_bill_detail(MagicMock(), 119, "hr", "12"))
+        asyncio.run(scraper._fetch_bill_detail(MagicMock(), 119, "hr", "12"))
+        assert len(state["calls"]) == 10
+
+    def test_fetch_bill_details_in_order_with_errors(self, tmp_path):
+        """Several bills hydrate in parallel; results keep input order."""
+        scraper = self._make_scraper()
+        respond, state = self._detail_responder()
+        scraper._request_with_retry = respond
+
+        results = asyncio.run(scraper.fetch_bill_details(
+            MagicMock(), [(119, "hr", "1"), (119, "s", "x"), (119, "s", "3")],
+        ))
+
+        assert results[0]["bill"]["number"] == "1"
+        assert isinstance(results[1], ValueError)
+        assert results[2]["bill"]["number"] == "3"
+        assert state["peak"] > 1
+
+        cache_path = tmp_path / "bill_detail_cache.json"
+        scraper.save_detail_cache(cache_path)
+        fresh = self._make_scraper()
+        assert fresh.load_detail_cache(cache_path) == 2
+        assert fresh.load_detail_cache(tmp_path / "missing.json") == 0
+
+    def test_hourly_quota_fits_congress_limit(self):
+        """The hourly quota stays under Congress.gov's 5,000/hour, and the
+        per-second rate lets a cold ~500-request build finish in a minute."""
+        from src.scrapers.congress_gov import CongressGovScraper
+
+        config_path = Path(__file__).resolve().parent.parent / "config" / "scanner_config.json"
+        source = json.loads(config_path.read_text(encoding="utf-8"))["sources"]["congress_gov"]
+        assert source["requests_per_hour"] <= 5000
+        assert CongressGovScraper.default_requests_per_hour <= 5000
+        assert (500 - source.get("burst", 1)) / source["requests_per_second"] < 60
+
+    def test_detail_cache_keeps_only_requested_bills(self, tmp_path):
+        scraper = self._make_scraper()
+        scraper._detail_cache = {
+            "119-hr-1": {"version": "a", "parts": {}},
+            "119-s-2": {"version": "b", "parts": {}},
+        }
+        cache_path = tmp_path / "bill_detail_cache.json"
+        scraper.save_detail_cache(cache_path, keep=[(119, "HR", "1")])
+        saved = json.loads(cache_path.read_text(encoding="utf-8"))["bills"]
+        assert list(saved) == ["119-hr-1"]
+
 
 # ===========================================================================
 # Federal Register Pagination Tests (~12 tests)
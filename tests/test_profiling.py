@@ -0,0 +1,228 @@
+"""Tests for the scan pipeline profiler (src/profiling.py).
+
+Covers:
+- Span timing, throughput and error capture
+- Concurrent scraper spans on separate trace tracks
+- Chrome trace-event export
+- Regression flags against the median of recent runs
+- write_profile output files and history
+- -X importtime parsing and --import-profile
+- Lazy CLI imports: each mode loads only its own stack
+"""
+
+import asyncio
+import json
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.paths import PROJECT_ROOT
+from src.profiling import (
+    ProfileHistory,
+    StageProfiler,
+    format_import_profile,
+    parse_importtime,
+)
+
+
+class _SlowScraper:
+    supports_incremental = False
+
+    def __init__(self, config):
+        pass
+
+    async def scan(self):
+        await asyncio.sleep(0.02)
+        return [{"source_id": "x", "source": "slow"}]
+
+
+class TestSpans:
+    """StageProfiler.span."""
+
+    def test_records_items_and_throughput(self):
+        profiler = StageProfiler()
+        with profiler.span("score") as span:
+            span.items = 10
+
+        (rec,) = profiler.spans
+        assert rec.name == "score" and rec.kind == "stage"
+        assert rec.wall_s > 0 and rec.cpu_s >= 0
+        assert rec.items_per_s == pytest.approx(10 / rec.wall_s)
+
+    def test_error_recorded_and_reraised(self):
+        profiler = StageProfiler()
+        with pytest.raises(ValueError):
+            with profiler.span("graph"):
+                raise ValueError("boom")
+        assert profiler.spans[0].error == "ValueError"
+
+    def test_disabled_profiler_records_nothing(self):
+        profiler = StageProfiler(enabled=False)
+        with profiler.span("score") as span:
+            span.items = 3
+        assert profiler.spans == []
+
+    def test_concurrent_scrapers_get_their_own_tracks(self, tmp_path):
+        from src.main import run_scan
+
+        profiler = StageProfiler()
+        with patch("src.main.OUTPUTS_DIR", tmp_path), \
+             patch.dict("src.main.SCRAPERS", {"a": _SlowScraper, "b": _SlowScraper}, clear=True):
+            items = asyncio.run(run_scan({}, [], ["a", "b"], profiler=profiler))
+
+        assert len(items) == 2
+        scrapers = [s for s in profiler.spans if s.kind == "scraper"]
+        assert sorted(s.name for s in scrapers) == ["a", "b"]
+        assert sorted(s.lane for s in scrapers) == [1, 2]
+        assert all(s.items == 1 and s.wall_s >= 0.02 for s in scrapers)
+
+
+class TestTraceExport:
+    """StageProfiler.trace_events / record."""
+
+    def test_trace_events_are_complete_events(self):
+        profiler = StageProfiler()
+        with profiler.span("ingest"):
+            with profiler.span("grants_gov", kind="scraper") as span:
+                span.items = 4
+
+        trace = profiler.trace_events()
+        events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        assert [(e["name"], e["cat"], e["tid"]) for e in events] == [
+            ("ingest", "stage", 0), ("grants_gov", "scraper", 1),
+        ]
+        assert events[1]["args"]["items"] == 4
+        assert events[0]["dur"] >= events[1]["dur"]
+
+        record = profiler.record()
+        assert [s["name"] for s in record["spans"]] == ["ingest", "grants_gov"]
+        assert "lane" not in record["spans"][0]
+        json.dumps(record)
+
+
+class TestHistory:
+    """ProfileHistory.regressions / append."""
+
+    @staticmethod
+    def _record(**walls):
+        return {
+            "started_at": "2026-01-01T00:00:00+00:00",
+            "total": {"wall_s": sum(walls.values())},
+            "spans": [{"name": n, "kind": "stage", "wall_s": w} for n, w in walls.items()],
+        }
+
+    def test_flags_stage_slower_than_recent_median(self, tmp_path):
+        history = ProfileHistory(tmp_path / "history.json", window=3)
+        for wall in (9.0, 1.0, 1.2, 0.8):
+            history.append(self._record(graph=wall, score=2.0))
+
+        flagged = history.regressions(self._record(graph=3.0, score=2.1))
+        assert [(r["name"], r["median_s"], r["runs"]) for r in flagged] == [("graph", 1.0, 3)]
+
+        reloaded = ProfileHistory(tmp_path / "history.json")
+        assert len(reloaded.runs) == 4
+        assert reloaded.runs[-1]["wall_s"] == {"stage:graph": 0.8, "stage:score": 2.0}
+
+    def test_needs_three_runs_and_ignores_noise(self, tmp_path):
+        history = ProfileHistory(tmp_path / "history.json")
+        history.append(self._record(graph=0.01))
+        history.append(self._record(graph=0.01))
+        assert history.regressions(self._record(graph=5.0)) == []
+        history.append(self._record(graph=0.01))
+        assert history.regressions(self._record(graph=0.1)) == []
+        assert len(history.regressions(self._record(graph=5.0))) == 1
+
+
+class TestWriteProfile:
+    """src.main.write_profile."""
+
+    def test_writes_record_trace_and_history(self, tmp_path, capsys):
+        import src.main as main_mod
+
+        profiler = StageProfiler()
+        with profiler.span("score") as span:
+            span.items = 1
+        with patch.object(main_mod, "PROFILES_DIR", tmp_path), \
+             patch.object(main_mod, "PROFILE_HISTORY_PATH", tmp_path / "history.json"):
+            assert main_mod.write_profile(profiler, {}) == []
+
+        names = sorted(p.name for p in tmp_path.iterdir())
+        assert names[0] == "history.json"
+        assert names[1].startswith("profile-") and names[1].endswith(".json")
+        assert names[2].endswith(".trace.json")
+        assert "score" in capsys.readouterr().out
+
+
+IMPORTTIME_STDERR = """\
+import time: self [us] | cumulative | imported package
+import time:        50 |         50 |       aiohttp.helpers
+import time:       300 |        350 |     aiohttp
+import time:       100 |        450 |   src.scrapers.http_pool
+import time:        20 |        470 | src.scrapers.base
+INFO some log line
+import time:        10 |         10 | json
+"""
+
+
+def _modules_after(code: str) -> set[str]:
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys; print(' '.join(sys.modules))"],
+        capture_output=True, text=True, cwd=str(PROJECT_ROOT), timeout=60, check=True,
+    )
+    return set(out.stdout.split())
+
+
+class TestImportProfile:
+    """parse_importtime / format_import_profile / --import-profile."""
+
+    def test_parses_depth_and_project_importer(self):
+        timings = parse_importtime(IMPORTTIME_STDERR.splitlines())
+        assert [(t.module, t.depth, t.via) for t in timings] == [
+            ("aiohttp.helpers", 3, "src.scrapers.http_pool"),
+            ("aiohttp", 2, "src.scrapers.http_pool"),
+            ("src.scrapers.http_pool", 1, "src.scrapers.base"),
+            ("src.scrapers.base", 0, None),
+            ("json", 0, None),
+        ]
+        assert timings[1].self_us == 300 and timings[1].cumulative_us == 350
+
+    def test_format_lists_slowest_first(self):
+        text = format_import_profile(parse_importtime(IMPORTTIME_STDERR.splitlines()), top=2)
+        lines = text.splitlines()
+        assert "0.5 ms total, 5 modules" in lines[0]
+        assert [line.split()[2] for line in lines[2:]] == ["src.scrapers.base", "src.scrapers.http_pool"]
+
+    def test_cli_reports_imports_for_mode(self):
+        out = subprocess.run(
+            [sys.executable, "-m", "src.main", "--import-profile", "--programs"],
+            capture_output=True, text=True, cwd=str(PROJECT_ROOT), timeout=120,
+        )
+        assert out.returncode == 0
+        assert "Tracked Programs" in out.stdout and "Slowest imports" in out.stdout
+        assert "import time:" not in out.stderr
+
+
+class TestLazyCliImports:
+    """src.main imports only what each CLI mode uses."""
+
+    def test_startup_skips_scrapers_graph_and_docx(self):
+        loaded = _modules_after("import src.main")
+        heavy = {"aiohttp", "numpy", "docx", "src.scrapers.base",
+                 "src.graph.builder", "src.reports.generator", "src.monitors"}
+        assert not heavy & loaded
+
+    def test_packet_path_skips_scrapers(self):
+        loaded = _modules_after("import src.main, src.packets.orchestrator")
+        assert "docx" in loaded
+        assert not {"aiohttp", "src.scrapers.base", "src.graph.builder"} & loaded
+
+    def test_scraper_classes_resolved_on_first_use(self):
+        from src.main import SCRAPERS, scraper_class
+        from src.scrapers.grants_gov import GrantsGovScraper
+
+        with patch.dict(SCRAPERS):
+            assert scraper_class("grants_gov") is GrantsGovScraper
+            assert SCRAPERS["grants_gov"] is GrantsGovScraper
+            assert scraper_class("nope") is None
@@ -421,6 +421,71 @@ class TestBatchReview:
         assert batch_result.total_passed == 0
         assert batch_result.total_failed == 0
 
+    def test_batch_review_worker_pool_matches_serial(self, tmp_path):
+        """workers > 1 produces the same BatchReviewResult, in the same order."""
+        internal_dir = tmp_path / "internal"
+        internal_dir.mkdir()
+        congressional_dir = tmp_path / "congressional"
+        congressional_dir.mkdir()
+        for i in range(4):
+            paras = _make_clean_paragraphs(15 + i * 5)
+            paras.append("TBD approach with new frame" if i % 2 else "CONFIDENTIAL")
+            _create_mock_docx(internal_dir, f"tribe_{i}_internal.docx", paras)
+            _create_mock_docx(congressional_dir, f"tribe_{i}_congressional.docx", paras)
+        (congressional_dir / "corrupt.docx").write_bytes(b"not a zip")
+
+        serial = DocumentQualityReviewer().review_batch(tmp_path)
+        pooled = DocumentQualityReviewer(workers=2).review_batch(tmp_path)
+
+        assert pooled == serial
+        assert serial.issues_by_category["error"] == 1
+
+
+class TestStreamingReader:
+    """The streaming DOCX reader sees what python-docx sees."""
+
+    def test_scan_matches_python_docx(self, tmp_path):
+        """Paragraph text, count and page-break estimate match Document()."""
+        from docx.enum.text import WD_BREAK
+
+        from src.packets.quality_review import _scan_docx
+
+        doc = Document()
+        doc.add_paragraph("Executive Summary")
+        para = doc.add_paragraph("tab\tline\nbreak ")
+        para.add_run("second run").add_break(WD_BREAK.PAGE)
+        table = doc.add_table(rows=1, cols=1)
+        table.cell(0, 0).text = "table text is not a body paragraph"
+        doc.add_paragraph("after table").add_run().add_break(WD_BREAK.COLUMN)
+        doc.add_page_break()
+        path = tmp_path / "mixed.docx"
+        doc.save(str(path))
+
+        reloaded = Document(str(path))
+        scan = _scan_docx(path)
+
+        assert scan.text == " ".join(p.text for p in reloaded.paragraphs)
+        assert scan.paragraph_count == len(reloaded.paragraphs)
+        assert scan.page_breaks == 2
+
+    def test_overlapping_patterns_all_reported(self, tmp_path):
+        """Nested literals ('lobby' in 'lobbying') and regexes each report."""
+        paras = _make_clean_paragraphs(25)
+        paras.append("Lobbying plan: approach the office with a new frame.")
+        path = _create_mock_docx(tmp_path, "overlap.docx", paras)
+
+        result = DocumentQualityReviewer().review_document(path, DOC_B)
+        messages = [i.message for i in result.issues if i.category == "audience_leakage"]
+
+        assert any("'lobby'" in m for m in messages)
+        assert any("'lobbying'" in m for m in messages)
+        assert any("approach.*with.*frame" in m for m in messages)
+
+    def test_only_genuine_regexes_searched_separately(self):
+        """Multi-word literals go through the shared matcher, not re.search."""
+        reviewer = DocumentQualityReviewer()
+        assert list(reviewer._internal_regexes) == [r"approach.*with.*frame"]
+
 
 class TestReportGeneration:
     """Verify markdown report generation."""
@@ -0,0 +1,115 @@
+"""Tests for the token-bucket rate limiter (src/scrapers/rate_limiter.py).
+
+Uses an injectable clock for deterministic refill behaviour.
+"""
+
+import asyncio
+
+import pytest
+
+from src.scrapers.rate_limiter import HourlyQuota, TokenBucket
+from tests.conftest import MockClock
+
+
+class TestTokenBucket:
+    """Refill, burst, and deferral semantics."""
+
+    def test_burst_up_to_capacity(self):
+        bucket = TokenBucket(rate=2, capacity=3, clock=MockClock(start=1000.0))
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    def test_refills_at_rate(self):
+        clock = MockClock(start=1000.0)
+        bucket = TokenBucket(rate=2, capacity=1, clock=clock)
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+        assert bucket.delay() == pytest.approx(0.5)
+        clock.advance(0.5)
+        assert bucket.try_acquire()
+
+    def test_refill_capped_at_capacity(self):
+        clock = MockClock(start=1000.0)
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+        bucket.try_acquire()
+        bucket.try_acquire()
+        clock.advance(60)
+        assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+
+    def test_default_capacity_matches_rate(self):
+        assert TokenBucket(rate=5).capacity == 5
+        assert TokenBucket(rate=0.2).capacity == 1
+
+    def test_defer_blocks_until_deadline(self):
+        clock = MockClock(start=1000.0)
+        bucket = TokenBucket(rate=10, capacity=10, clock=clock)
+        bucket.defer(3)
+        assert not bucket.try_acquire()
+        assert bucket.delay() == pytest.approx(3)
+        clock.advance(3)
+        assert bucket.try_acquire()
+
+    def test_defer_never_shortens_existing_pause(self):
+        clock = MockClock(start=1000.0)
+        bucket = TokenBucket(rate=10, clock=clock)
+        bucket.defer(5)
+        bucket.defer(1)
+        assert bucket.delay() == pytest.approx(5)
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_acquire_waits_for_token(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for _ in range(3):
+                await bucket.acquire()
+            return loop.time() - start
+
+        # First token is immediate, the next two each wait ~20ms
+        assert asyncio.run(run()) >= 0.035
+
+
+class TestHourlyQuota:
+    """HourlyQuota with an injected wall clock (no real sleeps)."""
+
+    def test_allows_limit_then_refuses(self):
+        quota = HourlyQuota(limit=3, clock=MockClock(start=6000.0))
+        assert [quota.try_acquire() for _ in range(4)] == [True, True, True, False]
+        assert quota.used() == 3
+
+    def test_frees_a_minute_after_the_hour(self):
+        clock = MockClock(start=6000.0)  # minute 100
+        quota = HourlyQuota(limit=2, clock=clock)
+        quota.try_acquire()
+        clock.advance(60)
+        quota.try_acquire()
+        # Minute 100's request counts until the end of minute 160
+        assert quota.delay() == pytest.approx(161 * 60 - 6060)
+        clock.advance(quota.delay())
+        assert quota.delay() == 0.0
+        assert quota.try_acquire()
+        assert not quota.try_acquire()
+
+    def test_snapshot_restore_keeps_larger_counts(self):
+        clock = MockClock(start=6000.0)
+        first = HourlyQuota(limit=500, clock=clock)
+        for _ in range(4):
+            first.try_acquire()
+        second = HourlyQuota(limit=500, clock=clock)
+        second.try_acquire()
+        second.restore(first.snapshot())
+        second.restore({"100": 1, "bad": "x"})
+        assert second.snapshot() == {"100": 4}
+
+    def test_restore_drops_minutes_outside_the_hour(self):
+        quota = HourlyQuota(limit=5, clock=MockClock(start=6000.0))
+        quota.restore({"30": 5, "99": 2})
+        assert quota.used() == 2
+
+    def test_rejects_non_positive_limit(self):
+        with pytest.raises(ValueError):
+            HourlyQuota(limit=0)
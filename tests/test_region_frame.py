@@ -0,0 +1,118 @@
+"""Tests for the columnar region frame (src/packets/region_frame.py).
+
+Covers:
+- Column layout and first-seen column order
+- take() subsets re-deriving column order and member info
+- Sums matching Python's built-in sum bit for bit
+- RegionalAggregator.region_frame matching aggregation from contexts
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.packets.context import TribePacketContext
+from src.packets.region_frame import RegionFrame, ordered_sum
+from src.packets.regional import RegionalAggregator, TribeRegionalRow
+
+
+def _row(tribe_id, hazards=(), members=(), awards=(), composite=None):
+    return TribeRegionalRow.from_context(TribePacketContext(
+        tribe_id=tribe_id,
+        tribe_name=tribe_id.title(),
+        awards=[{"obligation": a} for a in awards],
+        hazard_profile={"fema_nri": {
+            "top_hazards": [{"type": h, "risk_score": s} for h, s in hazards],
+            "composite": {"risk_score": composite},
+        }},
+        senators=[
+            {"bioguide_id": key, "formatted_name": name, "committees": []}
+            for key, name in members
+        ],
+    ))
+
+
+class TestLayout:
+    """RegionFrame.from_rows / take."""
+
+    def test_columns_in_first_seen_order(self):
+        frame = RegionFrame.from_rows([
+            _row("a", hazards=[("WFIR", 10.0), ("DRGT", 5.0)]),
+            _row("b", hazards=[("HRCN", 1.0), ("WFIR", None)]),
+        ])
+        assert frame.hazard_types == ["WFIR", "DRGT", "HRCN"]
+        assert frame.hazard_rank.tolist() == [[1, 2, 0], [2, 0, 1]]
+        assert np.isnan(frame.hazard_score[1, 0])
+        assert frame.hazard_tribe_counts().tolist() == [2, 1, 1]
+
+    def test_take_reorders_columns_and_member_info(self):
+        frame = RegionFrame.from_rows([
+            _row("a", hazards=[("WFIR", 1.0), ("DRGT", 1.0)],
+                 members=[("S1", "Sen. One (a)"), ("S2", "Sen. Two")]),
+            _row("b", hazards=[("DRGT", 1.0), ("WFIR", 1.0)],
+                 members=[("S2", "Sen. Two"), ("S1", "Sen. One (b)")]),
+            _row("c"),
+        ])
+        sub = frame.take([1, 2])
+        assert sub.tribe_ids == ["b", "c"]
+        assert sub.hazard_types == ["DRGT", "WFIR"]
+        assert sub.member_keys == ["S2", "S1"]
+        assert sub.member_info[1]["member_name"] == "Sen. One (b)"
+
+        empty = frame.take([])
+        assert len(empty) == 0 and empty.hazard_types == [] and empty.member_keys == []
+
+    def test_ordered_sum_matches_builtin(self):
+        # Python 3.12+ compensates float sum(); totals must follow it there
+        values = [0.1, 0.2, 0.3, 1e16, -1e16, 0.7]
+        assert ordered_sum(np.array(values)) == sum(values)
+        columns = np.array([values, values[::-1]]).T
+        assert ordered_sum(columns).tolist() == [sum(values), sum(values[::-1])]
+        assert ordered_sum(np.array([])) == 0.0
+        assert ordered_sum(np.zeros((0, 4))).tolist() == [0.0] * 4
+
+
+class TestRegionFrameAggregation:
+    """RegionalAggregator over a frame built once for every Tribe."""
+
+    def test_region_frame_matches_context_aggregation(self, tmp_path):
+        config = tmp_path / "regional_config.json"
+        config.write_text(json.dumps({"regions": {
+            "pnw": {"name": "PNW", "states": ["WA"]},
+            "alaska": {"name": "Alaska", "states": ["AK"]},
+            "crosscutting": {"name": "All", "states": []},
+        }}), encoding="utf-8")
+        registry = MagicMock()
+        registry.get_all.return_value = [
+            {"tribe_id": "t1", "states": ["WA"]},
+            {"tribe_id": "t2", "states": ["AK"]},
+            {"tribe_id": "t3", "states": ["WA", "AK"]},
+        ]
+        registry.get_ids_by_state.side_effect = lambda state: tuple(
+            t["tribe_id"] for t in registry.get_all.return_value if state in t["states"]
+        )
+        aggregator = RegionalAggregator(config, registry)
+
+        rows = {}
+        for tid, hazards, members, awards, composite in [
+            ("t1", [("WFIR", 3.3), ("DRGT", 1.1)], [("S1", "Sen. A")], [0.1, 0.2], 10.0),
+            ("t2", [("CFLD", 7.0)], [("S2", "Sen. B")], [], None),
+            ("t3", [("DRGT", 2.2), ("CFLD", 0.4)], [("S1", "Sen. A"), ("S2", "Sen. B")],
+             [0.3], 12.5),
+        ]:
+            rows[tid] = _row(tid, hazards, members, awards, composite)
+        aggregator.update_rows(rows)
+
+        for region_id in aggregator.get_region_ids():
+            expected = aggregator.aggregate(region_id, aggregator.region_rows(region_id))
+            actual = aggregator.aggregate(region_id, aggregator.region_frame(region_id))
+            expected.generated_at = actual.generated_at = ""
+            assert actual == expected
+
+        cross = aggregator.aggregate("crosscutting", aggregator.region_frame("crosscutting"))
+        assert cross.total_awards == 0.1 + 0.2 + 0.3
+        assert [h["hazard_type"] for h in cross.top_shared_hazards] == ["CFLD", "DRGT", "WFIR"]
+        assert [m["tribe_ids"] for m in cross.delegation_overlap] == [["t1", "t3"], ["t2", "t3"]]
+        assert cross.total_senators == 2
+        assert cross.tribes_without_hazards == ["t2"]
@@ -75,6 +75,9 @@ def mock_registry():
         {"tribe_id": "tribe_multi", "name": "Tribe Multi", "states": ["WA", "OR"]},
         {"tribe_id": "tribe_tx_1", "name": "Tribe TX One", "states": ["TX"]},
     ]
+    registry.get_ids_by_state.side_effect = lambda state: tuple(
+        t["tribe_id"] for t in registry.get_all.return_value if state in t["states"]
+    )
     return registry
 
 
@@ -716,6 +719,25 @@ class TestRegionalDocxSections:
         assert len(doc.tables) >= 1
         assert "Sen. Shared" in doc.tables[0].rows[1].cells[0].text
 
+    def test_regional_delegation_committee_bills_column(self):
+        """Overlap table gains a committee-bills column when counts exist."""
+        from docx import Document as DocxDocument
+        from src.packets.doc_types import DOC_C
+        from src.packets.docx_styles import StyleManager
+        from src.packets.docx_regional_sections import (
+            render_regional_delegation,
+        )
+
+        doc = DocxDocument()
+        sm = StyleManager(doc)
+        ctx = self._make_regional_ctx()
+        ctx.delegation_overlap[0]["committee_bills"] = 3
+        render_regional_delegation(doc, ctx, sm, DOC_C)
+
+        table = doc.tables[0]
+        assert table.rows[0].cells[4].text == "Tracked Bills in Committee"
+        assert table.rows[1].cells[4].text == "3"
+
     def test_regional_delegation_congressional_no_overlap(self):
         """Congressional delegation has no overlap analysis."""
         from docx import Document as DocxDocument
@@ -767,3 +789,97 @@ class TestRegionalDocxSections:
         assert "$500,000" in text
         assert "2 of 3" in text
         assert "Investment Gap" in text
+
+
+# ---------------------------------------------------------------------------
+# Test: Incremental rows and region digests
+# ---------------------------------------------------------------------------
+
+
+def _region_contexts() -> dict:
+    return {
+        "tribe_wa_1": _make_context(
+            "tribe_wa_1", "Tribe WA One", states=["WA"],
+            awards=[{"obligation": 0.1}, {"obligation": 0.2}],
+            senators=[{"bioguide_id": "S001", "formatted_name": "Sen. A"}],
+        ),
+        "tribe_wa_2": _make_context(
+            "tribe_wa_2", "Tribe WA Two", states=["WA"],
+            awards=[{"obligation": 0.3}],
+            senators=[{"bioguide_id": "S001", "formatted_name": "Sen. A"}],
+            hazard_profile={"fema_nri": {
+                "top_hazards": [{"type": "DRGT", "risk_score": 12.5}],
+                "composite": {"risk_score": 20.0},
+            }},
+        ),
+        "tribe_ak_1": _make_context(
+            "tribe_ak_1", "Tribe AK One", states=["AK"],
+            awards=[{"obligation": 500.0}],
+        ),
+    }
+
+
+def _rows(contexts: dict) -> dict:
+    from src.packets.regional import TribeRegionalRow
+
+    return {tid: TribeRegionalRow.from_context(ctx) for tid, ctx in contexts.items()}
+
+
+class TestIncrementalAggregation:
+    """Persisted TribeRegionalRows and per-region digests."""
+
+    def test_rows_aggregate_like_contexts(self, aggregator):
+        contexts = _region_contexts()
+        aggregator.update_rows(_rows(contexts))
+        for region_id in aggregator.get_region_ids():
+            region_contexts = [
+                contexts[tid] for tid in aggregator.get_tribe_ids_for_region(region_id)
+                if tid in contexts
+            ]
+            from_contexts = aggregator.aggregate(region_id, region_contexts)
+            from_rows = aggregator.aggregate(region_id, aggregator.region_rows(region_id))
+            from_contexts.generated_at = from_rows.generated_at = ""
+            assert from_rows == from_contexts
+
+    def test_only_regions_with_changed_tribes_get_new_digest(self, aggregator):
+        contexts = _region_contexts()
+        assert aggregator.update_rows(_rows(contexts)) == set(contexts)
+        before = {r: aggregator.region_digest(r) for r in aggregator.get_region_ids()}
+
+        assert aggregator.update_rows(_rows(contexts)) == set()
+
+        contexts["tribe_ak_1"].awards = [{"obligation": 750.0}]
+        changed = aggregator.update_rows(_rows(contexts))
+        assert changed == {"tribe_ak_1"}
+        assert aggregator.regions_for_tribes(changed) == {"alaska", "crosscutting"}
+        after = {r: aggregator.region_digest(r) for r in aggregator.get_region_ids()}
+        assert after["pnw"] == before["pnw"]
+        assert after["alaska"] != before["alaska"]
+        assert after["crosscutting"] != before["crosscutting"]
+
+    def test_missing_tribe_counts_as_changed(self, aggregator):
+        contexts = _region_contexts()
+        aggregator.update_rows(_rows(contexts))
+        del contexts["tribe_wa_2"]
+        assert aggregator.update_rows(_rows(contexts)) == {"tribe_wa_2"}
+        assert [r.tribe_id for r in aggregator.region_rows("pnw")] == ["tribe_wa_1"]
+
+    def test_state_round_trip(self, aggregator, config_path, mock_registry, tmp_path):
+        rows = _rows(_region_contexts())
+        aggregator.update_rows(rows, {"tribe_ak_1": "sig-1"})
+        aggregator.region_digests["alaska"] = aggregator.region_digest("alaska")
+        state = tmp_path / "state" / "regional_state.json"
+        aggregator.save_state(state)
+
+        reloaded = RegionalAggregator(config_path, mock_registry)
+        reloaded.load_state(state)
+        assert reloaded.rows == rows
+        assert reloaded.cached_row("tribe_ak_1", "sig-1") == rows["tribe_ak_1"]
+        assert reloaded.cached_row("tribe_ak_1", "sig-2") is None
+        assert reloaded.region_digest("alaska") == reloaded.region_digests["alaska"]
+
+    def test_corrupt_state_is_ignored(self, aggregator, tmp_path):
+        state = tmp_path / "regional_state.json"
+        state.write_text("{not json", encoding="utf-8")
+        aggregator.load_state(state)
+        assert aggregator.rows == {}
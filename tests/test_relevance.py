@@ -0,0 +1,94 @@
+"""Tests for RelevanceScorer's compiled keyword matcher.
+
+Scores computed through KeywordMatcher (src/text_matching.py) must equal
+the original per-keyword substring logic.
+"""
+
+import pytest
+
+from src.analysis.relevance import RelevanceScorer
+
+
+def _config() -> dict:
+    return {
+        "scoring": {
+            "weights": {
+                "program_match": 0.35,
+                "tribal_keyword_density": 0.2,
+                "recency": 0.1,
+                "source_authority": 0.15,
+                "action_relevance": 0.2,
+            },
+            "critical_boost": 0.1,
+            "relevance_threshold": 0.0,
+        },
+        "tribal_keywords": ["tribal", "tribe", "tribes", "indian", "indian country", "native"],
+        "action_keywords": ["NOFO", "final rule", "rule", "appropriation", "c++ (draft)"],
+    }
+
+
+def _programs() -> list[dict]:
+    return [
+        {"id": "bia_tcr", "name": "BIA TCR", "priority": "critical",
+         "keywords": ["Tribal Climate Resilience", "climate", "resilience", "climate"],
+         "scanner_trigger_keywords": ["adaptation", "climate resilience"]},
+        {"id": "fema_bric", "name": "FEMA BRIC", "priority": "high",
+         "keywords": ["BRIC", "hazard mitigation", "mitigation"]},
+        {"id": "epa_gap", "name": "EPA GAP", "priority": "high",
+         "keywords": ["gap", "environmental"], "scanner_trigger_keywords": []},
+    ]
+
+
+def _naive_score_components(scorer: RelevanceScorer, item: dict) -> tuple:
+    """Pre-matcher scoring logic for the three keyword factors."""
+    text = f"{item.get('title', '')} {item.get('abstract', '')}".lower()
+    total_hits = 0
+    matched = []
+    for program in scorer.programs:
+        hits = sum(1 for kw in program["keywords"] if kw.lower() in text)
+        hits += sum(1 for kw in program.get("scanner_trigger_keywords", []) if kw.lower() in text)
+        if hits:
+            matched.append(program["id"])
+            total_hits += hits
+    program_score = min(1.0, 0.3 + total_hits * 0.233) if matched else 0.0
+    words = text.split()
+    tribal = sum(1 for kw in scorer.tribal_keywords if kw in text)
+    density = min(1.0, tribal / max(len(words), 1) * 10) if words else 0.0
+    action = sum(1 for kw in scorer.action_keywords if kw in text)
+    action_score = min(1.0, action * 0.25) if action else 0.0
+    return program_score, matched, density, action_score
+
+
+class TestScorerUsesMatcher:
+    """Scores match the original per-keyword substring logic."""
+
+    @pytest.mark.parametrize("title, abstract", [
+        ("Tribal Climate Resilience NOFO", "Final rule on climate adaptation for Indian Country."),
+        ("FEMA BRIC hazard mitigation", "Tribes eligible; appropriation pending."),
+        ("Unrelated notice", ""),
+        ("Environmental GAP guidance", "tribe tribes tribal native c++ (draft)"),
+    ])
+    def test_components_identical(self, title, abstract):
+        scorer = RelevanceScorer(_config(), _programs())
+        item = {"title": title, "abstract": abstract, "published_date": "2026-01-15"}
+        program_score, matched, density, action_score = _naive_score_components(scorer, item)
+
+        result = scorer._score_item(item)
+        breakdown = result["score_breakdown"]
+        assert breakdown["program_match"] == round(program_score, 4)
+        assert result["matched_programs"] == matched
+        assert breakdown["tribal_keyword_density"] == round(density, 4)
+        assert breakdown["action_relevance"] == round(action_score, 4)
+
+    def test_cfda_match_not_double_counted(self):
+        scorer = RelevanceScorer(_config(), _programs())
+        item = {"title": "climate resilience", "abstract": "", "cfda_program_match": "bia_tcr"}
+        score, matched = scorer._program_match(item["title"], item)
+        assert [p["id"] for p in matched] == ["bia_tcr"]
+        assert score == min(1.0, 0.3 + 3 * 0.233)
+
+    def test_recency_memo_is_transparent(self):
+        scorer = RelevanceScorer(_config(), _programs())
+        first = scorer._recency("2020-01-01")
+        assert scorer._recency("2020-01-01") == first == 0.25
+        assert scorer._recency("not a date") == 0.3
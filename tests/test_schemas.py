@@ -6,7 +6,7 @@ compliance. Every test validates actual data, not mocked examples.
 Test categories:
 1. ProgramRecord validation against program_inventory.json
 2. TribeRecord validation against tribal_registry.json
-3. AwardCacheFile validation against award_cache/*.json
+3. AwardCacheFile validation against award_cache store records
 4. HazardProfile validation against hazard_profiles/*.json
 5. PolicyPosition validation against policy_tracking.json
 6. CongressionalDelegate + CongressionalDelegation validation
@@ -18,6 +18,7 @@ import json
 import pytest
 from pydantic import ValidationError
 
+from src.packets.award_store import AwardCacheStore
 from src.paths import (
     AWARD_CACHE_DIR,
     CONGRESSIONAL_CACHE_PATH,
@@ -81,10 +82,10 @@ def congressional_cache():
 
 
 def load_award_cache(tribe_id: str) -> dict:
-    """Load a specific award_cache file."""
-    path = AWARD_CACHE_DIR / f"{tribe_id}.json"
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    """Load a specific award_cache record from the award store."""
+    data = AwardCacheStore(AWARD_CACHE_DIR).get(tribe_id)
+    assert data is not None, f"No award cache record for {tribe_id}"
+    return data
 
 
 def load_hazard_profile(tribe_id: str) -> dict:
@@ -278,7 +279,7 @@ class TestTribeRecordSchema:
 
 
 class TestAwardCacheSchema:
-    """Validate award_cache files against AwardCacheFile schema."""
+    """Validate award_cache records against AwardCacheFile schema."""
 
     SAMPLE_TRIBES = [
         "epa_100000001",
@@ -290,7 +291,7 @@ class TestAwardCacheSchema:
 
     @pytest.mark.parametrize("tribe_id", SAMPLE_TRIBES)
     def test_award_cache_validates(self, tribe_id):
-        """Sample award_cache files must pass AwardCacheFile validation."""
+        """Sample award_cache records must pass AwardCacheFile validation."""
         data = load_award_cache(tribe_id)
         try:
             award = AwardCacheFile(**data)
@@ -298,27 +299,25 @@ class TestAwardCacheSchema:
         except ValidationError as e:
             pytest.fail(f"Award cache {tribe_id} validation failed: {e}")
 
-    def test_all_592_award_files_exist(self):
-        """There must be exactly 592 award_cache files."""
-        award_dir = AWARD_CACHE_DIR
-        files = list(award_dir.glob("epa_*.json"))
-        assert len(files) == 592, f"Expected 592 award cache files, got {len(files)}"
+    def test_all_592_award_records_exist(self):
+        """There must be exactly 592 award_cache records."""
+        tribe_ids = [t for t in AwardCacheStore(AWARD_CACHE_DIR).tribe_ids() if t.startswith("epa_")]
+        assert len(tribe_ids) == 592, f"Expected 592 award cache records, got {len(tribe_ids)}"
 
     def test_award_count_matches_awards_length(self):
-        """award_count must equal len(awards) in every file."""
-        award_dir = AWARD_CACHE_DIR
+        """award_count must equal len(awards) in every record."""
+        store = AwardCacheStore(AWARD_CACHE_DIR)
         errors = []
-        for f in sorted(award_dir.glob("epa_*.json"))[:50]:
-            with open(f, "r", encoding="utf-8") as fp:
-                data = json.load(fp)
+        for tribe_id in store.tribe_ids()[:50]:
+            data = store.get(tribe_id)
             if data["award_count"] != len(data["awards"]):
                 errors.append(
-                    f"{f.name}: award_count={data['award_count']} but len(awards)={len(data['awards'])}"
+                    f"{tribe_id}: award_count={data['award_count']} but len(awards)={len(data['awards'])}"
                 )
         assert not errors, "Mismatched award counts:\n" + "\n".join(errors)
 
     def test_total_obligation_non_negative(self):
-        """total_obligation must be >= 0 in every file."""
+        """total_obligation must be >= 0 in every record."""
         for tribe_id in self.SAMPLE_TRIBES:
             data = load_award_cache(tribe_id)
             assert data["total_obligation"] >= 0, (
@@ -326,7 +325,7 @@ class TestAwardCacheSchema:
             )
 
     def test_empty_awards_have_context(self):
-        """Files with 0 awards should have a no_awards_context message."""
+        """Records with 0 awards should have a no_awards_context message."""
         for tribe_id in self.SAMPLE_TRIBES:
             data = load_award_cache(tribe_id)
             if data["award_count"] == 0:
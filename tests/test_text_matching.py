@@ -0,0 +1,57 @@
+"""Tests for the shared single-pass keyword matcher (src/text_matching.py).
+
+KeywordMatcher must reproduce ``sum(1 for kw in keywords if kw in text)``
+exactly -- including overlapping, nested and repeated keywords.
+"""
+
+import random
+
+import pytest
+
+from src.text_matching import KeywordMatcher
+
+
+def _naive_counts(groups: dict, text: str) -> dict:
+    return {g: sum(1 for kw in kws if kw in text) for g, kws in groups.items()}
+
+
+class TestKeywordMatcher:
+    """Exact ``kw in text`` semantics from a single pass."""
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "tribes",                               # tribe is a prefix of tribes
+        "intertribal indian country",           # nested, mid-word
+        "aaaa",                                 # overlapping repeats
+        "climate resilience and tribal climate resilience",
+        "c++ (draft) rule",                     # regex metacharacters
+    ])
+    def test_matches_naive_counts(self, text):
+        groups = {
+            "a": ["tribe", "tribes", "tribal", "indian", "indian country", "in"],
+            "b": ["aa", "aaa", "a", "aa"],
+            "c": ["climate", "climate resilience", "resilience", "c++ (draft)", "rule"],
+        }
+        assert KeywordMatcher(groups).count(text) == {
+            g: n for g, n in _naive_counts(groups, text).items() if n
+        }
+
+    def test_empty_keyword_always_counts(self):
+        groups = {"g": ["", "x"]}
+        assert KeywordMatcher(groups).count("abc")["g"] == 1
+
+    def test_no_keywords(self):
+        assert KeywordMatcher({"g": []}).count("anything") == {}
+
+    def test_randomized_equivalence(self):
+        rng = random.Random(7)
+        alphabet = "ab c"
+        keywords = sorted({"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                           for _ in range(40)})
+        groups = {i: rng.sample(keywords, 8) for i in range(6)}
+        matcher = KeywordMatcher(groups)
+        for _ in range(300):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40)))
+            expected = _naive_counts(groups, text)
+            got = matcher.count(text)
+            assert {g: got[g] for g in groups} == expected, text
@@ -0,0 +1,123 @@
+"""Tests for batch Tribe x county aggregation (src/packets/tribe_matrix.py).
+
+Covers:
+- Weight summing across GEOIDs and per-Tribe normalization
+- Equal-weight fallback and include mask
+- Batch NRI/SVI aggregation matching the per-Tribe results
+- Vectorized national percentiles (ranks, ties, interpolation)
+"""
+
+import numpy as np
+import pytest
+
+from src.packets.nri_expanded import NRIExpandedBuilder, _risk_percentiles
+from src.packets.svi_builder import SVIProfileBuilder
+from src.packets.tribe_matrix import TribeCountyMatrix, _segment_sums
+
+AREA_WEIGHTS = {
+    "G1": [{"county_fips": "01001", "weight": 0.6}, {"county_fips": "01003", "weight": 0.2}],
+    "G2": [{"county_fips": "01001", "weight": 0.2}, {"county_fips": "99999", "weight": 0.5}],
+    "G3": [{"county_fips": "01005", "weight": 0.0}],
+}
+
+
+class TestTribeCountyMatrix:
+    """Sparse weight layout and weighted sums."""
+
+    def test_segment_sums_accumulate_left_to_right(self):
+        values = np.array([1e16, 1.0, -1e16, 5.0])
+        indptr = np.array([0, 3, 3, 4])
+        expected = [sum(values[:3].tolist()), 0.0, 5.0]
+        assert _segment_sums(values, indptr).tolist() == expected
+
+    def test_weights_summed_and_normalized(self):
+        matrix = TribeCountyMatrix([["G1", "G2"], [], ["MISSING"]], AREA_WEIGHTS)
+        assert matrix.county_counts.tolist() == [3, 0, 0]
+        assert matrix.entry_weight[0] == pytest.approx(1.5)
+
+        metrics = np.array([[10.0], [20.0]])
+        agg = matrix.aggregate({"01001": 0, "01003": 1}, metrics)
+        assert agg.matched.tolist() == [2, 0, 0]
+        assert agg.matched_weight[0] == pytest.approx(1.0)
+        # 01001: 0.8/1.0, 01003: 0.2/1.0
+        assert agg.values[0, 0] == pytest.approx(12.0)
+        assert agg.values[1:].tolist() == [[0.0], [0.0]]
+
+    def test_zero_weight_falls_back_to_equal_weights(self):
+        matrix = TribeCountyMatrix([["G3"]], AREA_WEIGHTS)
+        agg = matrix.aggregate({"01005": 0}, np.array([[7.0]]))
+        assert agg.matched.tolist() == [1]
+        assert agg.values[0, 0] == 7.0
+
+    def test_include_mask_drops_counties(self):
+        matrix = TribeCountyMatrix([["G1"]], AREA_WEIGHTS)
+        agg = matrix.aggregate(
+            {"01001": 0, "01003": 1},
+            np.array([[10.0], [20.0]]),
+            include=np.array([False, True]),
+        )
+        assert agg.matched.tolist() == [1]
+        assert agg.values[0, 0] == 20.0
+
+
+class TestBatchMatchesPerTribe:
+    """Builder batch paths agree with one-Tribe-at-a-time calls."""
+
+    def test_nri_batch(self):
+        builder = NRIExpandedBuilder.__new__(NRIExpandedBuilder)
+        builder._area_weights = AREA_WEIGHTS
+        hazards = {"WFIR": {"eal_total": 3.0}, "HRCN": {"eal_total": 3.0}}
+        builder._county_data = {
+            fips: {
+                "risk_score": score, "eal_total": 1.0, "eal_buildings": 0.5,
+                "eal_population": 0.25, "eal_agriculture": 0.0,
+                "eal_population_equivalence": 0.1, "sovi_score": 2.0,
+                "resl_score": 3.0, "hazards": hazards,
+            }
+            for fips, score in (("01001", 10.0), ("01003", 30.0), ("01005", 20.0))
+        }
+        builder.compute_national_percentiles()
+        tribes = [("t1", ["G1", "G2"]), ("t2", []), ("t3", ["G3"]), ("t4", ["MISSING"])]
+
+        batch = builder._aggregate_nri_batch(tribes)
+
+        assert batch == [builder._aggregate_tribe_nri(t, g) for t, g in tribes]
+        assert batch[0]["risk_score"] == 14.0
+        assert [h["code"] for h in batch[0]["top_hazards"]] == ["HRCN", "WFIR"]
+        assert batch[1]["note"] == "No AIANNH GEOIDs in crosswalk"
+        assert batch[3]["note"] == "No county weights from area crosswalk"
+
+    def test_svi_batch(self):
+        builder = SVIProfileBuilder.__new__(SVIProfileBuilder)
+        builder._area_weights = AREA_WEIGHTS
+        builder._tribe_to_geoids = {"t1": ["G1", "G2"], "t2": ["G3"]}
+        county_data = {
+            "01001": {"fips": "01001", "rpl_theme1": 0.5, "rpl_theme2": 0.5, "rpl_theme4": 0.5,
+                      "f_theme1": 1, "f_theme2": 0, "f_theme4": 2},
+            "01003": {"fips": "01003", "rpl_theme1": 0.0, "rpl_theme2": 0.0, "rpl_theme4": 0.0,
+                      "f_theme1": 4, "f_theme2": 4, "f_theme4": 4},
+        }
+        tribes = [("t1", {"states": ["AK"]}), ("t2", {"states": []})]
+
+        batch = builder._aggregate_svi_batch(tribes, county_data)
+
+        assert batch == [builder._aggregate_tribe_svi(t, tr, county_data) for t, tr in tribes]
+        assert batch[0]["counties_matched"] == 1
+        assert batch[0]["counties_in_crosswalk"] == 3
+        assert batch[0]["coverage_pct"] == pytest.approx(0.5333, abs=1e-4)
+        assert "note" in batch[1]
+
+
+class TestVectorizedPercentiles:
+    """_risk_percentiles applies the national percentile rules column-wise."""
+
+    def test_ranks_ties_and_interpolation(self):
+        base = [10.0, 20.0, 20.0, 30.0]
+        scores = [-1.0, 0.0, 5.0, 10.0, 15.0, 20.0, 27.5, 30.0, 999.0]
+        assert _risk_percentiles(base, scores) == [
+            0.0, 0.0, 0.0, 0.0, 16.67, 33.33, 91.67, 100.0, 100.0,
+        ]
+
+    def test_small_bases(self):
+        assert _risk_percentiles([], [5.0]) == [0.0]
+        assert _risk_percentiles([42.0], [0.0, 1.0]) == [0.0, 50.0]
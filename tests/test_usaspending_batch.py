@@ -385,3 +385,148 @@ class TestMultiYearFetch:
         # 2 results per (CFDA, FY), 2 years = 4 per CFDA
         for cfda in CFDA_TO_PROGRAM:
             assert len(result[cfda]) == 4
+
+
+# ── Concurrent fetch engine against a local aiohttp stub server ──
+
+
+class _StubUSASpending:
+    """Local spending_by_award stub that records concurrency and payloads."""
+
+    def __init__(self, pages_per_query=2, delay=0.02, throttle_first=False):
+        self.pages_per_query = pages_per_query
+        self.delay = delay
+        self.throttle_first = throttle_first
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests: list[dict] = []
+        self.throttled = 0
+
+    async def handle(self, request):
+        from aiohttp import web
+
+        payload = await request.json()
+        if self.throttle_first and not self.throttled:
+            self.throttled += 1
+            return web.json_response({}, status=429, headers={"Retry-After": "1"})
+        self.requests.append(payload)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        page = payload["page"]
+        cfda = payload["filters"]["program_numbers"][0]
+        group = payload["filters"]["award_type_codes"][0]
+        fy = payload["filters"].get("time_period", [{}])[0].get("end_date", "")[:4]
+        if page > self.pages_per_query:
+            return web.json_response({"results": [], "page_metadata": {"hasNext": False}})
+        return web.json_response({
+            "results": [{"Award ID": f"{cfda}-{fy}-{group}-p{page}"}],
+            "page_metadata": {"hasNext": page < self.pages_per_query},
+        })
+
+
+async def _run_against_stub(stub, source_cfg, coro_fn):
+    """Serve ``stub`` on localhost and run ``coro_fn(scraper)`` against it."""
+    from aiohttp import web
+
+    app = web.Application()
+    app.router.add_post("/api/v2/search/spending_by_award/", stub.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    try:
+        config = {
+            "sources": {
+                "usaspending": {
+                    "base_url": f"http://127.0.0.1:{port}/api/v2",
+                    **source_cfg,
+                },
+            },
+            "resilience": {"backoff_base": 1},
+        }
+        return await coro_fn(USASpendingScraper(config))
+    finally:
+        await runner.cleanup()
+
+
+class TestConcurrentFetchEngine:
+    """Bounded-concurrency fan-out, prefetch, and rate limiting (local stub)."""
+
+    def test_multi_year_fans_out_within_concurrency_limit(self):
+        stub = _StubUSASpending(pages_per_query=2)
+        cfg = {"max_concurrency": 6, "requests_per_second": 1000, "burst": 1000}
+
+        result = asyncio.run(_run_against_stub(
+            stub, cfg,
+            lambda s: s.fetch_all_tribal_awards_multi_year(fy_start=2024, fy_end=2025),
+        ))
+
+        assert 1 < stub.max_in_flight <= 6
+        # 14 CFDAs x 2 FYs x 2 groups x 2 pages
+        assert len(stub.requests) == 14 * 2 * 2 * 2
+        for cfda in CFDA_TO_PROGRAM:
+            ids = [a["Award ID"] for a in result[cfda]]
+            # FY order, then group order, then page order -- same as sequential
+            assert ids == [
+                f"{cfda}-2024-02-p1", f"{cfda}-2024-02-p2",
+                f"{cfda}-2024-06-p1", f"{cfda}-2024-06-p2",
+                f"{cfda}-2025-02-p1", f"{cfda}-2025-02-p2",
+                f"{cfda}-2025-06-p1", f"{cfda}-2025-06-p2",
+            ]
+
+    def test_page_prefetch_discards_pages_past_the_end(self):
+        stub = _StubUSASpending(pages_per_query=3)
+        cfg = {"page_prefetch": 4, "requests_per_second": 1000, "burst": 1000}
+
+        async def run(scraper):
+            async with scraper._create_session() as session:
+                return await scraper.fetch_tribal_awards_by_year(session, "15.156", 2024)
+
+        results = asyncio.run(_run_against_stub(stub, cfg, run))
+
+        ids = [r["Award ID"] for r in results]
+        assert ids == [
+            "15.156-2024-02-p1", "15.156-2024-02-p2", "15.156-2024-02-p3",
+            "15.156-2024-06-p1", "15.156-2024-06-p2", "15.156-2024-06-p3",
+        ]
+        # Page 1 alone, then pages 2-5 together, per group
+        pages = sorted(p["page"] for p in stub.requests)
+        assert pages == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
+
+    def test_429_retry_after_is_respected(self):
+        stub = _StubUSASpending(pages_per_query=1, throttle_first=True)
+        cfg = {"requests_per_second": 1000, "burst": 1000}
+
+        async def run(scraper):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            async with scraper._create_session() as session:
+                results = await scraper.fetch_tribal_awards_for_cfda(session, "15.156")
+            return results, loop.time() - start
+
+        results, elapsed = asyncio.run(_run_against_stub(stub, cfg, run))
+
+        assert stub.throttled == 1
+        assert len(results) == 2
+        assert elapsed >= 1.0
+
+    def test_token_bucket_limits_request_rate(self):
+        stub = _StubUSASpending(pages_per_query=1, delay=0)
+        cfg = {"max_concurrency": 16, "requests_per_second": 20, "burst": 2}
+
+        async def run(scraper):
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await scraper.fetch_all_tribal_awards()
+            return loop.time() - start
+
+        elapsed = asyncio.run(_run_against_stub(stub, cfg, run))
+
+        # 28 requests at 20 rps with a burst of 2 need >= 1.3s
+        assert len(stub.requests) == 28
+        assert elapsed >= 1.2
@@ -9,7 +9,7 @@ Validates cross-file consistency across:
 - scanner_config.json
 - grants_gov.py CFDA_NUMBERS
 - tribal_registry.json (Pydantic schema validation)
-- award_cache/*.json (Pydantic schema validation)
+- award_cache store records (Pydantic schema validation)
 - hazard_profiles/*.json (Pydantic schema validation)
 - congressional_cache.json (Pydantic schema validation)
 """
@@ -20,6 +20,7 @@ from pathlib import Path
 
 try:
     from pydantic import ValidationError
+    from src.packets.award_store import AwardCacheStore
     from src.schemas.models import (
         AwardCacheFile,
         CongressionalDelegate,
@@ -436,7 +437,7 @@ def check_tribe_schema_validation(report: ValidationReport, base_path: Path):
 
 
 def check_award_cache_schema_validation(report: ValidationReport, base_path: Path):
-    """Check 12: Validate sample award_cache files against AwardCacheFile Pydantic schema."""
+    """Check 12: Validate award_cache records against AwardCacheFile Pydantic schema."""
     if not PYDANTIC_AVAILABLE:
         report.add_check(
             "Award Cache Schema Validation",
@@ -454,29 +455,30 @@ def check_award_cache_schema_validation(report: ValidationReport, base_path: Pat
         )
         return
 
-    files = sorted(award_dir.glob("epa_*.json"))
+    store = AwardCacheStore(award_dir)
+    files = [tid for tid in store.tribe_ids() if tid.startswith("epa_")]
     errors = []
     validated = 0
 
-    # Validate all files (they are small)
-    for f in files:
+    # Validate all records (they are small)
+    for tribe_id in files:
+        data = store.get(tribe_id)
+        if data is None:
+            errors.append(f"Record '{tribe_id}': missing or invalid JSON")
+            continue
         try:
-            with open(f, "r", encoding="utf-8") as fp:
-                data = json.load(fp)
             AwardCacheFile(**data)
             validated += 1
         except ValidationError as e:
             for err in e.errors():
                 field = " -> ".join(str(loc) for loc in err["loc"])
-                errors.append(f"File '{f.name}', field '{field}': {err['msg']}")
-        except json.JSONDecodeError as e:
-            errors.append(f"File '{f.name}': Invalid JSON - {e}")
+                errors.append(f"Record '{tribe_id}', field '{field}': {err['msg']}")
 
     passed = len(errors) == 0
     if passed:
-        details = f"All {validated} award cache files pass AwardCacheFile schema validation"
+        details = f"All {validated} award cache records pass AwardCacheFile schema validation"
     else:
-        details = f"{len(errors)} validation errors across {len(files)} award cache files:\n"
+        details = f"{len(errors)} validation errors across {len(files)} award cache records:\n"
         details += "\n".join(errors[:20])
         if len(errors) > 20:
             details += f"\n... and {len(errors) - 20} more errors"